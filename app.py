@@ -1,14 +1,36 @@
 ﻿import dash
-from dash import Dash, html, dcc, Input, Output, State
+from dash import ALL, Dash, html, dcc, Input, Output, State
 import dash_bootstrap_components as dbc
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 import json
+import math
 import os
 import pandas as pd
 import numpy as np
 import matplotlib as mpl  
 import plotly.graph_objects as go
+from plotly.utils import PlotlyJSONEncoder
 from dash.dependencies import ClientsideFunction
+from sensors import process_ecg
+from synthetic_ecg import synthetic_ecg
+from ecg_cache import ECGAnalysisCache
+from figure_cache import FigureCache
+from ecg_stream import ECGStreamStore
+from downsampling import decimate_trace, xrange_from_relayout
+from ecg_storage import load_ecg_arrays
+from hrv import compute_hrv, heart_rate_summary
+from signal_quality import window_quality, bad_sample_mask, clean_peaks, clean_rr_mask, bad_segments
+import repository
+import auth
+import batch_analysis
+import training_load
+from vo2max import get_vo2max
+from cohort_stats import COHORT_METRICS, ELITE_PERCENTILE, CohortStats
+from training_load import load_training_load
+from hr_zones import ZONE_METRICS, ZONE_NAMES
+import threading
+from flask import request, jsonify, session
 
 # ===============================
 # CONFIGURACIÃ“N BASE
@@ -32,8 +54,10 @@ app.config.prevent_initial_callbacks = 'initial_duplicate'
 # ===============================
 # ALMACENAMIENTO DE USUARIOS (ACTUALIZADO PARA DOCTORES)
 # ===============================
+# Los JSON sólo se usan como origen de la migración inicial a SQLite (repository.py)
 USERS_FILE = "users.json"
 DOCTORS_FILE = "doctors.json"
+GOALS_FILE = "user_goals.json"
 
 # FunciÃ³n para inicializar usuarios de prueba
 def initialize_test_users():
@@ -79,74 +103,77 @@ def initialize_test_doctors():
     print(f"ðŸ‘¨â€âš•ï¸ MÃ©dicos de prueba inicializados: {list(test_doctors.keys())}")
     return test_doctors
 
-# FunciÃ³n para cargar usuarios desde archivo - VERSIÃ“N ACTUALIZADA
+# Función para cargar usuarios desde la base de datos
 def load_users():
     # Primero inicializar con usuarios de prueba
     test_users = initialize_test_users()
     
-    if os.path.exists(USERS_FILE):
-        try:
-            with open(USERS_FILE, 'r', encoding='utf-8') as f:
-                file_users = json.load(f)
-            
-            print(f"âœ… Usuarios cargados desde archivo: {list(file_users.keys())}")
-            
-            # Combinar: usuarios del archivo tienen prioridad sobre usuarios de prueba
-            combined_users = {**test_users, **file_users}
-            return combined_users
-            
-        except Exception as e:
-            print(f"âŒ Error cargando usuarios: {e}")
-            print("ðŸ“‹ Usando usuarios de prueba como respaldo")
-            return test_users
-    else:
-        print("ðŸ“‚ Archivo de usuarios no encontrado, usando usuarios de prueba")
+    try:
+        db_users = repository.load_athletes()
+        print(f"✅ Usuarios cargados desde la base de datos: {list(db_users.keys())}")
+        
+        # Combinar: usuarios guardados tienen prioridad sobre usuarios de prueba
+        return {**test_users, **db_users}
+        
+    except Exception as e:
+        print(f"❌ Error cargando usuarios: {e}")
+        print("📋 Usando usuarios de prueba como respaldo")
         return test_users
 
-# FunciÃ³n para cargar mÃ©dicos desde archivo
+# Función para cargar médicos desde la base de datos
 def load_doctors():
-    # Primero inicializar con mÃ©dicos de prueba
+    # Primero inicializar con médicos de prueba
     test_doctors = initialize_test_doctors()
     
-    if os.path.exists(DOCTORS_FILE):
-        try:
-            with open(DOCTORS_FILE, 'r', encoding='utf-8') as f:
-                file_doctors = json.load(f)
-            
-            print(f"âœ… MÃ©dicos cargados desde archivo: {list(file_doctors.keys())}")
-            
-            # Combinar: mÃ©dicos del archivo tienen prioridad sobre mÃ©dicos de prueba
-            combined_doctors = {**test_doctors, **file_doctors}
-            return combined_doctors
-            
-        except Exception as e:
-            print(f"âŒ Error cargando mÃ©dicos: {e}")
-            print("ðŸ“‹ Usando mÃ©dicos de prueba como respaldo")
-            return test_doctors
-    else:
-        print("ðŸ“‚ Archivo de mÃ©dicos no encontrado, usando mÃ©dicos de prueba")
+    try:
+        db_doctors = repository.load_doctors()
+        print(f"✅ Médicos cargados desde la base de datos: {list(db_doctors.keys())}")
+        
+        # Combinar: médicos guardados tienen prioridad sobre médicos de prueba
+        return {**test_doctors, **db_doctors}
+        
+    except Exception as e:
+        print(f"❌ Error cargando médicos: {e}")
+        print("📋 Usando médicos de prueba como respaldo")
         return test_doctors
 
-# FunciÃ³n para guardar mÃ©dicos en archivo
+# Función para guardar médicos (todos, en una transacción)
 def save_doctors(doctors_data):
     try:
-        with open(DOCTORS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(doctors_data, f, indent=2, ensure_ascii=False)
-        print(f"ðŸ’¾ MÃ©dicos guardados: {len(doctors_data)} mÃ©dicos")
+        repository.upsert_doctors(doctors_data)
+        print(f"💾 Médicos guardados: {len(doctors_data)} médicos")
         return True
     except Exception as e:
-        print(f"âŒ Error guardando mÃ©dicos: {e}")
+        print(f"❌ Error guardando médicos: {e}")
         return False
 
 def save_users(users_data):
-    """Guarda usuarios en archivo"""
+    """Guarda usuarios (todos, en una transacción)"""
+    try:
+        repository.upsert_athletes(users_data)
+        print(f"💾 Usuarios guardados: {len(users_data)} usuarios")
+        return True
+    except Exception as e:
+        print(f"❌ Error guardando usuarios: {e}")
+        return False
+
+def _save_row(write, username, *data):
+    """Escribe una sola fila en el repositorio (atleta, médico, paciente, objetivo...)"""
+    try:
+        write(username, *data)
+        return True
+    except Exception as e:
+        print(f"❌ Error guardando {username}: {e}")
+        return False
+
+def _save_athlete_fields(username, **fields):
+    """Actualiza columnas concretas de un atleta, creándolo si sólo existía en memoria"""
     try:
-        with open(USERS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(users_data, f, indent=2, ensure_ascii=False)
-        print(f"ðŸ’¾ Usuarios guardados: {len(users_data)} usuarios")
+        if not repository.update_athlete_fields(username, **fields):
+            repository.upsert_athlete(username, USERS_DB[username])
         return True
     except Exception as e:
-        print(f"âŒ Error guardando usuarios: {e}")
+        print(f"❌ Error actualizando {username}: {e}")
         return False
 
 def save_user(username, email, password, full_name=None, user_type="athlete"):
@@ -155,7 +182,7 @@ def save_user(username, email, password, full_name=None, user_type="athlete"):
     if user_type == "doctor":
         # Guardar como mÃ©dico
         new_doctor = {
-            "password": password,
+            "password_hash": auth.hash_password(password),
             "email": email,
             "full_name": full_name if full_name else username,
             "type": "doctor",
@@ -165,8 +192,8 @@ def save_user(username, email, password, full_name=None, user_type="athlete"):
         # Agregar a DOCTORS_DB
         DOCTORS_DB[username] = new_doctor
         
-        # Guardar en archivo
-        if save_doctors(DOCTORS_DB):
+        # Guardar sólo la fila del nuevo médico
+        if _save_row(repository.upsert_doctor, username, new_doctor):
             print(f"âœ… Nuevo mÃ©dico registrado: {username} ({full_name})")
             return True
         else:
@@ -176,7 +203,7 @@ def save_user(username, email, password, full_name=None, user_type="athlete"):
     else:
         # Guardar como atleta (por defecto)
         new_user = {
-            "password": password,
+            "password_hash": auth.hash_password(password),
             "email": email,
             "full_name": full_name if full_name else username,
             "onboarding_completed": False,  # Atletas necesitan onboarding
@@ -187,8 +214,8 @@ def save_user(username, email, password, full_name=None, user_type="athlete"):
         # Agregar a USERS_DB
         USERS_DB[username] = new_user
         
-        # Guardar en archivo
-        if save_users(USERS_DB):
+        # Guardar sólo la fila del nuevo atleta
+        if _save_row(repository.upsert_athlete, username, new_user):
             print(f"âœ… Nuevo atleta registrado: {username} ({full_name})")
             return True
         else:
@@ -201,7 +228,7 @@ def mark_onboarding_completed(username):
         USERS_DB[username]["onboarding_completed"] = True
         
         # Guardar el cambio
-        if save_users(USERS_DB):
+        if _save_athlete_fields(username, onboarding_completed=True):
             print(f"âœ… Onboarding marcado como completado para {username}")
             return True
     
@@ -214,22 +241,52 @@ def update_user_activity_level(username, activity_level):
         USERS_DB[username]["activity_level"] = activity_level
         
         # Guardar el cambio
-        if save_users(USERS_DB):
+        if _save_athlete_fields(username, activity_level=activity_level):
             print(f"âœ… Nivel de actividad actualizado para {username}: {activity_level}")
             return True
     
     print(f"âŒ Error actualizando nivel de actividad para {username}")
     return False
 
+def save_athlete_profile(username, **fields):
+    """Guarda datos del perfil sin columna propia (edad, FC máxima...); None los borra"""
+    if username in USERS_DB:
+        for name, value in fields.items():
+            if value is None:
+                USERS_DB[username].pop(name, None)
+            else:
+                USERS_DB[username][name] = value
+        try:
+            return repository.update_athlete_profile(username, **fields)
+        except Exception as e:
+            print(f"❌ Error guardando el perfil de {username}: {e}")
+    return False
+
 def get_user_activity_level(username):
     """Obtiene el nivel de actividad del usuario"""
     if username in USERS_DB:
         return USERS_DB[username].get("activity_level", 5)
     return 5  # Valor por defecto
 
-# Cargar usuarios y mÃ©dicos al inicio
-USERS_DB = load_users()
-DOCTORS_DB = load_doctors()
+# Crear tablas e importar los JSON heredados (sólo la primera vez)
+try:
+    if repository.migrate_from_json(USERS_FILE, DOCTORS_FILE, GOALS_FILE,
+                                    default_athletes=initialize_test_users(),
+                                    default_doctors=initialize_test_doctors()):
+        print("📦 Datos JSON migrados a SQLite")
+    migrated_passwords = auth.migrate_plaintext_passwords()
+    if migrated_passwords:
+        print(f"🔐 Contraseñas convertidas a hash: {migrated_passwords}")
+except Exception as e:
+    print(f"❌ Error migrando datos JSON a SQLite: {e}")
+
+# Cargar usuarios y mÃ©dicos al inicio. Son cachés de las tablas SQLite que se
+# recargan solas cuando otro worker escribe, así todos ven los mismos datos.
+USERS_DB = repository.CachedTable("athletes", load_users)
+DOCTORS_DB = repository.CachedTable("doctors", load_doctors)
+
+# Sesión firmada de Flask con el usuario autenticado, para las APIs que no pasan por Dash
+server.secret_key = os.environ.get("ATHLETICA_SECRET_KEY") or repository.secret_key()
 
 print(f"ðŸŽ¯ Base de datos lista: {len(USERS_DB)} usuarios y {len(DOCTORS_DB)} mÃ©dicos cargados")
 
@@ -424,23 +481,21 @@ def create_search_results_display(search_results, current_user):
 
 def _authenticate_in_db(identifier, password, db, user_type, entity_label):
     """Autentica por username o email en una base dada, conservando logs actuales."""
-    if identifier in db:
-        data = db[identifier]
-        if data["password"] == password:
+    username = auth.find_username(db, identifier)
+    if username is None:
+        return False, None
+
+    data = db[username]
+    by_email = username != identifier
+    if auth.verify_password(data, password):
+        if by_email:
+            print(f"? Login exitoso por email {entity_label}: '{identifier}' -> '{username}'")
+        else:
             print(f"? Login exitoso como {entity_label}: '{identifier}'")
-            return True, {**data, "user_type": user_type}
-        print(f"? Contraseña incorrecta para {entity_label} '{identifier}'")
-        return True, None
+        return True, {**data, "user_type": user_type}
 
-    for db_key, data in db.items():
-        if data.get("email") == identifier:
-            if data["password"] == password:
-                print(f"? Login exitoso por email {entity_label}: '{identifier}' -> '{db_key}'")
-                return True, {**data, "user_type": user_type}
-            print(f"? Contraseña incorrecta para email {entity_label} '{identifier}'")
-            return True, None
-
-    return False, None
+    print(f"? Contraseña incorrecta para {'email ' if by_email else ''}{entity_label} '{identifier}'")
+    return True, None
 
 
 def verify_user(username, password):
@@ -469,13 +524,11 @@ def get_user_type(username):
 
 def get_email_owner_type(email):
     """Devuelve el tipo de usuario que ya usa un email, o None si no existe."""
-    for user_data in USERS_DB.values():
-        if user_data.get("email") == email:
-            return "athlete"
+    if USERS_DB.lookup("email", email) is not None:
+        return "athlete"
 
-    for doctor_data in DOCTORS_DB.values():
-        if doctor_data.get("email") == email:
-            return "doctor"
+    if DOCTORS_DB.lookup("email", email) is not None:
+        return "doctor"
 
     return None
 
@@ -484,7 +537,7 @@ def add_patient_to_doctor(doctor_username, patient_username):
     if doctor_username in DOCTORS_DB and patient_username in USERS_DB:
         if patient_username not in DOCTORS_DB[doctor_username]["patients"]:
             DOCTORS_DB[doctor_username]["patients"].append(patient_username)
-            if save_doctors(DOCTORS_DB):
+            if _save_row(repository.add_patient, doctor_username, patient_username):
                 print(f"âœ… Paciente '{patient_username}' aÃ±adido al mÃ©dico '{doctor_username}'")
                 return True
     print(f"âŒ Error aÃ±adiendo paciente '{patient_username}' al mÃ©dico '{doctor_username}'")
@@ -495,7 +548,7 @@ def remove_patient_from_doctor(doctor_username, patient_username):
     if doctor_username in DOCTORS_DB:
         if patient_username in DOCTORS_DB[doctor_username]["patients"]:
             DOCTORS_DB[doctor_username]["patients"].remove(patient_username)
-            if save_doctors(DOCTORS_DB):
+            if _save_row(repository.remove_patient, doctor_username, patient_username):
                 print(f"âœ… Paciente '{patient_username}' eliminado del mÃ©dico '{doctor_username}'")
                 return True
     print(f"âŒ Error eliminando paciente '{patient_username}' del mÃ©dico '{doctor_username}'")
@@ -892,51 +945,20 @@ def get_health_description(health_score):
 # ===============================
 # ALMACENAMIENTO DE OBJETIVOS
 # ===============================
-GOALS_FILE = "user_goals.json"
 
 def load_user_goals(username):
-    """Carga los objetivos del usuario desde el archivo"""
-    if not os.path.exists(GOALS_FILE):
-        print(f"ðŸ“‚ Archivo {GOALS_FILE} no encontrado, creando estructura vacÃ­a")
-        return {"fitness": [], "health": []}
-    
+    """Carga los objetivos del usuario desde la base de datos"""
     try:
-        with open(GOALS_FILE, 'r', encoding='utf-8') as f:
-            all_goals = json.load(f)
-        
-        print(f"âœ… Objetivos cargados desde archivo. Usuarios en archivo: {list(all_goals.keys())}")
-        
-        # Si el usuario existe en el archivo, devolver sus objetivos
-        if username in all_goals:
-            user_goals = all_goals.get(username, {"fitness": [], "health": []})
-            print(f"ðŸ“Š Objetivos encontrados para {username}: {len(user_goals.get('fitness', []))} fitness, {len(user_goals.get('health', []))} health")
-            return user_goals
-        else:
-            # Si el usuario no existe, crear estructura vacÃ­a
-            print(f"ðŸ‘¤ Usuario {username} no encontrado en objetivos, creando estructura vacÃ­a")
-            return {"fitness": [], "health": []}
-            
-    except json.JSONDecodeError as e:
-        print(f"âŒ Error decodificando JSON en {GOALS_FILE}: {e}")
-        # Si el archivo estÃ¡ corrupto, crear uno nuevo
-        return {"fitness": [], "health": []}
+        user_goals = repository.load_goals(username)
+        print(f"ðŸ“Š Objetivos encontrados para {username}: {len(user_goals.get('fitness', []))} fitness, {len(user_goals.get('health', []))} health")
+        return user_goals
     except Exception as e:
-        print(f"âŒ Error cargando objetivos para {username}: {e}")
+        print(f"âŒ Error cargando objetivos para {username}: {e}")
         return {"fitness": [], "health": []}
 
 def save_user_goals(username, goals_data):
-    """Guarda los objetivos del usuario en el archivo"""
+    """Sustituye los objetivos del usuario (sólo sus filas)"""
     try:
-        all_goals = {}
-        if os.path.exists(GOALS_FILE):
-            try:
-                with open(GOALS_FILE, 'r', encoding='utf-8') as f:
-                    all_goals = json.load(f)
-                print(f"ðŸ“‚ Archivo existente cargado con {len(all_goals)} usuarios")
-            except json.JSONDecodeError:
-                print(f"âš ï¸ Archivo {GOALS_FILE} corrupto, creando nuevo")
-                all_goals = {}
-        
         # Validar que goals_data tenga la estructura correcta
         if not isinstance(goals_data, dict):
             print(f"âŒ Error: goals_data no es un diccionario: {type(goals_data)}")
@@ -948,15 +970,9 @@ def save_user_goals(username, goals_data):
         if "health" not in goals_data:
             goals_data["health"] = []
         
-        # Actualizar los objetivos del usuario
-        all_goals[username] = goals_data
-        
-        # Guardar en archivo
-        with open(GOALS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(all_goals, f, indent=2, ensure_ascii=False)
+        repository.replace_goals(username, goals_data)
         
         print(f"âœ… Objetivos guardados para {username}: {len(goals_data.get('fitness', []))} fitness, {len(goals_data.get('health', []))} health")
-        print(f"ðŸ“‹ Total usuarios en archivo: {len(all_goals)}")
         
         return True
     except Exception as e:
@@ -1013,8 +1029,8 @@ def add_user_goal(username, goal_type, goal_data):
         goals[goal_type] = [complete_goal_data]
         print(f"âœ… Lista {goal_type} creada y objetivo agregado")
     
-    # Guardar los objetivos actualizados
-    if save_user_goals(username, goals):
+    # Guardar sólo la fila del nuevo objetivo
+    if _save_row(repository.insert_goal, username, goal_type, complete_goal_data):
         print(f"âœ… Objetivo '{complete_goal_data['name']}' agregado exitosamente para {username} (ID: {goal_id})")
         
         # Verificar que se guardÃ³ correctamente
@@ -1042,7 +1058,7 @@ def mark_goal_completed(username, goal_id):
                 goal["progress"] = 100
                 goal["completed_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 
-                if save_user_goals(username, goals):
+                if _save_row(repository.update_goal, username, goal):
                     print(f"âœ… Objetivo {goal_id} marcado como completado para {username}")
                     return True
                 else:
@@ -1069,7 +1085,7 @@ def delete_user_goal(username, goal_id):
                 goals[goal_type].pop(i)
                 
                 # Guardar los cambios
-                if save_user_goals(username, goals):
+                if _save_row(repository.delete_goal, username, goal_id):
                     print(f"ðŸ—‘ï¸ Objetivo '{deleted_name}' ({goal_id}) eliminado exitosamente para {username}")
                     return True
                 else:
@@ -1281,47 +1297,29 @@ def estimate_nutrients_from_description(description):
     }
 
 def save_user_meal(username, meal_data):
-    """Guarda una comida en el archivo de comidas del usuario"""
-    MEALS_FILE = f"meals_{username}.json"
-    
+    """Guarda una comida del usuario"""
     try:
-        # Cargar comidas existentes
-        meals = []
-        if os.path.exists(MEALS_FILE):
-            with open(MEALS_FILE, 'r', encoding='utf-8') as f:
-                meals = json.load(f)
-        
         # Agregar nueva comida con ID y timestamp
         meal_data['id'] = f"meal_{int(datetime.now().timestamp())}"
         meal_data['date'] = datetime.now().strftime("%Y-%m-%d")
         meal_data['timestamp'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        meals.append(meal_data)
-        
-        # Guardar
-        with open(MEALS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(meals, f, indent=2, ensure_ascii=False)
+        repository.add_meal(username, meal_data)
         
         print(f"âœ… Comida guardada para {username}: {meal_data.get('type', 'sin tipo')}")
         return True
     except Exception as e:
-        print(f"âŒ Error guardando comida: {e}")
+        print(f"âŒ Error guardando comida: {e}")
         return False
 
 def load_user_meals(username):
     """Carga las comidas del usuario"""
-    MEALS_FILE = f"meals_{username}.json"
-    
-    if not os.path.exists(MEALS_FILE):
-        return []
-    
     try:
-        with open(MEALS_FILE, 'r', encoding='utf-8') as f:
-            meals = json.load(f)
+        meals = repository.load_meals(username)
         print(f"ðŸ“‹ Comidas cargadas para {username}: {len(meals)} comidas")
         return meals
     except Exception as e:
-        print(f"âŒ Error cargando comidas para {username}: {e}")
+        print(f"âŒ Error cargando comidas para {username}: {e}")
         return []
 
 def calculate_daily_totals(meals):
@@ -1587,127 +1585,36 @@ def create_exercise_content(exercise, current_index, total_exercises, time_remai
 # ===============================
 # PROCESAMIENTO ECG 
 # ===============================
-def find_peaks_simple(signal, min_distance=50, threshold=0.3):
-    peaks = []
-    signal_length = len(signal)
-    
-    if threshold is None:
-        threshold = np.mean(signal) + 0.5 * np.std(signal)
-    
-    for i in range(min_distance, signal_length - min_distance):
-        is_peak = True
-        for j in range(1, min_distance):
-            if (i - j >= 0 and signal[i] <= signal[i - j]) or \
-               (i + j < signal_length and signal[i] <= signal[i + j]):
-                is_peak = False
-                break
-        
-        if is_peak and signal[i] > threshold:
-            if not peaks or (i - peaks[-1]) >= min_distance:
-                peaks.append(i)
-    
-    return np.array(peaks)
+def process_ecg_signal(t, ecg):
+    """Filtra la señal, detecta picos R y calcula BPM a partir de arrays ya cargados"""
+    t, ecg_filtered, bpm, peaks, quality = process_ecg(t, ecg)
+
+    print(f"Calidad de señal: {int(quality['good'].sum())}/{len(quality['good'])} ventanas utilizables")
+    print(f"Picos detectados: {len(peaks)}")
+    if bpm is not None:
+        print(f"BPM calculado: {bpm:.1f}")
+    else:
+        print(f"Sin intervalos RR válidos ({len(peaks)} picos en tramos limpios): BPM no disponible")
+
+    return t, ecg_filtered, bpm, peaks, quality
 
 def load_ecg_and_compute_bpm(filepath="ecg_example.csv"):
     try:
         import os
         if not os.path.exists(filepath):
             print(f"Archivo {filepath} no encontrado, generando datos de ejemplo...")
-            # Generar datos de ejemplo mÃ¡s realistas
-            t_example = np.linspace(0, 10, 1000)
-            # Crear una seÃ±al ECG mÃ¡s realista con picos R
-            ecg_example = np.zeros_like(t_example)
-            
-            # Frecuencia cardÃ­aca de ~72 BPM = 1.2 Hz
-            heart_rate = 1.2  
-            
-            for i, t in enumerate(t_example):
-                # Onda P
-                if i % 83 < 10:  # Cada ~83 puntos para 72 BPM
-                    ecg_example[i] += 0.25 * np.sin(2 * np.pi * 5 * t)
-                # Complejo QRS (pico R)
-                if i % 83 == 41:  # Pico R en el medio
-                    ecg_example[i] += 1.5
-                # Onda T
-                if 45 <= i % 83 < 65:
-                    ecg_example[i] += 0.3 * np.sin(2 * np.pi * 2 * (t - 0.5))
-            
-            # Agregar algo de ruido
-            ecg_example += 0.1 * np.random.normal(size=len(ecg_example))
-            
-            # Encontrar picos (cada ~83 puntos para 72 BPM)
-            peaks = np.array([i for i in range(41, 1000, 83) if i < len(ecg_example)])
-            bpm = 72
-            
-            return t_example, ecg_example, bpm, peaks
+            t_example, ecg_example, peaks = synthetic_ecg(10, fs=100, heart_rate=72, seed=0)
+            return t_example, ecg_example, 72, peaks, window_quality(ecg_example, 100)
         
-        # CARGAR TU ARCHIVO CSV REAL
-        df = pd.read_csv(filepath)
+        # CARGAR TU ARCHIVO (CSV o binario .ecgbin, que se abre con memmap)
+        t, ecg = load_ecg_arrays(filepath)
         
-        print(f"Archivo cargado: {len(df)} puntos de datos")
-        print(f"Columnas: {df.columns.tolist()}")
-        
-        if "Time" not in df.columns or "ECG" not in df.columns:
-            print("ERROR: El archivo CSV no tiene las columnas 'Time' y 'ECG'")
-            raise ValueError("Columnas requeridas no encontradas")
-            
-        t = df["Time"].values
-        ecg = df["ECG"].values
+        print(f"Archivo cargado: {len(t)} puntos de datos")
 
         print(f"Rango de tiempo: {t[0]:.2f} a {t[-1]:.2f} segundos")
         print(f"Rango de ECG: {np.min(ecg):.4f} a {np.max(ecg):.4f}")
 
-        # Procesamiento de seÃ±al - NORMALIZAR para mejor detecciÃ³n
-        ecg_clean = ecg - np.mean(ecg)
-        
-        # Aplicar filtro pasa-banda simple para mejorar la seÃ±al
-        from scipy import signal
-        
-        # DiseÃ±ar filtro pasa-banda (0.5-40 Hz tÃ­pico para ECG)
-        fs = 1 / (t[1] - t[0]) if len(t) > 1 else 250  # Frecuencia de muestreo estimada
-        nyquist = fs / 2
-        
-        # Filtro Butterworth pasa-banda
-        lowcut = 0.5
-        highcut = 40.0
-        low = lowcut / nyquist
-        high = highcut / nyquist
-        b, a = signal.butter(3, [low, high], btype='band')
-        ecg_filtered = signal.filtfilt(b, a, ecg_clean)
-        
-        # Normalizar la seÃ±al filtrada
-        ecg_range = np.max(ecg_filtered) - np.min(ecg_filtered)
-        if ecg_range > 0:
-            ecg_normalized = (ecg_filtered - np.min(ecg_filtered)) / ecg_range
-        else:
-            ecg_normalized = ecg_filtered
-        
-        print(f"SeÃ±al normalizada - Rango: {np.min(ecg_normalized):.4f} a {np.max(ecg_normalized):.4f}")
-
-        # Encontrar picos con parÃ¡metros optimizados
-        min_distance = int(0.4 * fs)  # Al menos 400ms entre latidos (150 BPM mÃ¡ximo)
-        threshold = np.percentile(ecg_normalized, 85)  # Usar percentil 85 como threshold
-        
-        print(f"ParÃ¡metros detecciÃ³n - Min distance: {min_distance}, Threshold: {threshold:.4f}")
-        
-        peaks = find_peaks_simple(ecg_normalized, min_distance=min_distance, threshold=threshold)
-
-        print(f"Picos detectados: {len(peaks)}")
-
-        # Calcular BPM
-        if len(peaks) > 1:
-            rr_intervals = np.diff(t[peaks])
-            if len(rr_intervals) > 0 and np.mean(rr_intervals) > 0:
-                bpm = 60 / np.mean(rr_intervals)
-                print(f"BPM calculado: {bpm:.1f} (de {len(rr_intervals)} intervalos RR)")
-            else:
-                bpm = 72
-                print("Usando BPM por defecto (72) - problemas con intervalos RR")
-        else:
-            bpm = 72
-            print(f"Usando BPM por defecto (72) - solo {len(peaks)} picos detectados")
-
-        return t, ecg_filtered, bpm, peaks
+        return process_ecg_signal(t, ecg)
         
     except Exception as e:
         print(f"Error loading ECG: {e}")
@@ -1715,20 +1622,171 @@ def load_ecg_and_compute_bpm(filepath="ecg_example.csv"):
         traceback.print_exc()
         
         # Fallback a datos de ejemplo
-        t_example = np.linspace(0, 10, 1000)
-        ecg_example = (
-            np.sin(2 * np.pi * 1.2 * t_example) + 
-            0.5 * np.sin(2 * np.pi * 5 * t_example) +
-            0.3 * np.sin(2 * np.pi * 0.5 * t_example)
-        )
-        
-        # Agregar picos R artificiales
-        for i in range(41, 1000, 83):
-            if i < len(ecg_example):
-                ecg_example[i] += 2.0
-                
-        peaks = np.array([i for i in range(41, 1000, 83) if i < len(ecg_example)])
-        return t_example, ecg_example, 72, peaks
+        t_example, ecg_example, peaks = synthetic_ecg(10, fs=100, heart_rate=72, seed=0)
+        return t_example, ecg_example, 72, peaks, window_quality(ecg_example, 100)
+
+# Caché de ECG procesados compartida por todo el proceso (se invalida si cambia el archivo)
+ECG_CACHE = ECGAnalysisCache(maxsize=16)
+
+def clean_rr(t, peaks, quality):
+    """Máscara de intervalos RR que no atraviesan ventanas de mala calidad"""
+    return clean_rr_mask(peaks, bad_sample_mask(quality, len(t)))
+
+def compute_recording_hrv(filepath="ecg_example.csv"):
+    """HRV de una grabación a partir de sus picos R (reutiliza el análisis cacheado)"""
+    t, _, _, peaks, quality = ECG_CACHE.get(filepath, load_ecg_and_compute_bpm)
+    return compute_hrv(t[peaks], clean_rr(t, peaks, quality))
+
+def compute_recording_heart_rate(filepath="ecg_example.csv"):
+    """Serie de BPM latido a latido y sus estadísticas móviles, una vez por grabación"""
+    t, _, _, peaks, quality = ECG_CACHE.get(filepath, load_ecg_and_compute_bpm)
+    return heart_rate_summary(t[peaks], rr_mask=clean_rr(t, peaks, quality))
+
+def compute_recording_bad_segments(filepath="ecg_example.csv"):
+    """Tramos inutilizables de la grabación, listos para sombrear en el gráfico"""
+    t, _, _, _, quality = ECG_CACHE.get(filepath, load_ecg_and_compute_bpm)
+    return bad_segments(quality, t)
+
+def format_bpm(value):
+    """'72 bpm', o '-- bpm' si no hay latidos válidos"""
+    return f"{int(round(value))} bpm" if value is not None else "-- bpm"
+
+def format_hrv_summary(metrics):
+    """Texto corto con las métricas HRV disponibles"""
+    parts = []
+    if metrics.get("rmssd") is not None:
+        parts.append(f"RMSSD {metrics['rmssd']:.0f} ms")
+    if metrics.get("sdnn") is not None:
+        parts.append(f"SDNN {metrics['sdnn']:.0f} ms")
+    if metrics.get("pnn50") is not None:
+        parts.append(f"pNN50 {metrics['pnn50']:.0f}%")
+    if metrics.get("lf_hf") is not None:
+        parts.append(f"LF/HF {metrics['lf_hf']:.2f}")
+    return "HRV: " + (" · ".join(parts) if parts else "--")
+
+# Máximo de puntos por traza ECG enviados al navegador (~ancho del gráfico en píxeles)
+ECG_PLOT_MAX_POINTS = 1500
+
+# Buffers circulares con la señal en vivo de cada atleta (últimos 5 minutos a 250 Hz)
+ECG_STREAMS = ECGStreamStore(fs=250, window_seconds=300)
+
+@server.route("/api/ecg/<username>/samples", methods=["POST"])
+def ingest_ecg_samples(username):
+    """Recibe lotes de muestras ECG del wearable: {"samples": [...], "fs": 250}.
+
+    El wearable se identifica con la cabecera X-Device-Token del atleta;
+    también se aceptan envíos desde la sesión del propio atleta.
+    """
+    if username not in USERS_DB:
+        return jsonify({"error": f"Atleta '{username}' no encontrado"}), 404
+    if (session.get("user") != {"username": username, "type": "athlete"}
+            and not auth.verify_device_token(server.secret_key, username, request.headers.get("X-Device-Token"))):
+        return jsonify({"error": "Token de dispositivo no válido"}), 403
+
+    payload = request.get_json(silent=True) or {}
+    samples = payload.get("samples")
+    if not isinstance(samples, list) or not samples:
+        return jsonify({"error": "Se esperaba una lista 'samples' no vacía"}), 400
+
+    try:
+        buffer, result = ECG_STREAMS.ingest(username, samples, fs=payload.get("fs"))
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({
+        "received": len(samples),
+        "buffered": len(buffer),
+        "total": buffer.total_samples,
+        "new_peaks": result["peak_times"].tolist(),
+        "bpm": result["bpm"].tolist(),
+        "mean_bpm": result["mean_bpm"]
+    })
+
+@server.route("/api/ecg/<username>/device-token", methods=["GET"])
+def ecg_device_token(username):
+    """Token que el atleta configura en su wearable para enviar muestras"""
+    if session.get("user") != {"username": username, "type": "athlete"}:
+        return jsonify({"error": "Inicia sesión como este atleta para obtener el token"}), 403
+    return jsonify({"token": auth.device_token(server.secret_key, username)})
+
+# Percentiles de la cohorte para el radar de competencias (refrescados en segundo plano)
+COHORT = CohortStats()
+COHORT_LABELS = {
+    'endurance': ('Resistencia', '{:.0f} de carga crónica'),
+    'resting_hr': ('FC en reposo', '{:.0f} bpm'),
+    'vo2max': ('VO₂máx', '{:.1f} ml/kg/min'),
+    'volume': ('Volumen', '{:.0f} min en 28 días'),
+}
+
+# El estado de los análisis por lotes se guarda en SQLite (repository.*_batch_job):
+# cualquier worker puede responder a la consulta de progreso
+def _run_batch_analysis(doctor_username, patients):
+    def report(done, total):
+        repository.update_batch_job(doctor_username, done=done, total=total)
+
+    try:
+        summaries = batch_analysis.analyze_patients(patients, progress=report)
+        repository.update_batch_job(doctor_username, status="done", analyzed=len(summaries),
+                                    finished_at=datetime.now().isoformat(timespec="seconds"))
+        METRICS_FIGURES.schedule(*summaries)
+        print(f"✅ Análisis por lotes de {doctor_username}: {len(summaries)} pacientes")
+    except Exception as e:
+        repository.update_batch_job(doctor_username, status="error", error=str(e))
+        print(f"❌ Error en el análisis por lotes de {doctor_username}: {e}")
+
+@server.route("/api/doctors/<doctor_username>/ecg-analysis", methods=["POST"])
+def start_batch_analysis(doctor_username):
+    """Lanza en segundo plano el análisis de ECG de todos los pacientes del médico"""
+    if doctor_username not in DOCTORS_DB:
+        return jsonify({"error": f"Médico '{doctor_username}' no encontrado"}), 404
+    if session.get("user") != {"username": doctor_username, "type": "doctor"}:
+        return jsonify({"error": "Inicia sesión como este médico para lanzar el análisis"}), 403
+
+    patients = DOCTORS_DB[doctor_username].get("patients", [])
+    job = {"status": "running", "done": 0, "total": None, "patients": len(patients)}
+    if not repository.start_batch_job(doctor_username, job):
+        return jsonify(repository.get_batch_job(doctor_username)), 409
+
+    threading.Thread(target=_run_batch_analysis, args=(doctor_username, patients), daemon=True).start()
+    return jsonify(job), 202
+
+@server.route("/api/athletes/<username>/workouts", methods=["POST"])
+def log_workout_rpe(username):
+    """Cuestionario post-entreno: {"rpe": 0-10, "duration_min": 45, "date": "AAAA-MM-DD", "id": "...",
+    "distance_km": 8.5, "avg_hr": 150} (los dos últimos, opcionales, en carreras)"""
+    if username not in USERS_DB:
+        return jsonify({"error": f"Atleta '{username}' no encontrado"}), 404
+    if session.get("user") != {"username": username, "type": "athlete"}:
+        return jsonify({"error": "Inicia sesión como este atleta para registrar entrenamientos"}), 403
+
+    payload = request.get_json(silent=True) or {}
+    try:
+        rpe = float(payload["rpe"])
+        duration_min = float(payload["duration_min"])
+        # Carreras: distancia y FC media permiten la estimación submáxima del VO2máx
+        run = {key: float(payload[key]) for key in ("distance_km", "avg_hr") if payload.get(key) is not None}
+        day = datetime.strptime(payload.get("date") or datetime.now().strftime("%Y-%m-%d"), "%Y-%m-%d").date()
+    except (KeyError, TypeError, ValueError):
+        return jsonify({"error": "Se esperaba 'rpe', 'duration_min' y opcionalmente 'date' (AAAA-MM-DD)"}), 400
+    # float() acepta "nan" e "inf" y get_json el literal NaN: se comprueba que sean finitos
+    if not all(math.isfinite(value) for value in (rpe, duration_min, *run.values())):
+        return jsonify({"error": "Los valores numéricos deben ser finitos"}), 400
+    if not 0 <= rpe <= 10 or duration_min <= 0 or any(value <= 0 for value in run.values()):
+        return jsonify({"error": "RPE debe estar entre 0 y 10 y la duración, distancia y FC ser positivas"}), 400
+
+    session_id = payload.get("id") or f"rpe_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+    training_load.record_rpe_session(username, session_id, day.isoformat(), rpe, duration_min, **run)
+    METRICS_FIGURES.schedule(username)
+    return jsonify({"session_id": session_id, "load": training_load.srpe_load(rpe, duration_min)}), 201
+
+@server.route("/api/doctors/<doctor_username>/ecg-analysis", methods=["GET"])
+def batch_analysis_status(doctor_username):
+    if session.get("user") != {"username": doctor_username, "type": "doctor"}:
+        return jsonify({"error": "Inicia sesión como este médico para consultar el análisis"}), 403
+    job = repository.get_batch_job(doctor_username)
+    if job is None:
+        return jsonify({"status": "idle"})
+    return jsonify(job)
 
 # ===============================
 # HTML INDEX STRING
@@ -1768,6 +1826,28 @@ app.index_string = f'''
             return true;
         }}
         
+        // Mensajes temporales: si el contenido difiere del original, restaurarlo
+        // pasado delayMs sin ninguna llamada al servidor
+        window.clientside.resetTransientLabel = function(componentId, children, original, delayMs) {{
+            if (JSON.stringify(children) === JSON.stringify(original)) {{
+                return window.dash_clientside.no_update;
+            }}
+            setTimeout(function() {{
+                window.dash_clientside.set_props(componentId, {{children: original}});
+            }}, delayMs);
+            return window.dash_clientside.no_update;
+        }}
+        
+        // Estilos de la barra lateral: activo el botón cuya ruta es pathname
+        window.clientside.navStyles = function(pathname, routes, base, active, strict) {{
+            if (strict && routes.indexOf(pathname) === -1) {{
+                throw window.dash_clientside.PreventUpdate;
+            }}
+            return routes.map(function(route) {{
+                return route === pathname ? active : base;
+            }});
+        }}
+        
         // Inicializar cuando la pÃ¡gina carga
         document.addEventListener('DOMContentLoaded', function() {{
             console.log('ðŸš€ Athletica app loaded');
@@ -2357,864 +2437,903 @@ app.clientside_callback(
     prevent_initial_call=True
 )
 
+# ===============================
+# MENSAJES TEMPORALES (CLIENTSIDE)
+# ===============================
+def register_transient_label(component_id, original_children, delay_ms=2000):
+    """Restaura en el navegador el contenido original de un componente
+    unos segundos después de que un callback muestre un mensaje temporal"""
+    original = json.dumps(original_children, cls=PlotlyJSONEncoder)
+    app.clientside_callback(
+        f"""
+        function(children) {{
+            return window.clientside.resetTransientLabel('{component_id}', children, {original}, {delay_ms});
+        }}
+        """,
+        Output(component_id, 'children', allow_duplicate=True),
+        Input(component_id, 'children'),
+        prevent_initial_call=True
+    )
+
+register_transient_label("btn-agregar-objetivo", [
+    html.I(className="bi bi-plus-circle me-2"),
+    "Agregar Nuevo Objetivo"
+])
+register_transient_label("btn-agregar-comida", [
+    html.I(className="bi bi-plus-circle me-2"),
+    "Agregar Comida"
+])
+register_transient_label("btn-registrar-agua", [
+    html.I(className="bi bi-droplet me-2"),
+    "Registrar Agua (+250ml)"
+])
+
 # ===============================
 # WELCOME LAYOUT
 # ===============================
-welcome_layout = html.Div(
-    [
-        html.Div(
-            className="header-content",
-            children=[
-                html.H1("ATHLETICA", className="main-title"),
-                html.H4("Tu guÃ­a definitiva para la salud y el bienestar. Transforma tus datos en hÃ¡bitos.", className="subtitle"),
-            ]
-        ),
+@lru_cache(maxsize=None)
+def welcome_layout():
+    return html.Div(
+        [
+            html.Div(
+                className="header-content",
+                children=[
+                    html.H1("ATHLETICA", className="main-title"),
+                    html.H4("Tu guÃ­a definitiva para la salud y el bienestar. Transforma tus datos en hÃ¡bitos.", className="subtitle"),
+                ]
+            ),
         
-        html.Div(
-            [
-                html.Div([
-                    html.I(className="bi bi-calendar-check icon"), 
-                    html.P("Seguimiento Inteligente de HÃ¡bitos", className="card-title"),
-                    html.P("Registra tu actividad diaria, sueÃ±o y nutriciÃ³n. Recibe consejos para construir rutinas saludables.", className="card-text")
-                ], className="feature-card"),
+            html.Div(
+                [
+                    html.Div([
+                        html.I(className="bi bi-calendar-check icon"), 
+                        html.P("Seguimiento Inteligente de HÃ¡bitos", className="card-title"),
+                        html.P("Registra tu actividad diaria, sueÃ±o y nutriciÃ³n. Recibe consejos para construir rutinas saludables.", className="card-text")
+                    ], className="feature-card"),
 
-                html.Div([
-                    html.I(className="bi bi-activity icon"),
-                    html.P("Monitoreo de Bienestar y EnergÃ­a", className="card-title"),
-                    html.P("Analiza tu rendimiento y niveles de fatiga para saber cuÃ¡ndo esforzarte y cuÃ¡ndo descansar.", className="card-text")
-                ], className="feature-card"),
+                    html.Div([
+                        html.I(className="bi bi-activity icon"),
+                        html.P("Monitoreo de Bienestar y EnergÃ­a", className="card-title"),
+                        html.P("Analiza tu rendimiento y niveles de fatiga para saber cuÃ¡ndo esforzarte y cuÃ¡ndo descansar.", className="card-text")
+                    ], className="feature-card"),
 
-                html.Div([
-                    html.I(className="bi bi-bar-chart-line icon"),
-                    html.P("Reportes de Progreso Sencillos", className="card-title"),
-                    html.P("Visualiza tu evoluciÃ³n en el tiempo con grÃ¡ficos fÃ¡ciles de entender. Celebra tus logros.", className="card-text")
-                ], className="feature-card"),
-            ],
-            className="features-grid"
-        ),
+                    html.Div([
+                        html.I(className="bi bi-bar-chart-line icon"),
+                        html.P("Reportes de Progreso Sencillos", className="card-title"),
+                        html.P("Visualiza tu evoluciÃ³n en el tiempo con grÃ¡ficos fÃ¡ciles de entender. Celebra tus logros.", className="card-text")
+                    ], className="feature-card"),
+                ],
+                className="features-grid"
+            ),
 
-        html.Div(
-            [
-                dcc.Link(
-                    dbc.Button("Comenzar", color="primary", className="btn-start btn-primary-action"),
-                    href="/login",
-                    className="mx-3 dcc-link-button"
-                ),
-                dcc.Link(
-                    dbc.Button("Crear cuenta", color="secondary", className="btn-start btn-secondary-action"),
-                    href="/register",
-                    className="mx-3 dcc-link-button"
-                ),
-            ],
-            className="button-section"
-        ),
+            html.Div(
+                [
+                    dcc.Link(
+                        dbc.Button("Comenzar", color="primary", className="btn-start btn-primary-action"),
+                        href="/login",
+                        className="mx-3 dcc-link-button"
+                    ),
+                    dcc.Link(
+                        dbc.Button("Crear cuenta", color="secondary", className="btn-start btn-secondary-action"),
+                        href="/register",
+                        className="mx-3 dcc-link-button"
+                    ),
+                ],
+                className="button-section"
+            ),
 
-        html.P("Datos cifrados de extremo a extremo Â· Cumplimiento GDPR estricto", className="privacy"),
-    ],
-    className="welcome-container"
-)
+            html.P("Datos cifrados de extremo a extremo Â· Cumplimiento GDPR estricto", className="privacy"),
+        ],
+        className="welcome-container"
+    )
 
 # ===============================
 # LOGIN LAYOUT 
 # ===============================
-login_layout = html.Div(
-    className="auth-container",
-    children=[
-        # DIVS DE DIAGNÃ“STICO (OCULTOS)
-        html.Div(id="current-user-debug", style={"display": "none"}),
-        html.Div(id="onboarding-completed-debug", style={"display": "none"}),
+@lru_cache(maxsize=None)
+def login_layout():
+    return html.Div(
+        className="auth-container",
+        children=[
+            # DIVS DE DIAGNÃ“STICO (OCULTOS)
+            html.Div(id="current-user-debug", style={"display": "none"}),
+            html.Div(id="onboarding-completed-debug", style={"display": "none"}),
         
-        html.Div(
-            className="auth-wrapper",
-            children=[
-                html.Div(
-                    className="auth-form-side",
-                    children=[
-                        html.H2("Iniciar SesiÃ³n"),
-                        html.Div(className="input-group", children=[
-                            html.Span(html.I(className="bi bi-person-fill"), className="input-icon"),
-                            dcc.Input(
-                                id="login-username", 
-                                type="text", 
-                                placeholder="Usuario o Email",
-                                className="auth-input",
-                                style={
-                                    'width': '100%', 
-                                    'padding': '12px 40px 12px 40px',
-                                    'backgroundColor': '#2b2b2b',
-                                    'border': '1px solid #444',
-                                    'borderRadius': '10px',
-                                    'color': 'white', 
-                                    'fontSize': '1rem'
-                                }
-                            )
-                        ]),
-                        html.Div(className="input-group", children=[
-                            html.Span(html.I(className="bi bi-lock-fill"), className="input-icon"),
-                            dcc.Input(
-                                id="login-password", 
-                                type="password", 
-                                placeholder="ContraseÃ±a",
-                                className="auth-input",
-                                style={
-                                    'width': '100%', 
-                                    'padding': '12px 40px 12px 40px',
-                                    'backgroundColor': '#2b2b2b',
-                                    'border': '1px solid #444',
-                                    'borderRadius': '10px',
-                                    'color': 'white', 
-                                    'fontSize': '1rem'
-                                }
-                            ),
-                        ]),
-                        html.A("Â¿Olvidaste tu contraseÃ±a?", href="#", className="forgot-password"),
-                        dbc.Button("Entrar a Athletica", id="login-btn", className="auth-btn"),
-                        html.Div(id="login-message", className="text-warning mt-2"),
-                    ]
-                ),
+            html.Div(
+                className="auth-wrapper",
+                children=[
+                    html.Div(
+                        className="auth-form-side",
+                        children=[
+                            html.H2("Iniciar SesiÃ³n"),
+                            html.Div(className="input-group", children=[
+                                html.Span(html.I(className="bi bi-person-fill"), className="input-icon"),
+                                dcc.Input(
+                                    id="login-username", 
+                                    type="text", 
+                                    placeholder="Usuario o Email",
+                                    className="auth-input",
+                                    style={
+                                        'width': '100%', 
+                                        'padding': '12px 40px 12px 40px',
+                                        'backgroundColor': '#2b2b2b',
+                                        'border': '1px solid #444',
+                                        'borderRadius': '10px',
+                                        'color': 'white', 
+                                        'fontSize': '1rem'
+                                    }
+                                )
+                            ]),
+                            html.Div(className="input-group", children=[
+                                html.Span(html.I(className="bi bi-lock-fill"), className="input-icon"),
+                                dcc.Input(
+                                    id="login-password", 
+                                    type="password", 
+                                    placeholder="ContraseÃ±a",
+                                    className="auth-input",
+                                    style={
+                                        'width': '100%', 
+                                        'padding': '12px 40px 12px 40px',
+                                        'backgroundColor': '#2b2b2b',
+                                        'border': '1px solid #444',
+                                        'borderRadius': '10px',
+                                        'color': 'white', 
+                                        'fontSize': '1rem'
+                                    }
+                                ),
+                            ]),
+                            html.A("Â¿Olvidaste tu contraseÃ±a?", href="#", className="forgot-password"),
+                            dbc.Button("Entrar a Athletica", id="login-btn", className="auth-btn"),
+                            html.Div(id="login-message", className="text-warning mt-2"),
+                        ]
+                    ),
 
-                html.Div(
-                    className="auth-toggle-side",
-                    children=[
-                        html.H2("Â¿AÃºn no te has unido?"),
-                        html.P("RegÃ­strate para comenzar tu transformaciÃ³n con el anÃ¡lisis de rendimiento mÃ¡s avanzado."),
-                        dcc.Link(
-                            dbc.Button("Crear una cuenta", className="toggle-btn-promo"),
-                            href="/register",
-                            style={'text-decoration': 'none'}
-                        ),
-                    ]
-                )
-            ]
-        )
-    ]
-)
+                    html.Div(
+                        className="auth-toggle-side",
+                        children=[
+                            html.H2("Â¿AÃºn no te has unido?"),
+                            html.P("RegÃ­strate para comenzar tu transformaciÃ³n con el anÃ¡lisis de rendimiento mÃ¡s avanzado."),
+                            dcc.Link(
+                                dbc.Button("Crear una cuenta", className="toggle-btn-promo"),
+                                href="/register",
+                                style={'text-decoration': 'none'}
+                            ),
+                        ]
+                    )
+                ]
+            )
+        ]
+    )
 
 # ===============================
 # REGISTER LAYOUT (CON SCROLL VERTICAL)
 # ===============================
-register_layout = html.Div(
-    className="auth-container",
-    children=[
-        html.Div(
-            className="auth-wrapper",
-            children=[
-                # LADO IZQUIERDO: PromociÃ³n (sin scroll)
-                html.Div(
-                    className="auth-toggle-side",
-                    children=[
-                        html.H2("Â¡Bienvenido/a!"),
-                        html.P("Si ya tienes una cuenta, inicia sesiÃ³n para continuar optimizando tu rendimiento."),
-                        dcc.Link(
-                            dbc.Button("Iniciar SesiÃ³n", className="toggle-btn-promo"),
-                            href="/login",
-                            style={'text-decoration': 'none'}
-                        ),
-                    ]
-                ),
+@lru_cache(maxsize=None)
+def register_layout():
+    return html.Div(
+        className="auth-container",
+        children=[
+            html.Div(
+                className="auth-wrapper",
+                children=[
+                    # LADO IZQUIERDO: PromociÃ³n (sin scroll)
+                    html.Div(
+                        className="auth-toggle-side",
+                        children=[
+                            html.H2("Â¡Bienvenido/a!"),
+                            html.P("Si ya tienes una cuenta, inicia sesiÃ³n para continuar optimizando tu rendimiento."),
+                            dcc.Link(
+                                dbc.Button("Iniciar SesiÃ³n", className="toggle-btn-promo"),
+                                href="/login",
+                                style={'text-decoration': 'none'}
+                            ),
+                        ]
+                    ),
 
-                # LADO DERECHO: Formulario de registro (CON SCROLL)
-                html.Div(
-                    className="auth-form-side",
-                    children=[
-                        # CONTENEDOR PRINCIPAL CON TODO EL FORMULARIO
-                        html.Div(
-                            style={
-                                'width': '100%',
-                                'minHeight': '600px'  # Altura mÃ­nima
-                            },
-                            children=[
-                                html.H2("Crear Cuenta", style={'marginBottom': '30px'}),
+                    # LADO DERECHO: Formulario de registro (CON SCROLL)
+                    html.Div(
+                        className="auth-form-side",
+                        children=[
+                            # CONTENEDOR PRINCIPAL CON TODO EL FORMULARIO
+                            html.Div(
+                                style={
+                                    'width': '100%',
+                                    'minHeight': '600px'  # Altura mÃ­nima
+                                },
+                                children=[
+                                    html.H2("Crear Cuenta", style={'marginBottom': '30px'}),
                                 
-                                # SECCIÃ“N DE TIPO DE USUARIO
-                                html.Div(
-                                    style={
-                                        'marginBottom': '30px',
-                                        'border': '1px solid rgba(0, 212, 255, 0.2)',
-                                        'borderRadius': '12px',
-                                        'padding': '20px',
-                                        'backgroundColor': 'rgba(0, 212, 255, 0.05)'
-                                    },
-                                    children=[
-                                        html.P(
-                                            "Tipo de Usuario",
-                                            style={
-                                                'color': HIGHLIGHT_COLOR,
-                                                'fontWeight': '600',
-                                                'marginBottom': '20px',
-                                                'textTransform': 'uppercase',
-                                                'letterSpacing': '0.5px',
-                                                'fontSize': '1rem'
-                                            }
-                                        ),
-                                        
-                                        # CONTENEDOR DE BOTONES LATERAL
-                                        html.Div(
-                                            style={
-                                                'display': 'flex',
-                                                'flexDirection': 'row',
-                                                'gap': '15px',
-                                                'justifyContent': 'center',
-                                                'alignItems': 'center',
-                                                'marginBottom': '15px'
-                                            },
-                                            children=[
-                                                # BotÃ³n Atleta
-                                                html.Button(
-                                                    [
-                                                        html.Div("ðŸƒ", style={'fontSize': '1.8rem', 'marginBottom': '8px'}),
-                                                        html.Div([
-                                                            html.H4("Atleta", style={'color': '#fff', 'marginBottom': '5px', 'fontSize': '1.1rem'}),
-                                                            html.P("Monitoriza tu salud", 
-                                                                   style={'color': '#ccc', 'fontSize': '0.85rem', 'margin': '0'})
-                                                        ])
-                                                    ],
-                                                    id="btn-reg-type-athlete",
-                                                    n_clicks=0,
-                                                    style={
-                                                        'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                                        'border': '2px solid rgba(0, 212, 255, 0.3)',
-                                                        'borderRadius': '10px',
-                                                        'padding': '15px',
-                                                        'cursor': 'pointer',
-                                                        'transition': 'all 0.3s ease',
-                                                        'color': 'white',
-                                                        'textAlign': 'center',
-                                                        'flex': '1',
-                                                        'minWidth': '140px',
-                                                        'maxWidth': '160px',
-                                                        'minHeight': '100px',
-                                                        'display': 'flex',
-                                                        'flexDirection': 'column',
-                                                        'justifyContent': 'center',
-                                                        'alignItems': 'center'
-                                                    }
-                                                ),
-                                                
-                                                # BotÃ³n MÃ©dico
-                                                html.Button(
-                                                    [
-                                                        html.Div("ðŸ‘¨â€âš•ï¸", style={'fontSize': '1.8rem', 'marginBottom': '8px'}),
-                                                        html.Div([
-                                                            html.H4("MÃ©dico", style={'color': '#fff', 'marginBottom': '5px', 'fontSize': '1.1rem'}),
-                                                            html.P("Accede a datos", 
-                                                                   style={'color': '#ccc', 'fontSize': '0.85rem', 'margin': '0'})
-                                                        ])
-                                                    ],
-                                                    id="btn-reg-type-doctor",
-                                                    n_clicks=0,
-                                                    style={
-                                                        'backgroundColor': 'rgba(78, 205, 196, 0.1)',
-                                                        'border': '2px solid rgba(78, 205, 196, 0.3)',
-                                                        'borderRadius': '10px',
-                                                        'padding': '15px',
-                                                        'cursor': 'pointer',
-                                                        'transition': 'all 0.3s ease',
-                                                        'color': 'white',
-                                                        'textAlign': 'center',
-                                                        'flex': '1',
-                                                        'minWidth': '140px',
-                                                        'maxWidth': '160px',
-                                                        'minHeight': '100px',
-                                                        'display': 'flex',
-                                                        'flexDirection': 'column',
-                                                        'justifyContent': 'center',
-                                                        'alignItems': 'center'
-                                                    }
-                                                )
-                                            ]
-                                        ),
-                                        
-                                        # Input oculto que almacena el valor real
-                                        dcc.Input(
-                                            id="reg-user-type",
-                                            type="hidden",
-                                            value="athlete"
-                                        ),
-                                        
-                                        # Indicador de selecciÃ³n
-                                        html.Div(
-                                            id="reg-type-indicator",
-                                            style={
-                                                'marginTop': '15px',
-                                                'padding': '8px 12px',
-                                                'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                                'borderRadius': '6px',
-                                                'textAlign': 'center',
-                                                'fontSize': '0.9rem',
-                                                'color': HIGHLIGHT_COLOR
-                                            },
-                                            children="Seleccionado: Atleta"
-                                        )
-                                    ]
-                                ),
-                                
-                                # FORMULARIO COMPLETO
-                                html.Div(
-                                    style={'width': '100%'},
-                                    children=[
-                                        # Nombre de Usuario
-                                        html.Div(className="input-group", children=[
-                                            html.Span(html.I(className="bi bi-person-fill"), className="input-icon"),
-                                            dcc.Input(
-                                                id="reg-username", 
-                                                type="text", 
-                                                placeholder="Nombre de Usuario",
-                                                className="auth-input"
-                                            )
-                                        ]),
-                                        
-                                        # Email
-                                        html.Div(className="input-group", children=[
-                                            html.Span(html.I(className="bi bi-envelope-fill"), className="input-icon"),
-                                            dcc.Input(
-                                                id="reg-email", 
-                                                type="email", 
-                                                placeholder="Email",
-                                                className="auth-input"
-                                            )
-                                        ]),
-                                        
-                                        # ContraseÃ±a
-                                        html.Div(className="input-group", children=[
-                                            html.Span(html.I(className="bi bi-lock-fill"), className="input-icon"),
-                                            dcc.Input(
-                                                id="reg-password", 
-                                                type="password", 
-                                                placeholder="ContraseÃ±a",
-                                                className="auth-input"
-                                            )
-                                        ]),
-                                        
-                                        # Confirmar ContraseÃ±a
-                                        html.Div(className="input-group", children=[
-                                            html.Span(html.I(className="bi bi-lock-fill"), className="input-icon"),
-                                            dcc.Input(
-                                                id="reg-password2", 
-                                                type="password", 
-                                                placeholder="Confirmar ContraseÃ±a",
-                                                className="auth-input"
-                                            )
-                                        ]),
+                                    # SECCIÃ“N DE TIPO DE USUARIO
+                                    html.Div(
+                                        style={
+                                            'marginBottom': '30px',
+                                            'border': '1px solid rgba(0, 212, 255, 0.2)',
+                                            'borderRadius': '12px',
+                                            'padding': '20px',
+                                            'backgroundColor': 'rgba(0, 212, 255, 0.05)'
+                                        },
+                                        children=[
+                                            html.P(
+                                                "Tipo de Usuario",
+                                                style={
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'fontWeight': '600',
+                                                    'marginBottom': '20px',
+                                                    'textTransform': 'uppercase',
+                                                    'letterSpacing': '0.5px',
+                                                    'fontSize': '1rem'
+                                                }
+                                            ),
                                         
-                                        # Checkbox de tÃ©rminos y condiciones
-                                        html.Div(className="input-group", children=[
+                                            # CONTENEDOR DE BOTONES LATERAL
                                             html.Div(
                                                 style={
                                                     'display': 'flex',
+                                                    'flexDirection': 'row',
+                                                    'gap': '15px',
+                                                    'justifyContent': 'center',
                                                     'alignItems': 'center',
-                                                    'marginTop': '10px',
-                                                    'marginBottom': '20px'
+                                                    'marginBottom': '15px'
                                                 },
                                                 children=[
-                                                    dcc.Checklist(
-                                                        id="accept-terms",
-                                                        options=[{'label': 'Acepto los tÃ©rminos y condiciones', 'value': 'Acepto'}],
-                                                        value=[],
-                                                        style={'display': 'flex', 'alignItems': 'center'},
-                                                        inputStyle={
-                                                            'marginRight': '10px',
-                                                            'width': '18px',
-                                                            'height': '18px',
-                                                            'cursor': 'pointer'
-                                                        },
-                                                        labelStyle={
-                                                            'color': '#ccc',
-                                                            'fontSize': '0.95rem',
-                                                            'cursor': 'pointer'
+                                                    # BotÃ³n Atleta
+                                                    html.Button(
+                                                        [
+                                                            html.Div("ðŸƒ", style={'fontSize': '1.8rem', 'marginBottom': '8px'}),
+                                                            html.Div([
+                                                                html.H4("Atleta", style={'color': '#fff', 'marginBottom': '5px', 'fontSize': '1.1rem'}),
+                                                                html.P("Monitoriza tu salud", 
+                                                                       style={'color': '#ccc', 'fontSize': '0.85rem', 'margin': '0'})
+                                                            ])
+                                                        ],
+                                                        id="btn-reg-type-athlete",
+                                                        n_clicks=0,
+                                                        style={
+                                                            'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                                            'border': '2px solid rgba(0, 212, 255, 0.3)',
+                                                            'borderRadius': '10px',
+                                                            'padding': '15px',
+                                                            'cursor': 'pointer',
+                                                            'transition': 'all 0.3s ease',
+                                                            'color': 'white',
+                                                            'textAlign': 'center',
+                                                            'flex': '1',
+                                                            'minWidth': '140px',
+                                                            'maxWidth': '160px',
+                                                            'minHeight': '100px',
+                                                            'display': 'flex',
+                                                            'flexDirection': 'column',
+                                                            'justifyContent': 'center',
+                                                            'alignItems': 'center'
+                                                        }
+                                                    ),
+                                                
+                                                    # BotÃ³n MÃ©dico
+                                                    html.Button(
+                                                        [
+                                                            html.Div("ðŸ‘¨â€âš•ï¸", style={'fontSize': '1.8rem', 'marginBottom': '8px'}),
+                                                            html.Div([
+                                                                html.H4("MÃ©dico", style={'color': '#fff', 'marginBottom': '5px', 'fontSize': '1.1rem'}),
+                                                                html.P("Accede a datos", 
+                                                                       style={'color': '#ccc', 'fontSize': '0.85rem', 'margin': '0'})
+                                                            ])
+                                                        ],
+                                                        id="btn-reg-type-doctor",
+                                                        n_clicks=0,
+                                                        style={
+                                                            'backgroundColor': 'rgba(78, 205, 196, 0.1)',
+                                                            'border': '2px solid rgba(78, 205, 196, 0.3)',
+                                                            'borderRadius': '10px',
+                                                            'padding': '15px',
+                                                            'cursor': 'pointer',
+                                                            'transition': 'all 0.3s ease',
+                                                            'color': 'white',
+                                                            'textAlign': 'center',
+                                                            'flex': '1',
+                                                            'minWidth': '140px',
+                                                            'maxWidth': '160px',
+                                                            'minHeight': '100px',
+                                                            'display': 'flex',
+                                                            'flexDirection': 'column',
+                                                            'justifyContent': 'center',
+                                                            'alignItems': 'center'
                                                         }
                                                     )
                                                 ]
+                                            ),
+                                        
+                                            # Input oculto que almacena el valor real
+                                            dcc.Input(
+                                                id="reg-user-type",
+                                                type="hidden",
+                                                value="athlete"
+                                            ),
+                                        
+                                            # Indicador de selecciÃ³n
+                                            html.Div(
+                                                id="reg-type-indicator",
+                                                style={
+                                                    'marginTop': '15px',
+                                                    'padding': '8px 12px',
+                                                    'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                                    'borderRadius': '6px',
+                                                    'textAlign': 'center',
+                                                    'fontSize': '0.9rem',
+                                                    'color': HIGHLIGHT_COLOR
+                                                },
+                                                children="Seleccionado: Atleta"
                                             )
-                                        ]),
+                                        ]
+                                    ),
+                                
+                                    # FORMULARIO COMPLETO
+                                    html.Div(
+                                        style={'width': '100%'},
+                                        children=[
+                                            # Nombre de Usuario
+                                            html.Div(className="input-group", children=[
+                                                html.Span(html.I(className="bi bi-person-fill"), className="input-icon"),
+                                                dcc.Input(
+                                                    id="reg-username", 
+                                                    type="text", 
+                                                    placeholder="Nombre de Usuario",
+                                                    className="auth-input"
+                                                )
+                                            ]),
                                         
-                                        # BotÃ³n de registro
-                                        dbc.Button(
-                                            "Registrarse en Athletica", 
-                                            id="register-btn", 
-                                            className="auth-btn",
-                                            style={
-                                                'width': '100%',
-                                                'backgroundColor': HIGHLIGHT_COLOR,
-                                                'border': 'none',
-                                                'fontWeight': '600',
-                                                'padding': '14px',
-                                                'borderRadius': '10px',
-                                                'marginTop': '10px',
-                                                'marginBottom': '20px',  # Espacio extra abajo
-                                                'transition': '0.3s',
-                                                'color': '#0b0b0b',
-                                                'fontSize': '1.1rem'
-                                            }
-                                        ),
+                                            # Email
+                                            html.Div(className="input-group", children=[
+                                                html.Span(html.I(className="bi bi-envelope-fill"), className="input-icon"),
+                                                dcc.Input(
+                                                    id="reg-email", 
+                                                    type="email", 
+                                                    placeholder="Email",
+                                                    className="auth-input"
+                                                )
+                                            ]),
                                         
-                                        # Mensaje de registro (con suficiente espacio)
-                                        html.Div(
-                                            id="register-message", 
-                                            className="text-warning mt-2", 
-                                            style={
-                                                'marginTop': '15px',
-                                                'marginBottom': '40px',  # Espacio extra para scroll
-                                                'minHeight': '50px'  # Altura mÃ­nima
-                                            }
-                                        ),
+                                            # ContraseÃ±a
+                                            html.Div(className="input-group", children=[
+                                                html.Span(html.I(className="bi bi-lock-fill"), className="input-icon"),
+                                                dcc.Input(
+                                                    id="reg-password", 
+                                                    type="password", 
+                                                    placeholder="ContraseÃ±a",
+                                                    className="auth-input"
+                                                )
+                                            ]),
                                         
-                                        # ESPACIO EXTRA PARA ASEGURAR QUE HAY SCROLL
-                                        html.Div(
-                                            style={
-                                                'height': '50px',
-                                                'visibility': 'hidden'
-                                            }
-                                        )
-                                    ]
-                                )
-                            ]
-                        )
-                    ]
-                )
-            ]
-        )
-    ]
-)
+                                            # Confirmar ContraseÃ±a
+                                            html.Div(className="input-group", children=[
+                                                html.Span(html.I(className="bi bi-lock-fill"), className="input-icon"),
+                                                dcc.Input(
+                                                    id="reg-password2", 
+                                                    type="password", 
+                                                    placeholder="Confirmar ContraseÃ±a",
+                                                    className="auth-input"
+                                                )
+                                            ]),
+                                        
+                                            # Checkbox de tÃ©rminos y condiciones
+                                            html.Div(className="input-group", children=[
+                                                html.Div(
+                                                    style={
+                                                        'display': 'flex',
+                                                        'alignItems': 'center',
+                                                        'marginTop': '10px',
+                                                        'marginBottom': '20px'
+                                                    },
+                                                    children=[
+                                                        dcc.Checklist(
+                                                            id="accept-terms",
+                                                            options=[{'label': 'Acepto los tÃ©rminos y condiciones', 'value': 'Acepto'}],
+                                                            value=[],
+                                                            style={'display': 'flex', 'alignItems': 'center'},
+                                                            inputStyle={
+                                                                'marginRight': '10px',
+                                                                'width': '18px',
+                                                                'height': '18px',
+                                                                'cursor': 'pointer'
+                                                            },
+                                                            labelStyle={
+                                                                'color': '#ccc',
+                                                                'fontSize': '0.95rem',
+                                                                'cursor': 'pointer'
+                                                            }
+                                                        )
+                                                    ]
+                                                )
+                                            ]),
+                                        
+                                            # BotÃ³n de registro
+                                            dbc.Button(
+                                                "Registrarse en Athletica", 
+                                                id="register-btn", 
+                                                className="auth-btn",
+                                                style={
+                                                    'width': '100%',
+                                                    'backgroundColor': HIGHLIGHT_COLOR,
+                                                    'border': 'none',
+                                                    'fontWeight': '600',
+                                                    'padding': '14px',
+                                                    'borderRadius': '10px',
+                                                    'marginTop': '10px',
+                                                    'marginBottom': '20px',  # Espacio extra abajo
+                                                    'transition': '0.3s',
+                                                    'color': '#0b0b0b',
+                                                    'fontSize': '1.1rem'
+                                                }
+                                            ),
+                                        
+                                            # Mensaje de registro (con suficiente espacio)
+                                            html.Div(
+                                                id="register-message", 
+                                                className="text-warning mt-2", 
+                                                style={
+                                                    'marginTop': '15px',
+                                                    'marginBottom': '40px',  # Espacio extra para scroll
+                                                    'minHeight': '50px'  # Altura mÃ­nima
+                                                }
+                                            ),
+                                        
+                                            # ESPACIO EXTRA PARA ASEGURAR QUE HAY SCROLL
+                                            html.Div(
+                                                style={
+                                                    'height': '50px',
+                                                    'visibility': 'hidden'
+                                                }
+                                            )
+                                        ]
+                                    )
+                                ]
+                            )
+                        ]
+                    )
+                ]
+            )
+        ]
+    )
 
 # ===============================
 # DOCTOR DASHBOARD LAYOUT
 # ===============================
-doctor_dashboard_layout = html.Div(
-    id="doctor-container",
-    className="doctor-container",
-    style={
-        'backgroundColor': DARK_BACKGROUND,
-        'minHeight': '100vh',
-        'color': 'white',
-        'fontFamily': 'Inter, sans-serif'
-    },
-    children=[
+@lru_cache(maxsize=None)
+def doctor_dashboard_layout():
+    return html.Div(
+        id="doctor-container",
+        className="doctor-container",
+        style={
+            'backgroundColor': DARK_BACKGROUND,
+            'minHeight': '100vh',
+            'color': 'white',
+            'fontFamily': 'Inter, sans-serif'
+        },
+        children=[
 
-        # ===============================
-        # HEADER
-        # ===============================
-        html.Div(
-            id="doctor-header",
-            className="doctor-header",
-            style={
-                'backgroundColor': '#1a1a1a',
-                'padding': '15px 40px',
-                'borderBottom': '1px solid rgba(0, 212, 255, 0.1)',
-                'display': 'flex',
-                'justifyContent': 'space-between',
-                'alignItems': 'center'
-            },
-            children=[
-                html.Div(
-                    style={'display': 'flex', 'alignItems': 'center'},
-                    children=[
-                        html.Div(
-                            style={
-                                'width': '40px',
-                                'height': '40px',
-                                'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                'borderRadius': '10px',
-                                'border': f'2px solid {HIGHLIGHT_COLOR}',
-                                'display': 'flex',
-                                'alignItems': 'center',
-                                'justifyContent': 'center',
-                                'marginRight': '15px'
-                            },
-                            children=html.Span(
-                                "A",
+            # ===============================
+            # HEADER
+            # ===============================
+            html.Div(
+                id="doctor-header",
+                className="doctor-header",
+                style={
+                    'backgroundColor': '#1a1a1a',
+                    'padding': '15px 40px',
+                    'borderBottom': '1px solid rgba(0, 212, 255, 0.1)',
+                    'display': 'flex',
+                    'justifyContent': 'space-between',
+                    'alignItems': 'center'
+                },
+                children=[
+                    html.Div(
+                        style={'display': 'flex', 'alignItems': 'center'},
+                        children=[
+                            html.Div(
                                 style={
-                                    'color': HIGHLIGHT_COLOR,
-                                    'fontWeight': 'bold',
-                                    'fontSize': '1.2rem'
-                                }
-                            )
-                        ),
-                        html.H1(
-                            "ATHLETICA",
-                            style={
-                                'color': HIGHLIGHT_COLOR,
-                                'fontSize': '1.8rem',
-                                'fontWeight': '900',
-                                'letterSpacing': '2px',
-                                'textShadow': '0 0 15px rgba(0, 224, 255, 0.5)',
-                                'margin': '0'
-                            }
-                        )
-                    ]
-                ),
-
-                html.Div(
-                    style={
-                        'flex': '1',
-                        'height': '1px',
-                        'backgroundColor': 'rgba(0, 212, 255, 0.2)',
-                        'margin': '0 30px'
-                    }
-                ),
-
-                html.Div(
-                    style={'display': 'flex', 'alignItems': 'center'},
-                    children=[
-                        html.Div(
-                            style={'display': 'flex', 'alignItems': 'center', 'gap': '10px'},
-                            children=[
-                                html.Div(
-                                    id="doctor-profile-avatar",
+                                    'width': '40px',
+                                    'height': '40px',
+                                    'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                    'borderRadius': '10px',
+                                    'border': f'2px solid {HIGHLIGHT_COLOR}',
+                                    'display': 'flex',
+                                    'alignItems': 'center',
+                                    'justifyContent': 'center',
+                                    'marginRight': '15px'
+                                },
+                                children=html.Span(
+                                    "A",
                                     style={
-                                        'width': '45px',
-                                        'height': '45px',
-                                        'backgroundColor': '#4ecdc4',
-                                        'borderRadius': '50%',
-                                        'display': 'flex',
-                                        'alignItems': 'center',
-                                        'justifyContent': 'center',
-                                        'color': '#0a0a0a',
+                                        'color': HIGHLIGHT_COLOR,
                                         'fontWeight': 'bold',
                                         'fontSize': '1.2rem'
                                     }
-                                ),
-                                html.Div(
-                                    style={'textAlign': 'right'},
-                                    children=[
-                                        html.Div(
-                                            id="doctor-profile-name",
-                                            style={
-                                                'fontWeight': '600',
-                                                'fontSize': '1rem',
-                                                'color': '#fff'
-                                            }
-                                        ),
-                                        html.Div(
-                                            "MÃ©dico",
-                                            style={
-                                                'fontSize': '0.8rem',
-                                                'color': '#4ecdc4'
-                                            }
-                                        )
-                                    ]
                                 )
-                            ]
-                        )
-                    ]
-                )
-            ]
-        ),
-
-        # ===============================
-        # BODY (SIDEBAR + MAIN)
-        # ===============================
-        html.Div(
-            style={'display': 'flex'},
-            children=[
-
-                # ===============================
-                # SIDEBAR
-                # ===============================
-                html.Div(
-                    style={
-                        'width': '300px',
-                        'padding': '30px',
-                        'borderRight': '1px solid rgba(0, 212, 255, 0.1)',
-                        'backgroundColor': '#141414'
-                    },
-                    children=[
-
-                        html.H4(
-                            "NavegaciÃ³n MÃ©dico",
-                            style={
-                                'color': '#4ecdc4',
-                                'marginBottom': '20px',
-                                'fontSize': '1.1rem'
-                            }
-                        ),
+                            ),
+                            html.H1(
+                                "ATHLETICA",
+                                style={
+                                    'color': HIGHLIGHT_COLOR,
+                                    'fontSize': '1.8rem',
+                                    'fontWeight': '900',
+                                    'letterSpacing': '2px',
+                                    'textShadow': '0 0 15px rgba(0, 224, 255, 0.5)',
+                                    'margin': '0'
+                                }
+                            )
+                        ]
+                    ),
 
-                        html.Button(
-                            "Dashboard",
-                            id="nav-dashboard-doctor",
-                            n_clicks=0,
-                            style={
-                                'width': '100%',
-                                'padding': '12px',
-                                'backgroundColor': 'rgba(78, 205, 196, 0.1)',
-                                'borderRadius': '10px',
-                                'border': 'none',
-                                'color': '#4ecdc4',
-                                'textAlign': 'left',
-                                'marginBottom': '10px',
-                                'fontFamily': "'Inter', sans-serif",
-                                'cursor': 'pointer',
-                                'transition': 'all 0.3s ease'
-                            }
-                        ),
+                    html.Div(
+                        style={
+                            'flex': '1',
+                            'height': '1px',
+                            'backgroundColor': 'rgba(0, 212, 255, 0.2)',
+                            'margin': '0 30px'
+                        }
+                    ),
 
-                        html.Button(
-                            "Mis Pacientes",
-                            id="nav-pacientes-doctor",
-                            n_clicks=0,
-                            style={
-                                'width': '100%',
-                                'padding': '12px',
-                                'backgroundColor': 'transparent',
-                                'borderRadius': '10px',
-                                'border': 'none',
-                                'color': '#ccc',
-                                'textAlign': 'left',
-                                'marginBottom': '10px',
-                                'fontFamily': "'Inter', sans-serif",
-                                'cursor': 'pointer',
-                                'transition': 'all 0.3s ease'
-                            }
-                        ),
+                    html.Div(
+                        style={'display': 'flex', 'alignItems': 'center'},
+                        children=[
+                            html.Div(
+                                style={'display': 'flex', 'alignItems': 'center', 'gap': '10px'},
+                                children=[
+                                    html.Div(
+                                        id="doctor-profile-avatar",
+                                        style={
+                                            'width': '45px',
+                                            'height': '45px',
+                                            'backgroundColor': '#4ecdc4',
+                                            'borderRadius': '50%',
+                                            'display': 'flex',
+                                            'alignItems': 'center',
+                                            'justifyContent': 'center',
+                                            'color': '#0a0a0a',
+                                            'fontWeight': 'bold',
+                                            'fontSize': '1.2rem'
+                                        }
+                                    ),
+                                    html.Div(
+                                        style={'textAlign': 'right'},
+                                        children=[
+                                            html.Div(
+                                                id="doctor-profile-name",
+                                                style={
+                                                    'fontWeight': '600',
+                                                    'fontSize': '1rem',
+                                                    'color': '#fff'
+                                                }
+                                            ),
+                                            html.Div(
+                                                "MÃ©dico",
+                                                style={
+                                                    'fontSize': '0.8rem',
+                                                    'color': '#4ecdc4'
+                                                }
+                                            )
+                                        ]
+                                    )
+                                ]
+                            )
+                        ]
+                    )
+                ]
+            ),
 
-                        html.Hr(style={'margin': '30px 0', 'borderColor': '#2b2b2b'}),
+            # ===============================
+            # BODY (SIDEBAR + MAIN)
+            # ===============================
+            html.Div(
+                style={'display': 'flex'},
+                children=[
 
-                        html.H4(
-                            "Buscar Pacientes",
-                            style={'color': HIGHLIGHT_COLOR, 'marginBottom': '15px'}
-                        ),
+                    # ===============================
+                    # SIDEBAR
+                    # ===============================
+                    html.Div(
+                        style={
+                            'width': '300px',
+                            'padding': '30px',
+                            'borderRight': '1px solid rgba(0, 212, 255, 0.1)',
+                            'backgroundColor': '#141414'
+                        },
+                        children=[
 
-                        dcc.Input(
-                            id="doctor-search-input",
-                            type="text",
-                            placeholder="Nombre, usuario o email...",
-                            style={
-                                'width': '100%',
-                                'padding': '12px 15px',
-                                'backgroundColor': '#2b2b2b',
-                                'border': '1px solid #444',
-                                'borderRadius': '8px',
-                                'color': 'white',
-                                'fontSize': '1rem',
-                                'fontFamily': "'Inter', sans-serif",
-                                'marginBottom': '15px'
-                            }
-                        ),
+                            html.H4(
+                                "NavegaciÃ³n MÃ©dico",
+                                style={
+                                    'color': '#4ecdc4',
+                                    'marginBottom': '20px',
+                                    'fontSize': '1.1rem'
+                                }
+                            ),
 
-                        html.Button(
-                            "Buscar",
-                            id="doctor-search-btn",
-                            n_clicks=0,
-                            style={
-                                'width': '100%',
-                                'padding': '12px',
-                                'backgroundColor': HIGHLIGHT_COLOR,
-                                'border': 'none',
-                                'borderRadius': '8px',
-                                'fontWeight': '600',
-                                'color': '#0a0a0a',
-                                'fontFamily': "'Inter', sans-serif",
-                                'cursor': 'pointer',
-                                'transition': 'all 0.3s ease',
-                                'marginBottom': '20px'
-                            }
-                        ),
+                            html.Button(
+                                "Dashboard",
+                                id="nav-dashboard-doctor",
+                                n_clicks=0,
+                                style={
+                                    'width': '100%',
+                                    'padding': '12px',
+                                    'backgroundColor': 'rgba(78, 205, 196, 0.1)',
+                                    'borderRadius': '10px',
+                                    'border': 'none',
+                                    'color': '#4ecdc4',
+                                    'textAlign': 'left',
+                                    'marginBottom': '10px',
+                                    'fontFamily': "'Inter', sans-serif",
+                                    'cursor': 'pointer',
+                                    'transition': 'all 0.3s ease'
+                                }
+                            ),
 
-                        html.Div(
-                            id="doctor-search-results", 
-                            style={
-                                'marginTop': '20px',
-                                'maxHeight': '300px',
-                                'overflowY': 'auto'
-                            }
-                        )
-                    ]
-                ),
+                            html.Button(
+                                "Mis Pacientes",
+                                id="nav-pacientes-doctor",
+                                n_clicks=0,
+                                style={
+                                    'width': '100%',
+                                    'padding': '12px',
+                                    'backgroundColor': 'transparent',
+                                    'borderRadius': '10px',
+                                    'border': 'none',
+                                    'color': '#ccc',
+                                    'textAlign': 'left',
+                                    'marginBottom': '10px',
+                                    'fontFamily': "'Inter', sans-serif",
+                                    'cursor': 'pointer',
+                                    'transition': 'all 0.3s ease'
+                                }
+                            ),
 
-                # ===============================
-                # MAIN CONTENT
-                # ===============================
-                html.Div(
-                    className="doctor-main",
-                    style={
-                        'flex': '1',
-                        'padding': '40px',
-                        'overflowY': 'auto'
-                    },
-                    children=[
-                        html.Div(
-                            style={
-                                'display': 'flex',
-                                'justifyContent': 'space-between',
-                                'alignItems': 'center',
-                                'marginBottom': '20px'
-                            },
-                            children=[
-                                html.H2(
-                                    "Panel de Control MÃ©dico",
-                                    style={
-                                        'color': HIGHLIGHT_COLOR,
-                                        'margin': '0',
-                                        'fontSize': '2.2rem'
-                                    }
-                                ),
-                                html.Div(
-                                    children=f"Ãšltima actualizaciÃ³n: {datetime.now().strftime('%d/%m/%Y %H:%M')}",
-                                    style={'color': '#aaa', 'fontSize': '0.9rem'}
-                                )
-                            ]
-                        ),
+                            html.Hr(style={'margin': '30px 0', 'borderColor': '#2b2b2b'}),
 
-                        html.P(
-                            "Bienvenido/a al panel de control mÃ©dico. AquÃ­ puedes gestionar tus pacientes, ver sus datos de salud y monitorizar su progreso.",
-                            style={
-                                'color': '#ccc', 
-                                'fontSize': '1.1rem',
-                                'marginBottom': '30px',
-                                'maxWidth': '800px'
-                            }
-                        ),
+                            html.H4(
+                                "Buscar Pacientes",
+                                style={'color': HIGHLIGHT_COLOR, 'marginBottom': '15px'}
+                            ),
 
-                        # DespuÃ©s de la secciÃ³n de bÃºsqueda, agrega:
-                        html.Hr(style={'margin': '30px 0', 'borderColor': '#2b2b2b'}),
+                            dcc.Input(
+                                id="doctor-search-input",
+                                type="text",
+                                placeholder="Nombre, usuario o email...",
+                                style={
+                                    'width': '100%',
+                                    'padding': '12px 15px',
+                                    'backgroundColor': '#2b2b2b',
+                                    'border': '1px solid #444',
+                                    'borderRadius': '8px',
+                                    'color': 'white',
+                                    'fontSize': '1rem',
+                                    'fontFamily': "'Inter', sans-serif",
+                                    'marginBottom': '15px'
+                                }
+                            ),
 
-                        # EstadÃ­sticas de pacientes
-                        html.Div(
-                            style={
-                                'backgroundColor': '#1a1a1a',
-                                'borderRadius': '10px',
-                                'padding': '20px',
-                                'marginBottom': '20px',
-                                'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)'
-                            },
-                            children=[
-                                html.H4(
-                                    "ðŸ“Š EstadÃ­sticas de Pacientes", 
-                                    style={
-                                        'color': HIGHLIGHT_COLOR, 
-                                        'marginBottom': '15px',
-                                        'fontSize': '1.3rem'
-                                    }
-                                ),
-                                html.Div(
-                                    style={
-                                        'display': 'grid',
-                                        'gridTemplateColumns': 'repeat(4, 1fr)',
-                                        'gap': '15px'
-                                    },
-                                    children=[
-                                        html.Div(
-                                            style={'textAlign': 'center'},
-                                            children=[
-                                                html.Div(
-                                                    id="doctor-patient-count", 
-                                                    style={
-                                                        'fontSize': '1.8rem', 
-                                                        'fontWeight': '700', 
-                                                        'color': HIGHLIGHT_COLOR,
-                                                        'marginBottom': '5px'
-                                                    }
-                                                ),
-                                                html.Div("Total", style={'color': '#ccc', 'fontSize': '0.9rem'})
-                                            ]
-                                        ),
-                                        html.Div(
-                                            style={'textAlign': 'center'},
-                                            children=[
-                                                html.Div(
-                                                    id="doctor-active-patients-count", 
-                                                    style={
-                                                        'fontSize': '1.8rem', 
-                                                        'fontWeight': '700', 
-                                                        'color': '#4ecdc4',
-                                                        'marginBottom': '5px'
-                                                    }
-                                                ),
-                                                html.Div("Activos", style={'color': '#ccc', 'fontSize': '0.9rem'})
-                                            ]
-                                        ),
-                                        html.Div(
-                                            style={'textAlign': 'center'},
-                                            children=[
-                                                html.Div(
-                                                    id="doctor-avg-activity", 
-                                                    style={
-                                                        'fontSize': '1.8rem', 
-                                                        'fontWeight': '700', 
-                                                        'color': '#ffd166',
-                                                        'marginBottom': '5px'
-                                                    }
-                                                ),
-                                                html.Div("Actividad Prom.", style={'color': '#ccc', 'fontSize': '0.9rem'})
-                                            ]
-                                        ),
-                                        html.Div(
-                                            style={'textAlign': 'center'},
-                                            children=[
-                                                html.Div(
-                                                    id="doctor-risk-patients", 
-                                                    style={
-                                                        'fontSize': '1.8rem', 
-                                                        'fontWeight': '700', 
-                                                        'color': '#ff6b6b',
-                                                        'marginBottom': '5px'
-                                                    }
-                                                ),
-                                                html.Div("En Riesgo", style={'color': '#ccc', 'fontSize': '0.9rem'})
-                                            ]
-                                        )
-                                    ]
-                                )
-                            ]
-                        ),
+                            html.Button(
+                                "Buscar",
+                                id="doctor-search-btn",
+                                n_clicks=0,
+                                style={
+                                    'width': '100%',
+                                    'padding': '12px',
+                                    'backgroundColor': HIGHLIGHT_COLOR,
+                                    'border': 'none',
+                                    'borderRadius': '8px',
+                                    'fontWeight': '600',
+                                    'color': '#0a0a0a',
+                                    'fontFamily': "'Inter', sans-serif",
+                                    'cursor': 'pointer',
+                                    'transition': 'all 0.3s ease',
+                                    'marginBottom': '20px'
+                                }
+                            ),
 
-                        html.H4(
-                            "Mis Pacientes", 
-                            style={
-                                'color': HIGHLIGHT_COLOR, 
-                                'marginTop': '30px',
-                                'marginBottom': '15px',
-                                'fontSize': '1.5rem'
-                            }
-                        ),
-                        html.Div(
-                            "AquÃ­ puedes ver a todos tus pacientes. Haz doble clic en cualquier tarjeta para ver sus datos detallados.",
-                            style={
-                                'color': '#ccc', 
-                                'marginBottom': '20px',
-                                'fontSize': '1rem'
-                            }
-                        ),
+                            html.Div(
+                                id="doctor-search-results", 
+                                style={
+                                    'marginTop': '20px',
+                                    'maxHeight': '300px',
+                                    'overflowY': 'auto'
+                                }
+                            )
+                        ]
+                    ),
 
-                        # Contenedor de pacientes (se llenarÃ¡ dinÃ¡micamente)
-                        html.Div(
-                            id="doctor-patients-grid",
-                            style={
-                                'display': 'grid',
-                                'gridTemplateColumns': 'repeat(auto-fill, minmax(350px, 1fr))',
-                                'gap': '20px',
-                                'marginTop': '20px'
-                            }
-                        ),
+                    # ===============================
+                    # MAIN CONTENT
+                    # ===============================
+                    html.Div(
+                        className="doctor-main",
+                        style={
+                            'flex': '1',
+                            'padding': '40px',
+                            'overflowY': 'auto'
+                        },
+                        children=[
+                            html.Div(
+                                style={
+                                    'display': 'flex',
+                                    'justifyContent': 'space-between',
+                                    'alignItems': 'center',
+                                    'marginBottom': '20px'
+                                },
+                                children=[
+                                    html.H2(
+                                        "Panel de Control MÃ©dico",
+                                        style={
+                                            'color': HIGHLIGHT_COLOR,
+                                            'margin': '0',
+                                            'fontSize': '2.2rem'
+                                        }
+                                    ),
+                                    html.Div(
+                                        children=f"Ãšltima actualizaciÃ³n: {datetime.now().strftime('%d/%m/%Y %H:%M')}",
+                                        style={'color': '#aaa', 'fontSize': '0.9rem'}
+                                    )
+                                ]
+                            ),
 
-                        # Div de debug (opcional, puedes comentarlo en producciÃ³n)
-                        html.Div(
-                            id="doctor-debug-info",
-                            style={
-                                'marginTop': '40px',
-                                'padding': '15px',
-                                'backgroundColor': 'rgba(0, 0, 0, 0.2)',
-                                'borderRadius': '8px',
-                                'border': '1px solid #444',
-                                'fontSize': '0.85rem'
-                            }
-                        )
-                    ]
-                )
-            ]
-        )
-    ]
-)
+                            html.P(
+                                "Bienvenido/a al panel de control mÃ©dico. AquÃ­ puedes gestionar tus pacientes, ver sus datos de salud y monitorizar su progreso.",
+                                style={
+                                    'color': '#ccc', 
+                                    'fontSize': '1.1rem',
+                                    'marginBottom': '30px',
+                                    'maxWidth': '800px'
+                                }
+                            ),
 
-# ===============================
-# BODY (SIDEBAR + MAIN)
-# ===============================
-html.Div(
- style={'display': 'flex'},
- children=[
+                            # DespuÃ©s de la secciÃ³n de bÃºsqueda, agrega:
+                            html.Hr(style={'margin': '30px 0', 'borderColor': '#2b2b2b'}),
 
-     # ===============================
+                            # EstadÃ­sticas de pacientes
+                            html.Div(
+                                style={
+                                    'backgroundColor': '#1a1a1a',
+                                    'borderRadius': '10px',
+                                    'padding': '20px',
+                                    'marginBottom': '20px',
+                                    'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                    'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)'
+                                },
+                                children=[
+                                    html.H4(
+                                        "ðŸ“Š EstadÃ­sticas de Pacientes", 
+                                        style={
+                                            'color': HIGHLIGHT_COLOR, 
+                                            'marginBottom': '15px',
+                                            'fontSize': '1.3rem'
+                                        }
+                                    ),
+                                    html.Div(
+                                        style={
+                                            'display': 'grid',
+                                            'gridTemplateColumns': 'repeat(4, 1fr)',
+                                            'gap': '15px'
+                                        },
+                                        children=[
+                                            html.Div(
+                                                style={'textAlign': 'center'},
+                                                children=[
+                                                    html.Div(
+                                                        id="doctor-patient-count", 
+                                                        style={
+                                                            'fontSize': '1.8rem', 
+                                                            'fontWeight': '700', 
+                                                            'color': HIGHLIGHT_COLOR,
+                                                            'marginBottom': '5px'
+                                                        }
+                                                    ),
+                                                    html.Div("Total", style={'color': '#ccc', 'fontSize': '0.9rem'})
+                                                ]
+                                            ),
+                                            html.Div(
+                                                style={'textAlign': 'center'},
+                                                children=[
+                                                    html.Div(
+                                                        id="doctor-active-patients-count", 
+                                                        style={
+                                                            'fontSize': '1.8rem', 
+                                                            'fontWeight': '700', 
+                                                            'color': '#4ecdc4',
+                                                            'marginBottom': '5px'
+                                                        }
+                                                    ),
+                                                    html.Div("Activos", style={'color': '#ccc', 'fontSize': '0.9rem'})
+                                                ]
+                                            ),
+                                            html.Div(
+                                                style={'textAlign': 'center'},
+                                                children=[
+                                                    html.Div(
+                                                        id="doctor-avg-activity", 
+                                                        style={
+                                                            'fontSize': '1.8rem', 
+                                                            'fontWeight': '700', 
+                                                            'color': '#ffd166',
+                                                            'marginBottom': '5px'
+                                                        }
+                                                    ),
+                                                    html.Div("Actividad Prom.", style={'color': '#ccc', 'fontSize': '0.9rem'})
+                                                ]
+                                            ),
+                                            html.Div(
+                                                style={'textAlign': 'center'},
+                                                children=[
+                                                    html.Div(
+                                                        id="doctor-risk-patients", 
+                                                        style={
+                                                            'fontSize': '1.8rem', 
+                                                            'fontWeight': '700', 
+                                                            'color': '#ff6b6b',
+                                                            'marginBottom': '5px'
+                                                        }
+                                                    ),
+                                                    html.Div("En Riesgo", style={'color': '#ccc', 'fontSize': '0.9rem'})
+                                                ]
+                                            )
+                                        ]
+                                    )
+                                ]
+                            ),
+
+                            html.H4(
+                                "Mis Pacientes", 
+                                style={
+                                    'color': HIGHLIGHT_COLOR, 
+                                    'marginTop': '30px',
+                                    'marginBottom': '15px',
+                                    'fontSize': '1.5rem'
+                                }
+                            ),
+                            html.Div(
+                                "AquÃ­ puedes ver a todos tus pacientes. Haz doble clic en cualquier tarjeta para ver sus datos detallados.",
+                                style={
+                                    'color': '#ccc', 
+                                    'marginBottom': '20px',
+                                    'fontSize': '1rem'
+                                }
+                            ),
+
+                            # Contenedor de pacientes (se llenarÃ¡ dinÃ¡micamente)
+                            html.Div(
+                                id="doctor-patients-grid",
+                                style={
+                                    'display': 'grid',
+                                    'gridTemplateColumns': 'repeat(auto-fill, minmax(350px, 1fr))',
+                                    'gap': '20px',
+                                    'marginTop': '20px'
+                                }
+                            ),
+
+                            # Div de debug (opcional, puedes comentarlo en producciÃ³n)
+                            html.Div(
+                                id="doctor-debug-info",
+                                style={
+                                    'marginTop': '40px',
+                                    'padding': '15px',
+                                    'backgroundColor': 'rgba(0, 0, 0, 0.2)',
+                                    'borderRadius': '8px',
+                                    'border': '1px solid #444',
+                                    'fontSize': '0.85rem'
+                                }
+                            )
+                        ]
+                    )
+                ]
+            )
+        ]
+    )
+
+# ===============================
+# BODY (SIDEBAR + MAIN)
+# ===============================
+html.Div(
+ style={'display': 'flex'},
+ children=[
+
+     # ===============================
      # SIDEBAR
      # ===============================
      html.Div(
@@ -3353,18 +3472,18 @@ def onboarding_step_2():
         dbc.Row([
             dbc.Col([
                 html.P("Estatura (cm)", className="text-white-50 mb-1"),
-                dcc.Input(id="input-height", type="number", placeholder="175", min=100, max=250, className="onboarding-input")
+                dcc.Input(id="input-height", type="number", placeholder="175", min=100, max=250, debounce=True, className="onboarding-input")
             ], md=6),
             dbc.Col([
                 html.P("Peso (kg)", className="text-white-50 mb-1"),
-                dcc.Input(id="input-weight", type="number", placeholder="65", min=30, max=300, className="onboarding-input")
+                dcc.Input(id="input-weight", type="number", placeholder="65", min=30, max=300, debounce=True, className="onboarding-input")
             ], md=6),
         ], className="mb-4"),
         
         dbc.Row([
             dbc.Col([
                 html.P("Edad (aÃ±os)", className="text-white-50 mb-1"),
-                dcc.Input(id="input-age", type="number", placeholder="28", min=1, max=100, className="onboarding-input")
+                dcc.Input(id="input-age", type="number", placeholder="28", min=1, max=100, debounce=True, className="onboarding-input")
             ], md=6),
             dbc.Col([
                 html.P("GÃ©nero", className="text-white-50 mb-1"),
@@ -3383,6 +3502,13 @@ def onboarding_step_2():
             ], md=6),
         ], className="mb-4"),
         
+        dbc.Row([
+            dbc.Col([
+                html.P("FC máxima medida (opcional)", className="text-white-50 mb-1"),
+                dcc.Input(id="input-max-hr", type="number", placeholder="190", min=120, max=230, debounce=True, className="onboarding-input")
+            ], md=6),
+        ], className="mb-4"),
+        
         html.Div(id="step-2-error", className="text-warning mb-3"),
     ], className="p-4")
 
@@ -3505,37 +3631,39 @@ def onboarding_step_5():
         html.Div(id="step-5-error", className="text-warning mb-3"),
     ], className="p-4")
 
-onboarding_layout = html.Div(
-    className="onboarding-container",
-    children=[
-        html.Div(
-            className="onboarding-card",
-            children=[
-                html.Div(
-                    className="onboarding-header",
-                    children=[
-                        html.H3(id="onboarding-current-step-title", className="step-title"),
-                        html.P(id="onboarding-current-step-subtitle", className="step-subtitle"),
-                        html.Div(className="progress-bar-container", children=[
-                            html.Div(id="onboarding-progress-bar", className="progress-bar", style={"width": "0%"})
-                        ]),
-                    ]
-                ),
+@lru_cache(maxsize=None)
+def onboarding_layout():
+    return html.Div(
+        className="onboarding-container",
+        children=[
+            html.Div(
+                className="onboarding-card",
+                children=[
+                    html.Div(
+                        className="onboarding-header",
+                        children=[
+                            html.H3(id="onboarding-current-step-title", className="step-title"),
+                            html.P(id="onboarding-current-step-subtitle", className="step-subtitle"),
+                            html.Div(className="progress-bar-container", children=[
+                                html.Div(id="onboarding-progress-bar", className="progress-bar", style={"width": "0%"})
+                            ]),
+                        ]
+                    ),
 
-                html.Div(id="onboarding-content"),
+                    html.Div(id="onboarding-content"),
 
-                html.Div(
-                    [
-                        dbc.Button("Anterior", id="onboarding-prev-btn-visual", color="secondary", outline=True, className="me-3"),
-                        dbc.Button("Siguiente", id="onboarding-next-btn-visual", color="primary", className="auth-btn"),
-                    ],
-                    className="d-flex justify-content-between mt-4", 
-                    id="onboarding-nav-container"
-                )
-            ]
-        ),
-    ]
-)
+                    html.Div(
+                        [
+                            dbc.Button("Anterior", id="onboarding-prev-btn-visual", color="secondary", outline=True, className="me-3"),
+                            dbc.Button("Siguiente", id="onboarding-next-btn-visual", color="primary", className="auth-btn"),
+                        ],
+                        className="d-flex justify-content-between mt-4", 
+                        id="onboarding-nav-container"
+                    )
+                ]
+            ),
+        ]
+    )
 
 # ===============================
 # FUNCIÃ“N PARA CREAR LAYOUT DE INICIO (VERSIÃ“N CORREGIDA)
@@ -4287,6 +4415,11 @@ def create_inicio_layout(show_doctor_indicator=False, patient_username=None):
                                                 config={'displayModeBar': False},
                                                 style={'height': '200px'}
                                             ),
+                                            # Refresco de la señal en vivo (1 Hz): sólo se activa, en el
+                                            # navegador, cuando el atleta tiene un wearable transmitiendo
+                                            dcc.Interval(id='ecg-live-interval', interval=1000, n_intervals=0, disabled=True),
+                                            dcc.Interval(id='ecg-live-probe', interval=10000, n_intervals=0),
+                                            dcc.Store(id='ecg-live-available', data=False),
                                             
                                             html.Div(
                                                 [
@@ -4319,6 +4452,28 @@ def create_inicio_layout(show_doctor_indicator=False, patient_username=None):
                                                     'backgroundColor': 'rgba(0, 212, 255, 0.1)',
                                                     'borderRadius': '8px'
                                                 }
+                                            ),
+                                            # Variabilidad de la frecuencia cardiaca de la grabación
+                                            html.Div(
+                                                "HRV: --",
+                                                id="hrv-summary",
+                                                style={
+                                                    'color': '#ccc',
+                                                    'fontSize': '0.85rem',
+                                                    'textAlign': 'center',
+                                                    'marginTop': '10px'
+                                                }
+                                            ),
+                                            # VO2máx estimado a partir de las sesiones (guardado por atleta)
+                                            html.Div(
+                                                "VO₂máx: --",
+                                                id="vo2max-summary",
+                                                style={
+                                                    'color': '#ccc',
+                                                    'fontSize': '0.85rem',
+                                                    'textAlign': 'center',
+                                                    'marginTop': '5px'
+                                                }
                                             )
                                         ]
                                     ),
@@ -4387,7 +4542,9 @@ def create_inicio_layout(show_doctor_indicator=False, patient_username=None):
     )
 
 # Layout por defecto (sin indicador mÃ©dico)
-inicio_layout = create_inicio_layout()
+@lru_cache(maxsize=None)
+def inicio_layout():
+    return create_inicio_layout()
 
 def create_patient_view_layout(patient_username):
     """Crea el layout para ver datos de un paciente especÃ­fico"""
@@ -4409,4082 +4566,4142 @@ def create_patient_view_layout(patient_username):
 # ===============================
 # MÃ‰TRICAS LAYOUT (SOLO GRÃFICAS AVANZADAS)
 # ===============================
-metricas_layout = html.Div(
-    id="metricas-container",
-    className="metricas-container",
-    style={
-        'backgroundColor': DARK_BACKGROUND,
-        'minHeight': '100vh',
-        'color': 'white',
-        'fontFamily': 'Inter, sans-serif'
-    },
-    children=[
-        html.Div(
-            id="metricas-header",
-            className="metricas-header",
-            style={
-                'backgroundColor': '#1a1a1a',
-                'padding': '15px 40px',
-                'borderBottom': '1px solid rgba(0, 212, 255, 0.1)',
-                'display': 'flex',
-                'justifyContent': 'space-between',
-                'alignItems': 'center'
-            },
-            children=[
-                html.Div(
-                    style={'display': 'flex', 'alignItems': 'center'},
-                    children=[
-                        html.Div(
-                            style={
-                                'width': '40px',
-                                'height': '40px',
-                                'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                'borderRadius': '10px',
-                                'border': f'2px solid {HIGHLIGHT_COLOR}',
-                                'display': 'flex',
-                                'alignItems': 'center',
-                                'justifyContent': 'center',
-                                'marginRight': '15px'
-                            },
-                            children=html.Span("A", style={'color': HIGHLIGHT_COLOR, 'fontWeight': 'bold', 'fontSize': '1.2rem'})
-                        ),
-                        html.H1(
-                            "ATHLETICA",
-                            style={
-                                'color': HIGHLIGHT_COLOR,
-                                'fontSize': '1.8rem',
-                                'fontWeight': '900',
-                                'letterSpacing': '2px',
-                                'textShadow': f'0 0 15px rgba(0, 224, 255, 0.5)',
-                                'margin': '0'
-                            }
-                        )
-                    ]
-                ),
+@lru_cache(maxsize=None)
+def metricas_layout():
+    return html.Div(
+        id="metricas-container",
+        className="metricas-container",
+        style={
+            'backgroundColor': DARK_BACKGROUND,
+            'minHeight': '100vh',
+            'color': 'white',
+            'fontFamily': 'Inter, sans-serif'
+        },
+        children=[
+            html.Div(
+                id="metricas-header",
+                className="metricas-header",
+                style={
+                    'backgroundColor': '#1a1a1a',
+                    'padding': '15px 40px',
+                    'borderBottom': '1px solid rgba(0, 212, 255, 0.1)',
+                    'display': 'flex',
+                    'justifyContent': 'space-between',
+                    'alignItems': 'center'
+                },
+                children=[
+                    html.Div(
+                        style={'display': 'flex', 'alignItems': 'center'},
+                        children=[
+                            html.Div(
+                                style={
+                                    'width': '40px',
+                                    'height': '40px',
+                                    'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                    'borderRadius': '10px',
+                                    'border': f'2px solid {HIGHLIGHT_COLOR}',
+                                    'display': 'flex',
+                                    'alignItems': 'center',
+                                    'justifyContent': 'center',
+                                    'marginRight': '15px'
+                                },
+                                children=html.Span("A", style={'color': HIGHLIGHT_COLOR, 'fontWeight': 'bold', 'fontSize': '1.2rem'})
+                            ),
+                            html.H1(
+                                "ATHLETICA",
+                                style={
+                                    'color': HIGHLIGHT_COLOR,
+                                    'fontSize': '1.8rem',
+                                    'fontWeight': '900',
+                                    'letterSpacing': '2px',
+                                    'textShadow': f'0 0 15px rgba(0, 224, 255, 0.5)',
+                                    'margin': '0'
+                                }
+                            )
+                        ]
+                    ),
                 
-                html.Div(
-                    style={
-                        'flex': '1',
-                        'height': '1px',
-                        'backgroundColor': 'rgba(0, 212, 255, 0.2)',
-                        'margin': '0 30px'
-                    }
-                ),
+                    html.Div(
+                        style={
+                            'flex': '1',
+                            'height': '1px',
+                            'backgroundColor': 'rgba(0, 212, 255, 0.2)',
+                            'margin': '0 30px'
+                        }
+                    ),
                 
-                html.Div(
-                    style={'display': 'flex', 'alignItems': 'center', 'gap': '20px'},
-                    children=[
-                        html.Div(
-                            style={
-                                'display': 'flex',
-                                'alignItems': 'center',
-                                'gap': '10px',
-                                'cursor': 'pointer'
-                            },
-                            children=[
-                                html.Div(
-                                    id="metricas-user-profile-avatar",
-                                    style={
-                                        'width': '45px',
-                                        'height': '45px',
-                                        'backgroundColor': HIGHLIGHT_COLOR,
-                                        'borderRadius': '50%',
-                                        'border': f'2px solid {HIGHLIGHT_COLOR}',
-                                        'display': 'flex',
-                                        'alignItems': 'center',
-                                        'justifyContent': 'center',
-                                        'color': '#0a0a0a',
-                                        'fontWeight': 'bold',
-                                        'fontSize': '1.2rem'
-                                    }
-                                ),
-                                html.Div(
-                                    style={'textAlign': 'right'},
-                                    children=[
-                                        html.Div(
-                                            id="metricas-user-profile-name",
-                                            style={
-                                                'fontWeight': '600',
-                                                'fontSize': '1rem',
-                                                'color': '#fff'
-                                            }
-                                        ),
-                                        html.Div(
-                                            "Atleta",
-                                            style={
-                                                'fontSize': '0.8rem',
-                                                'color': HIGHLIGHT_COLOR,
-                                                'fontWeight': '500'
-                                            }
-                                        )
-                                    ]
-                                )
-                            ]
-                        ),
-                    ]
-                )
-            ]
-        ),
+                    html.Div(
+                        style={'display': 'flex', 'alignItems': 'center', 'gap': '20px'},
+                        children=[
+                            html.Div(
+                                style={
+                                    'display': 'flex',
+                                    'alignItems': 'center',
+                                    'gap': '10px',
+                                    'cursor': 'pointer'
+                                },
+                                children=[
+                                    html.Div(
+                                        id={"type": "user-profile-avatar", "page": "metricas"},
+                                        style={
+                                            'width': '45px',
+                                            'height': '45px',
+                                            'backgroundColor': HIGHLIGHT_COLOR,
+                                            'borderRadius': '50%',
+                                            'border': f'2px solid {HIGHLIGHT_COLOR}',
+                                            'display': 'flex',
+                                            'alignItems': 'center',
+                                            'justifyContent': 'center',
+                                            'color': '#0a0a0a',
+                                            'fontWeight': 'bold',
+                                            'fontSize': '1.2rem'
+                                        }
+                                    ),
+                                    html.Div(
+                                        style={'textAlign': 'right'},
+                                        children=[
+                                            html.Div(
+                                                id={"type": "user-profile-name", "page": "metricas"},
+                                                style={
+                                                    'fontWeight': '600',
+                                                    'fontSize': '1rem',
+                                                    'color': '#fff'
+                                                }
+                                            ),
+                                            html.Div(
+                                                "Atleta",
+                                                style={
+                                                    'fontSize': '0.8rem',
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'fontWeight': '500'
+                                                }
+                                            )
+                                        ]
+                                    )
+                                ]
+                            ),
+                        ]
+                    )
+                ]
+            ),
 
-        html.Div(
-            style={
-                'display': 'flex',
-                'minHeight': 'calc(100vh - 100px)'
-            },
-            children=[
-                html.Div(
-                    id="metricas-sidebar",
-                    className="metricas-sidebar",
-                    style={
-                        'width': '280px',
-                        'backgroundColor': '#141414',
-                        'padding': '25px 20px',
-                        'borderRight': '1px solid rgba(0, 212, 255, 0.1)',
-                        'display': 'flex',
-                        'flexDirection': 'column',
-                        'gap': '30px'
-                    },
-                    children=[
-                        html.Div(
-                            style={
-                                'padding': '20px',
-                                'backgroundColor': '#1a1a1a',
-                                'borderRadius': '15px',
-                                'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                'textAlign': 'center'
-                            },
-                            children=[
-                                html.Div(
-                                    id="metricas-sidebar-user-avatar",
-                                    style={
-                                        'width': '70px',
-                                        'height': '70px',
-                                        'backgroundColor': HIGHLIGHT_COLOR,
-                                        'borderRadius': '50%',
-                                        'border': f'3px solid {HIGHLIGHT_COLOR}',
-                                        'display': 'flex',
-                                        'alignItems': 'center',
-                                        'justifyContent': 'center',
-                                        'color': '#0a0a0a',
-                                        'fontWeight': 'bold',
-                                        'fontSize': '1.8rem',
-                                        'margin': '0 auto 15px'
-                                    }
-                                ),
+            html.Div(
+                style={
+                    'display': 'flex',
+                    'minHeight': 'calc(100vh - 100px)'
+                },
+                children=[
+                    html.Div(
+                        id="metricas-sidebar",
+                        className="metricas-sidebar",
+                        style={
+                            'width': '280px',
+                            'backgroundColor': '#141414',
+                            'padding': '25px 20px',
+                            'borderRight': '1px solid rgba(0, 212, 255, 0.1)',
+                            'display': 'flex',
+                            'flexDirection': 'column',
+                            'gap': '30px'
+                        },
+                        children=[
+                            html.Div(
+                                style={
+                                    'padding': '20px',
+                                    'backgroundColor': '#1a1a1a',
+                                    'borderRadius': '15px',
+                                    'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                    'textAlign': 'center'
+                                },
+                                children=[
+                                    html.Div(
+                                        id={"type": "sidebar-user-avatar", "page": "metricas"},
+                                        style={
+                                            'width': '70px',
+                                            'height': '70px',
+                                            'backgroundColor': HIGHLIGHT_COLOR,
+                                            'borderRadius': '50%',
+                                            'border': f'3px solid {HIGHLIGHT_COLOR}',
+                                            'display': 'flex',
+                                            'alignItems': 'center',
+                                            'justifyContent': 'center',
+                                            'color': '#0a0a0a',
+                                            'fontWeight': 'bold',
+                                            'fontSize': '1.8rem',
+                                            'margin': '0 auto 15px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="metricas-sidebar-user-fullname",
-                                    style={
-                                        'fontSize': '1.3rem',
-                                        'fontWeight': '700',
-                                        'color': '#ffffff',
-                                        'marginBottom': '5px'
-                                    }
-                                ),
+                                    html.Div(
+                                        id={"type": "sidebar-user-fullname", "page": "metricas"},
+                                        style={
+                                            'fontSize': '1.3rem',
+                                            'fontWeight': '700',
+                                            'color': '#ffffff',
+                                            'marginBottom': '5px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="metricas-sidebar-user-level",
-                                    style={
-                                        'fontSize': '0.9rem',
-                                        'color': HIGHLIGHT_COLOR,
-                                        'fontWeight': '500',
-                                        'marginBottom': '20px'
-                                    }
-                                ),
+                                    html.Div(
+                                        id={"type": "sidebar-user-level", "page": "metricas"},
+                                        style={
+                                            'fontSize': '0.9rem',
+                                            'color': HIGHLIGHT_COLOR,
+                                            'fontWeight': '500',
+                                            'marginBottom': '20px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    style={
-                                        'height': '1px',
-                                        'backgroundColor': 'rgba(255, 255, 255, 0.1)',
-                                        'margin': '15px 0'
-                                    }
-                                ),
+                                    html.Div(
+                                        style={
+                                            'height': '1px',
+                                            'backgroundColor': 'rgba(255, 255, 255, 0.1)',
+                                            'margin': '15px 0'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    "Estado de Salud",
-                                    style={
-                                        'fontSize': '1rem',
-                                        'fontWeight': '600',
-                                        'color': '#ffffff',
-                                        'marginBottom': '15px',
-                                        'textAlign': 'center'
-                                    }
-                                ),
+                                    html.Div(
+                                        "Estado de Salud",
+                                        style={
+                                            'fontSize': '1rem',
+                                            'fontWeight': '600',
+                                            'color': '#ffffff',
+                                            'marginBottom': '15px',
+                                            'textAlign': 'center'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="metricas-health-status-dots",
-                                    style={
-                                        'display': 'flex',
-                                        'justifyContent': 'center',
-                                        'gap': '8px',
-                                        'marginBottom': '12px'
-                                    }
-                                ),
+                                    html.Div(
+                                        id={"type": "health-status-dots", "page": "metricas"},
+                                        style={
+                                            'display': 'flex',
+                                            'justifyContent': 'center',
+                                            'gap': '8px',
+                                            'marginBottom': '12px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="metricas-health-status-description",
-                                    style={
-                                        'fontSize': '0.8rem',
-                                        'color': '#cccccc',
-                                        'textAlign': 'center',
-                                        'lineHeight': '1.4'
-                                    }
-                                )
-                            ]
-                        ),
+                                    html.Div(
+                                        id={"type": "health-status-description", "page": "metricas"},
+                                        style={
+                                            'fontSize': '0.8rem',
+                                            'color': '#cccccc',
+                                            'textAlign': 'center',
+                                            'lineHeight': '1.4'
+                                        }
+                                    )
+                                ]
+                            ),
                         
-                        html.Div(
-                            children=[
-                                html.H4(
-                                    "NavegaciÃ³n",
-                                    style={
-                                        'color': HIGHLIGHT_COLOR,
-                                        'marginBottom': '20px',
-                                        'marginTop': '25px',
-                                        'fontSize': '1.1rem',
-                                        'fontWeight': '600',
-                                        'paddingLeft': '10px'
-                                    }
-                                ),
-                                html.Div(
-                                    style={'display': 'flex', 'flexDirection': 'column', 'gap': '8px'},
-                                    children=[
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-house-door", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("Inicio", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-inicio-metricas",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
-                                        
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-graph-up", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("MÃ©tricas", style={'fontSize': '0.95rem', 'fontWeight': '500'})
-                                            ],
-                                            id="nav-metricas-metricas",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': f'1px solid {HIGHLIGHT_COLOR}',
-                                                'color': HIGHLIGHT_COLOR,
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
-                                        
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-bullseye", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("Objetivos", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-objetivos-metricas",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                            html.Div(
+                                children=[
+                                    html.H4(
+                                        "NavegaciÃ³n",
+                                        style={
+                                            'color': HIGHLIGHT_COLOR,
+                                            'marginBottom': '20px',
+                                            'marginTop': '25px',
+                                            'fontSize': '1.1rem',
+                                            'fontWeight': '600',
+                                            'paddingLeft': '10px'
+                                        }
+                                    ),
+                                    html.Div(
+                                        style={'display': 'flex', 'flexDirection': 'column', 'gap': '8px'},
+                                        children=[
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-house-door", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("Inicio", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-inicio-metricas",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
                                         
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-egg-fried", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("NutriciÃ³n", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-nutricion-metricas",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-graph-up", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("MÃ©tricas", style={'fontSize': '0.95rem', 'fontWeight': '500'})
+                                                ],
+                                                id="nav-metricas-metricas",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': f'1px solid {HIGHLIGHT_COLOR}',
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
+                                        
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-bullseye", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("Objetivos", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-objetivos-metricas",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
+                                        
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-egg-fried", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("NutriciÃ³n", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-nutricion-metricas",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
 
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-activity", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("Entrenamientos", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-entrenamientos-metricas",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-activity", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("Entrenamientos", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-entrenamientos-metricas",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
                                         
-                                    ]
-                                )
-                            ]
-                        )
-                    ]
-                ),
+                                        ]
+                                    )
+                                ]
+                            )
+                        ]
+                    ),
                 
-                # CONTENIDO PRINCIPAL PARA MÃ‰TRICAS (SOLO GRÃFICAS AVANZADAS)
-                html.Div(
-                    className="metricas-main",
-                    style={
-                        'flex': '1',
-                        'padding': '30px',
-                        'display': 'flex',
-                        'flexDirection': 'column',
-                        'gap': '25px',
-                        'overflowY': 'auto'
-                    },
-                    children=[
-                        # Header de mÃ©tricas
-                        html.Div(
-                            style={
-                                'display': 'flex',
-                                'justifyContent': 'space-between',
-                                'alignItems': 'center',
-                                'marginBottom': '10px'
-                            },
-                            children=[
-                                html.H2(
-                                    "AnÃ¡lisis de Rendimiento",
-                                    style={
-                                        'color': HIGHLIGHT_COLOR,
-                                        'fontSize': '2rem',
-                                        'fontWeight': '700',
-                                        'margin': '0'
-                                    }
-                                ),
-                                html.Div(
-                                    style={
-                                        'color': '#ccc',
-                                        'fontSize': '1rem'
-                                    },
-                                    children=f"Ãšltima actualizaciÃ³n: {datetime.now().strftime('%d/%m/%Y %H:%M')}"
-                                )
-                            ]
-                        ),
+                    # CONTENIDO PRINCIPAL PARA MÃ‰TRICAS (SOLO GRÃFICAS AVANZADAS)
+                    html.Div(
+                        className="metricas-main",
+                        style={
+                            'flex': '1',
+                            'padding': '30px',
+                            'display': 'flex',
+                            'flexDirection': 'column',
+                            'gap': '25px',
+                            'overflowY': 'auto'
+                        },
+                        children=[
+                            # Header de mÃ©tricas
+                            html.Div(
+                                style={
+                                    'display': 'flex',
+                                    'justifyContent': 'space-between',
+                                    'alignItems': 'center',
+                                    'marginBottom': '10px'
+                                },
+                                children=[
+                                    html.H2(
+                                        "AnÃ¡lisis de Rendimiento",
+                                        style={
+                                            'color': HIGHLIGHT_COLOR,
+                                            'fontSize': '2rem',
+                                            'fontWeight': '700',
+                                            'margin': '0'
+                                        }
+                                    ),
+                                    html.Div(
+                                        style={
+                                            'color': '#ccc',
+                                            'fontSize': '1rem'
+                                        },
+                                        children=f"Ãšltima actualizaciÃ³n: {datetime.now().strftime('%d/%m/%Y %H:%M')}"
+                                    )
+                                ]
+                            ),
                         
-                        # DescripciÃ³n
-                        html.P(
-                            "AnÃ¡lisis avanzado de mÃ©tricas deportivas utilizando inteligencia artificial para optimizar el rendimiento atlÃ©tico.",
-                            style={
-                                'color': '#ccc', 
-                                'fontSize': '1.1rem',
-                                'marginBottom': '30px',
-                                'maxWidth': '800px'
-                            }
-                        ),
+                            # DescripciÃ³n
+                            html.P(
+                                "AnÃ¡lisis avanzado de mÃ©tricas deportivas utilizando inteligencia artificial para optimizar el rendimiento atlÃ©tico.",
+                                style={
+                                    'color': '#ccc', 
+                                    'fontSize': '1.1rem',
+                                    'marginBottom': '30px',
+                                    'maxWidth': '800px'
+                                }
+                            ),
                         
-                        # PRIMERA GRÃFICA IMPRESIONANTE: AnÃ¡lisis de Intensidad vs RecuperaciÃ³n
-                        html.Div(
-                            style={
-                                'backgroundColor': '#1a1a1a',
-                                'borderRadius': '15px',
-                                'padding': '30px',
-                                'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                'boxShadow': '0 8px 30px rgba(0, 0, 0, 0.4)',
-                                'marginBottom': '25px'
-                            },
-                            children=[
-                                html.Div(
-                                    style={
-                                        'display': 'flex',
-                                        'justifyContent': 'space-between',
-                                        'alignItems': 'center',
-                                        'marginBottom': '20px'
-                                    },
-                                    children=[
-                                        html.H3(
-                                            "ðŸ“ˆ AnÃ¡lisis de Intensidad vs RecuperaciÃ³n",
-                                            style={
-                                                'color': HIGHLIGHT_COLOR,
-                                                'margin': '0',
-                                                'fontSize': '1.5rem'
-                                            }
-                                        ),
-                                        html.Div(
-                                            "Ãšltimos 30 dÃ­as",
-                                            style={
-                                                'color': '#ccc',
-                                                'fontSize': '0.9rem',
-                                                'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                                'padding': '8px 15px',
-                                                'borderRadius': '20px',
-                                                'fontWeight': '500'
-                                            }
-                                        )
-                                    ]
-                                ),
+                            # PRIMERA GRÃFICA IMPRESIONANTE: AnÃ¡lisis de Intensidad vs RecuperaciÃ³n
+                            html.Div(
+                                style={
+                                    'backgroundColor': '#1a1a1a',
+                                    'borderRadius': '15px',
+                                    'padding': '30px',
+                                    'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                    'boxShadow': '0 8px 30px rgba(0, 0, 0, 0.4)',
+                                    'marginBottom': '25px'
+                                },
+                                children=[
+                                    html.Div(
+                                        style={
+                                            'display': 'flex',
+                                            'justifyContent': 'space-between',
+                                            'alignItems': 'center',
+                                            'marginBottom': '20px'
+                                        },
+                                        children=[
+                                            html.H3(
+                                                "ðŸ“ˆ AnÃ¡lisis de Intensidad vs RecuperaciÃ³n",
+                                                style={
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'margin': '0',
+                                                    'fontSize': '1.5rem'
+                                                }
+                                            ),
+                                            html.Div(
+                                                "Ãšltimos 30 dÃ­as",
+                                                style={
+                                                    'color': '#ccc',
+                                                    'fontSize': '0.9rem',
+                                                    'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                                    'padding': '8px 15px',
+                                                    'borderRadius': '20px',
+                                                    'fontWeight': '500'
+                                                }
+                                            )
+                                        ]
+                                    ),
                                 
-                                html.P(
-                                    "RelaciÃ³n entre dÃ­as de entrenamiento de alta intensidad y dÃ­as de recuperaciÃ³n activa. "
-                                    "El equilibrio Ã³ptimo garantiza progreso sin sobreentrenamiento.",
-                                    style={'color': '#aaa', 'marginBottom': '25px', 'fontSize': '1rem'}
-                                ),
+                                    html.P(
+                                        "RelaciÃ³n entre dÃ­as de entrenamiento de alta intensidad y dÃ­as de recuperaciÃ³n activa. "
+                                        "El equilibrio Ã³ptimo garantiza progreso sin sobreentrenamiento.",
+                                        style={'color': '#aaa', 'marginBottom': '25px', 'fontSize': '1rem'}
+                                    ),
                                 
-                                # GRÃFICA 1 CON CONFIGURACIÃ“N SIMPLIFICADA
-                                dcc.Graph(
-                                    id='intensity-recovery-chart',
-                                    config={
-                                        'displayModeBar': True,
-                                        'displaylogo': False,
-                                        'modeBarButtons': [
-                                            ['zoom2d'],  # Solo botÃ³n de zoom
-                                            ['toImage']  # Solo botÃ³n de descargar
-                                        ],
-                                        'toImageButtonOptions': {
-                                            'format': 'png',
-                                            'filename': 'intensidad_recuperacion',
-                                            'height': 600,
-                                            'width': 1000,
-                                            'scale': 1
-                                        }
-                                    },
-                                    style={'height': '400px'}
-                                ),
+                                    # GRÃFICA 1 CON CONFIGURACIÃ“N SIMPLIFICADA
+                                    dcc.Graph(
+                                        id='intensity-recovery-chart',
+                                        config={
+                                            'displayModeBar': True,
+                                            'displaylogo': False,
+                                            'modeBarButtons': [
+                                                ['zoom2d'],  # Solo botÃ³n de zoom
+                                                ['toImage']  # Solo botÃ³n de descargar
+                                            ],
+                                            'toImageButtonOptions': {
+                                                'format': 'png',
+                                                'filename': 'intensidad_recuperacion',
+                                                'height': 600,
+                                                'width': 1000,
+                                                'scale': 1
+                                            }
+                                        },
+                                        style={'height': '400px'}
+                                    ),
                                 
-                                html.Div(
-                                    style={
-                                        'display': 'flex',
-                                        'justifyContent': 'space-between',
-                                        'marginTop': '20px',
-                                        'flexWrap': 'wrap',
-                                        'gap': '15px'
-                                    },
-                                    children=[
-                                        html.Div(
-                                            style={
-                                                'textAlign': 'center',
-                                                'padding': '15px',
-                                                'backgroundColor': 'rgba(0, 212, 255, 0.08)',
-                                                'borderRadius': '12px',
-                                                'flex': '1',
-                                                'minWidth': '200px'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    "87%",
-                                                    style={
-                                                        'fontSize': '2.5rem',
-                                                        'fontWeight': '700',
-                                                        'color': HIGHLIGHT_COLOR,
-                                                        'marginBottom': '5px'
-                                                    }
-                                                ),
-                                                html.Div(
-                                                    "Eficiencia de RecuperaciÃ³n",
-                                                    style={'color': '#ccc', 'fontSize': '0.9rem'}
-                                                )
-                                            ]
-                                        ),
-                                        html.Div(
-                                            style={
-                                                'textAlign': 'center',
-                                                'padding': '15px',
-                                                'backgroundColor': 'rgba(0, 212, 255, 0.08)',
-                                                'borderRadius': '12px',
-                                                'flex': '1',
-                                                'minWidth': '200px'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    "2.4%",
-                                                    style={
-                                                        'fontSize': '2.5rem',
-                                                        'fontWeight': '700',
-                                                        'color': '#4ecdc4',
-                                                        'marginBottom': '5px'
-                                                    }
-                                                ),
-                                                html.Div(
-                                                    "Mejora Semanal Promedio",
-                                                    style={'color': '#ccc', 'fontSize': '0.9rem'}
-                                                )
-                                            ]
-                                        ),
-                                        html.Div(
-                                            style={
-                                                'textAlign': 'center',
-                                                'padding': '15px',
-                                                'backgroundColor': 'rgba(0, 212, 255, 0.08)',
-                                                'borderRadius': '12px',
-                                                'flex': '1',
-                                                'minWidth': '200px'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    "15",
-                                                    style={
-                                                        'fontSize': '2.5rem',
-                                                        'fontWeight': '700',
-                                                        'color': '#ffd166',
-                                                        'marginBottom': '5px'
-                                                    }
-                                                ),
-                                                html.Div(
-                                                    "DÃ­as Ã“ptimos Consecutivos",
-                                                    style={'color': '#ccc', 'fontSize': '0.9rem'}
-                                                )
-                                            ]
-                                        )
-                                    ]
-                                )
-                            ]
-                        ),
+                                    html.Div(
+                                        style={
+                                            'display': 'flex',
+                                            'justifyContent': 'space-between',
+                                            'marginTop': '20px',
+                                            'flexWrap': 'wrap',
+                                            'gap': '15px'
+                                        },
+                                        children=[
+                                            html.Div(
+                                                style={
+                                                    'textAlign': 'center',
+                                                    'padding': '15px',
+                                                    'backgroundColor': 'rgba(0, 212, 255, 0.08)',
+                                                    'borderRadius': '12px',
+                                                    'flex': '1',
+                                                    'minWidth': '200px'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        "87%",
+                                                        style={
+                                                            'fontSize': '2.5rem',
+                                                            'fontWeight': '700',
+                                                            'color': HIGHLIGHT_COLOR,
+                                                            'marginBottom': '5px'
+                                                        }
+                                                    ),
+                                                    html.Div(
+                                                        "Eficiencia de RecuperaciÃ³n",
+                                                        style={'color': '#ccc', 'fontSize': '0.9rem'}
+                                                    )
+                                                ]
+                                            ),
+                                            html.Div(
+                                                style={
+                                                    'textAlign': 'center',
+                                                    'padding': '15px',
+                                                    'backgroundColor': 'rgba(0, 212, 255, 0.08)',
+                                                    'borderRadius': '12px',
+                                                    'flex': '1',
+                                                    'minWidth': '200px'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        "2.4%",
+                                                        style={
+                                                            'fontSize': '2.5rem',
+                                                            'fontWeight': '700',
+                                                            'color': '#4ecdc4',
+                                                            'marginBottom': '5px'
+                                                        }
+                                                    ),
+                                                    html.Div(
+                                                        "Mejora Semanal Promedio",
+                                                        style={'color': '#ccc', 'fontSize': '0.9rem'}
+                                                    )
+                                                ]
+                                            ),
+                                            html.Div(
+                                                style={
+                                                    'textAlign': 'center',
+                                                    'padding': '15px',
+                                                    'backgroundColor': 'rgba(0, 212, 255, 0.08)',
+                                                    'borderRadius': '12px',
+                                                    'flex': '1',
+                                                    'minWidth': '200px'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        "15",
+                                                        style={
+                                                            'fontSize': '2.5rem',
+                                                            'fontWeight': '700',
+                                                            'color': '#ffd166',
+                                                            'marginBottom': '5px'
+                                                        }
+                                                    ),
+                                                    html.Div(
+                                                        "DÃ­as Ã“ptimos Consecutivos",
+                                                        style={'color': '#ccc', 'fontSize': '0.9rem'}
+                                                    )
+                                                ]
+                                            )
+                                        ]
+                                    )
+                                ]
+                            ),
                         
-                        # SEGUNDA Y TERCERA GRÃFICA: Lado a lado
-                        html.Div(
-                            style={
-                                'display': 'grid',
-                                'gridTemplateColumns': 'repeat(2, 1fr)',
-                                'gap': '25px',
-                                'marginBottom': '25px'
-                            },
-                            children=[
-                                # SEGUNDA GRÃFICA: Heatmap de Rendimiento Semanal
-                                html.Div(
-                                    style={
-                                        'backgroundColor': '#1a1a1a',
-                                        'borderRadius': '15px',
-                                        'padding': '30px',
-                                        'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                        'boxShadow': '0 8px 30px rgba(0, 0, 0, 0.4)'
-                                    },
-                                    children=[
-                                        html.H3(
-                                            "ðŸ”¥ Heatmap de Rendimiento Semanal",
-                                            style={
-                                                'color': HIGHLIGHT_COLOR,
-                                                'margin': '0 0 15px 0',
-                                                'fontSize': '1.4rem'
-                                            }
-                                        ),
-                                        
-                                        html.P(
-                                            "DistribuciÃ³n de intensidad a lo largo de la semana. Los colores mÃ¡s cÃ¡lidos indican mayor intensidad de entrenamiento.",
-                                            style={'color': '#aaa', 'marginBottom': '25px', 'fontSize': '0.95rem'}
-                                        ),
-                                        
-                                        # GRÃFICA 2 CON CONFIGURACIÃ“N SIMPLIFICADA
-                                        dcc.Graph(
-                                            id='performance-heatmap',
-                                            config={
-                                                'displayModeBar': True,
-                                                'displaylogo': False,
-                                                'modeBarButtons': [
-                                                    ['zoom2d'],  # Solo botÃ³n de zoom
-                                                    ['toImage']  # Solo botÃ³n de descargar
-                                                ],
-                                                'toImageButtonOptions': {
-                                                    'format': 'png',
-                                                    'filename': 'heatmap_rendimiento',
-                                                    'height': 500,
-                                                    'width': 800,
-                                                    'scale': 1
+                            # SEGUNDA Y TERCERA GRÃFICA: Lado a lado
+                            html.Div(
+                                style={
+                                    'display': 'grid',
+                                    'gridTemplateColumns': 'repeat(2, 1fr)',
+                                    'gap': '25px',
+                                    'marginBottom': '25px'
+                                },
+                                children=[
+                                    # SEGUNDA GRÃFICA: Heatmap de Rendimiento Semanal
+                                    html.Div(
+                                        style={
+                                            'backgroundColor': '#1a1a1a',
+                                            'borderRadius': '15px',
+                                            'padding': '30px',
+                                            'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                            'boxShadow': '0 8px 30px rgba(0, 0, 0, 0.4)'
+                                        },
+                                        children=[
+                                            html.H3(
+                                                "ðŸ”¥ Heatmap de Rendimiento Semanal",
+                                                style={
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'margin': '0 0 15px 0',
+                                                    'fontSize': '1.4rem'
                                                 }
-                                            },
-                                            style={'height': '350px'}
-                                        ),
+                                            ),
                                         
-                                        html.Div(
-                                            style={
-                                                'display': 'flex',
-                                                'justifyContent': 'center',
-                                                'gap': '20px',
-                                                'marginTop': '20px'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    style={'display': 'flex', 'alignItems': 'center', 'gap': '8px'},
-                                                    children=[
-                                                        html.Div(style={
-                                                            'width': '20px',
-                                                            'height': '20px',
-                                                            'backgroundColor': '#0a2a38',
-                                                            'borderRadius': '4px'
-                                                        }),
-                                                        html.Span("Baja Intensidad", style={'color': '#ccc', 'fontSize': '0.9rem'})
-                                                    ]
-                                                ),
-                                                html.Div(
-                                                    style={'display': 'flex', 'alignItems': 'center', 'gap': '8px'},
-                                                    children=[
-                                                        html.Div(style={
-                                                            'width': '20px',
-                                                            'height': '20px',
-                                                            'backgroundColor': '#006d8f',
-                                                            'borderRadius': '4px'
-                                                        }),
-                                                        html.Span("Media", style={'color': '#ccc', 'fontSize': '0.9rem'})
-                                                    ]
-                                                ),
-                                                html.Div(
-                                                    style={'display': 'flex', 'alignItems': 'center', 'gap': '8px'},
-                                                    children=[
-                                                        html.Div(style={
-                                                            'width': '20px',
-                                                            'height': '20px',
-                                                            'backgroundColor': HIGHLIGHT_COLOR,
-                                                            'borderRadius': '4px'
-                                                        }),
-                                                        html.Span("Alta Intensidad", style={'color': '#ccc', 'fontSize': '0.9rem'})
-                                                    ]
-                                                )
-                                            ]
-                                        )
-                                    ]
-                                ),
-                                
-                                # TERCERA GRÃFICA: Radar de Competencias AtlÃ©ticas
-                                html.Div(
-                                    style={
-                                        'backgroundColor': '#1a1a1a',
-                                        'borderRadius': '15px',
-                                        'padding': '30px',
-                                        'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                        'boxShadow': '0 8px 30px rgba(0, 0, 0, 0.4)'
-                                    },
-                                    children=[
-                                        html.H3(
-                                            "ðŸŽ¯ Radar de Competencias AtlÃ©ticas",
-                                            style={
-                                                'color': HIGHLIGHT_COLOR,
-                                                'margin': '0 0 15px 0',
-                                                'fontSize': '1.4rem'
-                                            }
-                                        ),
+                                            html.P(
+                                                "DistribuciÃ³n de intensidad a lo largo de la semana. Los colores mÃ¡s cÃ¡lidos indican mayor intensidad de entrenamiento.",
+                                                style={'color': '#aaa', 'marginBottom': '25px', 'fontSize': '0.95rem'}
+                                            ),
                                         
-                                        html.P(
-                                            "Perfil completo de capacidades fÃ­sicas comparado con atletas de Ã©lite de tu categorÃ­a.",
-                                            style={'color': '#aaa', 'marginBottom': '25px', 'fontSize': '0.95rem'}
-                                        ),
+                                            # GRÃFICA 2 CON CONFIGURACIÃ“N SIMPLIFICADA
+                                            dcc.Graph(
+                                                id='performance-heatmap',
+                                                config={
+                                                    'displayModeBar': True,
+                                                    'displaylogo': False,
+                                                    'modeBarButtons': [
+                                                        ['zoom2d'],  # Solo botÃ³n de zoom
+                                                        ['toImage']  # Solo botÃ³n de descargar
+                                                    ],
+                                                    'toImageButtonOptions': {
+                                                        'format': 'png',
+                                                        'filename': 'heatmap_rendimiento',
+                                                        'height': 500,
+                                                        'width': 800,
+                                                        'scale': 1
+                                                    }
+                                                },
+                                                style={'height': '350px'}
+                                            ),
                                         
-                                        # GRÃFICA 3 CON CONFIGURACIÃ“N SIMPLIFICADA
-                                        dcc.Graph(
-                                            id='athletic-radar-chart',
-                                            config={
-                                                'displayModeBar': True,
-                                                'displaylogo': False,
-                                                'modeBarButtons': [
-                                                    ['zoom2d'],  # Solo botÃ³n de zoom
-                                                    ['toImage']  # Solo botÃ³n de descargar
-                                                ],
-                                                'toImageButtonOptions': {
-                                                    'format': 'png',
-                                                    'filename': 'radar_competencias',
-                                                    'height': 500,
-                                                    'width': 800,
-                                                    'scale': 1
+                                            html.Div(
+                                                style={
+                                                    'display': 'flex',
+                                                    'justifyContent': 'center',
+                                                    'gap': '20px',
+                                                    'marginTop': '20px'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        style={'display': 'flex', 'alignItems': 'center', 'gap': '8px'},
+                                                        children=[
+                                                            html.Div(style={
+                                                                'width': '20px',
+                                                                'height': '20px',
+                                                                'backgroundColor': '#0a2a38',
+                                                                'borderRadius': '4px'
+                                                            }),
+                                                            html.Span("Baja Intensidad", style={'color': '#ccc', 'fontSize': '0.9rem'})
+                                                        ]
+                                                    ),
+                                                    html.Div(
+                                                        style={'display': 'flex', 'alignItems': 'center', 'gap': '8px'},
+                                                        children=[
+                                                            html.Div(style={
+                                                                'width': '20px',
+                                                                'height': '20px',
+                                                                'backgroundColor': '#006d8f',
+                                                                'borderRadius': '4px'
+                                                            }),
+                                                            html.Span("Media", style={'color': '#ccc', 'fontSize': '0.9rem'})
+                                                        ]
+                                                    ),
+                                                    html.Div(
+                                                        style={'display': 'flex', 'alignItems': 'center', 'gap': '8px'},
+                                                        children=[
+                                                            html.Div(style={
+                                                                'width': '20px',
+                                                                'height': '20px',
+                                                                'backgroundColor': HIGHLIGHT_COLOR,
+                                                                'borderRadius': '4px'
+                                                            }),
+                                                            html.Span("Alta Intensidad", style={'color': '#ccc', 'fontSize': '0.9rem'})
+                                                        ]
+                                                    )
+                                                ]
+                                            )
+                                        ]
+                                    ),
+                                
+                                    # TERCERA GRÃFICA: Radar de Competencias AtlÃ©ticas
+                                    html.Div(
+                                        style={
+                                            'backgroundColor': '#1a1a1a',
+                                            'borderRadius': '15px',
+                                            'padding': '30px',
+                                            'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                            'boxShadow': '0 8px 30px rgba(0, 0, 0, 0.4)'
+                                        },
+                                        children=[
+                                            html.H3(
+                                                "ðŸŽ¯ Radar de Competencias AtlÃ©ticas",
+                                                style={
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'margin': '0 0 15px 0',
+                                                    'fontSize': '1.4rem'
                                                 }
-                                            },
-                                            style={'height': '350px'}
-                                        ),
+                                            ),
                                         
-                                        html.Div(
-                                            style={
-                                                'display': 'flex',
-                                                'justifyContent': 'space-between',
-                                                'marginTop': '20px'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    style={'textAlign': 'center'},
-                                                    children=[
-                                                        html.Div(
-                                                            "92%",
-                                                            style={
-                                                                'fontSize': '1.8rem',
-                                                                'fontWeight': '700',
-                                                                'color': '#4ecdc4',
-                                                                'marginBottom': '5px'
-                                                            }
-                                                        ),
-                                                        html.Div(
-                                                            "Resistencia",
-                                                            style={'color': '#ccc', 'fontSize': '0.9rem'}
-                                                        )
-                                                    ]
-                                                ),
-                                                html.Div(
-                                                    style={'textAlign': 'center'},
-                                                    children=[
-                                                        html.Div(
-                                                            "88%",
-                                                            style={
-                                                                'fontSize': '1.8rem',
-                                                                'fontWeight': '700',
-                                                                'color': '#ffd166',
-                                                                'marginBottom': '5px'
-                                                            }
-                                                        ),
-                                                        html.Div(
-                                                            "Fuerza",
-                                                            style={'color': '#ccc', 'fontSize': '0.9rem'}
-                                                        )
-                                                    ]
-                                                ),
-                                                html.Div(
-                                                    style={'textAlign': 'center'},
-                                                    children=[
-                                                        html.Div(
-                                                            "95%",
-                                                            style={
-                                                                'fontSize': '1.8rem',
-                                                                'fontWeight': '700',
-                                                                'color': HIGHLIGHT_COLOR,
-                                                                'marginBottom': '5px'
-                                                            }
-                                                        ),
-                                                        html.Div(
-                                                            "Velocidad",
-                                                            style={'color': '#ccc', 'fontSize': '0.9rem'}
-                                                        )
-                                                    ]
-                                                )
-                                            ]
-                                        )
-                                    ]
-                                )
-                            ]
-                        ),
-                        
-                        # Insights generados por IA
-                        html.Div(
-                            style={
-                                'backgroundColor': '#1a1a1a',
-                                'borderRadius': '15px',
-                                'padding': '30px',
-                                'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                'boxShadow': '0 8px 30px rgba(0, 0, 0, 0.4)'
-                            },
-                            children=[
-                                html.H3(
-                                    "ðŸ¤– Insights Generados por IA",
-                                    style={
-                                        'color': HIGHLIGHT_COLOR,
-                                        'margin': '0 0 20px 0',
-                                        'fontSize': '1.5rem'
-                                    }
-                                ),
-                                
-                                html.Div(
-                                    style={
-                                        'display': 'grid',
-                                        'gridTemplateColumns': 'repeat(3, 1fr)',
-                                        'gap': '20px'
-                                    },
-                                    children=[
-                                        html.Div(
-                                            style={
-                                                'padding': '20px',
-                                                'backgroundColor': 'rgba(0, 212, 255, 0.05)',
-                                                'borderRadius': '12px',
-                                                'borderLeft': f'4px solid {HIGHLIGHT_COLOR}'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    style={
-                                                        'display': 'flex',
-                                                        'alignItems': 'center',
-                                                        'gap': '10px',
-                                                        'marginBottom': '10px'
-                                                    },
-                                                    children=[
-                                                        html.I(className="bi bi-lightning-charge", style={'color': HIGHLIGHT_COLOR, 'fontSize': '1.2rem'}),
-                                                        html.H4(
-                                                            "Pico de Rendimiento",
-                                                            style={'color': '#fff', 'margin': '0', 'fontSize': '1.1rem'}
-                                                        )
-                                                    ]
-                                                ),
-                                                html.P(
-                                                    "Tu mejor momento de entrenamiento es entre 18:00-20:00 hrs. La potencia mÃ¡xima aumenta un 15% en esta ventana.",
-                                                    style={'color': '#ccc', 'fontSize': '0.95rem', 'lineHeight': '1.5'}
-                                                )
-                                            ]
-                                        ),
+                                            html.P(
+                                                "Perfil completo de capacidades fÃ­sicas comparado con atletas de Ã©lite de tu categorÃ­a.",
+                                                style={'color': '#aaa', 'marginBottom': '25px', 'fontSize': '0.95rem'}
+                                            ),
                                         
-                                        html.Div(
-                                            style={
-                                                'padding': '20px',
-                                                'backgroundColor': 'rgba(78, 205, 196, 0.05)',
-                                                'borderRadius': '12px',
-                                                'borderLeft': '4px solid #4ecdc4'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    style={
-                                                        'display': 'flex',
-                                                        'alignItems': 'center',
-                                                        'gap': '10px',
-                                                        'marginBottom': '10px'
-                                                    },
-                                                    children=[
-                                                        html.I(className="bi bi-shield-check", style={'color': '#4ecdc4', 'fontSize': '1.2rem'}),
-                                                        html.H4(
-                                                            "RecuperaciÃ³n Ã“ptima",
-                                                            style={'color': '#fff', 'margin': '0', 'fontSize': '1.1rem'}
-                                                        )
-                                                    ]
-                                                ),
-                                                html.P(
-                                                    "El sueÃ±o profundo ha aumentado un 22% tras ajustar el horario de entrenamiento vespertino.",
-                                                    style={'color': '#ccc', 'fontSize': '0.95rem', 'lineHeight': '1.5'}
-                                                )
-                                            ]
-                                        ),
+                                            # GRÃFICA 3 CON CONFIGURACIÃ“N SIMPLIFICADA
+                                            dcc.Graph(
+                                                id='athletic-radar-chart',
+                                                config={
+                                                    'displayModeBar': True,
+                                                    'displaylogo': False,
+                                                    'modeBarButtons': [
+                                                        ['zoom2d'],  # Solo botÃ³n de zoom
+                                                        ['toImage']  # Solo botÃ³n de descargar
+                                                    ],
+                                                    'toImageButtonOptions': {
+                                                        'format': 'png',
+                                                        'filename': 'radar_competencias',
+                                                        'height': 500,
+                                                        'width': 800,
+                                                        'scale': 1
+                                                    }
+                                                },
+                                                style={'height': '350px'}
+                                            ),
                                         
-                                        html.Div(
-                                            style={
-                                                'padding': '20px',
-                                                'backgroundColor': 'rgba(255, 209, 102, 0.05)',
-                                                'borderRadius': '12px',
-                                                'borderLeft': '4px solid #ffd166'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    style={
-                                                        'display': 'flex',
-                                                        'alignItems': 'center',
-                                                        'gap': '10px',
-                                                        'marginBottom': '10px'
-                                                    },
-                                                    children=[
-                                                        html.I(className="bi bi-graph-up-arrow", style={'color': '#ffd166', 'fontSize': '1.2rem'}),
-                                                        html.H4(
-                                                            "ProyecciÃ³n",
-                                                            style={'color': '#fff', 'margin': '0', 'fontSize': '1.1rem'}
-                                                        )
-                                                    ]
-                                                ),
-                                                html.P(
-                                                    "Con la progresiÃ³n actual, alcanzarÃ¡s el percentil 95 de atletas de tu categorÃ­a en 6 semanas.",
-                                                    style={'color': '#ccc', 'fontSize': '0.95rem', 'lineHeight': '1.5'}
-                                                )
-                                            ]
-                                        )
-                                    ]
-                                )
-                            ]
-                        )
-                    ]
-                )
-            ]
-        )
-    ]
-)
+                                            html.Div(
+                                                style={
+                                                    'display': 'flex',
+                                                    'justifyContent': 'space-between',
+                                                    'marginTop': '20px'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        style={'textAlign': 'center'},
+                                                        children=[
+                                                            html.Div(
+                                                                "92%",
+                                                                style={
+                                                                    'fontSize': '1.8rem',
+                                                                    'fontWeight': '700',
+                                                                    'color': '#4ecdc4',
+                                                                    'marginBottom': '5px'
+                                                                }
+                                                            ),
+                                                            html.Div(
+                                                                "Resistencia",
+                                                                style={'color': '#ccc', 'fontSize': '0.9rem'}
+                                                            )
+                                                        ]
+                                                    ),
+                                                    html.Div(
+                                                        style={'textAlign': 'center'},
+                                                        children=[
+                                                            html.Div(
+                                                                "88%",
+                                                                style={
+                                                                    'fontSize': '1.8rem',
+                                                                    'fontWeight': '700',
+                                                                    'color': '#ffd166',
+                                                                    'marginBottom': '5px'
+                                                                }
+                                                            ),
+                                                            html.Div(
+                                                                "Fuerza",
+                                                                style={'color': '#ccc', 'fontSize': '0.9rem'}
+                                                            )
+                                                        ]
+                                                    ),
+                                                    html.Div(
+                                                        style={'textAlign': 'center'},
+                                                        children=[
+                                                            html.Div(
+                                                                "95%",
+                                                                style={
+                                                                    'fontSize': '1.8rem',
+                                                                    'fontWeight': '700',
+                                                                    'color': HIGHLIGHT_COLOR,
+                                                                    'marginBottom': '5px'
+                                                                }
+                                                            ),
+                                                            html.Div(
+                                                                "Velocidad",
+                                                                style={'color': '#ccc', 'fontSize': '0.9rem'}
+                                                            )
+                                                        ]
+                                                    )
+                                                ]
+                                            )
+                                        ]
+                                    )
+                                ]
+                            ),
+                        
+                            # Tiempo en zonas cardíacas (totales diarios precalculados)
+                            html.Div(
+                                style={
+                                    'backgroundColor': '#1a1a1a',
+                                    'borderRadius': '15px',
+                                    'padding': '30px',
+                                    'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                    'boxShadow': '0 8px 30px rgba(0, 0, 0, 0.4)',
+                                    'marginBottom': '25px'
+                                },
+                                children=[
+                                    html.Div(
+                                        style={
+                                            'display': 'flex',
+                                            'justifyContent': 'space-between',
+                                            'alignItems': 'center',
+                                            'marginBottom': '20px'
+                                        },
+                                        children=[
+                                            html.H3(
+                                                "❤️ Tiempo en Zonas Cardíacas",
+                                                style={
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'margin': '0',
+                                                    'fontSize': '1.5rem'
+                                                }
+                                            ),
+                                            dbc.RadioItems(
+                                                id='hr-zones-range',
+                                                options=[
+                                                    {'label': 'Semana', 'value': 7},
+                                                    {'label': 'Mes', 'value': 30},
+                                                ],
+                                                value=7,
+                                                inline=True,
+                                                inputStyle={"marginRight": "8px"},
+                                                labelStyle={"fontSize": "0.9rem", "color": "#ccc", "marginRight": "15px"}
+                                            )
+                                        ]
+                                    ),
+                                    html.P(
+                                        "Minutos por día en cada zona según tu frecuencia cardíaca máxima (Z1 50-60 % … Z5 ≥ 90 %).",
+                                        style={'color': '#aaa', 'marginBottom': '25px', 'fontSize': '1rem'}
+                                    ),
+                                    dcc.Graph(
+                                        id='hr-zones-chart',
+                                        config={'displayModeBar': False},
+                                        style={'height': '320px'}
+                                    )
+                                ]
+                            ),
+                        
+                            # Insights generados por IA
+                            html.Div(
+                                style={
+                                    'backgroundColor': '#1a1a1a',
+                                    'borderRadius': '15px',
+                                    'padding': '30px',
+                                    'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                    'boxShadow': '0 8px 30px rgba(0, 0, 0, 0.4)'
+                                },
+                                children=[
+                                    html.H3(
+                                        "ðŸ¤– Insights Generados por IA",
+                                        style={
+                                            'color': HIGHLIGHT_COLOR,
+                                            'margin': '0 0 20px 0',
+                                            'fontSize': '1.5rem'
+                                        }
+                                    ),
+                                
+                                    html.Div(
+                                        style={
+                                            'display': 'grid',
+                                            'gridTemplateColumns': 'repeat(3, 1fr)',
+                                            'gap': '20px'
+                                        },
+                                        children=[
+                                            html.Div(
+                                                style={
+                                                    'padding': '20px',
+                                                    'backgroundColor': 'rgba(0, 212, 255, 0.05)',
+                                                    'borderRadius': '12px',
+                                                    'borderLeft': f'4px solid {HIGHLIGHT_COLOR}'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        style={
+                                                            'display': 'flex',
+                                                            'alignItems': 'center',
+                                                            'gap': '10px',
+                                                            'marginBottom': '10px'
+                                                        },
+                                                        children=[
+                                                            html.I(className="bi bi-lightning-charge", style={'color': HIGHLIGHT_COLOR, 'fontSize': '1.2rem'}),
+                                                            html.H4(
+                                                                "Pico de Rendimiento",
+                                                                style={'color': '#fff', 'margin': '0', 'fontSize': '1.1rem'}
+                                                            )
+                                                        ]
+                                                    ),
+                                                    html.P(
+                                                        "Tu mejor momento de entrenamiento es entre 18:00-20:00 hrs. La potencia mÃ¡xima aumenta un 15% en esta ventana.",
+                                                        style={'color': '#ccc', 'fontSize': '0.95rem', 'lineHeight': '1.5'}
+                                                    )
+                                                ]
+                                            ),
+                                        
+                                            html.Div(
+                                                style={
+                                                    'padding': '20px',
+                                                    'backgroundColor': 'rgba(78, 205, 196, 0.05)',
+                                                    'borderRadius': '12px',
+                                                    'borderLeft': '4px solid #4ecdc4'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        style={
+                                                            'display': 'flex',
+                                                            'alignItems': 'center',
+                                                            'gap': '10px',
+                                                            'marginBottom': '10px'
+                                                        },
+                                                        children=[
+                                                            html.I(className="bi bi-shield-check", style={'color': '#4ecdc4', 'fontSize': '1.2rem'}),
+                                                            html.H4(
+                                                                "RecuperaciÃ³n Ã“ptima",
+                                                                style={'color': '#fff', 'margin': '0', 'fontSize': '1.1rem'}
+                                                            )
+                                                        ]
+                                                    ),
+                                                    html.P(
+                                                        "El sueÃ±o profundo ha aumentado un 22% tras ajustar el horario de entrenamiento vespertino.",
+                                                        style={'color': '#ccc', 'fontSize': '0.95rem', 'lineHeight': '1.5'}
+                                                    )
+                                                ]
+                                            ),
+                                        
+                                            html.Div(
+                                                style={
+                                                    'padding': '20px',
+                                                    'backgroundColor': 'rgba(255, 209, 102, 0.05)',
+                                                    'borderRadius': '12px',
+                                                    'borderLeft': '4px solid #ffd166'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        style={
+                                                            'display': 'flex',
+                                                            'alignItems': 'center',
+                                                            'gap': '10px',
+                                                            'marginBottom': '10px'
+                                                        },
+                                                        children=[
+                                                            html.I(className="bi bi-graph-up-arrow", style={'color': '#ffd166', 'fontSize': '1.2rem'}),
+                                                            html.H4(
+                                                                "ProyecciÃ³n",
+                                                                style={'color': '#fff', 'margin': '0', 'fontSize': '1.1rem'}
+                                                            )
+                                                        ]
+                                                    ),
+                                                    html.P(
+                                                        "Con la progresiÃ³n actual, alcanzarÃ¡s el percentil 95 de atletas de tu categorÃ­a en 6 semanas.",
+                                                        style={'color': '#ccc', 'fontSize': '0.95rem', 'lineHeight': '1.5'}
+                                                    )
+                                                ]
+                                            )
+                                        ]
+                                    )
+                                ]
+                            )
+                        ]
+                    )
+                ]
+            )
+        ]
+    )
 
 # ===============================
 # OBJETIVOS LAYOUT 
 # ===============================
 
-objetivos_layout = html.Div(
-    id="objetivos-container",
-    className="objetivos-container",
-    style={
-        'backgroundColor': DARK_BACKGROUND,
-        'minHeight': '100vh',
-        'color': 'white',
-        'fontFamily': 'Inter, sans-serif'
-    },
-    children=[
-        # Header (igual que en inicio)
-        html.Div(
-            id="objetivos-header",
-            className="objetivos-header",
-            style={
-                'backgroundColor': '#1a1a1a',
-                'padding': '15px 40px',
-                'borderBottom': '1px solid rgba(0, 212, 255, 0.1)',
-                'display': 'flex',
-                'justifyContent': 'space-between',
-                'alignItems': 'center'
-            },
-            children=[
-                html.Div(
-                    style={'display': 'flex', 'alignItems': 'center'},
-                    children=[
-                        html.Div(
-                            style={
-                                'width': '40px',
-                                'height': '40px',
-                                'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                'borderRadius': '10px',
-                                'border': f'2px solid {HIGHLIGHT_COLOR}',
-                                'display': 'flex',
-                                'alignItems': 'center',
-                                'justifyContent': 'center',
-                                'marginRight': '15px'
-                            },
-                            children=html.Span("A", style={'color': HIGHLIGHT_COLOR, 'fontWeight': 'bold', 'fontSize': '1.2rem'})
-                        ),
-                        html.H1(
-                            "ATHLETICA",
-                            style={
-                                'color': HIGHLIGHT_COLOR,
-                                'fontSize': '1.8rem',
-                                'fontWeight': '900',
-                                'letterSpacing': '2px',
-                                'textShadow': f'0 0 15px rgba(0, 224, 255, 0.5)',
-                                'margin': '0'
-                            }
-                        )
-                    ]
-                ),
+@lru_cache(maxsize=None)
+def objetivos_layout():
+    return html.Div(
+        id="objetivos-container",
+        className="objetivos-container",
+        style={
+            'backgroundColor': DARK_BACKGROUND,
+            'minHeight': '100vh',
+            'color': 'white',
+            'fontFamily': 'Inter, sans-serif'
+        },
+        children=[
+            # Header (igual que en inicio)
+            html.Div(
+                id="objetivos-header",
+                className="objetivos-header",
+                style={
+                    'backgroundColor': '#1a1a1a',
+                    'padding': '15px 40px',
+                    'borderBottom': '1px solid rgba(0, 212, 255, 0.1)',
+                    'display': 'flex',
+                    'justifyContent': 'space-between',
+                    'alignItems': 'center'
+                },
+                children=[
+                    html.Div(
+                        style={'display': 'flex', 'alignItems': 'center'},
+                        children=[
+                            html.Div(
+                                style={
+                                    'width': '40px',
+                                    'height': '40px',
+                                    'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                    'borderRadius': '10px',
+                                    'border': f'2px solid {HIGHLIGHT_COLOR}',
+                                    'display': 'flex',
+                                    'alignItems': 'center',
+                                    'justifyContent': 'center',
+                                    'marginRight': '15px'
+                                },
+                                children=html.Span("A", style={'color': HIGHLIGHT_COLOR, 'fontWeight': 'bold', 'fontSize': '1.2rem'})
+                            ),
+                            html.H1(
+                                "ATHLETICA",
+                                style={
+                                    'color': HIGHLIGHT_COLOR,
+                                    'fontSize': '1.8rem',
+                                    'fontWeight': '900',
+                                    'letterSpacing': '2px',
+                                    'textShadow': f'0 0 15px rgba(0, 224, 255, 0.5)',
+                                    'margin': '0'
+                                }
+                            )
+                        ]
+                    ),
                 
-                html.Div(
-                    style={
-                        'flex': '1',
-                        'height': '1px',
-                        'backgroundColor': 'rgba(0, 212, 255, 0.2)',
-                        'margin': '0 30px'
-                    }
-                ),
+                    html.Div(
+                        style={
+                            'flex': '1',
+                            'height': '1px',
+                            'backgroundColor': 'rgba(0, 212, 255, 0.2)',
+                            'margin': '0 30px'
+                        }
+                    ),
                 
-                html.Div(
-                    style={'display': 'flex', 'alignItems': 'center', 'gap': '20px'},
-                    children=[
-                        html.Div(
-                            style={
-                                'display': 'flex',
-                                'alignItems': 'center',
-                                'gap': '10px',
-                                'cursor': 'pointer'
-                            },
-                            children=[
-                                html.Div(
-                                    id="objetivos-user-profile-avatar",
-                                    style={
-                                        'width': '45px',
-                                        'height': '45px',
-                                        'backgroundColor': HIGHLIGHT_COLOR,
-                                        'borderRadius': '50%',
-                                        'border': f'2px solid {HIGHLIGHT_COLOR}',
-                                        'display': 'flex',
-                                        'alignItems': 'center',
-                                        'justifyContent': 'center',
-                                        'color': '#0a0a0a',
-                                        'fontWeight': 'bold',
-                                        'fontSize': '1.2rem'
-                                    }
-                                ),
-                                html.Div(
-                                    style={'textAlign': 'right'},
-                                    children=[
-                                        html.Div(
-                                            id="objetivos-user-profile-name",
-                                            style={
-                                                'fontWeight': '600',
-                                                'fontSize': '1rem',
-                                                'color': '#fff'
-                                            }
-                                        ),
-                                        html.Div(
-                                            "Atleta",
-                                            style={
-                                                'fontSize': '0.8rem',
-                                                'color': HIGHLIGHT_COLOR,
-                                                'fontWeight': '500'
-                                            }
-                                        )
-                                    ]
-                                )
-                            ]
-                        ),
-                    ]
-                )
-            ]
-        ),
+                    html.Div(
+                        style={'display': 'flex', 'alignItems': 'center', 'gap': '20px'},
+                        children=[
+                            html.Div(
+                                style={
+                                    'display': 'flex',
+                                    'alignItems': 'center',
+                                    'gap': '10px',
+                                    'cursor': 'pointer'
+                                },
+                                children=[
+                                    html.Div(
+                                        id={"type": "user-profile-avatar", "page": "objetivos"},
+                                        style={
+                                            'width': '45px',
+                                            'height': '45px',
+                                            'backgroundColor': HIGHLIGHT_COLOR,
+                                            'borderRadius': '50%',
+                                            'border': f'2px solid {HIGHLIGHT_COLOR}',
+                                            'display': 'flex',
+                                            'alignItems': 'center',
+                                            'justifyContent': 'center',
+                                            'color': '#0a0a0a',
+                                            'fontWeight': 'bold',
+                                            'fontSize': '1.2rem'
+                                        }
+                                    ),
+                                    html.Div(
+                                        style={'textAlign': 'right'},
+                                        children=[
+                                            html.Div(
+                                                id={"type": "user-profile-name", "page": "objetivos"},
+                                                style={
+                                                    'fontWeight': '600',
+                                                    'fontSize': '1rem',
+                                                    'color': '#fff'
+                                                }
+                                            ),
+                                            html.Div(
+                                                "Atleta",
+                                                style={
+                                                    'fontSize': '0.8rem',
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'fontWeight': '500'
+                                                }
+                                            )
+                                        ]
+                                    )
+                                ]
+                            ),
+                        ]
+                    )
+                ]
+            ),
 
-        # Cuerpo principal con sidebar y contenido
-        html.Div(
-            style={
-                'display': 'flex',
-                'minHeight': 'calc(100vh - 100px)'
-            },
-            children=[
-                # Sidebar (igual que en inicio)
-                html.Div(
-                    id="objetivos-sidebar",
-                    className="objetivos-sidebar",
-                    style={
-                        'width': '280px',
-                        'backgroundColor': '#141414',
-                        'padding': '25px 20px',
-                        'borderRight': '1px solid rgba(0, 212, 255, 0.1)',
-                        'display': 'flex',
-                        'flexDirection': 'column',
-                        'gap': '30px'
-                    },
-                    children=[
-                        html.Div(
-                            style={
-                                'padding': '20px',
-                                'backgroundColor': '#1a1a1a',
-                                'borderRadius': '15px',
-                                'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                'textAlign': 'center'
-                            },
-                            children=[
-                                html.Div(
-                                    id="objetivos-sidebar-user-avatar",
-                                    style={
-                                        'width': '70px',
-                                        'height': '70px',
-                                        'backgroundColor': HIGHLIGHT_COLOR,
-                                        'borderRadius': '50%',
-                                        'border': f'3px solid {HIGHLIGHT_COLOR}',
-                                        'display': 'flex',
-                                        'alignItems': 'center',
-                                        'justifyContent': 'center',
-                                        'color': '#0a0a0a',
-                                        'fontWeight': 'bold',
-                                        'fontSize': '1.8rem',
-                                        'margin': '0 auto 15px'
-                                    }
-                                ),
+            # Cuerpo principal con sidebar y contenido
+            html.Div(
+                style={
+                    'display': 'flex',
+                    'minHeight': 'calc(100vh - 100px)'
+                },
+                children=[
+                    # Sidebar (igual que en inicio)
+                    html.Div(
+                        id="objetivos-sidebar",
+                        className="objetivos-sidebar",
+                        style={
+                            'width': '280px',
+                            'backgroundColor': '#141414',
+                            'padding': '25px 20px',
+                            'borderRight': '1px solid rgba(0, 212, 255, 0.1)',
+                            'display': 'flex',
+                            'flexDirection': 'column',
+                            'gap': '30px'
+                        },
+                        children=[
+                            html.Div(
+                                style={
+                                    'padding': '20px',
+                                    'backgroundColor': '#1a1a1a',
+                                    'borderRadius': '15px',
+                                    'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                    'textAlign': 'center'
+                                },
+                                children=[
+                                    html.Div(
+                                        id={"type": "sidebar-user-avatar", "page": "objetivos"},
+                                        style={
+                                            'width': '70px',
+                                            'height': '70px',
+                                            'backgroundColor': HIGHLIGHT_COLOR,
+                                            'borderRadius': '50%',
+                                            'border': f'3px solid {HIGHLIGHT_COLOR}',
+                                            'display': 'flex',
+                                            'alignItems': 'center',
+                                            'justifyContent': 'center',
+                                            'color': '#0a0a0a',
+                                            'fontWeight': 'bold',
+                                            'fontSize': '1.8rem',
+                                            'margin': '0 auto 15px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="objetivos-sidebar-user-fullname",
-                                    style={
-                                        'fontSize': '1.3rem',
-                                        'fontWeight': '700',
-                                        'color': '#ffffff',
-                                        'marginBottom': '5px'
-                                    }
-                                ),
+                                    html.Div(
+                                        id={"type": "sidebar-user-fullname", "page": "objetivos"},
+                                        style={
+                                            'fontSize': '1.3rem',
+                                            'fontWeight': '700',
+                                            'color': '#ffffff',
+                                            'marginBottom': '5px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="objetivos-sidebar-user-level",
-                                    style={
-                                        'fontSize': '0.9rem',
-                                        'color': HIGHLIGHT_COLOR,
-                                        'fontWeight': '500',
-                                        'marginBottom': '20px'
-                                    }
-                                ),
+                                    html.Div(
+                                        id={"type": "sidebar-user-level", "page": "objetivos"},
+                                        style={
+                                            'fontSize': '0.9rem',
+                                            'color': HIGHLIGHT_COLOR,
+                                            'fontWeight': '500',
+                                            'marginBottom': '20px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    style={
-                                        'height': '1px',
-                                        'backgroundColor': 'rgba(255, 255, 255, 0.1)',
-                                        'margin': '15px 0'
-                                    }
-                                ),
+                                    html.Div(
+                                        style={
+                                            'height': '1px',
+                                            'backgroundColor': 'rgba(255, 255, 255, 0.1)',
+                                            'margin': '15px 0'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    "Estado de Salud",
-                                    style={
-                                        'fontSize': '1rem',
-                                        'fontWeight': '600',
-                                        'color': '#ffffff',
-                                        'marginBottom': '15px',
-                                        'textAlign': 'center'
-                                    }
-                                ),
+                                    html.Div(
+                                        "Estado de Salud",
+                                        style={
+                                            'fontSize': '1rem',
+                                            'fontWeight': '600',
+                                            'color': '#ffffff',
+                                            'marginBottom': '15px',
+                                            'textAlign': 'center'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="objetivos-health-status-dots",
-                                    style={
-                                        'display': 'flex',
-                                        'justifyContent': 'center',
-                                        'gap': '8px',
-                                        'marginBottom': '12px'
-                                    }
-                                ),
+                                    html.Div(
+                                        id={"type": "health-status-dots", "page": "objetivos"},
+                                        style={
+                                            'display': 'flex',
+                                            'justifyContent': 'center',
+                                            'gap': '8px',
+                                            'marginBottom': '12px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="objetivos-health-status-description",
-                                    style={
-                                        'fontSize': '0.8rem',
-                                        'color': '#cccccc',
-                                        'textAlign': 'center',
-                                        'lineHeight': '1.4'
-                                    }
-                                )
-                            ]
-                        ),
+                                    html.Div(
+                                        id={"type": "health-status-description", "page": "objetivos"},
+                                        style={
+                                            'fontSize': '0.8rem',
+                                            'color': '#cccccc',
+                                            'textAlign': 'center',
+                                            'lineHeight': '1.4'
+                                        }
+                                    )
+                                ]
+                            ),
                         
-                        # NavegaciÃ³n
-                        html.Div(
-                            children=[
-                                html.H4(
-                                    "NavegaciÃ³n",
-                                    style={
-                                        'color': HIGHLIGHT_COLOR,
-                                        'marginBottom': '20px',
-                                        'marginTop': '25px',
-                                        'fontSize': '1.1rem',
-                                        'fontWeight': '600',
-                                        'paddingLeft': '10px'
-                                    }
-                                ),
-                                html.Div(
-                                    style={'display': 'flex', 'flexDirection': 'column', 'gap': '8px'},
-                                    children=[
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-house-door", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("Inicio", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-inicio-objetivos",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                            # NavegaciÃ³n
+                            html.Div(
+                                children=[
+                                    html.H4(
+                                        "NavegaciÃ³n",
+                                        style={
+                                            'color': HIGHLIGHT_COLOR,
+                                            'marginBottom': '20px',
+                                            'marginTop': '25px',
+                                            'fontSize': '1.1rem',
+                                            'fontWeight': '600',
+                                            'paddingLeft': '10px'
+                                        }
+                                    ),
+                                    html.Div(
+                                        style={'display': 'flex', 'flexDirection': 'column', 'gap': '8px'},
+                                        children=[
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-house-door", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("Inicio", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-inicio-objetivos",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
                                         
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-graph-up", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("MÃ©tricas", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-metricas-objetivos",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-graph-up", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("MÃ©tricas", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-metricas-objetivos",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
                                         
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-bullseye", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("Objetivos", style={'fontSize': '0.95rem', 'fontWeight': '500'})
-                                            ],
-                                            id="nav-objetivos-objetivos",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': f'1px solid {HIGHLIGHT_COLOR}',
-                                                'color': HIGHLIGHT_COLOR,
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-bullseye", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("Objetivos", style={'fontSize': '0.95rem', 'fontWeight': '500'})
+                                                ],
+                                                id="nav-objetivos-objetivos",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': f'1px solid {HIGHLIGHT_COLOR}',
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
                                         
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-egg-fried", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("NutriciÃ³n", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-nutricion-objetivos",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-egg-fried", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("NutriciÃ³n", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-nutricion-objetivos",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
                                         
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-activity", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("Entrenamientos", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-entrenamientos-objetivos",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-activity", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("Entrenamientos", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-entrenamientos-objetivos",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
                                         
-                                    ]
-                                )
-                            ]
-                        )
-                    ]
-                ),
+                                        ]
+                                    )
+                                ]
+                            )
+                        ]
+                    ),
                 
-                # CONTENIDO PRINCIPAL DE OBJETIVOS
-                html.Div(
-                    className="objetivos-main",
-                    style={
-                        'flex': '1',
-                        'padding': '40px',
-                        'display': 'flex',
-                        'flexDirection': 'column',
-                        'gap': '30px',
-                        'overflowY': 'auto'
-                    },
-                    children=[
-                        # TÃ­tulo principal
-                        html.Div(
-                            style={
-                                'display': 'flex',
-                                'justifyContent': 'space-between',
-                                'alignItems': 'center',
-                                'marginBottom': '10px'
-                            },
-                            children=[
-                                html.H2(
-                                    "ðŸŽ¯ Objetivos Semanales",
-                                    style={
-                                        'color': HIGHLIGHT_COLOR,
-                                        'fontSize': '2.5rem',
-                                        'fontWeight': '700',
-                                        'margin': '0'
-                                    }
-                                ),
+                    # CONTENIDO PRINCIPAL DE OBJETIVOS
+                    html.Div(
+                        className="objetivos-main",
+                        style={
+                            'flex': '1',
+                            'padding': '40px',
+                            'display': 'flex',
+                            'flexDirection': 'column',
+                            'gap': '30px',
+                            'overflowY': 'auto'
+                        },
+                        children=[
+                            # TÃ­tulo principal
+                            html.Div(
+                                style={
+                                    'display': 'flex',
+                                    'justifyContent': 'space-between',
+                                    'alignItems': 'center',
+                                    'marginBottom': '10px'
+                                },
+                                children=[
+                                    html.H2(
+                                        "ðŸŽ¯ Objetivos Semanales",
+                                        style={
+                                            'color': HIGHLIGHT_COLOR,
+                                            'fontSize': '2.5rem',
+                                            'fontWeight': '700',
+                                            'margin': '0'
+                                        }
+                                    ),
                                 
-                            ]
-                        ),
+                                ]
+                            ),
                         
-                        # SecciÃ³n de Objetivos Semanales
-                        html.Div(
-                            style={
-                                'backgroundColor': '#1a1a1a',
-                                'borderRadius': '15px',
-                                'padding': '30px',
-                                'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                'boxShadow': '0 8px 30px rgba(0, 0, 0, 0.4)'
-                            },
-                            children=[
-                                # TÃ­tulo de la secciÃ³n
-                                html.H3(
-                                    "Objetivos Semanales",
-                                    style={
-                                        'color': HIGHLIGHT_COLOR,
-                                        'fontSize': '1.8rem',
-                                        'marginBottom': '30px',
-                                        'borderBottom': '2px solid rgba(0, 212, 255, 0.3)',
-                                        'paddingBottom': '15px'
-                                    }
-                                ),
+                            # SecciÃ³n de Objetivos Semanales
+                            html.Div(
+                                style={
+                                    'backgroundColor': '#1a1a1a',
+                                    'borderRadius': '15px',
+                                    'padding': '30px',
+                                    'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                    'boxShadow': '0 8px 30px rgba(0, 0, 0, 0.4)'
+                                },
+                                children=[
+                                    # TÃ­tulo de la secciÃ³n
+                                    html.H3(
+                                        "Objetivos Semanales",
+                                        style={
+                                            'color': HIGHLIGHT_COLOR,
+                                            'fontSize': '1.8rem',
+                                            'marginBottom': '30px',
+                                            'borderBottom': '2px solid rgba(0, 212, 255, 0.3)',
+                                            'paddingBottom': '15px'
+                                        }
+                                    ),
                                 
-                                # Tarjetas de progreso
-                                html.Div(
-                                    style={
-                                        'display': 'grid',
-                                        'gridTemplateColumns': 'repeat(3, 1fr)',
-                                        'gap': '30px'
-                                    },
-                                    children=[
-                                        # Cardio
-                                        html.Div(
-                                            style={
-                                                'backgroundColor': '#141414',
-                                                'borderRadius': '12px',
-                                                'padding': '25px',
-                                                'border': f'1px solid {HIGHLIGHT_COLOR}',
-                                                'boxShadow': f'0 0 15px rgba(0, 212, 255, 0.2)'
-                                            },
-                                            children=[
-                                                html.H4(
-                                                    "ðŸ’“ Cardio",
-                                                    style={
-                                                        'color': HIGHLIGHT_COLOR,
-                                                        'fontSize': '1.5rem',
-                                                        'marginBottom': '15px',
-                                                        'display': 'flex',
-                                                        'alignItems': 'center',
-                                                        'gap': '10px'
-                                                    }
-                                                ),
+                                    # Tarjetas de progreso
+                                    html.Div(
+                                        style={
+                                            'display': 'grid',
+                                            'gridTemplateColumns': 'repeat(3, 1fr)',
+                                            'gap': '30px'
+                                        },
+                                        children=[
+                                            # Cardio
+                                            html.Div(
+                                                style={
+                                                    'backgroundColor': '#141414',
+                                                    'borderRadius': '12px',
+                                                    'padding': '25px',
+                                                    'border': f'1px solid {HIGHLIGHT_COLOR}',
+                                                    'boxShadow': f'0 0 15px rgba(0, 212, 255, 0.2)'
+                                                },
+                                                children=[
+                                                    html.H4(
+                                                        "ðŸ’“ Cardio",
+                                                        style={
+                                                            'color': HIGHLIGHT_COLOR,
+                                                            'fontSize': '1.5rem',
+                                                            'marginBottom': '15px',
+                                                            'display': 'flex',
+                                                            'alignItems': 'center',
+                                                            'gap': '10px'
+                                                        }
+                                                    ),
                                                 
-                                                html.Div(
-                                                    style={
-                                                        'display': 'flex',
-                                                        'justifyContent': 'space-between',
-                                                        'alignItems': 'center',
-                                                        'marginBottom': '15px'
-                                                    },
-                                                    children=[
-                                                        html.Span(
-                                                            "Progreso:",
-                                                            style={'color': '#ccc', 'fontSize': '1.1rem'}
-                                                        ),
-                                                        html.Span(
-                                                            "80%",
-                                                            style={'color': HIGHLIGHT_COLOR, 'fontSize': '1.5rem', 'fontWeight': '700'}
-                                                        )
-                                                    ]
-                                                ),
+                                                    html.Div(
+                                                        style={
+                                                            'display': 'flex',
+                                                            'justifyContent': 'space-between',
+                                                            'alignItems': 'center',
+                                                            'marginBottom': '15px'
+                                                        },
+                                                        children=[
+                                                            html.Span(
+                                                                "Progreso:",
+                                                                style={'color': '#ccc', 'fontSize': '1.1rem'}
+                                                            ),
+                                                            html.Span(
+                                                                "80%",
+                                                                style={'color': HIGHLIGHT_COLOR, 'fontSize': '1.5rem', 'fontWeight': '700'}
+                                                            )
+                                                        ]
+                                                    ),
                                                 
-                                                # Barra de progreso
-                                                html.Div(
-                                                    style={
-                                                        'height': '12px',
-                                                        'backgroundColor': '#2b2b2b',
-                                                        'borderRadius': '6px',
-                                                        'overflow': 'hidden',
-                                                        'marginBottom': '15px'
-                                                    },
-                                                    children=html.Div(
+                                                    # Barra de progreso
+                                                    html.Div(
                                                         style={
-                                                            'width': '80%',
-                                                            'height': '100%',
-                                                            'backgroundColor': HIGHLIGHT_COLOR,
+                                                            'height': '12px',
+                                                            'backgroundColor': '#2b2b2b',
                                                             'borderRadius': '6px',
-                                                            'boxShadow': f'0 0 10px {HIGHLIGHT_COLOR}'
-                                                        }
-                                                    )
-                                                ),
+                                                            'overflow': 'hidden',
+                                                            'marginBottom': '15px'
+                                                        },
+                                                        children=html.Div(
+                                                            style={
+                                                                'width': '80%',
+                                                                'height': '100%',
+                                                                'backgroundColor': HIGHLIGHT_COLOR,
+                                                                'borderRadius': '6px',
+                                                                'boxShadow': f'0 0 10px {HIGHLIGHT_COLOR}'
+                                                            }
+                                                        )
+                                                    ),
                                                 
-                                                # Detalles del objetivo
-                                                html.Div(
-                                                    style={
-                                                        'color': '#ccc',
-                                                        'fontSize': '1rem',
-                                                        'marginTop': '15px',
-                                                        'paddingTop': '15px',
-                                                        'borderTop': '1px solid #2b2b2b'
-                                                    },
-                                                    children=[
-                                                        html.P("âœ… 4 de 5 sesiones completadas", style={'margin': '5px 0'}),
-                                                        html.P("ðŸŽ¯ Objetivo: 5 sesiones de cardio", style={'margin': '5px 0'}),
-                                                        html.P("ðŸ“… PrÃ³xima: MaÃ±ana 8:00 AM", style={'margin': '5px 0', 'color': HIGHLIGHT_COLOR})
-                                                    ]
-                                                )
-                                            ]
-                                        ),
+                                                    # Detalles del objetivo
+                                                    html.Div(
+                                                        style={
+                                                            'color': '#ccc',
+                                                            'fontSize': '1rem',
+                                                            'marginTop': '15px',
+                                                            'paddingTop': '15px',
+                                                            'borderTop': '1px solid #2b2b2b'
+                                                        },
+                                                        children=[
+                                                            html.P("âœ… 4 de 5 sesiones completadas", style={'margin': '5px 0'}),
+                                                            html.P("ðŸŽ¯ Objetivo: 5 sesiones de cardio", style={'margin': '5px 0'}),
+                                                            html.P("ðŸ“… PrÃ³xima: MaÃ±ana 8:00 AM", style={'margin': '5px 0', 'color': HIGHLIGHT_COLOR})
+                                                        ]
+                                                    )
+                                                ]
+                                            ),
                                         
-                                        # Fuerza
-                                        html.Div(
-                                            style={
-                                                'backgroundColor': '#141414',
-                                                'borderRadius': '12px',
-                                                'padding': '25px',
-                                                'border': '1px solid #ffd166',
-                                                'boxShadow': '0 0 15px rgba(255, 209, 102, 0.2)'
-                                            },
-                                            children=[
-                                                html.H4(
-                                                    "ðŸ’ª Fuerza",
-                                                    style={
-                                                        'color': '#ffd166',
-                                                        'fontSize': '1.5rem',
-                                                        'marginBottom': '15px',
-                                                        'display': 'flex',
-                                                        'alignItems': 'center',
-                                                        'gap': '10px'
-                                                    }
-                                                ),
+                                            # Fuerza
+                                            html.Div(
+                                                style={
+                                                    'backgroundColor': '#141414',
+                                                    'borderRadius': '12px',
+                                                    'padding': '25px',
+                                                    'border': '1px solid #ffd166',
+                                                    'boxShadow': '0 0 15px rgba(255, 209, 102, 0.2)'
+                                                },
+                                                children=[
+                                                    html.H4(
+                                                        "ðŸ’ª Fuerza",
+                                                        style={
+                                                            'color': '#ffd166',
+                                                            'fontSize': '1.5rem',
+                                                            'marginBottom': '15px',
+                                                            'display': 'flex',
+                                                            'alignItems': 'center',
+                                                            'gap': '10px'
+                                                        }
+                                                    ),
                                                 
-                                                html.Div(
-                                                    style={
-                                                        'display': 'flex',
-                                                        'justifyContent': 'space-between',
-                                                        'alignItems': 'center',
-                                                        'marginBottom': '15px'
-                                                    },
-                                                    children=[
-                                                        html.Span(
-                                                            "Progreso:",
-                                                            style={'color': '#ccc', 'fontSize': '1.1rem'}
-                                                        ),
-                                                        html.Span(
-                                                            "67%",
-                                                            style={'color': '#ffd166', 'fontSize': '1.5rem', 'fontWeight': '700'}
-                                                        )
-                                                    ]
-                                                ),
+                                                    html.Div(
+                                                        style={
+                                                            'display': 'flex',
+                                                            'justifyContent': 'space-between',
+                                                            'alignItems': 'center',
+                                                            'marginBottom': '15px'
+                                                        },
+                                                        children=[
+                                                            html.Span(
+                                                                "Progreso:",
+                                                                style={'color': '#ccc', 'fontSize': '1.1rem'}
+                                                            ),
+                                                            html.Span(
+                                                                "67%",
+                                                                style={'color': '#ffd166', 'fontSize': '1.5rem', 'fontWeight': '700'}
+                                                            )
+                                                        ]
+                                                    ),
                                                 
-                                                # Barra de progreso
-                                                html.Div(
-                                                    style={
-                                                        'height': '12px',
-                                                        'backgroundColor': '#2b2b2b',
-                                                        'borderRadius': '6px',
-                                                        'overflow': 'hidden',
-                                                        'marginBottom': '15px'
-                                                    },
-                                                    children=html.Div(
+                                                    # Barra de progreso
+                                                    html.Div(
                                                         style={
-                                                            'width': '67%',
-                                                            'height': '100%',
-                                                            'backgroundColor': '#ffd166',
+                                                            'height': '12px',
+                                                            'backgroundColor': '#2b2b2b',
                                                             'borderRadius': '6px',
-                                                            'boxShadow': '0 0 10px #ffd166'
-                                                        }
-                                                    )
-                                                ),
+                                                            'overflow': 'hidden',
+                                                            'marginBottom': '15px'
+                                                        },
+                                                        children=html.Div(
+                                                            style={
+                                                                'width': '67%',
+                                                                'height': '100%',
+                                                                'backgroundColor': '#ffd166',
+                                                                'borderRadius': '6px',
+                                                                'boxShadow': '0 0 10px #ffd166'
+                                                            }
+                                                        )
+                                                    ),
                                                 
-                                                # Detalles del objetivo
-                                                html.Div(
-                                                    style={
-                                                        'color': '#ccc',
-                                                        'fontSize': '1rem',
-                                                        'marginTop': '15px',
-                                                        'paddingTop': '15px',
-                                                        'borderTop': '1px solid #2b2b2b'
-                                                    },
-                                                    children=[
-                                                        html.P("âœ… 2 de 3 sesiones completadas", style={'margin': '5px 0'}),
-                                                        html.P("ðŸŽ¯ Objetivo: 3 sesiones de fuerza", style={'margin': '5px 0'}),
-                                                        html.P("ðŸ“… PrÃ³xima: Hoy 19:00 PM", style={'margin': '5px 0', 'color': '#ffd166'})
-                                                    ]
-                                                )
-                                            ]
-                                        ),
+                                                    # Detalles del objetivo
+                                                    html.Div(
+                                                        style={
+                                                            'color': '#ccc',
+                                                            'fontSize': '1rem',
+                                                            'marginTop': '15px',
+                                                            'paddingTop': '15px',
+                                                            'borderTop': '1px solid #2b2b2b'
+                                                        },
+                                                        children=[
+                                                            html.P("âœ… 2 de 3 sesiones completadas", style={'margin': '5px 0'}),
+                                                            html.P("ðŸŽ¯ Objetivo: 3 sesiones de fuerza", style={'margin': '5px 0'}),
+                                                            html.P("ðŸ“… PrÃ³xima: Hoy 19:00 PM", style={'margin': '5px 0', 'color': '#ffd166'})
+                                                        ]
+                                                    )
+                                                ]
+                                            ),
                                         
-                                        # Flexibilidad
-                                        html.Div(
-                                            style={
-                                                'backgroundColor': '#141414',
-                                                'borderRadius': '12px',
-                                                'padding': '25px',
-                                                'border': '1px solid #4ecdc4',
-                                                'boxShadow': '0 0 15px rgba(78, 205, 196, 0.2)'
-                                            },
-                                            children=[
-                                                html.H4(
-                                                    "ðŸ§˜ Flexibilidad",
-                                                    style={
-                                                        'color': '#4ecdc4',
-                                                        'fontSize': '1.5rem',
-                                                        'marginBottom': '15px',
-                                                        'display': 'flex',
-                                                        'alignItems': 'center',
-                                                        'gap': '10px'
-                                                    }
-                                                ),
+                                            # Flexibilidad
+                                            html.Div(
+                                                style={
+                                                    'backgroundColor': '#141414',
+                                                    'borderRadius': '12px',
+                                                    'padding': '25px',
+                                                    'border': '1px solid #4ecdc4',
+                                                    'boxShadow': '0 0 15px rgba(78, 205, 196, 0.2)'
+                                                },
+                                                children=[
+                                                    html.H4(
+                                                        "ðŸ§˜ Flexibilidad",
+                                                        style={
+                                                            'color': '#4ecdc4',
+                                                            'fontSize': '1.5rem',
+                                                            'marginBottom': '15px',
+                                                            'display': 'flex',
+                                                            'alignItems': 'center',
+                                                            'gap': '10px'
+                                                        }
+                                                    ),
                                                 
-                                                html.Div(
-                                                    style={
-                                                        'display': 'flex',
-                                                        'justifyContent': 'space-between',
-                                                        'alignItems': 'center',
-                                                        'marginBottom': '15px'
-                                                    },
-                                                    children=[
-                                                        html.Span(
-                                                            "Progreso:",
-                                                            style={'color': '#ccc', 'fontSize': '1.1rem'}
-                                                        ),
-                                                        html.Span(
-                                                            "75%",
-                                                            style={'color': '#4ecdc4', 'fontSize': '1.5rem', 'fontWeight': '700'}
-                                                        )
-                                                    ]
-                                                ),
+                                                    html.Div(
+                                                        style={
+                                                            'display': 'flex',
+                                                            'justifyContent': 'space-between',
+                                                            'alignItems': 'center',
+                                                            'marginBottom': '15px'
+                                                        },
+                                                        children=[
+                                                            html.Span(
+                                                                "Progreso:",
+                                                                style={'color': '#ccc', 'fontSize': '1.1rem'}
+                                                            ),
+                                                            html.Span(
+                                                                "75%",
+                                                                style={'color': '#4ecdc4', 'fontSize': '1.5rem', 'fontWeight': '700'}
+                                                            )
+                                                        ]
+                                                    ),
                                                 
-                                                # Barra de progreso
-                                                html.Div(
-                                                    style={
-                                                        'height': '12px',
-                                                        'backgroundColor': '#2b2b2b',
-                                                        'borderRadius': '6px',
-                                                        'overflow': 'hidden',
-                                                        'marginBottom': '15px'
-                                                    },
-                                                    children=html.Div(
+                                                    # Barra de progreso
+                                                    html.Div(
                                                         style={
-                                                            'width': '75%',
-                                                            'height': '100%',
-                                                            'backgroundColor': '#4ecdc4',
+                                                            'height': '12px',
+                                                            'backgroundColor': '#2b2b2b',
                                                             'borderRadius': '6px',
-                                                            'boxShadow': '0 0 10px #4ecdc4'
-                                                        }
-                                                    )
-                                                ),
+                                                            'overflow': 'hidden',
+                                                            'marginBottom': '15px'
+                                                        },
+                                                        children=html.Div(
+                                                            style={
+                                                                'width': '75%',
+                                                                'height': '100%',
+                                                                'backgroundColor': '#4ecdc4',
+                                                                'borderRadius': '6px',
+                                                                'boxShadow': '0 0 10px #4ecdc4'
+                                                            }
+                                                        )
+                                                    ),
                                                 
-                                                # Detalles del objetivo
-                                                html.Div(
-                                                    style={
-                                                        'color': '#ccc',
-                                                        'fontSize': '1rem',
-                                                        'marginTop': '15px',
-                                                        'paddingTop': '15px',
-                                                        'borderTop': '1px solid #2b2b2b'
-                                                    },
-                                                    children=[
-                                                        html.P("âœ… 3 de 4 sesiones completadas", style={'margin': '5px 0'}),
-                                                        html.P("ðŸŽ¯ Objetivo: 4 sesiones de flexibilidad", style={'margin': '5px 0'}),
-                                                        html.P("ðŸ“… PrÃ³xima: MaÃ±ana 7:00 AM", style={'margin': '5px 0', 'color': '#4ecdc4'})
-                                                    ]
-                                                )
-                                            ]
-                                        )
-                                    ]
-                                ),
+                                                    # Detalles del objetivo
+                                                    html.Div(
+                                                        style={
+                                                            'color': '#ccc',
+                                                            'fontSize': '1rem',
+                                                            'marginTop': '15px',
+                                                            'paddingTop': '15px',
+                                                            'borderTop': '1px solid #2b2b2b'
+                                                        },
+                                                        children=[
+                                                            html.P("âœ… 3 de 4 sesiones completadas", style={'margin': '5px 0'}),
+                                                            html.P("ðŸŽ¯ Objetivo: 4 sesiones de flexibilidad", style={'margin': '5px 0'}),
+                                                            html.P("ðŸ“… PrÃ³xima: MaÃ±ana 7:00 AM", style={'margin': '5px 0', 'color': '#4ecdc4'})
+                                                        ]
+                                                    )
+                                                ]
+                                            )
+                                        ]
+                                    ),
                                 
-                                # Separador
-                                html.Hr(style={'borderColor': '#2b2b2b', 'margin': '40px 0'}),
+                                    # Separador
+                                    html.Hr(style={'borderColor': '#2b2b2b', 'margin': '40px 0'}),
                                 
-                                # SecciÃ³n de Objetivos de Fitness (DINÃMICA)
-                                html.Div(
-                                    id="fitness-goals-container",
-                                    children=[
-                                        html.H3(
-                                            "ðŸ‹ï¸ Objetivos de Fitness",
-                                            style={
-                                                'color': HIGHLIGHT_COLOR,
-                                                'fontSize': '1.8rem',
-                                                'marginBottom': '25px'
-                                            }
-                                        ),
+                                    # SecciÃ³n de Objetivos de Fitness (DINÃMICA)
+                                    html.Div(
+                                        id="fitness-goals-container",
+                                        children=[
+                                            html.H3(
+                                                "ðŸ‹ï¸ Objetivos de Fitness",
+                                                style={
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'fontSize': '1.8rem',
+                                                    'marginBottom': '25px'
+                                                }
+                                            ),
                                         
-                                        # Lista de objetivos de fitness (se actualizarÃ¡ dinÃ¡micamente)
-                                        html.Ul(
-                                            id="fitness-goals-list",
-                                            style={'listStyleType': 'none', 'padding': '0'},
-                                            children=[
-                                                # Los objetivos se cargarÃ¡n aquÃ­ dinÃ¡micamente
-                                            ]
-                                        )
-                                    ]
-                                ),
+                                            # Lista de objetivos de fitness (se actualizarÃ¡ dinÃ¡micamente)
+                                            html.Ul(
+                                                id="fitness-goals-list",
+                                                style={'listStyleType': 'none', 'padding': '0'},
+                                                children=[
+                                                    # Los objetivos se cargarÃ¡n aquÃ­ dinÃ¡micamente
+                                                ]
+                                            )
+                                        ]
+                                    ),
                                 
-                                # Separador
-                                html.Hr(style={'borderColor': '#2b2b2b', 'margin': '40px 0'}),
+                                    # Separador
+                                    html.Hr(style={'borderColor': '#2b2b2b', 'margin': '40px 0'}),
                                 
-                                # SecciÃ³n de Objetivos de Salud (DINÃMICA)
-                                html.Div(
-                                    id="health-goals-container",
-                                    children=[
-                                        html.H3(
-                                            "â¤ï¸ Objetivos de Salud",
-                                            style={
-                                                'color': HIGHLIGHT_COLOR,
-                                                'fontSize': '1.8rem',
-                                                'marginBottom': '25px'
-                                            }
-                                        ),
+                                    # SecciÃ³n de Objetivos de Salud (DINÃMICA)
+                                    html.Div(
+                                        id="health-goals-container",
+                                        children=[
+                                            html.H3(
+                                                "â¤ï¸ Objetivos de Salud",
+                                                style={
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'fontSize': '1.8rem',
+                                                    'marginBottom': '25px'
+                                                }
+                                            ),
                                         
-                                        # Lista de objetivos de salud (se actualizarÃ¡ dinÃ¡micamente)
-                                        html.Ul(
-                                            id="health-goals-list",
-                                            style={'listStyleType': 'none', 'padding': '0'},
-                                            children=[
-                                                # Los objetivos se cargarÃ¡n aquÃ­ dinÃ¡micamente
-                                            ]
-                                        )
-                                    ]
-                                ),
+                                            # Lista de objetivos de salud (se actualizarÃ¡ dinÃ¡micamente)
+                                            html.Ul(
+                                                id="health-goals-list",
+                                                style={'listStyleType': 'none', 'padding': '0'},
+                                                children=[
+                                                    # Los objetivos se cargarÃ¡n aquÃ­ dinÃ¡micamente
+                                                ]
+                                            )
+                                        ]
+                                    ),
                                 
-                                # BotÃ³n para agregar nuevo objetivo
-                                html.Div(
-                                    style={
-                                        'marginTop': '40px',
-                                        'textAlign': 'center'
-                                    },
-                                    children=dbc.Button(
-                                        [
-                                            html.I(className="bi bi-plus-circle me-2"),
-                                            "Agregar Nuevo Objetivo"
-                                        ],
-                                        id="btn-agregar-objetivo",
-                                        className="auth-btn",
+                                    # BotÃ³n para agregar nuevo objetivo
+                                    html.Div(
                                         style={
-                                            'backgroundColor': HIGHLIGHT_COLOR,
-                                            'border': 'none',
-                                            'fontWeight': '600',
-                                            'padding': '15px 30px',
-                                            'borderRadius': '12px',
-                                            'fontSize': '1.1rem',
-                                            'color': '#0a0a0a',
-                                            'transition': 'all 0.3s ease'
-                                        }
+                                            'marginTop': '40px',
+                                            'textAlign': 'center'
+                                        },
+                                        children=dbc.Button(
+                                            [
+                                                html.I(className="bi bi-plus-circle me-2"),
+                                                "Agregar Nuevo Objetivo"
+                                            ],
+                                            id="btn-agregar-objetivo",
+                                            className="auth-btn",
+                                            style={
+                                                'backgroundColor': HIGHLIGHT_COLOR,
+                                                'border': 'none',
+                                                'fontWeight': '600',
+                                                'padding': '15px 30px',
+                                                'borderRadius': '12px',
+                                                'fontSize': '1.1rem',
+                                                'color': '#0a0a0a',
+                                                'transition': 'all 0.3s ease'
+                                            }
+                                        )
                                     )
-                                )
-                            ]
-                        ),
+                                ]
+                            ),
                         
-                        # Resumen de progreso general
-                        html.Div(
-                            style={
-                                'backgroundColor': '#1a1a1a',
-                                'borderRadius': '15px',
-                                'padding': '25px',
-                                'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)'
-                            },
-                            children=[
-                                html.H3(
-                                    "ðŸ“ˆ Progreso General",
-                                    style={
-                                        'color': HIGHLIGHT_COLOR,
-                                        'marginBottom': '20px',
-                                        'fontSize': '1.5rem'
-                                    }
-                                ),
+                            # Resumen de progreso general
+                            html.Div(
+                                style={
+                                    'backgroundColor': '#1a1a1a',
+                                    'borderRadius': '15px',
+                                    'padding': '25px',
+                                    'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                    'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)'
+                                },
+                                children=[
+                                    html.H3(
+                                        "ðŸ“ˆ Progreso General",
+                                        style={
+                                            'color': HIGHLIGHT_COLOR,
+                                            'marginBottom': '20px',
+                                            'fontSize': '1.5rem'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    style={
-                                        'display': 'grid',
-                                        'gridTemplateColumns': 'repeat(3, 1fr)',
-                                        'gap': '20px'
-                                    },
-                                    children=[
-                                        html.Div(
-                                            style={'textAlign': 'center'},
-                                            children=[
-                                                html.Div(
-                                                    id="progreso-total-percent",  # AÃ‘ADE ESTE ID
-                                                    children="74%",  # CAMBIA ESTO
-                                                    style={
-                                                        'fontSize': '2.5rem',
-                                                        'fontWeight': '700',
-                                                        'color': HIGHLIGHT_COLOR,
-                                                        'marginBottom': '10px'
-                                                    }
-                                                ),
-                                                html.Div(
-                                                    "Progreso Total",
-                                                    style={'color': '#ccc', 'fontSize': '1rem'}
-                                                )
-                                            ]
-                                        ),
+                                    html.Div(
+                                        style={
+                                            'display': 'grid',
+                                            'gridTemplateColumns': 'repeat(3, 1fr)',
+                                            'gap': '20px'
+                                        },
+                                        children=[
+                                            html.Div(
+                                                style={'textAlign': 'center'},
+                                                children=[
+                                                    html.Div(
+                                                        id="progreso-total-percent",  # AÃ‘ADE ESTE ID
+                                                        children="74%",  # CAMBIA ESTO
+                                                        style={
+                                                            'fontSize': '2.5rem',
+                                                            'fontWeight': '700',
+                                                            'color': HIGHLIGHT_COLOR,
+                                                            'marginBottom': '10px'
+                                                        }
+                                                    ),
+                                                    html.Div(
+                                                        "Progreso Total",
+                                                        style={'color': '#ccc', 'fontSize': '1rem'}
+                                                    )
+                                                ]
+                                            ),
                                         
-                                        html.Div(
-                                            style={'textAlign': 'center'},
-                                            children=[
-                                                html.Div(
-                                                    id="objetivos-activos-count",  # AÃ‘ADE ESTE ID
-                                                    children="9",  # CAMBIA ESTO
-                                                    style={
-                                                        'fontSize': '2.5rem',
-                                                        'fontWeight': '700',
-                                                        'color': '#4ecdc4',
-                                                        'marginBottom': '10px'
-                                                    }
-                                                ),
-                                                html.Div(
-                                                    "Objetivos Activos",
-                                                    style={'color': '#ccc', 'fontSize': '1rem'}
-                                                )
-                                            ]
-                                        ),
+                                            html.Div(
+                                                style={'textAlign': 'center'},
+                                                children=[
+                                                    html.Div(
+                                                        id="objetivos-activos-count",  # AÃ‘ADE ESTE ID
+                                                        children="9",  # CAMBIA ESTO
+                                                        style={
+                                                            'fontSize': '2.5rem',
+                                                            'fontWeight': '700',
+                                                            'color': '#4ecdc4',
+                                                            'marginBottom': '10px'
+                                                        }
+                                                    ),
+                                                    html.Div(
+                                                        "Objetivos Activos",
+                                                        style={'color': '#ccc', 'fontSize': '1rem'}
+                                                    )
+                                                ]
+                                            ),
                                         
-                                        html.Div(
-                                            style={'textAlign': 'center'},
-                                            children=[
-                                                html.Div(
-                                                    "23",
-                                                    style={
-                                                        'fontSize': '2.5rem',
-                                                        'fontWeight': '700',
-                                                        'color': '#ffd166',
-                                                        'marginBottom': '10px'
-                                                    }
-                                                ),
-                                                html.Div(
-                                                    "DÃ­as Consecutivos",
-                                                    style={'color': '#ccc', 'fontSize': '1rem'}
-                                                )
-                                            ]
-                                        )
-                                    ]
-                                )
-                            ]
-                        ),
+                                            html.Div(
+                                                style={'textAlign': 'center'},
+                                                children=[
+                                                    html.Div(
+                                                        "23",
+                                                        style={
+                                                            'fontSize': '2.5rem',
+                                                            'fontWeight': '700',
+                                                            'color': '#ffd166',
+                                                            'marginBottom': '10px'
+                                                        }
+                                                    ),
+                                                    html.Div(
+                                                        "DÃ­as Consecutivos",
+                                                        style={'color': '#ccc', 'fontSize': '1rem'}
+                                                    )
+                                                ]
+                                            )
+                                        ]
+                                    )
+                                ]
+                            ),
                         
-                        # MODAL PARA AGREGAR NUEVOS OBJETIVOS (AGREGADO) - VERSIÃ“N CORREGIDA
-                        dbc.Modal(
-                            [
-                                dbc.ModalHeader(
-                                    html.H4("ðŸŽ¯ Agregar Nuevo Objetivo", style={'color': HIGHLIGHT_COLOR}),
-                                    close_button=True,
-                                    style={'backgroundColor': '#1a1a1a', 'borderBottom': '1px solid #2b2b2b'}
-                                ),
-                                dbc.ModalBody(
-                                    style={'backgroundColor': '#1a1a1a', 'color': 'white'},
-                                    children=[
-                                        # Paso 1: Elegir tipo de objetivo
-                                        html.Div(
-                                            id="choose-goal-type",
-                                            children=[
-                                                html.P("Â¿QuÃ© tipo de objetivo quieres agregar?", 
-                                                       style={'color': '#ccc', 'marginBottom': '20px', 'fontSize': '1.1rem'}),
+                            # MODAL PARA AGREGAR NUEVOS OBJETIVOS (AGREGADO) - VERSIÃ“N CORREGIDA
+                            dbc.Modal(
+                                [
+                                    dbc.ModalHeader(
+                                        html.H4("ðŸŽ¯ Agregar Nuevo Objetivo", style={'color': HIGHLIGHT_COLOR}),
+                                        close_button=True,
+                                        style={'backgroundColor': '#1a1a1a', 'borderBottom': '1px solid #2b2b2b'}
+                                    ),
+                                    dbc.ModalBody(
+                                        style={'backgroundColor': '#1a1a1a', 'color': 'white'},
+                                        children=[
+                                            # Paso 1: Elegir tipo de objetivo
+                                            html.Div(
+                                                id="choose-goal-type",
+                                                children=[
+                                                    html.P("Â¿QuÃ© tipo de objetivo quieres agregar?", 
+                                                           style={'color': '#ccc', 'marginBottom': '20px', 'fontSize': '1.1rem'}),
                                                 
-                                                html.Div(
-                                                    style={
-                                                        'display': 'grid',
-                                                        'gridTemplateColumns': 'repeat(2, 1fr)',
-                                                        'gap': '20px',
-                                                        'marginBottom': '30px'
-                                                    },
-                                                    children=[
-                                                        # OpciÃ³n Salud - AÃ‘ADIDO n_clicks=0
-                                                 
-                                                    html.Button(
-                                                     [
-                                                        html.Div("â¤ï¸", style={'fontSize': '2.5rem', 'marginBottom': '10px'}),
-                                                        html.H5("Salud", style={'color': HIGHLIGHT_COLOR, 'marginBottom': '5px'}),
-                                                        html.P("Frecuencia cardÃ­aca, sueÃ±o, HRV, etc.", 
-                                                        style={'color': '#ccc', 'fontSize': '0.9rem'})
-                                                    ],
-                                                        id="btn-health-goal",
-                                                        n_clicks=0,
+                                                    html.Div(
                                                         style={
-                                                        'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                                        'border': '1px solid rgba(0, 212, 255, 0.3)',
-                                                        'borderRadius': '12px',
-                                                        'padding': '20px',
-                                                        'cursor': 'pointer',
-                                                        'transition': 'all 0.3s ease',
-                                                        'color': 'white',
-                                                        'textAlign': 'center'
-                                                            }
-                                                    ),
+                                                            'display': 'grid',
+                                                            'gridTemplateColumns': 'repeat(2, 1fr)',
+                                                            'gap': '20px',
+                                                            'marginBottom': '30px'
+                                                        },
+                                                        children=[
+                                                            # OpciÃ³n Salud - AÃ‘ADIDO n_clicks=0
+                                                 
+                                                        html.Button(
+                                                         [
+                                                            html.Div("â¤ï¸", style={'fontSize': '2.5rem', 'marginBottom': '10px'}),
+                                                            html.H5("Salud", style={'color': HIGHLIGHT_COLOR, 'marginBottom': '5px'}),
+                                                            html.P("Frecuencia cardÃ­aca, sueÃ±o, HRV, etc.", 
+                                                            style={'color': '#ccc', 'fontSize': '0.9rem'})
+                                                        ],
+                                                            id="btn-health-goal",
+                                                            n_clicks=0,
+                                                            style={
+                                                            'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                                            'border': '1px solid rgba(0, 212, 255, 0.3)',
+                                                            'borderRadius': '12px',
+                                                            'padding': '20px',
+                                                            'cursor': 'pointer',
+                                                            'transition': 'all 0.3s ease',
+                                                            'color': 'white',
+                                                            'textAlign': 'center'
+                                                                }
+                                                        ),
 
-# OpciÃ³n Fitness - AÃ‘ADIDO n_clicks=0 CORREGIDO
-html.Button(
-    [
-        html.Div("ðŸ’ª", style={'fontSize': '2.5rem', 'marginBottom': '10px'}),
-        html.H5("Fitness", style={'color': '#ffd166', 'marginBottom': '5px'}),
-        html.P("Peso, correr, fuerza, flexibilidad", 
-               style={'color': '#ccc', 'fontSize': '0.9rem'})
-    ],
-    id="btn-fitness-goal",
-    n_clicks=0,  # Â¡AGREGADO!
-    style={
-        'backgroundColor': 'rgba(255, 209, 102, 0.1)',
-        'border': '1px solid rgba(255, 209, 102, 0.3)',
-        'borderRadius': '12px',
-        'padding': '20px',
-        'cursor': 'pointer',
-        'transition': 'all 0.3s ease',
-        'color': 'white',
-        'textAlign': 'center'
-    }
-)
-                                                    ]
-                                                )
-                                            ]
-                                        ),
+    # OpciÃ³n Fitness - AÃ‘ADIDO n_clicks=0 CORREGIDO
+    html.Button(
+        [
+            html.Div("ðŸ’ª", style={'fontSize': '2.5rem', 'marginBottom': '10px'}),
+            html.H5("Fitness", style={'color': '#ffd166', 'marginBottom': '5px'}),
+            html.P("Peso, correr, fuerza, flexibilidad", 
+                   style={'color': '#ccc', 'fontSize': '0.9rem'})
+        ],
+        id="btn-fitness-goal",
+        n_clicks=0,  # Â¡AGREGADO!
+        style={
+            'backgroundColor': 'rgba(255, 209, 102, 0.1)',
+            'border': '1px solid rgba(255, 209, 102, 0.3)',
+            'borderRadius': '12px',
+            'padding': '20px',
+            'cursor': 'pointer',
+            'transition': 'all 0.3s ease',
+            'color': 'white',
+            'textAlign': 'center'
+        }
+    )
+                                                        ]
+                                                    )
+                                                ]
+                                            ),
                                         
-                                        # Paso 2: Formulario para escribir el objetivo (inicialmente oculto)
-                                        html.Div(
-                                            id="goal-form-container",
-                                            style={'display': 'none'},
-                                            children=[
-                                                html.Div(
-                                                    id="goal-type-header",
-                                                    style={
-                                                        'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                                        'padding': '15px',
-                                                        'borderRadius': '10px',
-                                                        'marginBottom': '20px',
-                                                        'display': 'flex',
-                                                        'alignItems': 'center',
-                                                        'gap': '10px'
-                                                    },
-                                                    children=[
-                                                        html.Span("â¤ï¸", id="goal-type-icon", style={'fontSize': '1.5rem'}),
-                                                        html.Div(
-                                                            [
-                                                                html.Div("Objetivo de:", style={'color': '#ccc', 'fontSize': '0.9rem'}),
-                                                                html.Div("Salud", id="goal-type-text", style={'color': HIGHLIGHT_COLOR, 'fontWeight': 'bold', 'fontSize': '1.1rem'})
-                                                            ]
-                                                        )
-                                                    ]
-                                                ),
-                                                
-                                                # Formulario
-                                                html.Div(
-                                                    style={'marginBottom': '20px'},
-                                                    children=[
-                                                        html.Label("Nombre del objetivo", 
-                                                                  style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
-                                                        dcc.Input(
-                                                            id="goal-name-input",
-                                                            type="text",
-                                                            placeholder="Ej: Reducir frecuencia cardÃ­aca en reposo",
-                                                            style={
-                                                                'width': '100%',
-                                                                'padding': '12px 15px',
-                                                                'backgroundColor': '#2b2b2b',
-                                                                'border': '1px solid #444',
-                                                                'borderRadius': '8px',
-                                                                'color': 'white',
-                                                                'fontSize': '1rem'
-                                                            }
-                                                        )
-                                                    ]
-                                                ),
+                                            # Paso 2: Formulario para escribir el objetivo (inicialmente oculto)
+                                            html.Div(
+                                                id="goal-form-container",
+                                                style={'display': 'none'},
+                                                children=[
+                                                    html.Div(
+                                                        id="goal-type-header",
+                                                        style={
+                                                            'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                                            'padding': '15px',
+                                                            'borderRadius': '10px',
+                                                            'marginBottom': '20px',
+                                                            'display': 'flex',
+                                                            'alignItems': 'center',
+                                                            'gap': '10px'
+                                                        },
+                                                        children=[
+                                                            html.Span("â¤ï¸", id="goal-type-icon", style={'fontSize': '1.5rem'}),
+                                                            html.Div(
+                                                                [
+                                                                    html.Div("Objetivo de:", style={'color': '#ccc', 'fontSize': '0.9rem'}),
+                                                                    html.Div("Salud", id="goal-type-text", style={'color': HIGHLIGHT_COLOR, 'fontWeight': 'bold', 'fontSize': '1.1rem'})
+                                                                ]
+                                                            )
+                                                        ]
+                                                    ),
                                                 
-                                                html.Div(
-                                                    style={'marginBottom': '20px'},
-                                                    children=[
-                                                        html.Label("DescripciÃ³n (opcional)", 
-                                                                  style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
-                                                        dcc.Textarea(
-                                                            id="goal-description-input",
-                                                            placeholder="Describe tu objetivo con mÃ¡s detalle...",
-                                                            style={
-                                                                'width': '100%',
-                                                                'height': '100px',
-                                                                'padding': '12px 15px',
-                                                                'backgroundColor': '#2b2b2b',
-                                                                'border': '1px solid #444',
-                                                                'borderRadius': '8px',
-                                                                'color': 'white',
-                                                                'fontSize': '1rem',
-                                                                'resize': 'vertical'
-                                                            }
-                                                        )
-                                                    ]
-                                                ),
+                                                    # Formulario
+                                                    html.Div(
+                                                        style={'marginBottom': '20px'},
+                                                        children=[
+                                                            html.Label("Nombre del objetivo", 
+                                                                      style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
+                                                            dcc.Input(
+                                                                id="goal-name-input",
+                                                                type="text",
+                                                                placeholder="Ej: Reducir frecuencia cardÃ­aca en reposo",
+                                                                style={
+                                                                    'width': '100%',
+                                                                    'padding': '12px 15px',
+                                                                    'backgroundColor': '#2b2b2b',
+                                                                    'border': '1px solid #444',
+                                                                    'borderRadius': '8px',
+                                                                    'color': 'white',
+                                                                    'fontSize': '1rem'
+                                                                }
+                                                            )
+                                                        ]
+                                                    ),
                                                 
-                                                html.Div(
-                                                    style={
-                                                        'display': 'grid',
-                                                        'gridTemplateColumns': 'repeat(2, 1fr)',
-                                                        'gap': '15px',
-                                                        'marginBottom': '25px'
-                                                    },
-                                                    children=[
-                                                        html.Div(
-                                                            children=[
-                                                                html.Label("Valor objetivo", 
-                                                                          style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
-                                                                dcc.Input(
-                                                                    id="goal-target-input",
-                                                                    type="text",
-                                                                    placeholder="Ej: 65 bpm",
-                                                                    style={
-                                                                        'width': '100%',
-                                                                        'padding': '12px 15px',
-                                                                        'backgroundColor': '#2b2b2b',
-                                                                        'border': '1px solid #444',
-                                                                        'borderRadius': '8px',
-                                                                        'color': 'white',
-                                                                        'fontSize': '1rem'
-                                                                    }
-                                                                )
-                                                            ]
-                                                        ),
-                                                        
-                                                        html.Div(
-                                                            children=[
-                                                                html.Label("Plazo", 
-                                                                          style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
-                                                                dcc.Dropdown(
-                                                                    id="goal-deadline-dropdown",
-                                                                    options=[
-                                                                        {'label': '1 semana', 'value': '1_week'},
-                                                                        {'label': '2 semanas', 'value': '2_weeks'},
-                                                                        {'label': '1 mes', 'value': '1_month'},
-                                                                        {'label': '3 meses', 'value': '3_months'},
-                                                                        {'label': '6 meses', 'value': '6_months'}
-                                                                    ],
-                                                                    placeholder="Selecciona un plazo",
-                                                                    style={
-                                                                        'backgroundColor': '#2b2b2b',
-                                                                        'color': 'white',
-                                                                        'border': '1px solid #444'
-                                                                    },
-                                                                    className="dbc dbc-row-selectable"
-                                                                )
-                                                            ]
-                                                        )
-                                                    ]
-                                                ),
+                                                    html.Div(
+                                                        style={'marginBottom': '20px'},
+                                                        children=[
+                                                            html.Label("DescripciÃ³n (opcional)", 
+                                                                      style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
+                                                            dcc.Textarea(
+                                                                id="goal-description-input",
+                                                                placeholder="Describe tu objetivo con mÃ¡s detalle...",
+                                                                style={
+                                                                    'width': '100%',
+                                                                    'height': '100px',
+                                                                    'padding': '12px 15px',
+                                                                    'backgroundColor': '#2b2b2b',
+                                                                    'border': '1px solid #444',
+                                                                    'borderRadius': '8px',
+                                                                    'color': 'white',
+                                                                    'fontSize': '1rem',
+                                                                    'resize': 'vertical'
+                                                                }
+                                                            )
+                                                        ]
+                                                    ),
                                                 
-                                                # BotÃ³n para volver atrÃ¡s
-                                                html.Div(
-                                                    style={'textAlign': 'center', 'marginTop': '20px'},
-                                                    children=html.Button(
-                                                        "â† Volver a elegir tipo",
-                                                        id="btn-back-to-choose",
+                                                    html.Div(
                                                         style={
-                                                            'backgroundColor': 'transparent',
-                                                            'border': '1px solid #444',
-                                                            'color': '#ccc',
-                                                            'padding': '10px 20px',
-                                                            'borderRadius': '8px',
-                                                            'cursor': 'pointer',
-                                                            'fontSize': '0.9rem',
-                                                            'transition': 'all 0.3s ease'
-                                                        }
-                                                    )
-                                                )
-                                            ]
-                                        )
-                                    ]
-                                ),
-                                dbc.ModalFooter(
-                                    style={'backgroundColor': '#1a1a1a', 'borderTop': '1px solid #2b2b2b'},
-                                    children=[
-                                        dbc.Button(
-                                            "Cancelar",
-                                            id="btn-cancel-goal",
-                                            color="secondary",
-                                            className="me-2",
-                                            style={'borderRadius': '8px'}
-                                        ),
-                                        dbc.Button(
-                                            "Agregar Objetivo",
-                                            id="btn-submit-goal",
-                                            color="primary",
-                                            style={'backgroundColor': HIGHLIGHT_COLOR, 'borderColor': HIGHLIGHT_COLOR, 'borderRadius': '8px'}
-                                        )
-                                    ]
-                                )
-                            ],
-                            id="modal-add-goal",
-                            size="lg",
-                            is_open=False,
-                            centered=True,
-                            backdrop=True,
-                            style={'backgroundColor': 'rgba(0,0,0,0.7)'}
-                        )
-                    ]
-                )
-            ]
-        )
-    ]
-)
+                                                            'display': 'grid',
+                                                            'gridTemplateColumns': 'repeat(2, 1fr)',
+                                                            'gap': '15px',
+                                                            'marginBottom': '25px'
+                                                        },
+                                                        children=[
+                                                            html.Div(
+                                                                children=[
+                                                                    html.Label("Valor objetivo", 
+                                                                              style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
+                                                                    dcc.Input(
+                                                                        id="goal-target-input",
+                                                                        type="text",
+                                                                        placeholder="Ej: 65 bpm",
+                                                                        style={
+                                                                            'width': '100%',
+                                                                            'padding': '12px 15px',
+                                                                            'backgroundColor': '#2b2b2b',
+                                                                            'border': '1px solid #444',
+                                                                            'borderRadius': '8px',
+                                                                            'color': 'white',
+                                                                            'fontSize': '1rem'
+                                                                        }
+                                                                    )
+                                                                ]
+                                                            ),
+                                                        
+                                                            html.Div(
+                                                                children=[
+                                                                    html.Label("Plazo", 
+                                                                              style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
+                                                                    dcc.Dropdown(
+                                                                        id="goal-deadline-dropdown",
+                                                                        options=[
+                                                                            {'label': '1 semana', 'value': '1_week'},
+                                                                            {'label': '2 semanas', 'value': '2_weeks'},
+                                                                            {'label': '1 mes', 'value': '1_month'},
+                                                                            {'label': '3 meses', 'value': '3_months'},
+                                                                            {'label': '6 meses', 'value': '6_months'}
+                                                                        ],
+                                                                        placeholder="Selecciona un plazo",
+                                                                        style={
+                                                                            'backgroundColor': '#2b2b2b',
+                                                                            'color': 'white',
+                                                                            'border': '1px solid #444'
+                                                                        },
+                                                                        className="dbc dbc-row-selectable"
+                                                                    )
+                                                                ]
+                                                            )
+                                                        ]
+                                                    ),
+                                                
+                                                    # BotÃ³n para volver atrÃ¡s
+                                                    html.Div(
+                                                        style={'textAlign': 'center', 'marginTop': '20px'},
+                                                        children=html.Button(
+                                                            "â† Volver a elegir tipo",
+                                                            id="btn-back-to-choose",
+                                                            style={
+                                                                'backgroundColor': 'transparent',
+                                                                'border': '1px solid #444',
+                                                                'color': '#ccc',
+                                                                'padding': '10px 20px',
+                                                                'borderRadius': '8px',
+                                                                'cursor': 'pointer',
+                                                                'fontSize': '0.9rem',
+                                                                'transition': 'all 0.3s ease'
+                                                            }
+                                                        )
+                                                    )
+                                                ]
+                                            )
+                                        ]
+                                    ),
+                                    dbc.ModalFooter(
+                                        style={'backgroundColor': '#1a1a1a', 'borderTop': '1px solid #2b2b2b'},
+                                        children=[
+                                            dbc.Button(
+                                                "Cancelar",
+                                                id="btn-cancel-goal",
+                                                color="secondary",
+                                                className="me-2",
+                                                style={'borderRadius': '8px'}
+                                            ),
+                                            dbc.Button(
+                                                "Agregar Objetivo",
+                                                id="btn-submit-goal",
+                                                color="primary",
+                                                style={'backgroundColor': HIGHLIGHT_COLOR, 'borderColor': HIGHLIGHT_COLOR, 'borderRadius': '8px'}
+                                            )
+                                        ]
+                                    )
+                                ],
+                                id="modal-add-goal",
+                                size="lg",
+                                is_open=False,
+                                centered=True,
+                                backdrop=True,
+                                style={'backgroundColor': 'rgba(0,0,0,0.7)'}
+                            )
+                        ]
+                    )
+                ]
+            )
+        ]
+    )
 
 # ===============================
 # NUTRICIÃ“N LAYOUT (COMPLETO - BASADO EN LA IMAGEN)
 # ===============================
 
-nutricion_layout = html.Div(
-    id="nutricion-container",
-    className="nutricion-container",
-    style={
-        'backgroundColor': DARK_BACKGROUND,
-        'minHeight': '100vh',
-        'color': 'white',
-        'fontFamily': 'Inter, sans-serif'
-    },
-    children=[
-        # Header (igual que en otras pÃ¡ginas)
-        html.Div(
-            id="nutricion-header",
-            className="nutricion-header",
-            style={
-                'backgroundColor': '#1a1a1a',
-                'padding': '15px 40px',
-                'borderBottom': '1px solid rgba(0, 212, 255, 0.1)',
-                'display': 'flex',
-                'justifyContent': 'space-between',
-                'alignItems': 'center'
-            },
-            children=[
-                html.Div(
-                    style={'display': 'flex', 'alignItems': 'center'},
-                    children=[
-                        html.Div(
-                            style={
-                                'width': '40px',
-                                'height': '40px',
-                                'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                'borderRadius': '10px',
-                                'border': f'2px solid {HIGHLIGHT_COLOR}',
-                                'display': 'flex',
-                                'alignItems': 'center',
-                                'justifyContent': 'center',
-                                'marginRight': '15px'
-                            },
-                            children=html.Span("A", style={'color': HIGHLIGHT_COLOR, 'fontWeight': 'bold', 'fontSize': '1.2rem'})
-                        ),
-                        html.H1(
-                            "ATHLETICA",
-                            style={
-                                'color': HIGHLIGHT_COLOR,
-                                'fontSize': '1.8rem',
-                                'fontWeight': '900',
-                                'letterSpacing': '2px',
-                                'textShadow': f'0 0 15px rgba(0, 224, 255, 0.5)',
-                                'margin': '0'
-                            }
-                        )
-                    ]
-                ),
+@lru_cache(maxsize=None)
+def nutricion_layout():
+    return html.Div(
+        id="nutricion-container",
+        className="nutricion-container",
+        style={
+            'backgroundColor': DARK_BACKGROUND,
+            'minHeight': '100vh',
+            'color': 'white',
+            'fontFamily': 'Inter, sans-serif'
+        },
+        children=[
+            # Header (igual que en otras pÃ¡ginas)
+            html.Div(
+                id="nutricion-header",
+                className="nutricion-header",
+                style={
+                    'backgroundColor': '#1a1a1a',
+                    'padding': '15px 40px',
+                    'borderBottom': '1px solid rgba(0, 212, 255, 0.1)',
+                    'display': 'flex',
+                    'justifyContent': 'space-between',
+                    'alignItems': 'center'
+                },
+                children=[
+                    html.Div(
+                        style={'display': 'flex', 'alignItems': 'center'},
+                        children=[
+                            html.Div(
+                                style={
+                                    'width': '40px',
+                                    'height': '40px',
+                                    'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                    'borderRadius': '10px',
+                                    'border': f'2px solid {HIGHLIGHT_COLOR}',
+                                    'display': 'flex',
+                                    'alignItems': 'center',
+                                    'justifyContent': 'center',
+                                    'marginRight': '15px'
+                                },
+                                children=html.Span("A", style={'color': HIGHLIGHT_COLOR, 'fontWeight': 'bold', 'fontSize': '1.2rem'})
+                            ),
+                            html.H1(
+                                "ATHLETICA",
+                                style={
+                                    'color': HIGHLIGHT_COLOR,
+                                    'fontSize': '1.8rem',
+                                    'fontWeight': '900',
+                                    'letterSpacing': '2px',
+                                    'textShadow': f'0 0 15px rgba(0, 224, 255, 0.5)',
+                                    'margin': '0'
+                                }
+                            )
+                        ]
+                    ),
                 
-                html.Div(
-                    style={
-                        'flex': '1',
-                        'height': '1px',
-                        'backgroundColor': 'rgba(0, 212, 255, 0.2)',
-                        'margin': '0 30px'
-                    }
-                ),
+                    html.Div(
+                        style={
+                            'flex': '1',
+                            'height': '1px',
+                            'backgroundColor': 'rgba(0, 212, 255, 0.2)',
+                            'margin': '0 30px'
+                        }
+                    ),
                 
-                html.Div(
-                    style={'display': 'flex', 'alignItems': 'center', 'gap': '20px'},
-                    children=[
-                        html.Div(
-                            style={
-                                'display': 'flex',
-                                'alignItems': 'center',
-                                'gap': '10px',
-                                'cursor': 'pointer'
-                            },
-                            children=[
-                                html.Div(
-                                    id="nutricion-user-profile-avatar",
-                                    style={
-                                        'width': '45px',
-                                        'height': '45px',
-                                        'backgroundColor': HIGHLIGHT_COLOR,
-                                        'borderRadius': '50%',
-                                        'border': f'2px solid {HIGHLIGHT_COLOR}',
-                                        'display': 'flex',
-                                        'alignItems': 'center',
-                                        'justifyContent': 'center',
-                                        'color': '#0a0a0a',
-                                        'fontWeight': 'bold',
-                                        'fontSize': '1.2rem'
-                                    }
-                                ),
-                                html.Div(
-                                    style={'textAlign': 'right'},
-                                    children=[
-                                        html.Div(
-                                            id="nutricion-user-profile-name",
-                                            style={
-                                                'fontWeight': '600',
-                                                'fontSize': '1rem',
-                                                'color': '#fff'
-                                            }
-                                        ),
-                                        html.Div(
-                                            "Atleta",
-                                            style={
-                                                'fontSize': '0.8rem',
-                                                'color': HIGHLIGHT_COLOR,
-                                                'fontWeight': '500'
-                                            }
-                                        )
-                                    ]
-                                )
-                            ]
-                        ),
-                    ]
-                )
-            ]
-        ),
+                    html.Div(
+                        style={'display': 'flex', 'alignItems': 'center', 'gap': '20px'},
+                        children=[
+                            html.Div(
+                                style={
+                                    'display': 'flex',
+                                    'alignItems': 'center',
+                                    'gap': '10px',
+                                    'cursor': 'pointer'
+                                },
+                                children=[
+                                    html.Div(
+                                        id={"type": "user-profile-avatar", "page": "nutricion"},
+                                        style={
+                                            'width': '45px',
+                                            'height': '45px',
+                                            'backgroundColor': HIGHLIGHT_COLOR,
+                                            'borderRadius': '50%',
+                                            'border': f'2px solid {HIGHLIGHT_COLOR}',
+                                            'display': 'flex',
+                                            'alignItems': 'center',
+                                            'justifyContent': 'center',
+                                            'color': '#0a0a0a',
+                                            'fontWeight': 'bold',
+                                            'fontSize': '1.2rem'
+                                        }
+                                    ),
+                                    html.Div(
+                                        style={'textAlign': 'right'},
+                                        children=[
+                                            html.Div(
+                                                id={"type": "user-profile-name", "page": "nutricion"},
+                                                style={
+                                                    'fontWeight': '600',
+                                                    'fontSize': '1rem',
+                                                    'color': '#fff'
+                                                }
+                                            ),
+                                            html.Div(
+                                                "Atleta",
+                                                style={
+                                                    'fontSize': '0.8rem',
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'fontWeight': '500'
+                                                }
+                                            )
+                                        ]
+                                    )
+                                ]
+                            ),
+                        ]
+                    )
+                ]
+            ),
 
-        # Cuerpo principal con sidebar y contenido
-        html.Div(
-            style={
-                'display': 'flex',
-                'minHeight': 'calc(100vh - 100px)'
-            },
-            children=[
-                # Sidebar (igual que en otras pÃ¡ginas)
-                html.Div(
-                    id="nutricion-sidebar",
-                    className="nutricion-sidebar",
-                    style={
-                        'width': '280px',
-                        'backgroundColor': '#141414',
-                        'padding': '25px 20px',
-                        'borderRight': '1px solid rgba(0, 212, 255, 0.1)',
-                        'display': 'flex',
-                        'flexDirection': 'column',
-                        'gap': '30px'
-                    },
-                    children=[
-                        html.Div(
-                            style={
-                                'padding': '20px',
-                                'backgroundColor': '#1a1a1a',
-                                'borderRadius': '15px',
-                                'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                'textAlign': 'center'
-                            },
-                            children=[
-                                html.Div(
-                                    id="nutricion-sidebar-user-avatar",
-                                    style={
-                                        'width': '70px',
-                                        'height': '70px',
-                                        'backgroundColor': HIGHLIGHT_COLOR,
-                                        'borderRadius': '50%',
-                                        'border': f'3px solid {HIGHLIGHT_COLOR}',
-                                        'display': 'flex',
-                                        'alignItems': 'center',
-                                        'justifyContent': 'center',
-                                        'color': '#0a0a0a',
-                                        'fontWeight': 'bold',
-                                        'fontSize': '1.8rem',
-                                        'margin': '0 auto 15px'
-                                    }
-                                ),
+            # Cuerpo principal con sidebar y contenido
+            html.Div(
+                style={
+                    'display': 'flex',
+                    'minHeight': 'calc(100vh - 100px)'
+                },
+                children=[
+                    # Sidebar (igual que en otras pÃ¡ginas)
+                    html.Div(
+                        id="nutricion-sidebar",
+                        className="nutricion-sidebar",
+                        style={
+                            'width': '280px',
+                            'backgroundColor': '#141414',
+                            'padding': '25px 20px',
+                            'borderRight': '1px solid rgba(0, 212, 255, 0.1)',
+                            'display': 'flex',
+                            'flexDirection': 'column',
+                            'gap': '30px'
+                        },
+                        children=[
+                            html.Div(
+                                style={
+                                    'padding': '20px',
+                                    'backgroundColor': '#1a1a1a',
+                                    'borderRadius': '15px',
+                                    'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                    'textAlign': 'center'
+                                },
+                                children=[
+                                    html.Div(
+                                        id={"type": "sidebar-user-avatar", "page": "nutricion"},
+                                        style={
+                                            'width': '70px',
+                                            'height': '70px',
+                                            'backgroundColor': HIGHLIGHT_COLOR,
+                                            'borderRadius': '50%',
+                                            'border': f'3px solid {HIGHLIGHT_COLOR}',
+                                            'display': 'flex',
+                                            'alignItems': 'center',
+                                            'justifyContent': 'center',
+                                            'color': '#0a0a0a',
+                                            'fontWeight': 'bold',
+                                            'fontSize': '1.8rem',
+                                            'margin': '0 auto 15px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="nutricion-sidebar-user-fullname",
-                                    style={
-                                        'fontSize': '1.3rem',
-                                        'fontWeight': '700',
-                                        'color': '#ffffff',
-                                        'marginBottom': '5px'
-                                    }
-                                ),
+                                    html.Div(
+                                        id={"type": "sidebar-user-fullname", "page": "nutricion"},
+                                        style={
+                                            'fontSize': '1.3rem',
+                                            'fontWeight': '700',
+                                            'color': '#ffffff',
+                                            'marginBottom': '5px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="nutricion-sidebar-user-level",
-                                    style={
-                                        'fontSize': '0.9rem',
-                                        'color': HIGHLIGHT_COLOR,
-                                        'fontWeight': '500',
-                                        'marginBottom': '20px'
-                                    }
-                                ),
+                                    html.Div(
+                                        id={"type": "sidebar-user-level", "page": "nutricion"},
+                                        style={
+                                            'fontSize': '0.9rem',
+                                            'color': HIGHLIGHT_COLOR,
+                                            'fontWeight': '500',
+                                            'marginBottom': '20px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    style={
-                                        'height': '1px',
-                                        'backgroundColor': 'rgba(255, 255, 255, 0.1)',
-                                        'margin': '15px 0'
-                                    }
-                                ),
+                                    html.Div(
+                                        style={
+                                            'height': '1px',
+                                            'backgroundColor': 'rgba(255, 255, 255, 0.1)',
+                                            'margin': '15px 0'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    "Estado de Salud",
-                                    style={
-                                        'fontSize': '1rem',
-                                        'fontWeight': '600',
-                                        'color': '#ffffff',
-                                        'marginBottom': '15px',
-                                        'textAlign': 'center'
-                                    }
-                                ),
+                                    html.Div(
+                                        "Estado de Salud",
+                                        style={
+                                            'fontSize': '1rem',
+                                            'fontWeight': '600',
+                                            'color': '#ffffff',
+                                            'marginBottom': '15px',
+                                            'textAlign': 'center'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="nutricion-health-status-dots",
-                                    style={
-                                        'display': 'flex',
-                                        'justifyContent': 'center',
-                                        'gap': '8px',
-                                        'marginBottom': '12px'
-                                    }
-                                ),
+                                    html.Div(
+                                        id={"type": "health-status-dots", "page": "nutricion"},
+                                        style={
+                                            'display': 'flex',
+                                            'justifyContent': 'center',
+                                            'gap': '8px',
+                                            'marginBottom': '12px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="nutricion-health-status-description",
-                                    style={
-                                        'fontSize': '0.8rem',
-                                        'color': '#cccccc',
-                                        'textAlign': 'center',
-                                        'lineHeight': '1.4'
-                                    }
-                                )
-                            ]
-                        ),
+                                    html.Div(
+                                        id={"type": "health-status-description", "page": "nutricion"},
+                                        style={
+                                            'fontSize': '0.8rem',
+                                            'color': '#cccccc',
+                                            'textAlign': 'center',
+                                            'lineHeight': '1.4'
+                                        }
+                                    )
+                                ]
+                            ),
                         
-                        # NavegaciÃ³n
-                        html.Div(
-                            children=[
-                                html.H4(
-                                    "NavegaciÃ³n",
-                                    style={
-                                        'color': HIGHLIGHT_COLOR,
-                                        'marginBottom': '20px',
-                                        'marginTop': '25px',
-                                        'fontSize': '1.1rem',
-                                        'fontWeight': '600',
-                                        'paddingLeft': '10px'
-                                    }
-                                ),
-                                html.Div(
-                                    style={'display': 'flex', 'flexDirection': 'column', 'gap': '8px'},
-                                    children=[
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-house-door", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("Inicio", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-inicio-nutricion",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                            # NavegaciÃ³n
+                            html.Div(
+                                children=[
+                                    html.H4(
+                                        "NavegaciÃ³n",
+                                        style={
+                                            'color': HIGHLIGHT_COLOR,
+                                            'marginBottom': '20px',
+                                            'marginTop': '25px',
+                                            'fontSize': '1.1rem',
+                                            'fontWeight': '600',
+                                            'paddingLeft': '10px'
+                                        }
+                                    ),
+                                    html.Div(
+                                        style={'display': 'flex', 'flexDirection': 'column', 'gap': '8px'},
+                                        children=[
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-house-door", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("Inicio", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-inicio-nutricion",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
                                         
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-graph-up", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("MÃ©tricas", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-metricas-nutricion",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-graph-up", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("MÃ©tricas", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-metricas-nutricion",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
                                         
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-bullseye", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("Objetivos", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-objetivos-nutricion",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-bullseye", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("Objetivos", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-objetivos-nutricion",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
                                         
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-egg-fried", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("NutriciÃ³n", style={'fontSize': '0.95rem', 'fontWeight': '500'})
-                                            ],
-                                            id="nav-nutricion-nutricion",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': f'1px solid {HIGHLIGHT_COLOR}',
-                                                'color': HIGHLIGHT_COLOR,
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-egg-fried", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("NutriciÃ³n", style={'fontSize': '0.95rem', 'fontWeight': '500'})
+                                                ],
+                                                id="nav-nutricion-nutricion",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': f'1px solid {HIGHLIGHT_COLOR}',
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
 
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-activity", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("Entrenamientos", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-entrenamientos-nutricion",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-activity", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("Entrenamientos", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-entrenamientos-nutricion",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
                                         
-                                    ]
-                                )
-                            ]
-                        )
-                    ]
-                ),
+                                        ]
+                                    )
+                                ]
+                            )
+                        ]
+                    ),
                 
-                # CONTENIDO PRINCIPAL DE NUTRICIÃ“N (BASADO EN LA IMAGEN)
-                html.Div(
-                    className="nutricion-main",
-                    style={
-                        'flex': '1',
-                        'padding': '40px',
-                        'display': 'flex',
-                        'flexDirection': 'column',
-                        'gap': '30px',
-                        'overflowY': 'auto'
-                    },
-                    children=[
-                        # TÃ­tulo principal
-                        html.Div(
-                            style={
-                                'display': 'flex',
-                                'justifyContent': 'space-between',
-                                'alignItems': 'center',
-                                'marginBottom': '10px'
-                            },
-                            children=[
-                                html.H2(
-                                    "ðŸ¥— NutriciÃ³n y AlimentaciÃ³n",
-                                    style={
-                                        'color': HIGHLIGHT_COLOR,
-                                        'fontSize': '2.5rem',
-                                        'fontWeight': '700',
-                                        'margin': '0'
-                                    }
-                                ),
+                    # CONTENIDO PRINCIPAL DE NUTRICIÃ“N (BASADO EN LA IMAGEN)
+                    html.Div(
+                        className="nutricion-main",
+                        style={
+                            'flex': '1',
+                            'padding': '40px',
+                            'display': 'flex',
+                            'flexDirection': 'column',
+                            'gap': '30px',
+                            'overflowY': 'auto'
+                        },
+                        children=[
+                            # TÃ­tulo principal
+                            html.Div(
+                                style={
+                                    'display': 'flex',
+                                    'justifyContent': 'space-between',
+                                    'alignItems': 'center',
+                                    'marginBottom': '10px'
+                                },
+                                children=[
+                                    html.H2(
+                                        "ðŸ¥— NutriciÃ³n y AlimentaciÃ³n",
+                                        style={
+                                            'color': HIGHLIGHT_COLOR,
+                                            'fontSize': '2.5rem',
+                                            'fontWeight': '700',
+                                            'margin': '0'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    style={
-                                        'color': '#ccc',
-                                        'fontSize': '1rem'
-                                    },
-                                    children=f"Hoy, {datetime.now().strftime('%d/%m/%Y')}"
-                                )
-                            ]
-                        ),
+                                    html.Div(
+                                        style={
+                                            'color': '#ccc',
+                                            'fontSize': '1rem'
+                                        },
+                                        children=f"Hoy, {datetime.now().strftime('%d/%m/%Y')}"
+                                    )
+                                ]
+                            ),
                         
-                        # Resumen de calorÃ­as (Parte superior)
-                        html.Div(
-                            style={
-                                'display': 'grid',
-                                'gridTemplateColumns': 'repeat(4, 1fr)',
-                                'gap': '25px',
-                                'marginBottom': '30px'
-                            },
-                            children=[
-                                # Total de calorÃ­as
-                                html.Div(
-                                    style={
-                                        'backgroundColor': '#1a1a1a',
-                                        'borderRadius': '15px',
-                                        'padding': '25px',
-                                        'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                        'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)',
-                                        'gridColumn': 'span 2',
-                                        'textAlign': 'center'
-                                    },
-                                    children=[
-                                        html.H3(
-                                            id="calorias-total",
-                                            children="2847",
-                                            style={
-                                                'fontSize': '4rem',
-                                                'fontWeight': '700',
-                                                'color': HIGHLIGHT_COLOR,
-                                                'marginBottom': '10px'
-                                            }
-                                        ),
-                                        html.Div(
-                                            "de 3000 kcal objetivo",
-                                            style={
-                                                'color': '#ccc',
-                                                'fontSize': '1.2rem',
-                                                'marginBottom': '15px'
-                                            }
-                                        ),
-                                        html.Div(
+                            # Resumen de calorÃ­as (Parte superior)
+                            html.Div(
+                                style={
+                                    'display': 'grid',
+                                    'gridTemplateColumns': 'repeat(4, 1fr)',
+                                    'gap': '25px',
+                                    'marginBottom': '30px'
+                                },
+                                children=[
+                                    # Total de calorÃ­as
+                                    html.Div(
+                                        style={
+                                            'backgroundColor': '#1a1a1a',
+                                            'borderRadius': '15px',
+                                            'padding': '25px',
+                                            'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                            'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)',
+                                            'gridColumn': 'span 2',
+                                            'textAlign': 'center'
+                                        },
+                                        children=[
+                                            html.H3(
+                                                id="calorias-total",
+                                                children="2847",
+                                                style={
+                                                    'fontSize': '4rem',
+                                                    'fontWeight': '700',
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'marginBottom': '10px'
+                                                }
+                                            ),
                                             html.Div(
+                                                "de 3000 kcal objetivo",
                                                 style={
-                                                    'width': '75%',  # 2847/3800 â‰ˆ 75%
-                                                    'height': '100%',
-                                                    'backgroundColor': HIGHLIGHT_COLOR,
-                                                    'borderRadius': '5px',
-                                                    'transition': 'width 0.5s ease'
+                                                    'color': '#ccc',
+                                                    'fontSize': '1.2rem',
+                                                    'marginBottom': '15px'
                                                 }
                                             ),
-                                            style={
-                                                'width': '100%',
-                                                'height': '10px',
-                                                'backgroundColor': '#2b2b2b',
-                                                'borderRadius': '5px',
-                                                'overflow': 'hidden'
-                                            }
-                                        )
-                                    ]
-                                ),
+                                            html.Div(
+                                                html.Div(
+                                                    style={
+                                                        'width': '75%',  # 2847/3800 â‰ˆ 75%
+                                                        'height': '100%',
+                                                        'backgroundColor': HIGHLIGHT_COLOR,
+                                                        'borderRadius': '5px',
+                                                        'transition': 'width 0.5s ease'
+                                                    }
+                                                ),
+                                                style={
+                                                    'width': '100%',
+                                                    'height': '10px',
+                                                    'backgroundColor': '#2b2b2b',
+                                                    'borderRadius': '5px',
+                                                    'overflow': 'hidden'
+                                                }
+                                            )
+                                        ]
+                                    ),
                                 
-                                # Carbohidratos
-                                html.Div(
-                                    style={
-                                        'backgroundColor': '#1a1a1a',
-                                        'borderRadius': '15px',
-                                        'padding': '25px',
-                                        'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                        'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)',
-                                        'textAlign': 'center'
-                                    },
-                                    children=[
-                                        html.H3(
-                                            id="carbohidratos-total",
-                                            children="180g",
-                                            style={
-                                                'fontSize': '2.5rem',
-                                                'fontWeight': '700',
-                                                'color': '#4ecdc4',
-                                                'marginBottom': '10px'
-                                            }
-                                        ),
-                                        html.Div(
-                                            "Carbohidratos",
-                                            style={
-                                                'color': '#ccc',
-                                                'fontSize': '1.1rem'
-                                            }
-                                        )
-                                    ]
-                                ),
+                                    # Carbohidratos
+                                    html.Div(
+                                        style={
+                                            'backgroundColor': '#1a1a1a',
+                                            'borderRadius': '15px',
+                                            'padding': '25px',
+                                            'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                            'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)',
+                                            'textAlign': 'center'
+                                        },
+                                        children=[
+                                            html.H3(
+                                                id="carbohidratos-total",
+                                                children="180g",
+                                                style={
+                                                    'fontSize': '2.5rem',
+                                                    'fontWeight': '700',
+                                                    'color': '#4ecdc4',
+                                                    'marginBottom': '10px'
+                                                }
+                                            ),
+                                            html.Div(
+                                                "Carbohidratos",
+                                                style={
+                                                    'color': '#ccc',
+                                                    'fontSize': '1.1rem'
+                                                }
+                                            )
+                                        ]
+                                    ),
                                 
-                                # ProteÃ­nas
-                                html.Div(
-                                    style={
-                                        'backgroundColor': '#1a1a1a',
-                                        'borderRadius': '15px',
-                                        'padding': '25px',
-                                        'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                        'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)',
-                                        'textAlign': 'center'
-                                    },
-                                    children=[
-                                        html.H3(
-                                            id="proteinas-total",
-                                            children="95g",
-                                            style={
-                                                'fontSize': '2.5rem',
-                                                'fontWeight': '700',
-                                                'color': '#ffd166',
-                                                'marginBottom': '10px'
-                                            }
-                                        ),
-                                        html.Div(
-                                            "ProteÃ­nas",
-                                            style={
-                                                'color': '#ccc',
-                                                'fontSize': '1.1rem'
-                                            }
-                                        )
-                                    ]
-                                ),
+                                    # ProteÃ­nas
+                                    html.Div(
+                                        style={
+                                            'backgroundColor': '#1a1a1a',
+                                            'borderRadius': '15px',
+                                            'padding': '25px',
+                                            'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                            'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)',
+                                            'textAlign': 'center'
+                                        },
+                                        children=[
+                                            html.H3(
+                                                id="proteinas-total",
+                                                children="95g",
+                                                style={
+                                                    'fontSize': '2.5rem',
+                                                    'fontWeight': '700',
+                                                    'color': '#ffd166',
+                                                    'marginBottom': '10px'
+                                                }
+                                            ),
+                                            html.Div(
+                                                "ProteÃ­nas",
+                                                style={
+                                                    'color': '#ccc',
+                                                    'fontSize': '1.1rem'
+                                                }
+                                            )
+                                        ]
+                                    ),
                                 
-                                # Grasas
-                                html.Div(
-                                    style={
-                                        'backgroundColor': '#1a1a1a',
-                                        'borderRadius': '15px',
-                                        'padding': '25px',
-                                        'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                        'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)',
-                                        'textAlign': 'center'
-                                    },
-                                    children=[
-                                        html.H3(
-                                            id="grasas-total",
-                                            children="65g",
-                                            style={
-                                                'fontSize': '2.5rem',
-                                                'fontWeight': '700',
-                                                'color': '#ff6b6b',
-                                                'marginBottom': '10px'
-                                            }
-                                        ),
-                                        html.Div(
-                                            "Grasas",
-                                            style={
-                                                'color': '#ccc',
-                                                'fontSize': '1.1rem'
-                                            }
-                                        )
-                                    ]
-                                )
-                            ]
-                        ),
+                                    # Grasas
+                                    html.Div(
+                                        style={
+                                            'backgroundColor': '#1a1a1a',
+                                            'borderRadius': '15px',
+                                            'padding': '25px',
+                                            'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                            'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)',
+                                            'textAlign': 'center'
+                                        },
+                                        children=[
+                                            html.H3(
+                                                id="grasas-total",
+                                                children="65g",
+                                                style={
+                                                    'fontSize': '2.5rem',
+                                                    'fontWeight': '700',
+                                                    'color': '#ff6b6b',
+                                                    'marginBottom': '10px'
+                                                }
+                                            ),
+                                            html.Div(
+                                                "Grasas",
+                                                style={
+                                                    'color': '#ccc',
+                                                    'fontSize': '1.1rem'
+                                                }
+                                            )
+                                        ]
+                                    )
+                                ]
+                            ),
                         
-                        # SecciÃ³n principal: Registro de comidas + HidrataciÃ³n
-                        html.Div(
-                            style={
-                                'display': 'grid',
-                                'gridTemplateColumns': '3fr 2fr',
-                                'gap': '30px'
-                            },
-                            children=[
-                                # COLUMNA IZQUIERDA: Registro de Comidas
-                                html.Div(
-                                    style={
-                                        'backgroundColor': '#1a1a1a',
-                                        'borderRadius': '15px',
-                                        'padding': '30px',
-                                        'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                        'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)'
-                                    },
-                                    children=[
-                                        html.H3(
-                                            "ðŸ“ Registro de Comidas",
-                                            style={
-                                                'color': HIGHLIGHT_COLOR,
-                                                'fontSize': '1.8rem',
-                                                'marginBottom': '30px',
-                                                'borderBottom': '2px solid rgba(0, 212, 255, 0.3)',
-                                                'paddingBottom': '15px'
-                                            }
-                                        ),
+                            # SecciÃ³n principal: Registro de comidas + HidrataciÃ³n
+                            html.Div(
+                                style={
+                                    'display': 'grid',
+                                    'gridTemplateColumns': '3fr 2fr',
+                                    'gap': '30px'
+                                },
+                                children=[
+                                    # COLUMNA IZQUIERDA: Registro de Comidas
+                                    html.Div(
+                                        style={
+                                            'backgroundColor': '#1a1a1a',
+                                            'borderRadius': '15px',
+                                            'padding': '30px',
+                                            'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                            'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)'
+                                        },
+                                        children=[
+                                            html.H3(
+                                                "ðŸ“ Registro de Comidas",
+                                                style={
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'fontSize': '1.8rem',
+                                                    'marginBottom': '30px',
+                                                    'borderBottom': '2px solid rgba(0, 212, 255, 0.3)',
+                                                    'paddingBottom': '15px'
+                                                }
+                                            ),
                                         
-                                        # Desayuno
-                                        html.Div(
-                                            style={
-                                                'marginBottom': '25px',
-                                                'paddingBottom': '25px',
-                                                'borderBottom': '1px solid #2b2b2b'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    style={
-                                                        'display': 'flex',
-                                                        'justifyContent': 'space-between',
-                                                        'alignItems': 'center',
-                                                        'marginBottom': '15px'
-                                                    },
-                                                    children=[
-                                                        html.H4(
-                                                            "ðŸ³ Desayuno",
-                                                            style={
-                                                                'color': '#fff',
-                                                                'fontSize': '1.4rem',
-                                                                'margin': '0'
-                                                            }
-                                                        ),
-                                                        html.Div(
-                                                            "08:00",
-                                                            style={
-                                                                'color': HIGHLIGHT_COLOR,
-                                                                'fontSize': '1.1rem',
-                                                                'fontWeight': '500'
-                                                            }
-                                                        )
-                                                    ]
-                                                ),
-                                                html.Div(
-                                                    id="meal-list-desayuno",
-                                                    children=[
-                                                        html.Div(
-                                                            "â€¢ Avena con frutas y nueces",
-                                                            style={'color': '#ccc', 'marginBottom': '5px'}
-                                                        ),
-                                                        html.Div(
-                                                            "â€¢ CafÃ© negro sin azÃºcar",
-                                                            style={'color': '#ccc', 'marginBottom': '5px'}
-                                                        )
-                                                    ]
-                                                )
-                                            ]
-                                        ),
+                                            # Desayuno
+                                            html.Div(
+                                                style={
+                                                    'marginBottom': '25px',
+                                                    'paddingBottom': '25px',
+                                                    'borderBottom': '1px solid #2b2b2b'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        style={
+                                                            'display': 'flex',
+                                                            'justifyContent': 'space-between',
+                                                            'alignItems': 'center',
+                                                            'marginBottom': '15px'
+                                                        },
+                                                        children=[
+                                                            html.H4(
+                                                                "ðŸ³ Desayuno",
+                                                                style={
+                                                                    'color': '#fff',
+                                                                    'fontSize': '1.4rem',
+                                                                    'margin': '0'
+                                                                }
+                                                            ),
+                                                            html.Div(
+                                                                "08:00",
+                                                                style={
+                                                                    'color': HIGHLIGHT_COLOR,
+                                                                    'fontSize': '1.1rem',
+                                                                    'fontWeight': '500'
+                                                                }
+                                                            )
+                                                        ]
+                                                    ),
+                                                    html.Div(
+                                                        id="meal-list-desayuno",
+                                                        children=[
+                                                            html.Div(
+                                                                "â€¢ Avena con frutas y nueces",
+                                                                style={'color': '#ccc', 'marginBottom': '5px'}
+                                                            ),
+                                                            html.Div(
+                                                                "â€¢ CafÃ© negro sin azÃºcar",
+                                                                style={'color': '#ccc', 'marginBottom': '5px'}
+                                                            )
+                                                        ]
+                                                    )
+                                                ]
+                                            ),
                                         
-                                        # Almuerzo
-                                        html.Div(
-                                            style={
-                                                'marginBottom': '25px',
-                                                'paddingBottom': '25px',
-                                                'borderBottom': '1px solid #2b2b2b'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    style={
-                                                        'display': 'flex',
-                                                        'justifyContent': 'space-between',
-                                                        'alignItems': 'center',
-                                                        'marginBottom': '15px'
-                                                    },
-                                                    children=[
-                                                        html.H4(
-                                                            "ðŸ¥— Almuerzo",
-                                                            style={
-                                                                'color': '#fff',
-                                                                'fontSize': '1.4rem',
-                                                                'margin': '0'
-                                                            }
-                                                        ),
-                                                        html.Div(
-                                                            "12:30",
-                                                            style={
-                                                                'color': HIGHLIGHT_COLOR,
-                                                                'fontSize': '1.1rem',
-                                                                'fontWeight': '500'
-                                                            }
-                                                        )
-                                                    ]
-                                                ),
-                                                html.Div(
-                                                    id="meal-list-almuerzo",
-                                                    children=[
-                                                        html.Div(
-                                                            "â€¢ Ensalada de pollo a la parrilla",
-                                                            style={'color': '#ccc', 'marginBottom': '5px'}
-                                                        ),
-                                                        html.Div(
-                                                            "â€¢ Quinoa y vegetales al vapor",
-                                                            style={'color': '#ccc', 'marginBottom': '5px'}
-                                                        ),
-                                                        html.Div(
-                                                            "â€¢ Agua con limÃ³n",
-                                                            style={'color': '#ccc', 'marginBottom': '5px'}
-                                                        )
-                                                    ]
-                                                )
-                                            ]
-                                        ),
+                                            # Almuerzo
+                                            html.Div(
+                                                style={
+                                                    'marginBottom': '25px',
+                                                    'paddingBottom': '25px',
+                                                    'borderBottom': '1px solid #2b2b2b'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        style={
+                                                            'display': 'flex',
+                                                            'justifyContent': 'space-between',
+                                                            'alignItems': 'center',
+                                                            'marginBottom': '15px'
+                                                        },
+                                                        children=[
+                                                            html.H4(
+                                                                "ðŸ¥— Almuerzo",
+                                                                style={
+                                                                    'color': '#fff',
+                                                                    'fontSize': '1.4rem',
+                                                                    'margin': '0'
+                                                                }
+                                                            ),
+                                                            html.Div(
+                                                                "12:30",
+                                                                style={
+                                                                    'color': HIGHLIGHT_COLOR,
+                                                                    'fontSize': '1.1rem',
+                                                                    'fontWeight': '500'
+                                                                }
+                                                            )
+                                                        ]
+                                                    ),
+                                                    html.Div(
+                                                        id="meal-list-almuerzo",
+                                                        children=[
+                                                            html.Div(
+                                                                "â€¢ Ensalada de pollo a la parrilla",
+                                                                style={'color': '#ccc', 'marginBottom': '5px'}
+                                                            ),
+                                                            html.Div(
+                                                                "â€¢ Quinoa y vegetales al vapor",
+                                                                style={'color': '#ccc', 'marginBottom': '5px'}
+                                                            ),
+                                                            html.Div(
+                                                                "â€¢ Agua con limÃ³n",
+                                                                style={'color': '#ccc', 'marginBottom': '5px'}
+                                                            )
+                                                        ]
+                                                    )
+                                                ]
+                                            ),
                                         
-                                        # Cena
-                                        html.Div(
-                                            style={
-                                                'marginBottom': '30px',
-                                                'paddingBottom': '25px',
-                                                'borderBottom': '1px solid #2b2b2b'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    style={
-                                                        'display': 'flex',
-                                                        'justifyContent': 'space-between',
-                                                        'alignItems': 'center',
-                                                        'marginBottom': '15px'
-                                                    },
-                                                    children=[
-                                                        html.H4(
-                                                            "ðŸ² Cena",
-                                                            style={
-                                                                'color': '#fff',
-                                                                'fontSize': '1.4rem',
-                                                                'margin': '0'
-                                                            }
-                                                        ),
-                                                        html.Div(
-                                                            "18:00",
-                                                            style={
-                                                                'color': HIGHLIGHT_COLOR,
-                                                                'fontSize': '1.1rem',
-                                                                'fontWeight': '500'
-                                                            }
-                                                        )
-                                                    ]
-                                                ),
-                                                html.Div(
-                                                    id="meal-list-cena",
-                                                    children=[
-                                                        html.Div(
-                                                            "â€¢ SalmÃ³n a la plancha",
-                                                            style={'color': '#ccc', 'marginBottom': '5px'}
-                                                        ),
-                                                        html.Div(
-                                                            "â€¢ EspÃ¡rragos y brÃ³coli",
-                                                            style={'color': '#ccc', 'marginBottom': '5px'}
-                                                        ),
-                                                        html.Div(
-                                                            "â€¢ Batido de proteÃ­nas",
-                                                            style={'color': '#ccc', 'marginBottom': '5px'}
-                                                        )
-                                                    ]
-                                                )
-                                            ]
-                                        ),
+                                            # Cena
+                                            html.Div(
+                                                style={
+                                                    'marginBottom': '30px',
+                                                    'paddingBottom': '25px',
+                                                    'borderBottom': '1px solid #2b2b2b'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        style={
+                                                            'display': 'flex',
+                                                            'justifyContent': 'space-between',
+                                                            'alignItems': 'center',
+                                                            'marginBottom': '15px'
+                                                        },
+                                                        children=[
+                                                            html.H4(
+                                                                "ðŸ² Cena",
+                                                                style={
+                                                                    'color': '#fff',
+                                                                    'fontSize': '1.4rem',
+                                                                    'margin': '0'
+                                                                }
+                                                            ),
+                                                            html.Div(
+                                                                "18:00",
+                                                                style={
+                                                                    'color': HIGHLIGHT_COLOR,
+                                                                    'fontSize': '1.1rem',
+                                                                    'fontWeight': '500'
+                                                                }
+                                                            )
+                                                        ]
+                                                    ),
+                                                    html.Div(
+                                                        id="meal-list-cena",
+                                                        children=[
+                                                            html.Div(
+                                                                "â€¢ SalmÃ³n a la plancha",
+                                                                style={'color': '#ccc', 'marginBottom': '5px'}
+                                                            ),
+                                                            html.Div(
+                                                                "â€¢ EspÃ¡rragos y brÃ³coli",
+                                                                style={'color': '#ccc', 'marginBottom': '5px'}
+                                                            ),
+                                                            html.Div(
+                                                                "â€¢ Batido de proteÃ­nas",
+                                                                style={'color': '#ccc', 'marginBottom': '5px'}
+                                                            )
+                                                        ]
+                                                    )
+                                                ]
+                                            ),
                                         
-                                        # Snacks
-                                        html.Div(
-                                            style={
-                                                'marginBottom': '30px'
-                                            },
-                                            children=[
-                                                html.H4(
-                                                    "ðŸŽ Snacks",
+                                            # Snacks
+                                            html.Div(
+                                                style={
+                                                    'marginBottom': '30px'
+                                                },
+                                                children=[
+                                                    html.H4(
+                                                        "ðŸŽ Snacks",
+                                                        style={
+                                                            'color': '#fff',
+                                                            'fontSize': '1.4rem',
+                                                            'margin': '0 0 15px 0'
+                                                        }
+                                                    ),
+                                                    html.Div(
+                                                        id="meal-list-snacks",
+                                                        children=[
+                                                            html.Div(
+                                                                "â€¢ Manzana verde (10:30)",
+                                                                style={'color': '#ccc', 'marginBottom': '5px'}
+                                                            ),
+                                                            html.Div(
+                                                                "â€¢ Yogur griego con almendras (16:00)",
+                                                                style={'color': '#ccc', 'marginBottom': '5px'}
+                                                            )
+                                                        ]
+                                                    )
+                                                ]
+                                            ),
+                                        
+                                            # BotÃ³n para agregar comida
+                                            html.Div(
+                                                style={
+                                                    'textAlign': 'center',
+                                                    'marginTop': '20px'
+                                                },
+                                                children=dbc.Button(
+                                                    [
+                                                        html.I(className="bi bi-plus-circle me-2"),
+                                                        "Agregar Comida"
+                                                    ],
+                                                    id="btn-agregar-comida",
+                                                    className="auth-btn",
                                                     style={
-                                                        'color': '#fff',
-                                                        'fontSize': '1.4rem',
-                                                        'margin': '0 0 15px 0'
+                                                        'backgroundColor': HIGHLIGHT_COLOR,
+                                                        'border': 'none',
+                                                        'fontWeight': '600',
+                                                        'padding': '15px 30px',
+                                                        'borderRadius': '12px',
+                                                        'fontSize': '1.1rem',
+                                                        'color': '#0a0a0a',
+                                                        'transition': 'all 0.3s ease',
+                                                        'width': '100%'
                                                     }
-                                                ),
-                                                html.Div(
-                                                    id="meal-list-snacks",
-                                                    children=[
-                                                        html.Div(
-                                                            "â€¢ Manzana verde (10:30)",
-                                                            style={'color': '#ccc', 'marginBottom': '5px'}
-                                                        ),
-                                                        html.Div(
-                                                            "â€¢ Yogur griego con almendras (16:00)",
-                                                            style={'color': '#ccc', 'marginBottom': '5px'}
-                                                        )
-                                                    ]
                                                 )
-                                            ]
-                                        ),
-                                        
-                                        # BotÃ³n para agregar comida
-                                        html.Div(
-                                            style={
-                                                'textAlign': 'center',
-                                                'marginTop': '20px'
-                                            },
-                                            children=dbc.Button(
-                                                [
-                                                    html.I(className="bi bi-plus-circle me-2"),
-                                                    "Agregar Comida"
-                                                ],
-                                                id="btn-agregar-comida",
-                                                className="auth-btn",
-                                                style={
-                                                    'backgroundColor': HIGHLIGHT_COLOR,
-                                                    'border': 'none',
-                                                    'fontWeight': '600',
-                                                    'padding': '15px 30px',
-                                                    'borderRadius': '12px',
-                                                    'fontSize': '1.1rem',
-                                                    'color': '#0a0a0a',
-                                                    'transition': 'all 0.3s ease',
-                                                    'width': '100%'
-                                                }
                                             )
-                                        )
-                                    ]
-                                ),
+                                        ]
+                                    ),
                                 
-                                # COLUMNA DERECHA: HidrataciÃ³n
-                                html.Div(
-                                    style={
-                                        'backgroundColor': '#1a1a1a',
-                                        'borderRadius': '15px',
-                                        'padding': '30px',
-                                        'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                        'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)'
-                                    },
-                                    children=[
-                                        html.H3(
-                                            "ðŸ’§ HidrataciÃ³n",
-                                            style={
-                                                'color': HIGHLIGHT_COLOR,
-                                                'fontSize': '1.8rem',
-                                                'marginBottom': '30px',
-                                                'borderBottom': '2px solid rgba(0, 212, 255, 0.3)',
-                                                'paddingBottom': '15px'
-                                            }
-                                        ),
+                                    # COLUMNA DERECHA: HidrataciÃ³n
+                                    html.Div(
+                                        style={
+                                            'backgroundColor': '#1a1a1a',
+                                            'borderRadius': '15px',
+                                            'padding': '30px',
+                                            'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                            'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)'
+                                        },
+                                        children=[
+                                            html.H3(
+                                                "ðŸ’§ HidrataciÃ³n",
+                                                style={
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'fontSize': '1.8rem',
+                                                    'marginBottom': '30px',
+                                                    'borderBottom': '2px solid rgba(0, 212, 255, 0.3)',
+                                                    'paddingBottom': '15px'
+                                                }
+                                            ),
                                         
-                                        # Progreso de hidrataciÃ³n
-                                        html.Div(
-                                            style={
-                                                'textAlign': 'center',
-                                                'marginBottom': '30px'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    style={
-                                                        'position': 'relative',
-                                                        'width': '200px',
-                                                        'height': '200px',
-                                                        'margin': '0 auto 20px'
-                                                    },
-                                                    children=[
-                                                        # CÃ­rculo de fondo
-                                                        html.Div(
-                                                            style={
-                                                                'position': 'absolute',
-                                                                'top': '0',
-                                                                'left': '0',
-                                                                'width': '100%',
-                                                                'height': '100%',
-                                                                'borderRadius': '50%',
-                                                                'border': '10px solid #2b2b2b',
-                                                                'boxSizing': 'border-box'
-                                                            }
-                                                        ),
-                                                        # CÃ­rculo de progreso (70% = 2.1L/3L)
-                                                        html.Div(
-                                                            id="hidratacion-circle-progress",
-                                                            style={
-                                                                'position': 'absolute',
-                                                                'top': '0',
-                                                                'left': '0',
-                                                                'width': '100%',
-                                                                'height': '100%',
-                                                                'borderRadius': '50%',
-                                                                'border': '10px solid transparent',
-                                                                'borderTop': f'10px solid {HIGHLIGHT_COLOR}',
-                                                                'borderRight': f'10px solid {HIGHLIGHT_COLOR}',
-                                                                'transform': 'rotate(252deg)',  # 70% de 360Â° = 252Â°
-                                                                'boxSizing': 'border-box'
-                                                            }
-                                                        ),
-                                                        # Texto en el centro
-                                                        html.Div(
-                                                            style={
-                                                                'position': 'absolute',
-                                                                'top': '50%',
-                                                                'left': '50%',
-                                                                'transform': 'translate(-50%, -50%)',
-                                                                'textAlign': 'center'
-                                                            },
-                                                            children=[
-                                                                html.Div(
-                                                                    id="hidratacion-progreso",
-                                                                    children="2.1L",
-                                                                    style={
-                                                                        'fontSize': '2.5rem',
-                                                                        'fontWeight': '700',
-                                                                        'color': HIGHLIGHT_COLOR,
-                                                                        'marginBottom': '5px'
-                                                                    }
-                                                                ),
-                                                                html.Div(
-                                                                    id="hidratacion-texto",
-                                                                    children="de 3L objetivo",
-                                                                    style={
-                                                                        'color': '#ccc',
-                                                                        'fontSize': '1rem'
-                                                                    }
-                                                                )
-                                                            ]
-                                                        )
-                                                    ]
-                                                ),
+                                            # Progreso de hidrataciÃ³n
+                                            html.Div(
+                                                style={
+                                                    'textAlign': 'center',
+                                                    'marginBottom': '30px'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        style={
+                                                            'position': 'relative',
+                                                            'width': '200px',
+                                                            'height': '200px',
+                                                            'margin': '0 auto 20px'
+                                                        },
+                                                        children=[
+                                                            # CÃ­rculo de fondo
+                                                            html.Div(
+                                                                style={
+                                                                    'position': 'absolute',
+                                                                    'top': '0',
+                                                                    'left': '0',
+                                                                    'width': '100%',
+                                                                    'height': '100%',
+                                                                    'borderRadius': '50%',
+                                                                    'border': '10px solid #2b2b2b',
+                                                                    'boxSizing': 'border-box'
+                                                                }
+                                                            ),
+                                                            # CÃ­rculo de progreso (70% = 2.1L/3L)
+                                                            html.Div(
+                                                                id="hidratacion-circle-progress",
+                                                                style={
+                                                                    'position': 'absolute',
+                                                                    'top': '0',
+                                                                    'left': '0',
+                                                                    'width': '100%',
+                                                                    'height': '100%',
+                                                                    'borderRadius': '50%',
+                                                                    'border': '10px solid transparent',
+                                                                    'borderTop': f'10px solid {HIGHLIGHT_COLOR}',
+                                                                    'borderRight': f'10px solid {HIGHLIGHT_COLOR}',
+                                                                    'transform': 'rotate(252deg)',  # 70% de 360Â° = 252Â°
+                                                                    'boxSizing': 'border-box'
+                                                                }
+                                                            ),
+                                                            # Texto en el centro
+                                                            html.Div(
+                                                                style={
+                                                                    'position': 'absolute',
+                                                                    'top': '50%',
+                                                                    'left': '50%',
+                                                                    'transform': 'translate(-50%, -50%)',
+                                                                    'textAlign': 'center'
+                                                                },
+                                                                children=[
+                                                                    html.Div(
+                                                                        id="hidratacion-progreso",
+                                                                        children="2.1L",
+                                                                        style={
+                                                                            'fontSize': '2.5rem',
+                                                                            'fontWeight': '700',
+                                                                            'color': HIGHLIGHT_COLOR,
+                                                                            'marginBottom': '5px'
+                                                                        }
+                                                                    ),
+                                                                    html.Div(
+                                                                        id="hidratacion-texto",
+                                                                        children="de 3L objetivo",
+                                                                        style={
+                                                                            'color': '#ccc',
+                                                                            'fontSize': '1rem'
+                                                                        }
+                                                                    )
+                                                                ]
+                                                            )
+                                                        ]
+                                                    ),
                                                 
-                                                html.Div(
-                                                    "70% del objetivo diario completado",
-                                                    style={
-                                                        'color': HIGHLIGHT_COLOR,
-                                                        'fontSize': '1.1rem',
-                                                        'fontWeight': '500',
-                                                        'marginBottom': '15px'
-                                                    }
-                                                )
-                                            ]
-                                        ),
+                                                    html.Div(
+                                                        "70% del objetivo diario completado",
+                                                        style={
+                                                            'color': HIGHLIGHT_COLOR,
+                                                            'fontSize': '1.1rem',
+                                                            'fontWeight': '500',
+                                                            'marginBottom': '15px'
+                                                        }
+                                                    )
+                                                ]
+                                            ),
                                         
-                                        # Recomendaciones de hidrataciÃ³n
-                                        html.Div(
-                                            style={
-                                                'backgroundColor': 'rgba(0, 212, 255, 0.05)',
-                                                'borderRadius': '12px',
-                                                'padding': '20px',
-                                                'marginBottom': '30px'
-                                            },
-                                            children=[
-                                                html.H4(
-                                                    "ðŸ’¡ Recomendaciones",
+                                            # Recomendaciones de hidrataciÃ³n
+                                            html.Div(
+                                                style={
+                                                    'backgroundColor': 'rgba(0, 212, 255, 0.05)',
+                                                    'borderRadius': '12px',
+                                                    'padding': '20px',
+                                                    'marginBottom': '30px'
+                                                },
+                                                children=[
+                                                    html.H4(
+                                                        "ðŸ’¡ Recomendaciones",
+                                                        style={
+                                                            'color': HIGHLIGHT_COLOR,
+                                                            'fontSize': '1.3rem',
+                                                            'marginBottom': '15px'
+                                                        }
+                                                    ),
+                                                    html.Ul(
+                                                        style={'paddingLeft': '20px', 'margin': '0'},
+                                                        children=[
+                                                            html.Li(
+                                                                "Bebe 500ml adicionales por cada hora de ejercicio",
+                                                                style={'color': '#ccc', 'marginBottom': '8px'}
+                                                            ),
+                                                            html.Li(
+                                                                "Toma agua al despertar para activar el metabolismo",
+                                                                style={'color': '#ccc', 'marginBottom': '8px'}
+                                                            ),
+                                                            html.Li(
+                                                                "Controla el color de tu orina como indicador de hidrataciÃ³n",
+                                                                style={'color': '#ccc'}
+                                                            )
+                                                        ]
+                                                    )
+                                                ]
+                                            ),
+                                        
+                                            # BotÃ³n para registrar agua
+                                            html.Div(
+                                                style={
+                                                    'textAlign': 'center'
+                                                },
+                                                children=dbc.Button(
+                                                    [
+                                                        html.I(className="bi bi-droplet me-2"),
+                                                        "Registrar Agua (+250ml)"
+                                                    ],
+                                                    id="btn-registrar-agua",
+                                                    className="auth-btn",
                                                     style={
+                                                        'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                                        'border': f'2px solid {HIGHLIGHT_COLOR}',
+                                                        'fontWeight': '600',
+                                                        'padding': '15px 30px',
+                                                        'borderRadius': '12px',
+                                                        'fontSize': '1.1rem',
                                                         'color': HIGHLIGHT_COLOR,
-                                                        'fontSize': '1.3rem',
-                                                        'marginBottom': '15px'
+                                                        'transition': 'all 0.3s ease',
+                                                        'width': '100%'
                                                     }
-                                                ),
-                                                html.Ul(
-                                                    style={'paddingLeft': '20px', 'margin': '0'},
-                                                    children=[
-                                                        html.Li(
-                                                            "Bebe 500ml adicionales por cada hora de ejercicio",
-                                                            style={'color': '#ccc', 'marginBottom': '8px'}
-                                                        ),
-                                                        html.Li(
-                                                            "Toma agua al despertar para activar el metabolismo",
-                                                            style={'color': '#ccc', 'marginBottom': '8px'}
-                                                        ),
-                                                        html.Li(
-                                                            "Controla el color de tu orina como indicador de hidrataciÃ³n",
-                                                            style={'color': '#ccc'}
-                                                        )
-                                                    ]
-                                                )
-                                            ]
-                                        ),
-                                        
-                                        # BotÃ³n para registrar agua
-                                        html.Div(
-                                            style={
-                                                'textAlign': 'center'
-                                            },
-                                            children=dbc.Button(
-                                                [
-                                                    html.I(className="bi bi-droplet me-2"),
-                                                    "Registrar Agua (+250ml)"
-                                                ],
-                                                id="btn-registrar-agua",
-                                                className="auth-btn",
-                                                style={
-                                                    'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                                    'border': f'2px solid {HIGHLIGHT_COLOR}',
-                                                    'fontWeight': '600',
-                                                    'padding': '15px 30px',
-                                                    'borderRadius': '12px',
-                                                    'fontSize': '1.1rem',
-                                                    'color': HIGHLIGHT_COLOR,
-                                                    'transition': 'all 0.3s ease',
-                                                    'width': '100%'
-                                                }
+                                                )
                                             )
-                                        )
-                                    ]
-                                )
-                            ]
-                        ),
+                                        ]
+                                    )
+                                ]
+                            ),
                         
-                        # GrÃ¡fico de distribuciÃ³n de macronutrientes
-                        html.Div(
-                            style={
-                                'backgroundColor': '#1a1a1a',
-                                'borderRadius': '15px',
-                                'padding': '30px',
-                                'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)'
-                            },
-                            children=[
-                                html.H3(
-                                    "ðŸ“Š DistribuciÃ³n de Macronutrientes",
-                                    style={
-                                        'color': HIGHLIGHT_COLOR,
-                                        'fontSize': '1.8rem',
-                                        'marginBottom': '30px'
-                                    }
-                                ),
+                            # GrÃ¡fico de distribuciÃ³n de macronutrientes
+                            html.Div(
+                                style={
+                                    'backgroundColor': '#1a1a1a',
+                                    'borderRadius': '15px',
+                                    'padding': '30px',
+                                    'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                    'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)'
+                                },
+                                children=[
+                                    html.H3(
+                                        "ðŸ“Š DistribuciÃ³n de Macronutrientes",
+                                        style={
+                                            'color': HIGHLIGHT_COLOR,
+                                            'fontSize': '1.8rem',
+                                            'marginBottom': '30px'
+                                        }
+                                    ),
                                 
-                                # GrÃ¡fico de pastel
-                                dcc.Graph(
-                                    id='macronutrientes-chart',
-                                    config={'displayModeBar': False},
-                                    style={'height': '300px'}
-                                ),
+                                    # GrÃ¡fico de pastel
+                                    dcc.Graph(
+                                        id='macronutrientes-chart',
+                                        config={'displayModeBar': False},
+                                        style={'height': '300px'}
+                                    ),
                                 
-                                # Leyenda de macronutrientes
-                                html.Div(
-                                    style={
-                                        'display': 'flex',
-                                        'justifyContent': 'center',
-                                        'gap': '30px',
-                                        'marginTop': '20px',
-                                        'flexWrap': 'wrap'
-                                    },
-                                    children=[
-                                        html.Div(
-                                            style={'display': 'flex', 'alignItems': 'center', 'gap': '10px'},
-                                            children=[
-                                                html.Div(
-                                                    style={
-                                                        'width': '20px',
-                                                        'height': '20px',
-                                                        'backgroundColor': '#4ecdc4',
-                                                        'borderRadius': '4px'
-                                                    }
-                                                ),
-                                                html.Span(
-                                                    "Carbohidratos: 180g (53%)",
-                                                    style={'color': '#ccc', 'fontWeight': '500'}
-                                                )
-                                            ]
-                                        ),
-                                        html.Div(
-                                            style={'display': 'flex', 'alignItems': 'center', 'gap': '10px'},
-                                            children=[
-                                                html.Div(
-                                                    style={
-                                                        'width': '20px',
-                                                        'height': '20px',
-                                                        'backgroundColor': '#ffd166',
-                                                        'borderRadius': '4px'
-                                                    }
-                                                ),
-                                                html.Span(
-                                                    "ProteÃ­nas: 95g (28%)",
-                                                    style={'color': '#ccc', 'fontWeight': '500'}
-                                                )
-                                            ]
-                                        ),
-                                        html.Div(
-                                            style={'display': 'flex', 'alignItems': 'center', 'gap': '10px'},
-                                            children=[
-                                                html.Div(
-                                                    style={
-                                                        'width': '20px',
-                                                        'height': '20px',
-                                                        'backgroundColor': '#ff6b6b',
-                                                        'borderRadius': '4px'
-                                                    }
-                                                ),
-                                                html.Span(
-                                                    "Grasas: 65g (19%)",
-                                                    style={'color': '#ccc', 'fontWeight': '500'}
-                                                )
-                                            ]
-                                        )
-                                    ]
-                                )
-                            ]
-                        ),
+                                    # Leyenda de macronutrientes
+                                    html.Div(
+                                        style={
+                                            'display': 'flex',
+                                            'justifyContent': 'center',
+                                            'gap': '30px',
+                                            'marginTop': '20px',
+                                            'flexWrap': 'wrap'
+                                        },
+                                        children=[
+                                            html.Div(
+                                                style={'display': 'flex', 'alignItems': 'center', 'gap': '10px'},
+                                                children=[
+                                                    html.Div(
+                                                        style={
+                                                            'width': '20px',
+                                                            'height': '20px',
+                                                            'backgroundColor': '#4ecdc4',
+                                                            'borderRadius': '4px'
+                                                        }
+                                                    ),
+                                                    html.Span(
+                                                        "Carbohidratos: 180g (53%)",
+                                                        style={'color': '#ccc', 'fontWeight': '500'}
+                                                    )
+                                                ]
+                                            ),
+                                            html.Div(
+                                                style={'display': 'flex', 'alignItems': 'center', 'gap': '10px'},
+                                                children=[
+                                                    html.Div(
+                                                        style={
+                                                            'width': '20px',
+                                                            'height': '20px',
+                                                            'backgroundColor': '#ffd166',
+                                                            'borderRadius': '4px'
+                                                        }
+                                                    ),
+                                                    html.Span(
+                                                        "ProteÃ­nas: 95g (28%)",
+                                                        style={'color': '#ccc', 'fontWeight': '500'}
+                                                    )
+                                                ]
+                                            ),
+                                            html.Div(
+                                                style={'display': 'flex', 'alignItems': 'center', 'gap': '10px'},
+                                                children=[
+                                                    html.Div(
+                                                        style={
+                                                            'width': '20px',
+                                                            'height': '20px',
+                                                            'backgroundColor': '#ff6b6b',
+                                                            'borderRadius': '4px'
+                                                        }
+                                                    ),
+                                                    html.Span(
+                                                        "Grasas: 65g (19%)",
+                                                        style={'color': '#ccc', 'fontWeight': '500'}
+                                                    )
+                                                ]
+                                            )
+                                        ]
+                                    )
+                                ]
+                            ),
                         
-                        # MODAL PARA AGREGAR COMIDA (AGREGAR ESTO) - PUNTO 1
-                        dbc.Modal(
-                            [
-                                dbc.ModalHeader(
-                                    html.H4("ðŸ½ï¸ Agregar Nueva Comida", style={'color': HIGHLIGHT_COLOR}),
-                                    close_button=True,
-                                    style={'backgroundColor': '#1a1a1a', 'borderBottom': '1px solid #2b2b2b'}
-                                ),
-                                dbc.ModalBody(
-                                    style={'backgroundColor': '#1a1a1a', 'color': 'white'},
-                                    children=[
-                                        # Tipo de comida
-                                        html.Div(
-                                            style={'marginBottom': '20px'},
-                                            children=[
-                                                html.Label("Tipo de comida", 
-                                                          style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
-                                                dcc.Dropdown(
-                                                    id="meal-type-dropdown",
-                                                    options=[
-                                                        {'label': 'ðŸ³ Desayuno', 'value': 'desayuno'},
-                                                        {'label': 'ðŸ¥— Almuerzo', 'value': 'almuerzo'},
-                                                        {'label': 'ðŸ² Cena', 'value': 'cena'},
-                                                        {'label': 'ðŸŽ Snacks', 'value': 'snacks'}
-                                                    ],
-                                                    placeholder="Selecciona el tipo de comida",
-                                                    style={
-                                                        'backgroundColor': '#2b2b2b',
-                                                        'color': 'white',
-                                                        'border': '1px solid #444'
-                                                    },
-                                                    className="dbc dbc-row-selectable"
-                                                )
-                                            ]
-                                        ),
+                            # MODAL PARA AGREGAR COMIDA (AGREGAR ESTO) - PUNTO 1
+                            dbc.Modal(
+                                [
+                                    dbc.ModalHeader(
+                                        html.H4("ðŸ½ï¸ Agregar Nueva Comida", style={'color': HIGHLIGHT_COLOR}),
+                                        close_button=True,
+                                        style={'backgroundColor': '#1a1a1a', 'borderBottom': '1px solid #2b2b2b'}
+                                    ),
+                                    dbc.ModalBody(
+                                        style={'backgroundColor': '#1a1a1a', 'color': 'white'},
+                                        children=[
+                                            # Tipo de comida
+                                            html.Div(
+                                                style={'marginBottom': '20px'},
+                                                children=[
+                                                    html.Label("Tipo de comida", 
+                                                              style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
+                                                    dcc.Dropdown(
+                                                        id="meal-type-dropdown",
+                                                        options=[
+                                                            {'label': 'ðŸ³ Desayuno', 'value': 'desayuno'},
+                                                            {'label': 'ðŸ¥— Almuerzo', 'value': 'almuerzo'},
+                                                            {'label': 'ðŸ² Cena', 'value': 'cena'},
+                                                            {'label': 'ðŸŽ Snacks', 'value': 'snacks'}
+                                                        ],
+                                                        placeholder="Selecciona el tipo de comida",
+                                                        style={
+                                                            'backgroundColor': '#2b2b2b',
+                                                            'color': 'white',
+                                                            'border': '1px solid #444'
+                                                        },
+                                                        className="dbc dbc-row-selectable"
+                                                    )
+                                                ]
+                                            ),
                                         
-                                        # Hora de la comida
-                                        html.Div(
-                                            style={'marginBottom': '20px'},
-                                            children=[
-                                                html.Label("Hora de la comida", 
-                                                          style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
-                                                dcc.Input(
-                                                    id="meal-time-input",
-                                                    type="text",
-                                                    placeholder="Ej: 08:00, 12:30, 18:00",
-                                                    style={
-                                                        'width': '100%',
-                                                        'padding': '12px 15px',
-                                                        'backgroundColor': '#2b2b2b',
-                                                        'border': '1px solid #444',
-                                                        'borderRadius': '8px',
-                                                        'color': 'white',
-                                                        'fontSize': '1rem'
-                                                    }
-                                                )
-                                            ]
-                                        ),
+                                            # Hora de la comida
+                                            html.Div(
+                                                style={'marginBottom': '20px'},
+                                                children=[
+                                                    html.Label("Hora de la comida", 
+                                                              style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
+                                                    dcc.Input(
+                                                        id="meal-time-input",
+                                                        type="text",
+                                                        placeholder="Ej: 08:00, 12:30, 18:00",
+                                                        style={
+                                                            'width': '100%',
+                                                            'padding': '12px 15px',
+                                                            'backgroundColor': '#2b2b2b',
+                                                            'border': '1px solid #444',
+                                                            'borderRadius': '8px',
+                                                            'color': 'white',
+                                                            'fontSize': '1rem'
+                                                        }
+                                                    )
+                                                ]
+                                            ),
                                         
-                                        # DescripciÃ³n de la comida
-                                        html.Div(
-                                            style={'marginBottom': '20px'},
-                                            children=[
-                                                html.Label("Â¿QuÃ© has comido?", 
-                                                          style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
-                                                dcc.Textarea(
-                                                    id="meal-description-input",
-                                                    placeholder="Ej: Avena con frutas y nueces, CafÃ© negro sin azÃºcar...",
-                                                    style={
-                                                        'width': '100%',
-                                                        'height': '100px',
-                                                        'padding': '12px 15px',
-                                                        'backgroundColor': '#2b2b2b',
-                                                        'border': '1px solid #444',
-                                                        'borderRadius': '8px',
-                                                        'color': 'white',
-                                                        'fontSize': '1rem',
-                                                        'resize': 'vertical'
-                                                    }
-                                                )
-                                            ]
-                                        ),
+                                            # DescripciÃ³n de la comida
+                                            html.Div(
+                                                style={'marginBottom': '20px'},
+                                                children=[
+                                                    html.Label("Â¿QuÃ© has comido?", 
+                                                              style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
+                                                    dcc.Textarea(
+                                                        id="meal-description-input",
+                                                        placeholder="Ej: Avena con frutas y nueces, CafÃ© negro sin azÃºcar...",
+                                                        style={
+                                                            'width': '100%',
+                                                            'height': '100px',
+                                                            'padding': '12px 15px',
+                                                            'backgroundColor': '#2b2b2b',
+                                                            'border': '1px solid #444',
+                                                            'borderRadius': '8px',
+                                                            'color': 'white',
+                                                            'fontSize': '1rem',
+                                                            'resize': 'vertical'
+                                                        }
+                                                    )
+                                                ]
+                                            ),
                                         
-                                        # Macronutrientes (estimados - opcional)
-                                        html.Div(
-                                            style={
-                                                'backgroundColor': 'rgba(0, 212, 255, 0.05)',
-                                                'padding': '15px',
-                                                'borderRadius': '10px',
-                                                'marginBottom': '20px'
-                                            },
-                                            children=[
-                                                html.H5("ðŸ“Š Macronutrientes Estimados (Opcional)", 
-                                                       style={'color': HIGHLIGHT_COLOR, 'marginBottom': '10px'}),
-                                                html.P("Si conoces los valores, puedes ingresarlos manualmente. Si no, el sistema estimarÃ¡ automÃ¡ticamente.", 
-                                                       style={'color': '#ccc', 'fontSize': '0.9rem', 'marginBottom': '15px'}),
+                                            # Macronutrientes (estimados - opcional)
+                                            html.Div(
+                                                style={
+                                                    'backgroundColor': 'rgba(0, 212, 255, 0.05)',
+                                                    'padding': '15px',
+                                                    'borderRadius': '10px',
+                                                    'marginBottom': '20px'
+                                                },
+                                                children=[
+                                                    html.H5("ðŸ“Š Macronutrientes Estimados (Opcional)", 
+                                                           style={'color': HIGHLIGHT_COLOR, 'marginBottom': '10px'}),
+                                                    html.P("Si conoces los valores, puedes ingresarlos manualmente. Si no, el sistema estimarÃ¡ automÃ¡ticamente.", 
+                                                           style={'color': '#ccc', 'fontSize': '0.9rem', 'marginBottom': '15px'}),
                                                 
-                                                html.Div(
-                                                    style={
-                                                        'display': 'grid',
-                                                        'gridTemplateColumns': 'repeat(3, 1fr)',
-                                                        'gap': '10px'
-                                                    },
-                                                    children=[
-                                                        html.Div(
-                                                            children=[
-                                                                html.Label("Carbohidratos (g)", 
-                                                                          style={'color': '#ccc', 'fontSize': '0.9rem', 'marginBottom': '5px', 'display': 'block'}),
-                                                                dcc.Input(
-                                                                    id="carbs-input",
-                                                                    type="number",
-                                                                    placeholder="Ej: 45",
-                                                                    min=0,
-                                                                    step=1,
-                                                                    style={
-                                                                        'width': '100%',
-                                                                        'padding': '8px 10px',
-                                                                        'backgroundColor': '#2b2b2b',
-                                                                        'border': '1px solid #444',
-                                                                        'borderRadius': '6px',
-                                                                        'color': 'white',
-                                                                        'fontSize': '0.9rem'
-                                                                    }
-                                                                )
-                                                            ]
-                                                        ),
-                                                        html.Div(
-                                                            children=[
-                                                                html.Label("ProteÃ­nas (g)", 
-                                                                          style={'color': '#ccc', 'fontSize': '0.9rem', 'marginBottom': '5px', 'display': 'block'}),
-                                                                dcc.Input(
-                                                                    id="protein-input",
-                                                                    type="number",
-                                                                    placeholder="Ej: 25",
-                                                                    min=0,
-                                                                    step=1,
-                                                                    style={
-                                                                        'width': '100%',
-                                                                        'padding': '8px 10px',
-                                                                        'backgroundColor': '#2b2b2b',
-                                                                        'border': '1px solid #444',
-                                                                        'borderRadius': '6px',
-                                                                        'color': 'white',
-                                                                        'fontSize': '0.9rem'
-                                                                    }
-                                                                )
-                                                            ]
-                                                        ),
-                                                        html.Div(
-                                                            children=[
-                                                                html.Label("Grasas (g)", 
-                                                                          style={'color': '#ccc', 'fontSize': '0.9rem', 'marginBottom': '5px', 'display': 'block'}),
-                                                                dcc.Input(
-                                                                    id="fat-input",
-                                                                    type="number",
-                                                                    placeholder="Ej: 15",
-                                                                    min=0,
-                                                                    step=1,
-                                                                    style={
-                                                                        'width': '100%',
-                                                                        'padding': '8px 10px',
-                                                                        'backgroundColor': '#2b2b2b',
-                                                                        'border': '1px solid #444',
-                                                                        'borderRadius': '6px',
-                                                                        'color': 'white',
-                                                                        'fontSize': '0.9rem'
-                                                                    }
-                                                                )
-                                                            ]
-                                                        )
-                                                    ]
-                                                )
-                                            ]
-                                        ),
+                                                    html.Div(
+                                                        style={
+                                                            'display': 'grid',
+                                                            'gridTemplateColumns': 'repeat(3, 1fr)',
+                                                            'gap': '10px'
+                                                        },
+                                                        children=[
+                                                            html.Div(
+                                                                children=[
+                                                                    html.Label("Carbohidratos (g)", 
+                                                                              style={'color': '#ccc', 'fontSize': '0.9rem', 'marginBottom': '5px', 'display': 'block'}),
+                                                                    dcc.Input(
+                                                                        id="carbs-input",
+                                                                        type="number",
+                                                                        placeholder="Ej: 45",
+                                                                        min=0,
+                                                                        step=1,
+                                                                        style={
+                                                                            'width': '100%',
+                                                                            'padding': '8px 10px',
+                                                                            'backgroundColor': '#2b2b2b',
+                                                                            'border': '1px solid #444',
+                                                                            'borderRadius': '6px',
+                                                                            'color': 'white',
+                                                                            'fontSize': '0.9rem'
+                                                                        }
+                                                                    )
+                                                                ]
+                                                            ),
+                                                            html.Div(
+                                                                children=[
+                                                                    html.Label("ProteÃ­nas (g)", 
+                                                                              style={'color': '#ccc', 'fontSize': '0.9rem', 'marginBottom': '5px', 'display': 'block'}),
+                                                                    dcc.Input(
+                                                                        id="protein-input",
+                                                                        type="number",
+                                                                        placeholder="Ej: 25",
+                                                                        min=0,
+                                                                        step=1,
+                                                                        style={
+                                                                            'width': '100%',
+                                                                            'padding': '8px 10px',
+                                                                            'backgroundColor': '#2b2b2b',
+                                                                            'border': '1px solid #444',
+                                                                            'borderRadius': '6px',
+                                                                            'color': 'white',
+                                                                            'fontSize': '0.9rem'
+                                                                        }
+                                                                    )
+                                                                ]
+                                                            ),
+                                                            html.Div(
+                                                                children=[
+                                                                    html.Label("Grasas (g)", 
+                                                                              style={'color': '#ccc', 'fontSize': '0.9rem', 'marginBottom': '5px', 'display': 'block'}),
+                                                                    dcc.Input(
+                                                                        id="fat-input",
+                                                                        type="number",
+                                                                        placeholder="Ej: 15",
+                                                                        min=0,
+                                                                        step=1,
+                                                                        style={
+                                                                            'width': '100%',
+                                                                            'padding': '8px 10px',
+                                                                            'backgroundColor': '#2b2b2b',
+                                                                            'border': '1px solid #444',
+                                                                            'borderRadius': '6px',
+                                                                            'color': 'white',
+                                                                            'fontSize': '0.9rem'
+                                                                        }
+                                                                    )
+                                                                ]
+                                                            )
+                                                        ]
+                                                    )
+                                                ]
+                                            ),
                                         
-                                        # CalorÃ­as estimadas
-                                        html.Div(
-                                            style={'marginBottom': '20px'},
-                                            children=[
-                                                html.Label("CalorÃ­as estimadas", 
-                                                          style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
-                                                dcc.Input(
-                                                    id="calories-input",
-                                                    type="number",
-                                                    placeholder="Ej: 350",
-                                                    min=0,
-                                                    step=1,
-                                                    style={
-                                                        'width': '100%',
-                                                        'padding': '12px 15px',
-                                                        'backgroundColor': '#2b2b2b',
-                                                        'border': '1px solid #444',
-                                                        'borderRadius': '8px',
-                                                        'color': 'white',
-                                                        'fontSize': '1rem'
-                                                    }
-                                                )
-                                            ]
-                                        )
-                                    ]
-                                ),
-                                dbc.ModalFooter(
-                                    style={'backgroundColor': '#1a1a1a', 'borderTop': '1px solid #2b2b2b'},
-                                    children=[
-                                        dbc.Button(
-                                            "Cancelar",
-                                            id="btn-cancel-meal",
-                                            color="secondary",
-                                            className="me-2",
-                                            style={'borderRadius': '8px'}
-                                        ),
-                                        dbc.Button(
-                                            "Agregar Comida",
-                                            id="btn-submit-meal",
-                                            color="primary",
-                                            style={'backgroundColor': HIGHLIGHT_COLOR, 'borderColor': HIGHLIGHT_COLOR, 'borderRadius': '8px'}
-                                        )
-                                    ]
-                                )
-                            ],
-                            id="modal-add-meal",
-                            size="lg",
-                            is_open=False,
-                            centered=True,
-                            backdrop=True,
-                            style={'backgroundColor': 'rgba(0,0,0,0.7)'}
-                        )
-                    ]
-                )
-            ]
-        )
-    ]
-)
-
-# ===============================
-# ENTRENAMIENTOS LAYOUT
-# ===============================
+                                            # CalorÃ­as estimadas
+                                            html.Div(
+                                                style={'marginBottom': '20px'},
+                                                children=[
+                                                    html.Label("CalorÃ­as estimadas", 
+                                                              style={'color': '#ccc', 'fontWeight': '500', 'marginBottom': '8px', 'display': 'block'}),
+                                                    dcc.Input(
+                                                        id="calories-input",
+                                                        type="number",
+                                                        placeholder="Ej: 350",
+                                                        min=0,
+                                                        step=1,
+                                                        style={
+                                                            'width': '100%',
+                                                            'padding': '12px 15px',
+                                                            'backgroundColor': '#2b2b2b',
+                                                            'border': '1px solid #444',
+                                                            'borderRadius': '8px',
+                                                            'color': 'white',
+                                                            'fontSize': '1rem'
+                                                        }
+                                                    )
+                                                ]
+                                            )
+                                        ]
+                                    ),
+                                    dbc.ModalFooter(
+                                        style={'backgroundColor': '#1a1a1a', 'borderTop': '1px solid #2b2b2b'},
+                                        children=[
+                                            dbc.Button(
+                                                "Cancelar",
+                                                id="btn-cancel-meal",
+                                                color="secondary",
+                                                className="me-2",
+                                                style={'borderRadius': '8px'}
+                                            ),
+                                            dbc.Button(
+                                                "Agregar Comida",
+                                                id="btn-submit-meal",
+                                                color="primary",
+                                                style={'backgroundColor': HIGHLIGHT_COLOR, 'borderColor': HIGHLIGHT_COLOR, 'borderRadius': '8px'}
+                                            )
+                                        ]
+                                    )
+                                ],
+                                id="modal-add-meal",
+                                size="lg",
+                                is_open=False,
+                                centered=True,
+                                backdrop=True,
+                                style={'backgroundColor': 'rgba(0,0,0,0.7)'}
+                            )
+                        ]
+                    )
+                ]
+            )
+        ]
+    )
 
 # ===============================
-# ENTRENAMIENTOS LAYOUT (MODIFICADO)
-# ===============================
-
-entrenamientos_layout = html.Div(
-    id="entrenamientos-container",
-    className="entrenamientos-container",
-    style={
-        'backgroundColor': DARK_BACKGROUND,
-        'minHeight': '100vh',
-        'color': 'white',
-        'fontFamily': 'Inter, sans-serif'
-    },
-    children=[
-        # Header (igual que en otras pÃ¡ginas)
-        html.Div(
-            id="entrenamientos-header",
-            className="entrenamientos-header",
-            style={
-                'backgroundColor': '#1a1a1a',
-                'padding': '15px 40px',
-                'borderBottom': '1px solid rgba(0, 212, 255, 0.1)',
-                'display': 'flex',
-                'justifyContent': 'space-between',
-                'alignItems': 'center'
-            },
-            children=[
-                html.Div(
-                    style={'display': 'flex', 'alignItems': 'center'},
-                    children=[
-                        html.Div(
-                            style={
-                                'width': '40px',
-                                'height': '40px',
-                                'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                'borderRadius': '10px',
-                                'border': f'2px solid {HIGHLIGHT_COLOR}',
-                                'display': 'flex',
-                                'alignItems': 'center',
-                                'justifyContent': 'center',
-                                'marginRight': '15px'
-                            },
-                            children=html.Span("A", style={'color': HIGHLIGHT_COLOR, 'fontWeight': 'bold', 'fontSize': '1.2rem'})
-                        ),
-                        html.H1(
-                            "ATHLETICA",
-                            style={
-                                'color': HIGHLIGHT_COLOR,
-                                'fontSize': '1.8rem',
-                                'fontWeight': '900',
-                                'letterSpacing': '2px',
-                                'textShadow': f'0 0 15px rgba(0, 224, 255, 0.5)',
-                                'margin': '0'
-                            }
-                        )
-                    ]
-                ),
+# ENTRENAMIENTOS LAYOUT
+# ===============================
+
+# ===============================
+# ENTRENAMIENTOS LAYOUT (MODIFICADO)
+# ===============================
+
+@lru_cache(maxsize=None)
+def entrenamientos_layout():
+    return html.Div(
+        id="entrenamientos-container",
+        className="entrenamientos-container",
+        style={
+            'backgroundColor': DARK_BACKGROUND,
+            'minHeight': '100vh',
+            'color': 'white',
+            'fontFamily': 'Inter, sans-serif'
+        },
+        children=[
+            # Header (igual que en otras pÃ¡ginas)
+            html.Div(
+                id="entrenamientos-header",
+                className="entrenamientos-header",
+                style={
+                    'backgroundColor': '#1a1a1a',
+                    'padding': '15px 40px',
+                    'borderBottom': '1px solid rgba(0, 212, 255, 0.1)',
+                    'display': 'flex',
+                    'justifyContent': 'space-between',
+                    'alignItems': 'center'
+                },
+                children=[
+                    html.Div(
+                        style={'display': 'flex', 'alignItems': 'center'},
+                        children=[
+                            html.Div(
+                                style={
+                                    'width': '40px',
+                                    'height': '40px',
+                                    'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                    'borderRadius': '10px',
+                                    'border': f'2px solid {HIGHLIGHT_COLOR}',
+                                    'display': 'flex',
+                                    'alignItems': 'center',
+                                    'justifyContent': 'center',
+                                    'marginRight': '15px'
+                                },
+                                children=html.Span("A", style={'color': HIGHLIGHT_COLOR, 'fontWeight': 'bold', 'fontSize': '1.2rem'})
+                            ),
+                            html.H1(
+                                "ATHLETICA",
+                                style={
+                                    'color': HIGHLIGHT_COLOR,
+                                    'fontSize': '1.8rem',
+                                    'fontWeight': '900',
+                                    'letterSpacing': '2px',
+                                    'textShadow': f'0 0 15px rgba(0, 224, 255, 0.5)',
+                                    'margin': '0'
+                                }
+                            )
+                        ]
+                    ),
                 
-                html.Div(
-                    style={
-                        'flex': '1',
-                        'height': '1px',
-                        'backgroundColor': 'rgba(0, 212, 255, 0.2)',
-                        'margin': '0 30px'
-                    }
-                ),
+                    html.Div(
+                        style={
+                            'flex': '1',
+                            'height': '1px',
+                            'backgroundColor': 'rgba(0, 212, 255, 0.2)',
+                            'margin': '0 30px'
+                        }
+                    ),
                 
-                html.Div(
-                    style={'display': 'flex', 'alignItems': 'center', 'gap': '20px'},
-                    children=[
-                        html.Div(
-                            style={
-                                'display': 'flex',
-                                'alignItems': 'center',
-                                'gap': '10px',
-                                'cursor': 'pointer'
-                            },
-                            children=[
-                                html.Div(
-                                    id="entrenamientos-user-profile-avatar",
-                                    style={
-                                        'width': '45px',
-                                        'height': '45px',
-                                        'backgroundColor': HIGHLIGHT_COLOR,
-                                        'borderRadius': '50%',
-                                        'border': f'2px solid {HIGHLIGHT_COLOR}',
-                                        'display': 'flex',
-                                        'alignItems': 'center',
-                                        'justifyContent': 'center',
-                                        'color': '#0a0a0a',
-                                        'fontWeight': 'bold',
-                                        'fontSize': '1.2rem'
-                                    }
-                                ),
-                                html.Div(
-                                    style={'textAlign': 'right'},
-                                    children=[
-                                        html.Div(
-                                            id="entrenamientos-user-profile-name",
-                                            style={
-                                                'fontWeight': '600',
-                                                'fontSize': '1rem',
-                                                'color': '#fff'
-                                            }
-                                        ),
-                                        html.Div(
-                                            "Atleta",
-                                            style={
-                                                'fontSize': '0.8rem',
-                                                'color': HIGHLIGHT_COLOR,
-                                                'fontWeight': '500'
-                                            }
-                                        )
-                                    ]
-                                )
-                            ]
-                        ),
-                    ]
-                )
-            ]
-        ),
+                    html.Div(
+                        style={'display': 'flex', 'alignItems': 'center', 'gap': '20px'},
+                        children=[
+                            html.Div(
+                                style={
+                                    'display': 'flex',
+                                    'alignItems': 'center',
+                                    'gap': '10px',
+                                    'cursor': 'pointer'
+                                },
+                                children=[
+                                    html.Div(
+                                        id={"type": "user-profile-avatar", "page": "entrenamientos"},
+                                        style={
+                                            'width': '45px',
+                                            'height': '45px',
+                                            'backgroundColor': HIGHLIGHT_COLOR,
+                                            'borderRadius': '50%',
+                                            'border': f'2px solid {HIGHLIGHT_COLOR}',
+                                            'display': 'flex',
+                                            'alignItems': 'center',
+                                            'justifyContent': 'center',
+                                            'color': '#0a0a0a',
+                                            'fontWeight': 'bold',
+                                            'fontSize': '1.2rem'
+                                        }
+                                    ),
+                                    html.Div(
+                                        style={'textAlign': 'right'},
+                                        children=[
+                                            html.Div(
+                                                id={"type": "user-profile-name", "page": "entrenamientos"},
+                                                style={
+                                                    'fontWeight': '600',
+                                                    'fontSize': '1rem',
+                                                    'color': '#fff'
+                                                }
+                                            ),
+                                            html.Div(
+                                                "Atleta",
+                                                style={
+                                                    'fontSize': '0.8rem',
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'fontWeight': '500'
+                                                }
+                                            )
+                                        ]
+                                    )
+                                ]
+                            ),
+                        ]
+                    )
+                ]
+            ),
 
-        # Cuerpo principal con sidebar y contenido
-        html.Div(
-            style={
-                'display': 'flex',
-                'minHeight': 'calc(100vh - 100px)'
-            },
-            children=[
-                # Sidebar (igual que en otras pÃ¡ginas)
-                html.Div(
-                    id="entrenamientos-sidebar",
-                    className="entrenamientos-sidebar",
-                    style={
-                        'width': '280px',
-                        'backgroundColor': '#141414',
-                        'padding': '25px 20px',
-                        'borderRight': '1px solid rgba(0, 212, 255, 0.1)',
-                        'display': 'flex',
-                        'flexDirection': 'column',
-                        'gap': '30px'
-                    },
-                    children=[
-                        html.Div(
-                            style={
-                                'padding': '20px',
-                                'backgroundColor': '#1a1a1a',
-                                'borderRadius': '15px',
-                                'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                'textAlign': 'center'
-                            },
-                            children=[
-                                html.Div(
-                                    id="entrenamientos-sidebar-user-avatar",
-                                    style={
-                                        'width': '70px',
-                                        'height': '70px',
-                                        'backgroundColor': HIGHLIGHT_COLOR,
-                                        'borderRadius': '50%',
-                                        'border': f'3px solid {HIGHLIGHT_COLOR}',
-                                        'display': 'flex',
-                                        'alignItems': 'center',
-                                        'justifyContent': 'center',
-                                        'color': '#0a0a0a',
-                                        'fontWeight': 'bold',
-                                        'fontSize': '1.8rem',
-                                        'margin': '0 auto 15px'
-                                    }
-                                ),
+            # Cuerpo principal con sidebar y contenido
+            html.Div(
+                style={
+                    'display': 'flex',
+                    'minHeight': 'calc(100vh - 100px)'
+                },
+                children=[
+                    # Sidebar (igual que en otras pÃ¡ginas)
+                    html.Div(
+                        id="entrenamientos-sidebar",
+                        className="entrenamientos-sidebar",
+                        style={
+                            'width': '280px',
+                            'backgroundColor': '#141414',
+                            'padding': '25px 20px',
+                            'borderRight': '1px solid rgba(0, 212, 255, 0.1)',
+                            'display': 'flex',
+                            'flexDirection': 'column',
+                            'gap': '30px'
+                        },
+                        children=[
+                            html.Div(
+                                style={
+                                    'padding': '20px',
+                                    'backgroundColor': '#1a1a1a',
+                                    'borderRadius': '15px',
+                                    'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                    'textAlign': 'center'
+                                },
+                                children=[
+                                    html.Div(
+                                        id={"type": "sidebar-user-avatar", "page": "entrenamientos"},
+                                        style={
+                                            'width': '70px',
+                                            'height': '70px',
+                                            'backgroundColor': HIGHLIGHT_COLOR,
+                                            'borderRadius': '50%',
+                                            'border': f'3px solid {HIGHLIGHT_COLOR}',
+                                            'display': 'flex',
+                                            'alignItems': 'center',
+                                            'justifyContent': 'center',
+                                            'color': '#0a0a0a',
+                                            'fontWeight': 'bold',
+                                            'fontSize': '1.8rem',
+                                            'margin': '0 auto 15px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="entrenamientos-sidebar-user-fullname",
-                                    style={
-                                        'fontSize': '1.3rem',
-                                        'fontWeight': '700',
-                                        'color': '#ffffff',
-                                        'marginBottom': '5px'
-                                    }
-                                ),
+                                    html.Div(
+                                        id={"type": "sidebar-user-fullname", "page": "entrenamientos"},
+                                        style={
+                                            'fontSize': '1.3rem',
+                                            'fontWeight': '700',
+                                            'color': '#ffffff',
+                                            'marginBottom': '5px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="entrenamientos-sidebar-user-level",
-                                    style={
-                                        'fontSize': '0.9rem',
-                                        'color': HIGHLIGHT_COLOR,
-                                        'fontWeight': '500',
-                                        'marginBottom': '20px'
-                                    }
-                                ),
+                                    html.Div(
+                                        id={"type": "sidebar-user-level", "page": "entrenamientos"},
+                                        style={
+                                            'fontSize': '0.9rem',
+                                            'color': HIGHLIGHT_COLOR,
+                                            'fontWeight': '500',
+                                            'marginBottom': '20px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    style={
-                                        'height': '1px',
-                                        'backgroundColor': 'rgba(255, 255, 255, 0.1)',
-                                        'margin': '15px 0'
-                                    }
-                                ),
+                                    html.Div(
+                                        style={
+                                            'height': '1px',
+                                            'backgroundColor': 'rgba(255, 255, 255, 0.1)',
+                                            'margin': '15px 0'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    "Estado de Salud",
-                                    style={
-                                        'fontSize': '1rem',
-                                        'fontWeight': '600',
-                                        'color': '#ffffff',
-                                        'marginBottom': '15px',
-                                        'textAlign': 'center'
-                                    }
-                                ),
+                                    html.Div(
+                                        "Estado de Salud",
+                                        style={
+                                            'fontSize': '1rem',
+                                            'fontWeight': '600',
+                                            'color': '#ffffff',
+                                            'marginBottom': '15px',
+                                            'textAlign': 'center'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="entrenamientos-health-status-dots",
-                                    style={
-                                        'display': 'flex',
-                                        'justifyContent': 'center',
-                                        'gap': '8px',
-                                        'marginBottom': '12px'
-                                    }
-                                ),
+                                    html.Div(
+                                        id={"type": "health-status-dots", "page": "entrenamientos"},
+                                        style={
+                                            'display': 'flex',
+                                            'justifyContent': 'center',
+                                            'gap': '8px',
+                                            'marginBottom': '12px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    id="entrenamientos-health-status-description",
-                                    style={
-                                        'fontSize': '0.8rem',
-                                        'color': '#cccccc',
-                                        'textAlign': 'center',
-                                        'lineHeight': '1.4'
-                                    }
-                                )
-                            ]
-                        ),
+                                    html.Div(
+                                        id={"type": "health-status-description", "page": "entrenamientos"},
+                                        style={
+                                            'fontSize': '0.8rem',
+                                            'color': '#cccccc',
+                                            'textAlign': 'center',
+                                            'lineHeight': '1.4'
+                                        }
+                                    )
+                                ]
+                            ),
                         
-                        # NavegaciÃ³n
-                        html.Div(
-                            children=[
-                                html.H4(
-                                    "NavegaciÃ³n",
-                                    style={
-                                        'color': HIGHLIGHT_COLOR,
-                                        'marginBottom': '20px',
-                                        'marginTop': '25px',
-                                        'fontSize': '1.1rem',
-                                        'fontWeight': '600',
-                                        'paddingLeft': '10px'
-                                    }
-                                ),
-                                html.Div(
-                                    style={'display': 'flex', 'flexDirection': 'column', 'gap': '8px'},
-                                    children=[
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-house-door", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("Inicio", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-inicio-entrenamientos",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                            # NavegaciÃ³n
+                            html.Div(
+                                children=[
+                                    html.H4(
+                                        "NavegaciÃ³n",
+                                        style={
+                                            'color': HIGHLIGHT_COLOR,
+                                            'marginBottom': '20px',
+                                            'marginTop': '25px',
+                                            'fontSize': '1.1rem',
+                                            'fontWeight': '600',
+                                            'paddingLeft': '10px'
+                                        }
+                                    ),
+                                    html.Div(
+                                        style={'display': 'flex', 'flexDirection': 'column', 'gap': '8px'},
+                                        children=[
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-house-door", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("Inicio", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-inicio-entrenamientos",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
                                         
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-graph-up", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("MÃ©tricas", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-metricas-entrenamientos",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-graph-up", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("MÃ©tricas", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-metricas-entrenamientos",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
                                         
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-bullseye", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("Objetivos", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-objetivos-entrenamientos",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-bullseye", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("Objetivos", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-objetivos-entrenamientos",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
                                         
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-egg-fried", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("NutriciÃ³n", style={'fontSize': '0.95rem', 'fontWeight': '400'})
-                                            ],
-                                            id="nav-nutricion-entrenamientos",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'transparent',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': '1px solid transparent',
-                                                'color': '#ccc',
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-egg-fried", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("NutriciÃ³n", style={'fontSize': '0.95rem', 'fontWeight': '400'})
+                                                ],
+                                                id="nav-nutricion-entrenamientos",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'transparent',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': '1px solid transparent',
+                                                    'color': '#ccc',
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
                                         
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-activity", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
-                                                html.Span("Entrenamientos", style={'fontSize': '0.95rem', 'fontWeight': '500'})
-                                            ],
-                                            id="nav-entrenamientos-entrenamientos",
-                                            n_clicks=0,
-                                            style={
-                                                'display': 'flex',
-                                                'alignItems': 'center',
-                                                'padding': '12px 15px',
-                                                'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                                'borderRadius': '10px',
-                                                'cursor': 'pointer',
-                                                'transition': 'all 0.3s ease',
-                                                'border': f'1px solid {HIGHLIGHT_COLOR}',
-                                                'color': HIGHLIGHT_COLOR,
-                                                'textAlign': 'left',
-                                                'fontFamily': "'Inter', sans-serif",
-                                                'border': 'none'
-                                            }
-                                        ),
-                                    ]
-                                )
-                            ]
-                        )
-                    ]
-                ),
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-activity", style={'marginRight': '12px', 'fontSize': '1.1rem'}),
+                                                    html.Span("Entrenamientos", style={'fontSize': '0.95rem', 'fontWeight': '500'})
+                                                ],
+                                                id="nav-entrenamientos-entrenamientos",
+                                                n_clicks=0,
+                                                style={
+                                                    'display': 'flex',
+                                                    'alignItems': 'center',
+                                                    'padding': '12px 15px',
+                                                    'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                                    'borderRadius': '10px',
+                                                    'cursor': 'pointer',
+                                                    'transition': 'all 0.3s ease',
+                                                    'border': f'1px solid {HIGHLIGHT_COLOR}',
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'textAlign': 'left',
+                                                    'fontFamily': "'Inter', sans-serif",
+                                                    'border': 'none'
+                                                }
+                                            ),
+                                        ]
+                                    )
+                                ]
+                            )
+                        ]
+                    ),
                 
-                # CONTENIDO PRINCIPAL DE ENTRENAMIENTOS (NUEVO)
-                html.Div(
-                    className="entrenamientos-main",
-                    style={
-                        'flex': '1',
-                        'padding': '40px',
-                        'display': 'flex',
-                        'flexDirection': 'column',
-                        'gap': '30px',
-                        'overflowY': 'auto'
-                    },
-                    children=[
-                        # TÃ­tulo principal
-                        html.Div(
-                            style={
-                                'display': 'flex',
-                                'justifyContent': 'space-between',
-                                'alignItems': 'center',
-                                'marginBottom': '10px'
-                            },
-                            children=[
-                                html.H2(
-                                    "ðŸ’ª Entrenamientos",
-                                    style={
-                                        'color': HIGHLIGHT_COLOR,
-                                        'fontSize': '2.5rem',
-                                        'fontWeight': '700',
-                                        'margin': '0'
-                                    }
-                                ),
+                    # CONTENIDO PRINCIPAL DE ENTRENAMIENTOS (NUEVO)
+                    html.Div(
+                        className="entrenamientos-main",
+                        style={
+                            'flex': '1',
+                            'padding': '40px',
+                            'display': 'flex',
+                            'flexDirection': 'column',
+                            'gap': '30px',
+                            'overflowY': 'auto'
+                        },
+                        children=[
+                            # TÃ­tulo principal
+                            html.Div(
+                                style={
+                                    'display': 'flex',
+                                    'justifyContent': 'space-between',
+                                    'alignItems': 'center',
+                                    'marginBottom': '10px'
+                                },
+                                children=[
+                                    html.H2(
+                                        "ðŸ’ª Entrenamientos",
+                                        style={
+                                            'color': HIGHLIGHT_COLOR,
+                                            'fontSize': '2.5rem',
+                                            'fontWeight': '700',
+                                            'margin': '0'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    style={
-                                        'color': '#ccc',
-                                        'fontSize': '1rem'
-                                    },
-                                    children=f"Hoy, {datetime.now().strftime('%d/%m/%Y')}"
-                                )
-                            ]
-                        ),
-                        
-                        # Mensaje informativo
-                        html.Div(
-                            style={
-                                'backgroundColor': '#1a1a1a',
-                                'borderRadius': '15px',
-                                'padding': '30px',
-                                'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)',
-                                'marginBottom': '30px'
-                            },
-                            children=[
-                                html.H3(
-                                    "ðŸ“¡ Registro de Entrenamientos",
-                                    style={
-                                        'color': HIGHLIGHT_COLOR,
-                                        'fontSize': '1.8rem',
-                                        'marginBottom': '20px'
-                                    }
-                                ),
+                                    html.Div(
+                                        style={
+                                            'color': '#ccc',
+                                            'fontSize': '1rem'
+                                        },
+                                        children=f"Hoy, {datetime.now().strftime('%d/%m/%Y')}"
+                                    )
+                                ]
+                            ),
+                        
+                            # Mensaje informativo
+                            html.Div(
+                                style={
+                                    'backgroundColor': '#1a1a1a',
+                                    'borderRadius': '15px',
+                                    'padding': '30px',
+                                    'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                    'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)',
+                                    'marginBottom': '30px'
+                                },
+                                children=[
+                                    html.H3(
+                                        "ðŸ“¡ Registro de Entrenamientos",
+                                        style={
+                                            'color': HIGHLIGHT_COLOR,
+                                            'fontSize': '1.8rem',
+                                            'marginBottom': '20px'
+                                        }
+                                    ),
                                 
-                                html.P(
-                                    "Los entrenamientos que realices se registrarÃ¡n automÃ¡ticamente utilizando un dispositivo externo propio del usuario (reloj inteligente, banda de actividad, etc.).",
-                                    style={
-                                        'color': '#ccc',
-                                        'fontSize': '1.1rem',
-                                        'lineHeight': '1.6',
-                                        'marginBottom': '25px'
-                                    }
-                                ),
+                                    html.P(
+                                        "Los entrenamientos que realices se registrarÃ¡n automÃ¡ticamente utilizando un dispositivo externo propio del usuario (reloj inteligente, banda de actividad, etc.).",
+                                        style={
+                                            'color': '#ccc',
+                                            'fontSize': '1.1rem',
+                                            'lineHeight': '1.6',
+                                            'marginBottom': '25px'
+                                        }
+                                    ),
                                 
-                                html.P(
-                                    "Para comenzar a registrar tus entrenamientos, conecta tu dispositivo compatible vÃ­a Bluetooth:",
-                                    style={
-                                        'color': '#ccc',
-                                        'fontSize': '1.1rem',
-                                        'lineHeight': '1.6',
-                                        'marginBottom': '30px'
-                                    }
-                                ),
+                                    html.P(
+                                        "Para comenzar a registrar tus entrenamientos, conecta tu dispositivo compatible vÃ­a Bluetooth:",
+                                        style={
+                                            'color': '#ccc',
+                                            'fontSize': '1.1rem',
+                                            'lineHeight': '1.6',
+                                            'marginBottom': '30px'
+                                        }
+                                    ),
                                 
-                                # BotÃ³n de conexiÃ³n Bluetooth
-                                html.Div(
-                                    style={
-                                        'textAlign': 'center',
-                                        'marginTop': '20px'
-                                    },
-                                    children=[
-                                        html.Button(
-                                            [
-                                                html.I(className="bi bi-bluetooth me-2", style={'fontSize': '1.2rem'}),
-                                                html.Span("Conectar Dispositivo", id="btn-conectar-text", style={'fontSize': '1.1rem'})
-                                            ],
-                                            id="btn-conectar-bluetooth",
-                                            n_clicks=0,
-                                            style={
-                                                'backgroundColor': HIGHLIGHT_COLOR,
-                                                'border': 'none',
-                                                'fontWeight': '600',
-                                                'padding': '15px 40px',
-                                                'borderRadius': '12px',
-                                                'fontSize': '1.1rem',
-                                                'color': '#0a0a0a',
-                                                'transition': 'all 0.3s ease',
-                                                'cursor': 'pointer',
-                                                'boxShadow': f'0 4px 15px rgba(0, 212, 255, 0.4)'
-                                            }
-                                        ),
+                                    # BotÃ³n de conexiÃ³n Bluetooth
+                                    html.Div(
+                                        style={
+                                            'textAlign': 'center',
+                                            'marginTop': '20px'
+                                        },
+                                        children=[
+                                            html.Button(
+                                                [
+                                                    html.I(className="bi bi-bluetooth me-2", style={'fontSize': '1.2rem'}),
+                                                    html.Span("Conectar Dispositivo", id="btn-conectar-text", style={'fontSize': '1.1rem'})
+                                                ],
+                                                id="btn-conectar-bluetooth",
+                                                n_clicks=0,
+                                                style={
+                                                    'backgroundColor': HIGHLIGHT_COLOR,
+                                                    'border': 'none',
+                                                    'fontWeight': '600',
+                                                    'padding': '15px 40px',
+                                                    'borderRadius': '12px',
+                                                    'fontSize': '1.1rem',
+                                                    'color': '#0a0a0a',
+                                                    'transition': 'all 0.3s ease',
+                                                    'cursor': 'pointer',
+                                                    'boxShadow': f'0 4px 15px rgba(0, 212, 255, 0.4)'
+                                                }
+                                            ),
                                         
-                                        # Estado de conexiÃ³n
-                                        html.Div(
-                                            id="estado-conexion",
-                                            style={
-                                                'marginTop': '20px',
-                                                'padding': '10px 20px',
-                                                'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-                                                'borderRadius': '8px',
-                                                'border': f'1px solid {HIGHLIGHT_COLOR}',
-                                                'display': 'inline-block'
-                                            },
-                                            children=[
-                                                html.I(className="bi bi-circle-fill me-2", id="icono-estado", style={'color': '#ff6b6b', 'fontSize': '0.8rem'}),
-                                                html.Span("Dispositivo desconectado", id="texto-estado", style={'color': '#ccc', 'fontWeight': '500'})
-                                            ]
-                                        )
-                                    ]
-                                ),
+                                            # Estado de conexiÃ³n
+                                            html.Div(
+                                                id="estado-conexion",
+                                                style={
+                                                    'marginTop': '20px',
+                                                    'padding': '10px 20px',
+                                                    'backgroundColor': 'rgba(0, 212, 255, 0.1)',
+                                                    'borderRadius': '8px',
+                                                    'border': f'1px solid {HIGHLIGHT_COLOR}',
+                                                    'display': 'inline-block'
+                                                },
+                                                children=[
+                                                    html.I(className="bi bi-circle-fill me-2", id="icono-estado", style={'color': '#ff6b6b', 'fontSize': '0.8rem'}),
+                                                    html.Span("Dispositivo desconectado", id="texto-estado", style={'color': '#ccc', 'fontWeight': '500'})
+                                                ]
+                                            )
+                                        ]
+                                    ),
                                 
-                                # Dispositivos compatibles
-                                html.Div(
-                                    style={
-                                        'marginTop': '40px',
-                                        'paddingTop': '30px',
-                                        'borderTop': '1px solid #2b2b2b'
-                                    },
-                                    children=[
-                                        html.H4(
-                                            "ðŸ“± Dispositivos Compatibles",
-                                            style={
-                                                'color': HIGHLIGHT_COLOR,
-                                                'fontSize': '1.4rem',
-                                                'marginBottom': '20px'
-                                            }
-                                        ),
+                                    # Dispositivos compatibles
+                                    html.Div(
+                                        style={
+                                            'marginTop': '40px',
+                                            'paddingTop': '30px',
+                                            'borderTop': '1px solid #2b2b2b'
+                                        },
+                                        children=[
+                                            html.H4(
+                                                "ðŸ“± Dispositivos Compatibles",
+                                                style={
+                                                    'color': HIGHLIGHT_COLOR,
+                                                    'fontSize': '1.4rem',
+                                                    'marginBottom': '20px'
+                                                }
+                                            ),
                                         
-                                        html.Div(
-                                            style={
-                                                'display': 'grid',
-                                                'gridTemplateColumns': 'repeat(auto-fit, minmax(200px, 1fr))',
-                                                'gap': '20px'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    style={
-                                                        'backgroundColor': 'rgba(0, 212, 255, 0.05)',
-                                                        'padding': '20px',
-                                                        'borderRadius': '10px',
-                                                        'textAlign': 'center',
-                                                        'border': '1px solid rgba(0, 212, 255, 0.1)'
-                                                    },
-                                                    children=[
-                                                        html.I(className="bi bi-apple", style={'color': HIGHLIGHT_COLOR, 'fontSize': '2rem', 'marginBottom': '10px'}),
-                                                        html.Div("Apple Watch", style={'color': '#fff', 'fontWeight': '600', 'marginBottom': '5px'}),
-                                                        html.Div("Series 4 o superior", style={'color': '#ccc', 'fontSize': '0.9rem'})
-                                                    ]
-                                                ),
+                                            html.Div(
+                                                style={
+                                                    'display': 'grid',
+                                                    'gridTemplateColumns': 'repeat(auto-fit, minmax(200px, 1fr))',
+                                                    'gap': '20px'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        style={
+                                                            'backgroundColor': 'rgba(0, 212, 255, 0.05)',
+                                                            'padding': '20px',
+                                                            'borderRadius': '10px',
+                                                            'textAlign': 'center',
+                                                            'border': '1px solid rgba(0, 212, 255, 0.1)'
+                                                        },
+                                                        children=[
+                                                            html.I(className="bi bi-apple", style={'color': HIGHLIGHT_COLOR, 'fontSize': '2rem', 'marginBottom': '10px'}),
+                                                            html.Div("Apple Watch", style={'color': '#fff', 'fontWeight': '600', 'marginBottom': '5px'}),
+                                                            html.Div("Series 4 o superior", style={'color': '#ccc', 'fontSize': '0.9rem'})
+                                                        ]
+                                                    ),
                                                 
-                                                html.Div(
-                                                    style={
-                                                        'backgroundColor': 'rgba(0, 212, 255, 0.05)',
-                                                        'padding': '20px',
-                                                        'borderRadius': '10px',
-                                                        'textAlign': 'center',
-                                                        'border': '1px solid rgba(0, 212, 255, 0.1)'
-                                                    },
-                                                    children=[
-                                                        html.I(className="bi bi-watch", style={'color': HIGHLIGHT_COLOR, 'fontSize': '2rem', 'marginBottom': '10px'}),
-                                                        html.Div("Garmin", style={'color': '#fff', 'fontWeight': '600', 'marginBottom': '5px'}),
-                                                        html.Div("Forerunner, Fenix", style={'color': '#ccc', 'fontSize': '0.9rem'})
-                                                    ]
-                                                ),
+                                                    html.Div(
+                                                        style={
+                                                            'backgroundColor': 'rgba(0, 212, 255, 0.05)',
+                                                            'padding': '20px',
+                                                            'borderRadius': '10px',
+                                                            'textAlign': 'center',
+                                                            'border': '1px solid rgba(0, 212, 255, 0.1)'
+                                                        },
+                                                        children=[
+                                                            html.I(className="bi bi-watch", style={'color': HIGHLIGHT_COLOR, 'fontSize': '2rem', 'marginBottom': '10px'}),
+                                                            html.Div("Garmin", style={'color': '#fff', 'fontWeight': '600', 'marginBottom': '5px'}),
+                                                            html.Div("Forerunner, Fenix", style={'color': '#ccc', 'fontSize': '0.9rem'})
+                                                        ]
+                                                    ),
                                                 
-                                                html.Div(
-                                                    style={
-                                                        'backgroundColor': 'rgba(0, 212, 255, 0.05)',
-                                                        'padding': '20px',
-                                                        'borderRadius': '10px',
-                                                        'textAlign': 'center',
-                                                        'border': '1px solid rgba(0, 212, 255, 0.1)'
-                                                    },
-                                                    children=[
-                                                        html.I(className="bi bi-phone", style={'color': HIGHLIGHT_COLOR, 'fontSize': '2rem', 'marginBottom': '10px'}),
-                                                        html.Div("Fitbit", style={'color': '#fff', 'fontWeight': '600', 'marginBottom': '5px'}),
-                                                        html.Div("Versa, Charge", style={'color': '#ccc', 'fontSize': '0.9rem'})
-                                                    ]
-                                                ),
+                                                    html.Div(
+                                                        style={
+                                                            'backgroundColor': 'rgba(0, 212, 255, 0.05)',
+                                                            'padding': '20px',
+                                                            'borderRadius': '10px',
+                                                            'textAlign': 'center',
+                                                            'border': '1px solid rgba(0, 212, 255, 0.1)'
+                                                        },
+                                                        children=[
+                                                            html.I(className="bi bi-phone", style={'color': HIGHLIGHT_COLOR, 'fontSize': '2rem', 'marginBottom': '10px'}),
+                                                            html.Div("Fitbit", style={'color': '#fff', 'fontWeight': '600', 'marginBottom': '5px'}),
+                                                            html.Div("Versa, Charge", style={'color': '#ccc', 'fontSize': '0.9rem'})
+                                                        ]
+                                                    ),
                                                 
-                                                html.Div(
-                                                    style={
-                                                        'backgroundColor': 'rgba(0, 212, 255, 0.05)',
-                                                        'padding': '20px',
-                                                        'borderRadius': '10px',
-                                                        'textAlign': 'center',
-                                                        'border': '1px solid rgba(0, 212, 255, 0.1)'
-                                                    },
-                                                    children=[
-                                                        html.I(className="bi bi-watch", style={'color': HIGHLIGHT_COLOR, 'fontSize': '2rem', 'marginBottom': '10px'}),
-                                                        html.Div("Samsung Galaxy", style={'color': '#fff', 'fontWeight': '600', 'marginBottom': '5px'}),
-                                                        html.Div("Watch Series", style={'color': '#ccc', 'fontSize': '0.9rem'})
-                                                    ]
-                                                )
-                                            ]
-                                        )
-                                    ]
-                                )
-                            ]
-                        ),
+                                                    html.Div(
+                                                        style={
+                                                            'backgroundColor': 'rgba(0, 212, 255, 0.05)',
+                                                            'padding': '20px',
+                                                            'borderRadius': '10px',
+                                                            'textAlign': 'center',
+                                                            'border': '1px solid rgba(0, 212, 255, 0.1)'
+                                                        },
+                                                        children=[
+                                                            html.I(className="bi bi-watch", style={'color': HIGHLIGHT_COLOR, 'fontSize': '2rem', 'marginBottom': '10px'}),
+                                                            html.Div("Samsung Galaxy", style={'color': '#fff', 'fontWeight': '600', 'marginBottom': '5px'}),
+                                                            html.Div("Watch Series", style={'color': '#ccc', 'fontSize': '0.9rem'})
+                                                        ]
+                                                    )
+                                                ]
+                                            )
+                                        ]
+                                    )
+                                ]
+                            ),
                         
-                        # PrÃ³ximos entrenamientos (ejemplo)
-                        html.Div(
-                            style={
-                                'backgroundColor': '#1a1a1a',
-                                'borderRadius': '15px',
-                                'padding': '30px',
-                                'border': '1px solid rgba(0, 212, 255, 0.1)',
-                                'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)'
-                            },
-                            children=[
-                                html.H3(
-                                    "ðŸ“… PrÃ³ximos Entrenamientos",
-                                    style={
-                                        'color': HIGHLIGHT_COLOR,
-                                        'fontSize': '1.8rem',
-                                        'marginBottom': '25px'
-                                    }
-                                ),
+                            # PrÃ³ximos entrenamientos (ejemplo)
+                            html.Div(
+                                style={
+                                    'backgroundColor': '#1a1a1a',
+                                    'borderRadius': '15px',
+                                    'padding': '30px',
+                                    'border': '1px solid rgba(0, 212, 255, 0.1)',
+                                    'boxShadow': '0 5px 20px rgba(0, 0, 0, 0.3)'
+                                },
+                                children=[
+                                    html.H3(
+                                        "ðŸ“… PrÃ³ximos Entrenamientos",
+                                        style={
+                                            'color': HIGHLIGHT_COLOR,
+                                            'fontSize': '1.8rem',
+                                            'marginBottom': '25px'
+                                        }
+                                    ),
                                 
-                                html.Div(
-                                    style={
-                                        'display': 'grid',
-                                        'gridTemplateColumns': 'repeat(auto-fit, minmax(300px, 1fr))',
-                                        'gap': '20px'
-                                    },
-                                    children=[
-                                        html.Div(
-                                            style={
-                                                'backgroundColor': 'rgba(0, 212, 255, 0.08)',
-                                                'padding': '20px',
-                                                'borderRadius': '10px',
-                                                'borderLeft': f'4px solid {HIGHLIGHT_COLOR}'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    style={
-                                                        'display': 'flex',
-                                                        'justifyContent': 'space-between',
-                                                        'alignItems': 'center',
-                                                        'marginBottom': '15px'
-                                                    },
-                                                    children=[
-                                                        html.H4(
-                                                            "ðŸƒ Carrera Continua",
-                                                            style={'color': '#fff', 'margin': '0', 'fontSize': '1.2rem'}
-                                                        ),
-                                                        html.Div(
-                                                            "MaÃ±ana 8:00",
-                                                            style={'color': HIGHLIGHT_COLOR, 'fontWeight': '500'}
-                                                        )
-                                                    ]
-                                                ),
-                                                html.P(
-                                                    "30 minutos a ritmo moderado. Zona cardÃ­aca 2-3.",
-                                                    style={'color': '#ccc', 'marginBottom': '10px', 'fontSize': '0.95rem'}
-                                                ),
-                                                html.Div(
-                                                    [
-                                                        html.Span("Distancia: ", style={'color': '#ccc'}),
-                                                        html.Span("5 km", style={'color': HIGHLIGHT_COLOR, 'fontWeight': '500'})
-                                                    ],
-                                                    style={'fontSize': '0.9rem'}
-                                                )
-                                            ]
-                                        ),
-                                        
-                                        html.Div(
-                                            style={
-                                                'backgroundColor': 'rgba(78, 205, 196, 0.08)',
-                                                'padding': '20px',
-                                                'borderRadius': '10px',
-                                                'borderLeft': '4px solid #4ecdc4'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    style={
-                                                        'display': 'flex',
-                                                        'justifyContent': 'space-between',
-                                                        'alignItems': 'center',
-                                                        'marginBottom': '15px'
-                                                    },
-                                                    children=[
-                                                        html.H4(
-                                                            "ðŸ’ª Entrenamiento de Fuerza",
-                                                            style={'color': '#fff', 'margin': '0', 'fontSize': '1.2rem'}
-                                                        ),
-                                                        html.Div(
-                                                            "Jueves 19:00",
-                                                            style={'color': '#4ecdc4', 'fontWeight': '500'}
-                                                        )
-                                                    ]
-                                                ),
-                                                html.P(
-                                                    "Circuito de fuerza: piernas, pecho y espalda.",
-                                                    style={'color': '#ccc', 'marginBottom': '10px', 'fontSize': '0.95rem'}
-                                                ),
-                                                html.Div(
-                                                    [
-                                                        html.Span("DuraciÃ³n: ", style={'color': '#ccc'}),
-                                                        html.Span("45 min", style={'color': '#4ecdc4', 'fontWeight': '500'})
-                                                    ],
-                                                    style={'fontSize': '0.9rem'}
-                                                )
-                                            ]
-                                        ),
+                                    html.Div(
+                                        style={
+                                            'display': 'grid',
+                                            'gridTemplateColumns': 'repeat(auto-fit, minmax(300px, 1fr))',
+                                            'gap': '20px'
+                                        },
+                                        children=[
+                                            html.Div(
+                                                style={
+                                                    'backgroundColor': 'rgba(0, 212, 255, 0.08)',
+                                                    'padding': '20px',
+                                                    'borderRadius': '10px',
+                                                    'borderLeft': f'4px solid {HIGHLIGHT_COLOR}'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        style={
+                                                            'display': 'flex',
+                                                            'justifyContent': 'space-between',
+                                                            'alignItems': 'center',
+                                                            'marginBottom': '15px'
+                                                        },
+                                                        children=[
+                                                            html.H4(
+                                                                "ðŸƒ Carrera Continua",
+                                                                style={'color': '#fff', 'margin': '0', 'fontSize': '1.2rem'}
+                                                            ),
+                                                            html.Div(
+                                                                "MaÃ±ana 8:00",
+                                                                style={'color': HIGHLIGHT_COLOR, 'fontWeight': '500'}
+                                                            )
+                                                        ]
+                                                    ),
+                                                    html.P(
+                                                        "30 minutos a ritmo moderado. Zona cardÃ­aca 2-3.",
+                                                        style={'color': '#ccc', 'marginBottom': '10px', 'fontSize': '0.95rem'}
+                                                    ),
+                                                    html.Div(
+                                                        [
+                                                            html.Span("Distancia: ", style={'color': '#ccc'}),
+                                                            html.Span("5 km", style={'color': HIGHLIGHT_COLOR, 'fontWeight': '500'})
+                                                        ],
+                                                        style={'fontSize': '0.9rem'}
+                                                    )
+                                                ]
+                                            ),
                                         
-                                        html.Div(
-                                            style={
-                                                'backgroundColor': 'rgba(255, 209, 102, 0.08)',
-                                                'padding': '20px',
-                                                'borderRadius': '10px',
-                                                'borderLeft': '4px solid #ffd166'
-                                            },
-                                            children=[
-                                                html.Div(
-                                                    style={
-                                                        'display': 'flex',
-                                                        'justifyContent': 'space-between',
-                                                        'alignItems': 'center',
-                                                        'marginBottom': '15px'
-                                                    },
-                                                    children=[
-                                                        html.H4(
-                                                            "ðŸ§˜ RecuperaciÃ³n Activa",
-                                                            style={'color': '#fff', 'margin': '0', 'fontSize': '1.2rem'}
-                                                        ),
-                                                        html.Div(
-                                                            "Viernes 9:00",
-                                                            style={'color': '#ffd166', 'fontWeight': '500'}
-                                                        )
-                                                    ]
-                                                ),
-                                                html.P(
-                                                    "Yoga y estiramientos para mejorar flexibilidad.",
-                                                    style={'color': '#ccc', 'marginBottom': '10px', 'fontSize': '0.95rem'}
-                                                ),
-                                                html.Div(
-                                                    [
-                                                        html.Span("Intensidad: ", style={'color': '#ccc'}),
-                                                        html.Span("Baja", style={'color': '#ffd166', 'fontWeight': '500'})
-                                                    ],
-                                                    style={'fontSize': '0.9rem'}
-                                                )
-                                            ]
-                                        )
-                                    ]
-                                )
-                            ]
-                        )
-                    ]
-                )
-            ]
-        )
-    ]
-)
+                                            html.Div(
+                                                style={
+                                                    'backgroundColor': 'rgba(78, 205, 196, 0.08)',
+                                                    'padding': '20px',
+                                                    'borderRadius': '10px',
+                                                    'borderLeft': '4px solid #4ecdc4'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        style={
+                                                            'display': 'flex',
+                                                            'justifyContent': 'space-between',
+                                                            'alignItems': 'center',
+                                                            'marginBottom': '15px'
+                                                        },
+                                                        children=[
+                                                            html.H4(
+                                                                "ðŸ’ª Entrenamiento de Fuerza",
+                                                                style={'color': '#fff', 'margin': '0', 'fontSize': '1.2rem'}
+                                                            ),
+                                                            html.Div(
+                                                                "Jueves 19:00",
+                                                                style={'color': '#4ecdc4', 'fontWeight': '500'}
+                                                            )
+                                                        ]
+                                                    ),
+                                                    html.P(
+                                                        "Circuito de fuerza: piernas, pecho y espalda.",
+                                                        style={'color': '#ccc', 'marginBottom': '10px', 'fontSize': '0.95rem'}
+                                                    ),
+                                                    html.Div(
+                                                        [
+                                                            html.Span("DuraciÃ³n: ", style={'color': '#ccc'}),
+                                                            html.Span("45 min", style={'color': '#4ecdc4', 'fontWeight': '500'})
+                                                        ],
+                                                        style={'fontSize': '0.9rem'}
+                                                    )
+                                                ]
+                                            ),
+                                        
+                                            html.Div(
+                                                style={
+                                                    'backgroundColor': 'rgba(255, 209, 102, 0.08)',
+                                                    'padding': '20px',
+                                                    'borderRadius': '10px',
+                                                    'borderLeft': '4px solid #ffd166'
+                                                },
+                                                children=[
+                                                    html.Div(
+                                                        style={
+                                                            'display': 'flex',
+                                                            'justifyContent': 'space-between',
+                                                            'alignItems': 'center',
+                                                            'marginBottom': '15px'
+                                                        },
+                                                        children=[
+                                                            html.H4(
+                                                                "ðŸ§˜ RecuperaciÃ³n Activa",
+                                                                style={'color': '#fff', 'margin': '0', 'fontSize': '1.2rem'}
+                                                            ),
+                                                            html.Div(
+                                                                "Viernes 9:00",
+                                                                style={'color': '#ffd166', 'fontWeight': '500'}
+                                                            )
+                                                        ]
+                                                    ),
+                                                    html.P(
+                                                        "Yoga y estiramientos para mejorar flexibilidad.",
+                                                        style={'color': '#ccc', 'marginBottom': '10px', 'fontSize': '0.95rem'}
+                                                    ),
+                                                    html.Div(
+                                                        [
+                                                            html.Span("Intensidad: ", style={'color': '#ccc'}),
+                                                            html.Span("Baja", style={'color': '#ffd166', 'fontWeight': '500'})
+                                                        ],
+                                                        style={'fontSize': '0.9rem'}
+                                                    )
+                                                ]
+                                            )
+                                        ]
+                                    )
+                                ]
+                            )
+                        ]
+                    )
+                ]
+            )
+        ]
+    )
 
 # ===============================
 # LAYOUT PRINCIPAL
@@ -8581,6 +8798,40 @@ def handle_initial_navigation(current_user, onboarding_completed, user_type, cur
     
     return dash.no_update
 
+# ==========================================================
+# MARCADORES DE PÁGINA
+# ==========================================================
+
+# Cada layout montado en page-content va acompañado de un dcc.Store
+# "page-<página>" con la ruta. Los callbacks de una página escuchan su
+# marcador en vez de url.pathname: sólo se disparan cuando su página se
+# monta, no en cada navegación de la app.
+PAGE_NAMES = {
+    '/': 'welcome',
+    '/login': 'login',
+    '/register': 'register',
+    '/onboarding': 'onboarding',
+    '/inicio': 'inicio',
+    '/metricas': 'metricas',
+    '/objetivos': 'objetivos',
+    '/nutricion': 'nutricion',
+    '/entrenamientos': 'entrenamientos',
+    '/doctor-dashboard': 'doctor-dashboard',
+}
+
+
+def page_marker_id(page):
+    return f"page-{page}"
+
+
+def page_pathname(page):
+    """Input con la ruta (incluida la query) cada vez que se monta la página"""
+    return Input(page_marker_id(page), 'data')
+
+
+def with_page_marker(page, pathname, layout):
+    return [dcc.Store(id=page_marker_id(page), data=pathname), layout]
+
 # ==========================================================
 # CALLBACK PRINCIPAL DE PÃGINA (ULTRA SIMPLIFICADO)
 # ==========================================================
@@ -8602,7 +8853,7 @@ def display_page_corrected(pathname, current_user, user_type):
     # Si es mÃ©dico y quiere ver dashboard mÃ©dico
     if base_path == '/doctor-dashboard':
         if user_type == "doctor":
-            return doctor_dashboard_layout
+            return with_page_marker('doctor-dashboard', pathname, doctor_dashboard_layout())
         else:
             # Si no es mÃ©dico, redirigir a inicio
             return html.Div("Acceso no autorizado", style={'textAlign': 'center', 'padding': '50px'})
@@ -8617,12 +8868,13 @@ def display_page_corrected(pathname, current_user, user_type):
             patients = DOCTORS_DB[current_user].get("patients", [])
             if patient_username in patients:
                 # Crear layout especial para vista de paciente
-                return create_patient_view_layout(patient_username)
+                return with_page_marker('inicio', pathname, create_patient_view_layout(patient_username))
         
         # Si no tiene permisos, mostrar inicio normal
-        return inicio_layout
+        return with_page_marker('inicio', pathname, inicio_layout())
     
-    # Mapeo simple de rutas a layouts
+    # Mapeo de rutas a las funciones que construyen su layout (memoizadas:
+    # cada worker construye sólo las páginas que sirve, en su primera visita)
     route_map = {
         '/': welcome_layout,
         '/login': login_layout,
@@ -8635,7 +8887,9 @@ def display_page_corrected(pathname, current_user, user_type):
         '/entrenamientos': entrenamientos_layout,
     }
     
-    return route_map.get(base_path, welcome_layout)
+    if base_path not in route_map:
+        base_path = '/'
+    return with_page_marker(PAGE_NAMES[base_path], pathname, route_map[base_path]())
 
 # ==========================================================
 # CALLBACKS PARA EL DASHBOARD MÃ‰DICO
@@ -8648,7 +8902,7 @@ def display_page_corrected(pathname, current_user, user_type):
      Output("doctor-debug-info", "children")],  # Solo estos 4 Outputs existen
     [Input("current-user", "data"),
      Input("user-type-store", "data"),
-     Input("url", "pathname"),
+     page_pathname('doctor-dashboard'),
      Input("doctor-dashboard-refresh-trigger", "data")],  
     prevent_initial_call=False
 )
@@ -8678,10 +8932,14 @@ def update_doctor_dashboard_corrected(current_user, user_type, pathname, refresh
     
     print(f"ðŸ‘¨â€âš•ï¸ MÃ©dico {current_user} tiene {patient_count} pacientes: {patient_usernames}")
     
+    # Resúmenes de ECG precalculados por el análisis por lotes (una sola consulta)
+    ecg_summaries = repository.load_ecg_summaries(patient_usernames)
+    
     # Crear tarjetas de pacientes
     patient_cards = []
     total_activity = 0
     total_bpm = 0
+    patients_with_bpm = 0
     risk_patients = 0
     
     for patient_username in patient_usernames:
@@ -8691,12 +8949,14 @@ def update_doctor_dashboard_corrected(current_user, user_type, pathname, refresh
             activity_level = patient_data.get("activity_level", 5)
             health_score = get_health_score_from_activity_level(activity_level)
             
-            # Calcular BPM simulado basado en actividad
-            base_bpm = 60 + (activity_level * 2)
+            # BPM medio de sus grabaciones (None si aún no se han analizado)
+            patient_bpm = ecg_summaries.get(patient_username, {}).get("bpm")
             
             # Acumular para promedios
             total_activity += activity_level
-            total_bpm += base_bpm
+            if patient_bpm is not None:
+                total_bpm += patient_bpm
+                patients_with_bpm += 1
             
             # Contar pacientes en riesgo (baja actividad)
             if activity_level <= 3:
@@ -8853,7 +9113,7 @@ def update_doctor_dashboard_corrected(current_user, user_type, pathname, refresh
                                 style={'textAlign': 'center'},
                                 children=[
                                     html.Div(
-                                        f"{base_bpm}",
+                                        f"{patient_bpm:.0f}" if patient_bpm is not None else "--",
                                         style={
                                             'fontSize': '1.2rem',
                                             'fontWeight': '700',
@@ -8928,7 +9188,7 @@ def update_doctor_dashboard_corrected(current_user, user_type, pathname, refresh
     
     # Calcular promedios
     avg_activity = round(total_activity / max(patient_count, 1), 1) if patient_count > 0 else 0.0
-    avg_bpm = round(total_bpm / max(patient_count, 1)) if patient_count > 0 else 0
+    avg_bpm = round(total_bpm / patients_with_bpm) if patients_with_bpm > 0 else "--"
     
     # Crear estadÃ­sticas para debug
     stats_text = f"""
@@ -9666,17 +9926,12 @@ def submit_new_meal(submit_clicks, meal_type, meal_time, description,
      Output("protein-input", "value", allow_duplicate=True),
      Output("fat-input", "value", allow_duplicate=True),
      Output("calories-input", "value", allow_duplicate=True)],
-    [Input("modal-add-meal", "is_open"),
-     Input("url", "pathname")],  # AÃ‘ADIR pathname
+    Input("modal-add-meal", "is_open"),
     prevent_initial_call=True
 )
-def reset_meal_form_when_opening(is_open, current_path):
+def reset_meal_form_when_opening(is_open):
     """Restablece el formulario cuando se abre el modal de comida"""
     
-    # SOLO EJECUTAR SI ESTAMOS EN NUTRICIÃ“N
-    if current_path != '/nutricion' and current_path is not None:
-        raise dash.exceptions.PreventUpdate
-    
     if is_open:
         print("ðŸ”“ Abriendo modal, reset formulario")
         # Limpiar campos del formulario
@@ -9949,36 +10204,6 @@ def submit_new_goal_corrected(submit_clicks, name, description, target, deadline
         print("âŒ Error al agregar objetivo")
         return dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update
 
-# ==========================================================
-# CALLBACK PARA RESETAR MENSAJE DE Ã‰XITO
-# ==========================================================
-
-@app.callback(
-    Output("btn-agregar-objetivo", "children", allow_duplicate=True),
-    [Input("btn-agregar-objetivo", "children")],
-    [State("url", "pathname")],
-    prevent_initial_call=True
-)
-def reset_success_message(children, pathname):
-    """Resetea el mensaje de Ã©xito despuÃ©s de agregar objetivo"""
-    
-    if pathname != '/objetivos':
-        raise dash.exceptions.PreventUpdate
-    
-    # Verificar si el botÃ³n muestra mensaje de Ã©xito
-    if isinstance(children, list) and len(children) > 0:
-        # Si el botÃ³n tiene icono de check, significa que acaba de agregar
-        # Esperar 2 segundos y luego restaurar el texto original
-        import time
-        time.sleep(2)
-        
-        return [
-            html.I(className="bi bi-plus-circle me-2"),
-            "Agregar Nuevo Objetivo"
-        ]
-    
-    return dash.no_update
-    
 # ==========================================================
 # 2. CALLBACK PARA MANEJAR VERIFICACIÃ“N DE OBJETIVOS
 # ==========================================================
@@ -10175,17 +10400,12 @@ def handle_delete_goal(n_clicks_list, current_user, current_goals, pathname):
      Output("goal-description-input", "value", allow_duplicate=True),
      Output("goal-target-input", "value", allow_duplicate=True),
      Output("goal-deadline-dropdown", "value", allow_duplicate=True)],
-    [Input("url", "pathname"),  # AÃ‘ADIR pathname como Input
-     Input("modal-add-goal", "is_open")],
+    Input("modal-add-goal", "is_open"),
     prevent_initial_call=True
 )
-def reset_goal_form_when_opening(current_path, is_open):
+def reset_goal_form_when_opening(is_open):
     """Restablece el formulario cuando se abre el modal de objetivos"""
     
-    # SOLO EJECUTAR SI ESTAMOS EN OBJETIVOS
-    if current_path != '/objetivos' and current_path is not None:
-        raise dash.exceptions.PreventUpdate
-    
     if is_open:
         print("ðŸ”“ Abriendo modal de objetivos, reset formulario")
         # Mostrar selecciÃ³n de tipo y ocultar formulario, limpiar campos
@@ -10210,7 +10430,7 @@ def reset_goal_form_when_opening(current_path, is_open):
      Output("progreso-total-percent", "children"),
      Output("objetivos-activos-count", "children")],
     [Input("user-goals-store", "data"),
-     Input("url", "pathname")],
+     page_pathname('objetivos')],
     [State("current-user", "data")],
     prevent_initial_call=False
 )
@@ -10601,7 +10821,7 @@ def update_goals_display_simple(goals_data, pathname, current_user):
 @app.callback(
     Output("macronutrientes-chart", "figure"),
     [Input("nutrition-totals-store", "data"),
-     Input("url", "pathname"),
+     page_pathname('nutricion'),
      Input("current-user", "data")],  # NUEVO: Agregar usuario
     prevent_initial_call=False
 )
@@ -10714,7 +10934,7 @@ def update_macronutrients_chart(totals, pathname, current_user):
      Output("health-status-dots", "children"),
      Output("health-status-description", "children"),
      Output("health-summary-text", "children")],
-    [Input("url", "pathname"),],
+    [page_pathname('inicio'),],
     [State("current-user", "data"),
      State("user-type-store", "data")],
     prevent_initial_call=False
@@ -11102,126 +11322,53 @@ def handle_navigation_doctor(dashboard_clicks, pacientes_clicks, metricas_clicks
 # CALLBACKS PARA ESTILOS DE NAVEGACIÃ“N (TODOS LOS COMPLETOS)
 # ==========================================================
 
-@app.callback(
-    [Output("nav-inicio-entrenamientos", "style"),
-     Output("nav-metricas-entrenamientos", "style"),
-     Output("nav-objetivos-entrenamientos", "style"),
-     Output("nav-nutricion-entrenamientos", "style"),
-     Output("nav-entrenamientos-entrenamientos", "style"),
-     ],
-    [Input("url", "pathname")],
-    prevent_initial_call=True
-)
-def update_entrenamientos_nav_styles(pathname):
-    """Actualiza estilos de navegaciÃ³n en la pÃ¡gina de entrenamientos"""
-    if pathname not in ['/inicio', '/metricas', '/objetivos', '/nutricion', '/entrenamientos']:
-        raise dash.exceptions.PreventUpdate
-    
-    # Estilo base para botones inactivos
-    base_style = {
-        'display': 'flex',
-        'alignItems': 'center',
-        'padding': '12px 15px',
-        'backgroundColor': 'transparent',
-        'borderRadius': '10px',
-        'cursor': 'pointer',
-        'transition': 'all 0.3s ease',
-        'border': '1px solid transparent',
-        'color': '#ccc',
-        'textAlign': 'left',
-        'fontFamily': "'Inter', sans-serif",
-        'border': 'none'
-    }
-    
-    # Estilo para botÃ³n activo
-    active_style = {
-        'display': 'flex',
-        'alignItems': 'center',
-        'padding': '12px 15px',
-        'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-        'borderRadius': '10px',
-        'cursor': 'pointer',
-        'transition': 'all 0.3s ease',
-        'border': f'1px solid {HIGHLIGHT_COLOR}',
-        'color': HIGHLIGHT_COLOR,
-        'textAlign': 'left',
-        'fontFamily': "'Inter', sans-serif",
-        'border': 'none'
-    }
-    
-    # Inicializar todos con estilo base 
-    styles = [base_style] * 5
-    
-    # Actualizar segÃºn la ruta activa
-    if pathname == '/inicio':
-        styles[0] = active_style  # Inicio
-    elif pathname == '/metricas':
-        styles[1] = active_style  # MÃ©tricas
-    elif pathname == '/objetivos':
-        styles[2] = active_style  # Objetivos
-    elif pathname == '/nutricion':
-        styles[3] = active_style  # NutriciÃ³n
-    elif pathname == '/entrenamientos':
-        styles[4] = active_style  # Entrenamientos
-    
-    return styles
+# Los estilos sólo dependen de la ruta: se calculan en el navegador
+# (window.clientside.navStyles) sin ninguna llamada al servidor
+NAV_BASE_STYLE = {
+    'display': 'flex',
+    'alignItems': 'center',
+    'padding': '12px 15px',
+    'backgroundColor': 'transparent',
+    'borderRadius': '10px',
+    'cursor': 'pointer',
+    'transition': 'all 0.3s ease',
+    'border': 'none',
+    'color': '#ccc',
+    'textAlign': 'left',
+    'fontFamily': "'Inter', sans-serif",
+}
+NAV_ACTIVE_STYLE = {**NAV_BASE_STYLE, 'backgroundColor': 'rgba(0, 212, 255, 0.1)', 'color': HIGHLIGHT_COLOR}
+DOCTOR_NAV_ACTIVE_STYLE = {**NAV_BASE_STYLE, 'backgroundColor': 'rgba(78, 205, 196, 0.1)', 'color': '#4ecdc4'}
 
-# ==========================================================
-# CALLBACK PARA ESTILOS DE NAVEGACIÃ“N MÃ‰DICA (NUEVO)
-# ==========================================================
+ATHLETE_NAV_ROUTES = ['/inicio', '/metricas', '/objetivos', '/nutricion', '/entrenamientos']
+DOCTOR_NAV_ROUTES = ['/doctor-dashboard', None, None, None]  # Sólo el dashboard tiene ruta propia
 
-@app.callback(
-    [Output("nav-dashboard-doctor", "style"),
-     Output("nav-pacientes-doctor", "style"),
-     Output("nav-metricas-doctor", "style"),
-     Output("nav-config-doctor", "style")],
-    [Input("url", "pathname")],
-    prevent_initial_call=True
-)
-def update_doctor_nav_styles(pathname):
-    """Actualiza estilos de navegaciÃ³n en el dashboard mÃ©dico"""
-    
-    # Estilo base para botones inactivos
-    base_style = {
-        'display': 'flex',
-        'alignItems': 'center',
-        'padding': '12px 15px',
-        'backgroundColor': 'transparent',
-        'borderRadius': '10px',
-        'cursor': 'pointer',
-        'transition': 'all 0.3s ease',
-        'border': '1px solid transparent',
-        'color': '#ccc',
-        'textAlign': 'left',
-        'fontFamily': "'Inter', sans-serif",
-        'border': 'none'
-    }
-    
-    # Estilo para botÃ³n activo (color mÃ©dico)
-    active_style = {
-        'display': 'flex',
-        'alignItems': 'center',
-        'padding': '12px 15px',
-        'backgroundColor': 'rgba(78, 205, 196, 0.1)',
-        'borderRadius': '10px',
-        'cursor': 'pointer',
-        'transition': 'all 0.3s ease',
-        'border': f'1px solid #4ecdc4',
-        'color': '#4ecdc4',
-        'textAlign': 'left',
-        'fontFamily': "'Inter', sans-serif",
-        'border': 'none'
-    }
-    
-    # Inicializar todos con estilo base
-    styles = [base_style] * 4
-    
-    # Actualizar segÃºn la ruta activa
-    if pathname == '/doctor-dashboard':
-        styles[0] = active_style  # Dashboard activo
-    # AquÃ­ puedes agregar lÃ³gica para otras rutas mÃ©dicas cuando las crees
-    
-    return styles
+
+def register_nav_styles(page, button_ids, routes, active_style, strict=True):
+    """Resalta en el navegador el botón de la barra lateral de la ruta actual.
+
+    Con strict, una ruta que no está en routes no cambia los estilos.
+    """
+    app.clientside_callback(
+        f"""
+        function(pathname) {{
+            return window.clientside.navStyles(pathname, {json.dumps(routes)},
+                {json.dumps(NAV_BASE_STYLE)}, {json.dumps(active_style)}, {json.dumps(strict)});
+        }}
+        """,
+        [Output(button_id, 'style') for button_id in button_ids],
+        page_pathname(page),
+        prevent_initial_call=False
+    )
+
+
+for nav_page in ['inicio', 'metricas', 'objetivos', 'nutricion', 'entrenamientos']:
+    register_nav_styles(nav_page, [f"nav-{route[1:]}-{nav_page}" for route in ATHLETE_NAV_ROUTES],
+                        ATHLETE_NAV_ROUTES, NAV_ACTIVE_STYLE)
+
+register_nav_styles('doctor-dashboard',
+                    ["nav-dashboard-doctor", "nav-pacientes-doctor", "nav-metricas-doctor", "nav-config-doctor"],
+                    DOCTOR_NAV_ROUTES, DOCTOR_NAV_ACTIVE_STYLE, strict=False)
 
 # ==========================================================
 # FUNCIONES AUXILIARES PARA PUNTOS DE SALUD
@@ -11283,497 +11430,222 @@ def update_activity_level_during_onboarding(activity_level, current_user, curren
     
     return activity_level
 
-# ==========================================================
-# CALLBACK UNIFICADO PARA PERFILES DE USUARIO (CORREGIDO)
-# ==========================================================
-
-# Modificar la funciÃ³n create_profile_callback para manejar mÃ©dicos:
-
-def create_profile_callback(output_ids, page_name):
-    """Crea un callback dinÃ¡mico para actualizar perfiles de usuario"""
-    
-    @app.callback(
-        [Output(f"{page_name}-sidebar-user-avatar", "children"),
-         Output(f"{page_name}-sidebar-user-fullname", "children"),
-         Output(f"{page_name}-sidebar-user-level", "children"),
-         Output(f"{page_name}-health-status-dots", "children"),
-         Output(f"{page_name}-health-status-description", "children"),
-         Output(f"{page_name}-user-profile-avatar", "children"),
-         Output(f"{page_name}-user-profile-name", "children")],
-        [Input("current-user", "data"),
-         Input("user-activity-level", "data"),
-         Input("user-type-store", "data")],  # NUEVO INPUT
-        prevent_initial_call=False
-    )
-    def update_page_profile(current_user, activity_level, user_type):
-        """Actualiza perfil en la pÃ¡gina especÃ­fica"""
-        print(f"ðŸ” UPDATE {page_name.upper()} PROFILE - user: {current_user}, type: {user_type}, activity: {activity_level}")
-        
-        if current_user is None:
-            # Usuario no logueado
-            return "U", "Usuario", "Visitante", [], "Sin datos", "U", "Usuario"
-        
-        # Si es mÃ©dico, mostrar informaciÃ³n diferente
-        if user_type == "doctor" and current_user in DOCTORS_DB:
-            doctor_data = DOCTORS_DB[current_user]
-            
-            # Avatar del mÃ©dico (usar D en lugar de inicial para diferenciar)
-            avatar_initial = "D"
-            
-            full_name = doctor_data.get("full_name", current_user)
-            patient_count = len(doctor_data.get("patients", []))
-            level_text = f"MÃ©dico â€¢ {patient_count} paciente{'s' if patient_count != 1 else ''}"
-            
-            # Para mÃ©dicos, mostrar puntos de actividad diferente
-            health_dots = []
-            for i in range(5):
-                # Todos los puntos activos para mÃ©dicos
-                dot_style = {
-                    'width': '12px',
-                    'height': '12px',
-                    'backgroundColor': '#4ecdc4',  # Color diferente para mÃ©dicos
-                    'borderRadius': '50%',
-                    'boxShadow': '0 0 8px #4ecdc4'
-                }
-                health_dots.append(html.Div(style=dot_style))
-            
-            health_status_text = html.Div([
-                html.Div("ðŸ‘¨â€âš•ï¸ MÃ©dico Especialista", 
-                        style={'color': '#4ecdc4', 'fontWeight': '600', 'fontSize': '0.9rem', 'marginBottom': '5px'}),
-                html.Div("Acceso completo a datos de pacientes", 
-                        style={'color': '#cccccc', 'fontSize': '0.8rem', 'lineHeight': '1.4'})
-            ], style={'textAlign': 'center'})
-            
-            print(f"âœ… Perfil mÃ©dico actualizado: {full_name}")
-            
-            return (
-                avatar_initial,
-                full_name,
-                level_text,
-                health_dots,
-                health_status_text,
-                avatar_initial,
-                full_name
-            )
-        
-        # Si es atleta, usar la lÃ³gica original
-        # Si activity_level es None, obtener del usuario o usar valor por defecto
-        if activity_level is None:
-            print(f"âš ï¸ activity_level es None para {current_user}, obteniendo de la base de datos")
-            if current_user in USERS_DB:
-                activity_level = USERS_DB[current_user].get("activity_level", 5)
-            else:
-                activity_level = 5
-        
-        # Obtener informaciÃ³n del usuario
-        user_info = {}
-        if current_user in USERS_DB:
-            user_info = {
-                "full_name": USERS_DB[current_user].get("full_name", current_user),
-                "level": "Atleta Intermedio" if activity_level >= 7 else "Atleta Principiante" if activity_level <= 4 else "Atleta"
-            }
-        else:
-            user_info = {
-                "full_name": current_user,
-                "level": "Atleta"
-            }
-        
-        # Obtener inicial del avatar
-        avatar_initial = user_info["full_name"][0].upper() if user_info["full_name"] else current_user[0].upper()
-        
-        # Calcular estado de salud basado en nivel de actividad
-        health_score = get_health_score_from_activity_level(activity_level)
-        health_description = get_health_description(health_score)
-        
-        # Generar cÃ­rculos de estado de salud (5 cÃ­rculos totales)
-        health_dots = []
-        for i in range(5):
-            if i < health_score:
-                # CÃ­rculo lleno (activo)
-                dot_style = {
-                    'width': '12px',
-                    'height': '12px',
-                    'backgroundColor': HIGHLIGHT_COLOR,
-                    'borderRadius': '50%',
-                    'boxShadow': f'0 0 8px {HIGHLIGHT_COLOR}'
-                }
-            else:
-                # CÃ­rculo vacÃ­o (inactivo)
-                dot_style = {
-                    'width': '12px',
-                    'height': '12px',
-                    'backgroundColor': '#444',
-                    'borderRadius': '50%',
-                    'border': '1px solid #666'
-                }
-            health_dots.append(html.Div(style=dot_style))
-        
-        # Crear texto del estado de salud
-        health_status_text = html.Div([
-            html.Div(f"Estado de Salud: {health_score}/5", 
-                    style={'color': HIGHLIGHT_COLOR, 'fontWeight': '600', 'fontSize': '0.9rem', 'marginBottom': '5px'}),
-            html.Div(health_description, 
-                    style={'color': '#cccccc', 'fontSize': '0.8rem', 'lineHeight': '1.4'})
-        ], style={'textAlign': 'center'})
-        
-        print(f"âœ… Perfil atleta actualizado: {user_info['full_name']}, actividad: {activity_level}, salud: {health_score}/5")
-        
-        return (
-            avatar_initial,
-            user_info["full_name"],
-            user_info["level"],
-            health_dots,
-            health_status_text,
-            avatar_initial,
-            user_info["full_name"]
-        )
-    
-    return update_page_profile
-
-# REGISTRAR TODOS LOS CALLBACKS DE PERFIL
-
-update_entrenamientos_profiles = create_profile_callback([
-    "entrenamientos-sidebar-user-avatar",
-    "entrenamientos-sidebar-user-fullname",
-    "entrenamientos-sidebar-user-level",
-    "entrenamientos-health-status-dots",
-    "entrenamientos-health-status-description",
-    "entrenamientos-user-profile-avatar",
-    "entrenamientos-user-profile-name"
-], "entrenamientos")
-
-update_inicio_profiles = create_profile_callback([
-    "sidebar-user-avatar",
-    "sidebar-user-fullname",
-    "sidebar-user-level",
-    "health-status-dots",
-    "health-status-description",
-    "user-profile-avatar",
-    "user-profile-name"
-], "")
-
-update_metricas_profiles = create_profile_callback([
-    "metricas-sidebar-user-avatar",
-    "metricas-sidebar-user-fullname",
-    "metricas-sidebar-user-level",
-    "metricas-health-status-dots",
-    "metricas-health-status-description",
-    "metricas-user-profile-avatar",
-    "metricas-user-profile-name"
-], "metricas")
-
-update_objetivos_profiles = create_profile_callback([
-    "objetivos-sidebar-user-avatar",
-    "objetivos-sidebar-user-fullname",
-    "objetivos-sidebar-user-level",
-    "objetivos-health-status-dots",
-    "objetivos-health-status-description",
-    "objetivos-user-profile-avatar",
-    "objetivos-user-profile-name"
-], "objetivos")
-
-update_nutricion_profiles = create_profile_callback([
-    "nutricion-sidebar-user-avatar",
-    "nutricion-sidebar-user-fullname",
-    "nutricion-sidebar-user-level",
-    "nutricion-health-status-dots",
-    "nutricion-health-status-description",
-    "nutricion-user-profile-avatar",
-    "nutricion-user-profile-name"
-], "nutricion")
-
-# ==========================================================
-# CALLBACKS PARA ESTILOS DE NAVEGACIÃ“N (CONTINUACIÃ“N)
-# ==========================================================
-
-@app.callback(
-    [Output("nav-inicio-inicio", "style"),
-     Output("nav-metricas-inicio", "style"),
-     Output("nav-objetivos-inicio", "style"),
-     Output("nav-nutricion-inicio", "style"),
-     Output("nav-entrenamientos-inicio", "style"),],
-    [Input("url", "pathname")],
-    prevent_initial_call=True
-)
-def update_inicio_nav_styles(pathname):
-    if pathname not in ['/inicio', '/metricas', '/objetivos', '/nutricion', '/entrenamientos']:
-        raise dash.exceptions.PreventUpdate
-    
-    # Estilo base para botones inactivos
-    base_style = {
-        'display': 'flex',
-        'alignItems': 'center',
-        'padding': '12px 15px',
-        'backgroundColor': 'transparent',
-        'borderRadius': '10px',
-        'cursor': 'pointer',
-        'transition': 'all 0.3s ease',
-        'border': '1px solid transparent',
-        'color': '#ccc',
-        'textAlign': 'left',
-        'fontFamily': "'Inter', sans-serif",
-        'border': 'none'
-    }
-    
-    # Estilo para botÃ³n activo
-    active_style = {
-        'display': 'flex',
-        'alignItems': 'center',
-        'padding': '12px 15px',
-        'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-        'borderRadius': '10px',
-        'cursor': 'pointer',
-        'transition': 'all 0.3s ease',
-        'border': f'1px solid {HIGHLIGHT_COLOR}',
-        'color': HIGHLIGHT_COLOR,
-        'textAlign': 'left',
-        'fontFamily': "'Inter', sans-serif",
-        'border': 'none'
-    }
-    
-    # Inicializar todos con estilo base (SOLO 6 ELEMENTOS)
-    styles = [base_style] * 5  
-    
-    # Actualizar segÃºn la ruta activa
-    if pathname == '/inicio':
-        styles[0] = active_style  # Inicio
-    elif pathname == '/metricas':
-        styles[1] = active_style  # MÃ©tricas
-    elif pathname == '/objetivos':
-        styles[2] = active_style  # Objetivos
-    elif pathname == '/nutricion':
-        styles[3] = active_style  # NutriciÃ³n
-    elif pathname == '/entrenamientos':
-        styles[4] = active_style  # Entrenamientos
-    
-    return styles
-
-@app.callback(
-    [Output("nav-inicio-metricas", "style"),
-     Output("nav-metricas-metricas", "style"),
-     Output("nav-objetivos-metricas", "style"),
-     Output("nav-nutricion-metricas", "style"),
-     Output("nav-entrenamientos-metricas", "style"),],
-    [Input("url", "pathname")],
-    prevent_initial_call=True
-)
-def update_metricas_nav_styles(pathname):
-    """Actualiza estilos de navegaciÃ³n en la pÃ¡gina de mÃ©tricas"""
-    if pathname not in ['/inicio', '/metricas', '/objetivos', '/nutricion', '/entrenamientos']:
-        raise dash.exceptions.PreventUpdate
-    
-    # Estilo base para botones inactivos
-    base_style = {
-        'display': 'flex',
-        'alignItems': 'center',
-        'padding': '12px 15px',
-        'backgroundColor': 'transparent',
-        'borderRadius': '10px',
-        'cursor': 'pointer',
-        'transition': 'all 0.3s ease',
-        'border': '1px solid transparent',
-        'color': '#ccc',
-        'textAlign': 'left',
-        'fontFamily': "'Inter', sans-serif",
-        'border': 'none'
-    }
-    
-    # Estilo para botÃ³n activo
-    active_style = {
-        'display': 'flex',
-        'alignItems': 'center',
-        'padding': '12px 15px',
-        'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-        'borderRadius': '10px',
-        'cursor': 'pointer',
-        'transition': 'all 0.3s ease',
-        'border': f'1px solid {HIGHLIGHT_COLOR}',
-        'color': HIGHLIGHT_COLOR,
-        'textAlign': 'left',
-        'fontFamily': "'Inter', sans-serif",
-        'border': 'none'
-    }
-    
-    # Inicializar todos con estilo base
-    styles = [base_style] * 5
-    
-    # Actualizar segÃºn la ruta activa
-    if pathname == '/inicio':
-        styles[0] = active_style  # Inicio
-    elif pathname == '/metricas':
-        styles[1] = active_style  # MÃ©tricas
-    elif pathname == '/objetivos':
-        styles[2] = active_style  # Objetivos
-    elif pathname == '/nutricion':
-        styles[3] = active_style  # NutriciÃ³n
-    elif pathname == '/entrenamientos':
-        styles[4] = active_style  # Entrenamientos
-    
-    return styles
-
+# Rangos válidos de los datos biométricos del paso 2 (fuera de rango no se guardan)
+BIOMETRIC_RANGES = {
+    "height": (100, 250),
+    "weight": (30, 300),
+    "age": (1, 100),
+    "max_hr": (120, 230),
+}
+
 @app.callback(
-    [Output("nav-inicio-objetivos", "style"),
-     Output("nav-metricas-objetivos", "style"),
-     Output("nav-objetivos-objetivos", "style"),
-     Output("nav-nutricion-objetivos", "style"),
-     Output("nav-entrenamientos-objetivos", "style"),],
-    [Input("url", "pathname")],
+    Output("step-2-error", "children"),
+    [Input("input-height", "value"),
+     Input("input-weight", "value"),
+     Input("input-age", "value"),
+     Input("input-max-hr", "value"),
+     Input("input-gender", "value")],
+    [State("current-user", "data")],
     prevent_initial_call=True
 )
-def update_objetivos_nav_styles(pathname):
-    """Actualiza estilos de navegaciÃ³n en la pÃ¡gina de objetivos"""
-    if pathname not in ['/inicio', '/metricas', '/objetivos', '/nutricion', '/entrenamientos']:
+def save_biometrics_during_onboarding(height, weight, age, max_hr, gender, current_user):
+    """Guarda en el perfil los datos biométricos del paso 2 (la edad, la FC máxima
+    y el sexo calibran las zonas, el TRIMP y el VO2máx)"""
+    if not current_user:
         raise dash.exceptions.PreventUpdate
-    
-    # Estilo base para botones inactivos
-    base_style = {
-        'display': 'flex',
-        'alignItems': 'center',
-        'padding': '12px 15px',
-        'backgroundColor': 'transparent',
-        'borderRadius': '10px',
-        'cursor': 'pointer',
-        'transition': 'all 0.3s ease',
-        'border': '1px solid transparent',
-        'color': '#ccc',
-        'textAlign': 'left',
-        'fontFamily': "'Inter', sans-serif",
-        'border': 'none'
-    }
-    
-    # Estilo para botÃ³n activo
-    active_style = {
-        'display': 'flex',
-        'alignItems': 'center',
-        'padding': '12px 15px',
-        'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-        'borderRadius': '10px',
-        'cursor': 'pointer',
-        'transition': 'all 0.3s ease',
-        'border': f'1px solid {HIGHLIGHT_COLOR}',
-        'color': HIGHLIGHT_COLOR,
-        'textAlign': 'left',
-        'fontFamily': "'Inter', sans-serif",
-        'border': 'none'
-    }
-    
-    # Inicializar todos con estilo base
-    styles = [base_style] * 5
-    
-    # Actualizar segÃºn la ruta activa
-    if pathname == '/inicio':
-        styles[0] = active_style  # Inicio
-    elif pathname == '/metricas':
-        styles[1] = active_style  # MÃ©tricas
-    elif pathname == '/objetivos':
-        styles[2] = active_style  # Objetivos
-    elif pathname == '/nutricion':
-        styles[3] = active_style  # NutriciÃ³n
-    elif pathname == '/entrenamientos':
-        styles[4] = active_style  # Entrenamientos
-    
-    return styles
+
+    values = {"height": height, "weight": weight, "age": age, "max_hr": max_hr}
+    invalid = [name for name, value in values.items()
+               if value is not None and not BIOMETRIC_RANGES[name][0] <= value <= BIOMETRIC_RANGES[name][1]]
+    save_athlete_profile(current_user, gender=gender,
+                         **{name: value for name, value in values.items() if name not in invalid})
+    return "Revisa los valores fuera de rango" if invalid else ""
+
+# ==========================================================
+# CALLBACK UNIFICADO PARA PERFILES DE USUARIO (CORREGIDO)
+# ==========================================================
+
+# Los componentes del perfil de cada página tienen ids {"type": campo, "page": página}
+# y un único callback con ALL rellena los de la página montada. El perfil de
+# inicio lo actualiza update_patient_view, que además muestra la vista de paciente.
+PROFILE_FIELDS = ["sidebar-user-avatar", "sidebar-user-fullname", "sidebar-user-level",
+                  "health-status-dots", "health-status-description",
+                  "user-profile-avatar", "user-profile-name"]
+
+# Perfiles de la barra lateral que se conservan por worker (los más recientes)
+PROFILE_CACHE_SIZE = 512
+
+
+def _health_dots(health_score, color=HIGHLIGHT_COLOR):
+    """5 círculos: los health_score primeros llenos"""
+    active = {'width': '12px', 'height': '12px', 'backgroundColor': color,
+              'borderRadius': '50%', 'boxShadow': f'0 0 8px {color}'}
+    inactive = {'width': '12px', 'height': '12px', 'backgroundColor': '#444',
+                'borderRadius': '50%', 'border': '1px solid #666'}
+    return [html.Div(style=active if i < health_score else inactive) for i in range(5)]
+
+
+def _build_sidebar_profile(username, user_type, activity_level):
+    if user_type == "doctor" and username in DOCTORS_DB:
+        doctor_data = DOCTORS_DB[username]
+        # Avatar del médico (D en lugar de la inicial para diferenciar)
+        full_name = doctor_data.get("full_name", username)
+        patient_count = len(doctor_data.get("patients", []))
+        health_status_text = html.Div([
+            html.Div("👨‍⚕️ Médico Especialista",
+                    style={'color': '#4ecdc4', 'fontWeight': '600', 'fontSize': '0.9rem', 'marginBottom': '5px'}),
+            html.Div("Acceso completo a datos de pacientes",
+                    style={'color': '#cccccc', 'fontSize': '0.8rem', 'lineHeight': '1.4'})
+        ], style={'textAlign': 'center'})
+        return ("D", full_name, f"Médico • {patient_count} paciente{'s' if patient_count != 1 else ''}",
+                _health_dots(5, '#4ecdc4'), health_status_text, "D", full_name)
+
+    if activity_level is None:
+        activity_level = get_user_activity_level(username)
+    full_name = USERS_DB[username].get("full_name", username) if username in USERS_DB else username
+    level = "Atleta Intermedio" if activity_level >= 7 else "Atleta Principiante" if activity_level <= 4 else "Atleta"
+    avatar_initial = full_name[0].upper() if full_name else username[0].upper()
+
+    health_score = get_health_score_from_activity_level(activity_level)
+    health_status_text = html.Div([
+        html.Div(f"Estado de Salud: {health_score}/5",
+                style={'color': HIGHLIGHT_COLOR, 'fontWeight': '600', 'fontSize': '0.9rem', 'marginBottom': '5px'}),
+        html.Div(get_health_description(health_score),
+                style={'color': '#cccccc', 'fontSize': '0.8rem', 'lineHeight': '1.4'})
+    ], style={'textAlign': 'center'})
+    return (avatar_initial, full_name, level, _health_dots(health_score),
+            health_status_text, avatar_initial, full_name)
+
+
+def sidebar_profile(username, user_type, activity_level=None):
+    """Valores de PROFILE_FIELDS para el usuario, construidos una vez por usuario y nivel"""
+    if username is None:
+        # Usuario no logueado
+        return ("U", "Usuario", "Visitante", [], "Sin datos", "U", "Usuario")
+    if username not in USERS_DB and username not in DOCTORS_DB:
+        return _build_sidebar_profile(username, user_type, activity_level)
+    # La versión de la fila del usuario forma parte de la clave: sus escrituras, de
+    # este worker o de otro, dejan obsoletos sólo sus propios perfiles
+    version = repository.data_version(f"{'doctor' if user_type == 'doctor' else 'athlete'}:{username}")
+    return _cached_sidebar_profile(username, user_type, activity_level, version)
+
+
+@lru_cache(maxsize=PROFILE_CACHE_SIZE)
+def _cached_sidebar_profile(username, user_type, activity_level, version):
+    return _build_sidebar_profile(username, user_type, activity_level)
+
 
 @app.callback(
-    [Output("nav-inicio-nutricion", "style"),
-     Output("nav-metricas-nutricion", "style"),
-     Output("nav-objetivos-nutricion", "style"),
-     Output("nav-nutricion-nutricion", "style"),
-     Output("nav-entrenamientos-nutricion", "style"),],
-    [Input("url", "pathname")],
-    prevent_initial_call=True
+    [Output({"type": field, "page": ALL}, "children") for field in PROFILE_FIELDS],
+    [Input("current-user", "data"),
+     Input("user-activity-level", "data"),
+     Input("user-type-store", "data")],
+    prevent_initial_call=False
 )
-def update_nutricion_nav_styles(pathname):
-    """Actualiza estilos de navegaciÃ³n en la pÃ¡gina de nutriciÃ³n"""
-    if pathname not in ['/inicio', '/metricas', '/objetivos', '/nutricion', '/entrenamientos']:
+def update_sidebar_profiles(current_user, activity_level, user_type):
+    """Rellena el perfil de la barra lateral de la página montada"""
+    outputs = dash.callback_context.outputs_list
+    if not any(outputs):
         raise dash.exceptions.PreventUpdate
-    
-    # Estilo base para botones inactivos
-    base_style = {
-        'display': 'flex',
-        'alignItems': 'center',
-        'padding': '12px 15px',
-        'backgroundColor': 'transparent',
-        'borderRadius': '10px',
-        'cursor': 'pointer',
-        'transition': 'all 0.3s ease',
-        'border': '1px solid transparent',
-        'color': '#ccc',
-        'textAlign': 'left',
-        'fontFamily': "'Inter', sans-serif",
-        'border': 'none'
-    }
-    
-    # Estilo para botÃ³n activo
-    active_style = {
-        'display': 'flex',
-        'alignItems': 'center',
-        'padding': '12px 15px',
-        'backgroundColor': 'rgba(0, 212, 255, 0.1)',
-        'borderRadius': '10px',
-        'cursor': 'pointer',
-        'transition': 'all 0.3s ease',
-        'border': f'1px solid {HIGHLIGHT_COLOR}',
-        'color': HIGHLIGHT_COLOR,
-        'textAlign': 'left',
-        'fontFamily': "'Inter', sans-serif",
-        'border': 'none'
-    }
-    
-    # Inicializar todos con estilo base
-    styles = [base_style] * 5
-    
-    # Actualizar segÃºn la ruta activa
-    if pathname == '/inicio':
-        styles[0] = active_style  # Inicio
-    elif pathname == '/metricas':
-        styles[1] = active_style  # MÃ©tricas
-    elif pathname == '/objetivos':
-        styles[2] = active_style  # Objetivos
-    elif pathname == '/nutricion':
-        styles[3] = active_style  # NutriciÃ³n
-    elif pathname == '/entrenamientos':
-        styles[4] = active_style  # Entrenamientos
-    
-    return styles
+    profile = sidebar_profile(current_user, user_type, activity_level)
+    return [[value] * len(components) for value, components in zip(profile, outputs)]
 
 # ==========================================================
 # CALLBACKS PARA ECG Y GRÃFICAS
 # ==========================================================
 
+def format_vo2max(estimate):
+    if estimate.get('vo2max') is None:
+        return "VO₂máx: -- (faltan sesiones con FC en reposo)"
+    return (f"VO₂máx: {estimate['vo2max']:.1f} ml/kg/min · "
+            f"FC reposo {estimate['resting_hr']:.0f} · FC máx {estimate['max_hr']:.0f} bpm")
+
+@app.callback(
+    Output('vo2max-summary', 'children'),
+    [page_pathname('inicio'),
+     Input('current-user', 'data')],
+    [State('user-type-store', 'data')],
+    prevent_initial_call=False
+)
+def update_vo2max_summary(pathname, current_user, user_type):
+    """Lee la estimación guardada; sólo se recalcula si el atleta tiene sesiones nuevas"""
+    target_user = current_user
+    if pathname and '/inicio?patient=' in pathname and user_type == "doctor":
+        target_user = pathname.split('?patient=')[1].split('&')[0]
+    if not target_user or target_user not in USERS_DB:
+        return "VO₂máx: --"
+    return format_vo2max(get_vo2max(target_user, USERS_DB[target_user]))
+
+def ecg_target_user(pathname, current_user, user_type):
+    """Atleta cuyo ECG se muestra: el paciente de /inicio?patient= si lo ve su médico, si no el usuario"""
+    if pathname and '/inicio?patient=' in pathname and user_type == "doctor":
+        patient_username = pathname.split('?patient=')[1].split('&')[0]
+        if patient_username:
+            return patient_username
+    return current_user
+
+@app.callback(
+    Output('ecg-live-available', 'data'),
+    [page_pathname('inicio'),
+     Input('current-user', 'data'),
+     Input('ecg-live-probe', 'n_intervals')],
+    [State('user-type-store', 'data'),
+     State('ecg-live-available', 'data')],
+    prevent_initial_call=False
+)
+def check_ecg_live_stream(pathname, current_user, n_intervals, user_type, available):
+    """Sondeo lento (cada 10 s, siempre activo) de si el wearable del atleta sigue transmitiendo"""
+    streaming = ECG_STREAMS.is_live(ecg_target_user(pathname, current_user, user_type))
+    if streaming == available:
+        raise dash.exceptions.PreventUpdate
+    return streaming
+
+# El refresco de 1 Hz sólo está activo mientras el sondeo ve señal en vivo
+app.clientside_callback(
+    """
+    function(available) {
+        return !available;
+    }
+    """,
+    Output('ecg-live-interval', 'disabled'),
+    Input('ecg-live-available', 'data')
+)
+
 @app.callback(
     [Output('ecg-graph', 'figure'),
      Output('current-bpm', 'children'),
      Output('bpm-status', 'children'),
      Output('max-bpm', 'children'),
      Output('min-bpm', 'children'),
-     Output('avg-bpm', 'children')],
-    [Input('url', 'pathname'),
-     Input('current-user', 'data')],
+     Output('avg-bpm', 'children'),
+     Output('hrv-summary', 'children')],
+    [page_pathname('inicio'),
+     Input('current-user', 'data'),
+     Input('ecg-live-interval', 'n_intervals'),
+     Input('ecg-graph', 'relayoutData')],
      [State('user-type-store', 'data')],
     prevent_initial_call=False
 )
-def update_ecg_inicio(pathname, current_user, user_type):
+def update_ecg_inicio(pathname, current_user, n_intervals, relayout_data, user_type):
     print(f"ðŸ” ECG Callback - pathname: {pathname}, user: {current_user}")
 
         
-    # Determinar si estamos viendo un paciente
-    is_viewing_patient = False
-    patient_username = None
+    target_user = ecg_target_user(pathname, current_user, user_type)
+    print(f"ðŸ‘¤ Mostrando ECG de: {target_user}")
     
-    if '/inicio?patient=' in pathname:
-        patient_username = pathname.split('?patient=')[1].split('&')[0]
-        is_viewing_patient = True
+    # Los ticks del intervalo sólo sirven para refrescar la señal en vivo
+    ctx = dash.callback_context
+    is_live_tick = bool(ctx.triggered) and ctx.triggered[0]['prop_id'].startswith('ecg-live-interval')
+    if is_live_tick and not (ECG_STREAMS.is_live(target_user) and ECG_STREAMS.has_data(target_user, min_seconds=2)):
+        raise dash.exceptions.PreventUpdate
     
-    # Determinar para quiÃ©n mostrar datos
-    if is_viewing_patient and user_type == "doctor" and patient_username:
-        # Mostrar datos del paciente
-        target_user = patient_username
-        print(f"ðŸ‘¨â€âš•ï¸ Mostrando ECG del paciente: {target_user}")
-    else:
-        # Mostrar datos del usuario actual
-        target_user = current_user
-        print(f"ðŸ‘¤ Mostrando ECG del usuario: {target_user}")
+    # Zoom del usuario: sólo se recalcula si cambia el rango visible del eje x
+    x_range = xrange_from_relayout(relayout_data)
+    is_zoom = bool(ctx.triggered) and ctx.triggered[0]['prop_id'].startswith('ecg-graph.relayoutData')
+    if is_zoom and x_range is None:
+        raise dash.exceptions.PreventUpdate
+    if x_range == "reset":
+        x_range = None
     
     # Solo ejecutar si estamos en inicio o mÃ©tricas
     if pathname not in ['/inicio', '/metricas']:
@@ -11795,11 +11667,30 @@ def update_ecg_inicio(pathname, current_user, user_type):
                 }]
             }
         }
-        return empty_fig, "Cargando...", "Cargando", "Cargando", "Cargando", "Cargando"
+        return empty_fig, "Cargando...", "Cargando", "Cargando", "Cargando", "Cargando", "HRV: --"
     
     try:
         print("ðŸ“Š Cargando datos de ECG...")
-        t, ecg, bpm, peaks = load_ecg_and_compute_bpm("ecg_example.csv")
+        if ECG_STREAMS.has_data(target_user, min_seconds=2):
+            # Señal en vivo: ya filtrada y con picos calculados de forma incremental en la ingesta
+            processor = ECG_STREAMS.get_processor(target_user)
+            t, ecg, peaks, bpm = processor.recent()
+            # La calidad se mide sobre la señal cruda del mismo tramo
+            t_raw, raw = ECG_STREAMS.get_buffer(target_user).snapshot()
+            quality = window_quality(raw, processor.fs)
+            bad_mask = bad_sample_mask(quality, len(raw))[np.clip(np.searchsorted(t_raw, t), 0, len(raw) - 1)]
+            peaks = clean_peaks(peaks, bad_mask)
+            rr_mask = clean_rr_mask(peaks, bad_mask)
+            hrv_metrics = compute_hrv(t[peaks], rr_mask)
+            hr_stats = heart_rate_summary(t[peaks], rr_mask=rr_mask)
+            segments = bad_segments(quality, t_raw)
+            print(f"📡 ECG en vivo de {target_user}: {len(t)} muestras")
+        else:
+            t, ecg, bpm, peaks, _ = ECG_CACHE.get("ecg_example.csv", load_ecg_and_compute_bpm)
+            segments = ECG_CACHE.get("ecg_example.csv", compute_recording_bad_segments)
+            hrv_metrics = ECG_CACHE.get("ecg_example.csv", compute_recording_hrv)
+            hr_stats = ECG_CACHE.get("ecg_example.csv", compute_recording_heart_rate)
+            print(f"🗃️ Caché ECG: {ECG_CACHE.stats()}")
         
         if len(t) == 0 or len(ecg) == 0:
             print("âš ï¸ No hay datos de ECG disponibles")
@@ -11820,15 +11711,24 @@ def update_ecg_inicio(pathname, current_user, user_type):
                     }]
                 }
             }
-            return empty_fig, "0 bpm", "Sin datos", "0 bpm", "0 bpm", "0 bpm"
+            return empty_fig, "0 bpm", "Sin datos", "0 bpm", "0 bpm", "0 bpm", "HRV: --"
         
         print(f"âœ… Datos ECG cargados: {len(t)} puntos, BPM: {bpm}")
         
+        # Sólo se envía la ventana visible, reducida a ~ancho del gráfico en píxeles
+        if x_range:
+            i0, i1 = np.searchsorted(t, x_range)
+            i0, i1 = max(i0 - 1, 0), min(i1 + 1, len(t))
+        else:
+            i0, i1 = 0, len(t)
+        t_plot, ecg_plot = decimate_trace(t[i0:i1], ecg[i0:i1], ECG_PLOT_MAX_POINTS)
+        visible_peaks = peaks[(peaks >= i0) & (peaks < i1)]
+        
         fig = {
             'data': [
                 {
-                    'x': t,
-                    'y': ecg,
+                    'x': t_plot,
+                    'y': ecg_plot,
                     'type': 'scatter',
                     'mode': 'lines',
                     'line': {'color': HIGHLIGHT_COLOR, 'width': 2},
@@ -11864,6 +11764,7 @@ def update_ecg_inicio(pathname, current_user, user_type):
                 'showlegend': False,
                 'hovermode': 'closest',
                 'height': 200,
+                'uirevision': target_user,
                 'title': {
                     'text': 'SeÃ±al ECG en Tiempo Real',
                     'font': {'color': HIGHLIGHT_COLOR, 'size': 14},
@@ -11873,10 +11774,24 @@ def update_ecg_inicio(pathname, current_user, user_type):
             }
         }
         
-        if len(peaks) > 0:
+        if x_range:
+            fig['layout']['xaxis']['range'] = list(x_range)
+        
+        # Sombrear los tramos de mala calidad excluidos del cálculo de BPM
+        fig['layout']['shapes'] = [
+            {
+                'type': 'rect', 'xref': 'x', 'yref': 'paper',
+                'x0': seg_start, 'x1': seg_end, 'y0': 0, 'y1': 1,
+                'fillcolor': 'rgba(255, 107, 107, 0.15)', 'line': {'width': 0}, 'layer': 'below'
+            }
+            for seg_start, seg_end in segments
+            if seg_end >= t[i0] and seg_start <= t[i1 - 1]
+        ]
+        
+        if len(visible_peaks) > 0:
             fig['data'].append({
-                'x': t[peaks],
-                'y': ecg[peaks],
+                'x': t[visible_peaks],
+                'y': ecg[visible_peaks],
                 'mode': 'markers',
                 'marker': {
                     'color': '#ff6b6b', 
@@ -11889,29 +11804,31 @@ def update_ecg_inicio(pathname, current_user, user_type):
                 'showlegend': False
             })
         
-        if bpm < 60:
+        if bpm is None:
+            status = "Señal no válida"
+        elif bpm < 60:
             status = "Bradicardia"
         elif bpm < 100:
             status = "Normal" 
         else:
             status = "Taquicardia"
         
-        if len(ecg) > 0:
-            max_bpm = int(bpm * 1.18)
-            min_bpm = int(bpm * 0.82)
-            avg_bpm = int(bpm)
-        else:
-            max_bpm = min_bpm = avg_bpm = int(bpm)
+        # Máx/mín de la media móvil y media de la serie latido a latido (sin latidos, el BPM global)
+        max_bpm, min_bpm, avg_bpm = (
+            hr_stats[key] if hr_stats[key] is not None else bpm
+            for key in ("max_bpm", "min_bpm", "avg_bpm")
+        )
         
-        print(f"âœ… ECG generado exitosamente: BPM={int(bpm)}, Status={status}")
+        print(f"âœ… ECG generado exitosamente: BPM={format_bpm(bpm)}, Status={status}")
         
         return (
             fig,
-            f"{int(bpm)} bpm",
+            format_bpm(bpm),
             status,
-            f"{max_bpm} bpm",
-            f"{min_bpm} bpm", 
-            f"{avg_bpm} bpm"
+            format_bpm(max_bpm),
+            format_bpm(min_bpm), 
+            format_bpm(avg_bpm),
+            format_hrv_summary(hrv_metrics)
         )
         
     except Exception as e:
@@ -11920,12 +11837,7 @@ def update_ecg_inicio(pathname, current_user, user_type):
         traceback.print_exc()
         
         # Crear datos de ejemplo de fallback
-        t_example = np.linspace(0, 10, 1000)
-        ecg_example = (
-            0.5 * np.sin(2 * np.pi * 0.2 * t_example) +
-            1.5 * np.sin(2 * np.pi * 1.0 * (t_example - 0.1)) * np.exp(-5 * (t_example - 0.1)**2) +
-            0.3 * np.sin(2 * np.pi * 0.3 * (t_example - 0.3))
-        )
+        t_example, ecg_example, _ = synthetic_ecg(10, fs=100, heart_rate=60, seed=0)
         
         fig_fallback = {
             'data': [{
@@ -11976,8 +11888,361 @@ def update_ecg_inicio(pathname, current_user, user_type):
             "Normal", 
             "85 bpm", 
             "65 bpm", 
-            "72 bpm"
+            "72 bpm",
+            "HRV: --"
+        )
+
+# ==========================================================
+# ZONAS CARDÍACAS
+# ==========================================================
+
+HR_ZONE_COLORS = ('#4ecdc4', HIGHLIGHT_COLOR, '#ffd166', '#ff9f43', '#ff6b6b')
+
+def load_zone_minutes(username, days, end_date=None):
+    """Fechas y matriz (días x 5 zonas) de minutos desde los totales diarios, sin tocar muestras"""
+    end_date = end_date or datetime.now().date()
+    dates = pd.date_range(end=end_date, periods=days).date
+    rollups = repository.load_daily_rollups(
+        username, dates[0].isoformat(), dates[-1].isoformat(), ZONE_METRICS)
+    minutes = np.zeros((days, len(ZONE_METRICS)))
+    for row, day in enumerate(dates):
+        totals = rollups.get(day.isoformat())
+        if totals:
+            minutes[row] = [totals.get(metric, 0.0) / 60 for metric in ZONE_METRICS]
+    return dates, minutes
+
+def load_weekly_calendar(username, metric, weeks=4, end_date=None):
+    """Lunes de cada semana y matriz (semanas x 7) de una métrica diaria.
+
+    Una sola consulta por rango a los totales diarios y un reshape: el coste
+    depende de los días de la ventana, no de las sesiones o comidas guardadas.
+    Los días posteriores a end_date quedan como NaN (celdas vacías).
+    """
+    end_date = end_date or datetime.now().date()
+    first_monday = end_date - timedelta(days=end_date.weekday() + 7 * (weeks - 1))
+    dates = pd.date_range(start=first_monday, periods=7 * weeks).date
+    rollups = repository.load_daily_rollups(
+        username, dates[0].isoformat(), end_date.isoformat(), [metric])
+    values = np.array([rollups.get(day.isoformat(), {}).get(metric, 0.0) for day in dates])
+    values[dates > end_date] = np.nan
+    return dates[::7], values.reshape(weeks, 7)
+
+@app.callback(
+    Output('hr-zones-chart', 'figure'),
+    [Input('hr-zones-range', 'value'),
+     Input('current-user', 'data')],
+    prevent_initial_call=False
+)
+def update_hr_zones_chart(days, current_user):
+    """Barras apiladas con los minutos diarios en cada zona cardíaca"""
+    if not current_user:
+        raise dash.exceptions.PreventUpdate
+    dates, minutes = load_zone_minutes(current_user, int(days or 7))
+    labels = [day.strftime('%d/%m') for day in dates]
+    return {
+        'data': [
+            {
+                'type': 'bar',
+                'x': labels,
+                'y': minutes[:, zone],
+                'name': ZONE_NAMES[zone],
+                'marker': {'color': HR_ZONE_COLORS[zone]},
+                'hovertemplate': f'{ZONE_NAMES[zone]}: ' + '%{y:.0f} min<extra></extra>'
+            }
+            for zone in range(len(ZONE_NAMES))
+        ],
+        'layout': {
+            'barmode': 'stack',
+            'paper_bgcolor': 'rgba(0,0,0,0)',
+            'plot_bgcolor': 'rgba(0,0,0,0)',
+            'font': {'color': '#ccc'},
+            'xaxis': {'gridcolor': '#2b2b2b'},
+            'yaxis': {'title': 'Minutos', 'gridcolor': '#2b2b2b'},
+            'legend': {'orientation': 'h', 'y': 1.1},
+            'margin': {'t': 30, 'b': 40, 'l': 50, 'r': 20},
+            'annotations': [] if minutes.any() else [{
+                'text': 'Sin tiempo en zonas en este periodo',
+                'xref': 'paper', 'yref': 'paper', 'x': 0.5, 'y': 0.5,
+                'showarrow': False, 'font': {'size': 14, 'color': '#666'}
+            }]
+        }
+    }
+
+def build_advanced_metrics_figures(current_user):
+    """Las tres gráficas avanzadas de métricas del atleta: intensidad, heatmap y radar"""
+    
+    # 1. GRÃFICA DE INTENSIDAD VS RECUPERACIÃ“N
+    # Carga diaria (TRIMP/sRPE) y cargas aguda/crónica precalculadas en los totales diarios
+    load = load_training_load(current_user, days=30) if current_user else None
+    if load is None:
+        load = {'dates': [], 'load': [], 'acute_load': [], 'chronic_load': [], 'acwr': []}
+    days = [day.strftime('%d/%m') for day in load['dates']]
+    
+    intensity_fig = {
+        'data': [
+            {
+                'x': days,
+                'y': load['load'],
+                'type': 'bar',
+                'name': 'Carga diaria (TRIMP)',
+                'marker': {'color': 'rgba(255, 209, 102, 0.5)'},
+                'hovertemplate': 'Carga: %{y:.0f}<extra></extra>'
+            },
+            {
+                'x': days,
+                'y': load['acute_load'],
+                'type': 'scatter',
+                'mode': 'lines+markers',
+                'name': 'Carga Aguda (7 días)',
+                'line': {'color': HIGHLIGHT_COLOR, 'width': 3, 'shape': 'spline'},
+                'marker': {'size': 6, 'color': HIGHLIGHT_COLOR},
+                'fill': 'tozeroy',
+                'fillcolor': 'rgba(0, 212, 255, 0.1)'
+            },
+            {
+                'x': days,
+                'y': load['chronic_load'],
+                'type': 'scatter',
+                'mode': 'lines+markers',
+                'name': 'Carga Crónica (28 días)',
+                'line': {'color': '#4ecdc4', 'width': 3, 'shape': 'spline'},
+                'marker': {'size': 6, 'color': '#4ecdc4'},
+                'fill': 'tozeroy',
+                'fillcolor': 'rgba(78, 205, 196, 0.1)',
+                'customdata': load['acwr'],
+                'hovertemplate': 'Crónica: %{y:.1f}<br>Ratio agudo:crónico: %{customdata:.2f}<extra></extra>'
+            }
+        ],
+        'layout': {
+            'title': {
+                'text': 'Carga Aguda vs Crónica (Últimos 30 días)',
+                'font': {'color': HIGHLIGHT_COLOR, 'size': 18},
+                'x': 0.5,
+                'xanchor': 'center'
+            },
+            'paper_bgcolor': '#1a1a1a',
+            'plot_bgcolor': '#1a1a1a',
+            'font': {'color': '#ccc'},
+            'xaxis': {
+                'title': 'DÃ­as',
+                'gridcolor': '#2b2b2b',
+                'zerolinecolor': '#2b2b2b',
+                'titlefont': {'color': '#ccc', 'size': 14},
+                'tickfont': {'color': '#ccc', 'size': 12},
+                'showgrid': True,
+                'gridwidth': 1,
+                'showline': True,
+                'linecolor': '#444'
+            },
+            'yaxis': {
+                'title': 'Carga (TRIMP)',
+                'gridcolor': '#2b2b2b',
+                'zerolinecolor': '#2b2b2b',
+                'titlefont': {'color': '#ccc', 'size': 14},
+                'tickfont': {'color': '#ccc', 'size': 12},
+                'showgrid': True,
+                'gridwidth': 1,
+                'showline': True,
+                'linecolor': '#444'
+            },
+            'margin': {'t': 60, 'b': 60, 'l': 80, 'r': 40},
+            'showlegend': True,
+            'legend': {
+                'x': 0.02,
+                'y': 1,
+                'bgcolor': 'rgba(0,0,0,0.5)',
+                'bordercolor': '#444',
+                'borderwidth': 1,
+                'font': {'color': '#ccc', 'size': 12}
+            },
+            'hovermode': 'x unified',
+            'height': 400
+        }
+    }
+    
+    # 2. HEATMAP DE RENDIMIENTO SEMANAL
+    days_of_week = ['Lun', 'Mar', 'MiÃ©', 'Jue', 'Vie', 'SÃ¡b', 'Dom']
+    
+    # Carga diaria de las últimas 4 semanas (filas = semanas, columnas = días)
+    week_starts, heatmap_data = load_weekly_calendar(current_user, 'load', weeks=4) if current_user \
+        else ([], np.zeros((0, 7)))
+    weeks = [f"Sem {monday.strftime('%d/%m')}" for monday in week_starts]
+    heatmap_data = np.round(heatmap_data).tolist()
+    
+    colorscale = [
+        [0, '#0a2a38'],
+        [0.4, '#006d8f'],
+        [1, HIGHLIGHT_COLOR]
+    ]
+    
+    heatmap_fig = {
+        'data': [{
+            'z': heatmap_data,
+            'x': days_of_week,
+            'y': weeks,
+            'type': 'heatmap',
+            'colorscale': colorscale,
+            'showscale': True,
+            'colorbar': {
+                'title': 'Carga',
+                'titleside': 'right',
+                'titlefont': {'color': '#ccc', 'size': 12},
+                'tickfont': {'color': '#ccc', 'size': 11},
+                'ticks': 'outside',
+                'tickcolor': '#ccc',
+                'ticklen': 5,
+                'thickness': 15,
+                'len': 0.8
+            },
+            'hovertemplate': 'DÃ­a: %{x}<br>Semana: %{y}<br>Carga: %{z:.0f}<extra></extra>'
+        }],
+        'layout': {
+            'title': {
+                'text': 'Heatmap de Rendimiento Semanal',
+                'font': {'color': HIGHLIGHT_COLOR, 'size': 18},
+                'x': 0.5,
+                'xanchor': 'center'
+            },
+            'paper_bgcolor': '#1a1a1a',
+            'plot_bgcolor': '#1a1a1a',
+            'font': {'color': '#ccc'},
+            'xaxis': {
+                'side': 'bottom',
+                'tickfont': {'color': '#ccc', 'size': 12},
+                'gridcolor': '#2b2b2b',
+                'linecolor': '#444'
+            },
+            'yaxis': {
+                'tickfont': {'color': '#ccc', 'size': 12},
+                'gridcolor': '#2b2b2b',
+                'linecolor': '#444'
+            },
+            'margin': {'t': 60, 'b': 60, 'l': 80, 'r': 80},
+            'height': 350
+        }
+    }
+    
+    # 3. RADAR DE COMPETENCIAS ATLÉTICAS: percentil del atleta dentro de la cohorte
+    COHORT.start()
+    cohort = COHORT.athlete(current_user) if current_user else {}
+    categories = [COHORT_LABELS[metric][0] for metric in COHORT_METRICS]
+    user_values = [round(cohort[metric]['rank']) if cohort.get(metric, {}).get('rank') is not None else 0
+                   for metric in COHORT_METRICS]
+    user_details = [COHORT_LABELS[metric][1].format(cohort[metric]['value'])
+                    if cohort.get(metric, {}).get('value') is not None else 'Sin datos'
+                    for metric in COHORT_METRICS]
+    elite_values = [ELITE_PERCENTILE] * len(COHORT_METRICS)
+    
+    radar_fig = go.Figure()
+    
+    radar_fig.add_trace(go.Scatterpolar(
+        r=elite_values,
+        theta=categories,
+        fill='toself',
+        name=f'Percentil {ELITE_PERCENTILE} de la cohorte',
+        hovertemplate=f'<b>%{{theta}}</b><br>Percentil {ELITE_PERCENTILE}<extra></extra>',
+        line_color='rgba(255, 255, 255, 0.4)',
+        fillcolor='rgba(255, 255, 255, 0.1)',
+        line_width=2,
+        opacity=0.6
+    ))
+    
+    radar_fig.add_trace(go.Scatterpolar(
+        r=user_values,
+        theta=categories,
+        fill='toself',
+        name='Tu Percentil',
+        customdata=user_details,
+        hovertemplate='<b>%{theta}</b><br>Percentil: %{r}<br>%{customdata}<extra></extra>',
+        line_color=HIGHLIGHT_COLOR,
+        fillcolor=f'rgba(0, 212, 255, 0.3)',
+        line_width=3,
+        opacity=0.8
+    ))
+    
+    radar_fig.update_layout(
+        title={
+            'text': 'Radar de Competencias AtlÃ©ticas',
+            'font': {'color': HIGHLIGHT_COLOR, 'size': 18, 'family': "'Inter', sans-serif"},
+            'x': 0.5,
+            'xanchor': 'center',
+            'y': 0.95
+        },
+        paper_bgcolor='#1a1a1a',
+        plot_bgcolor='#1a1a1a',
+        font={'color': '#ccc', 'family': "'Inter', sans-serif", 'size': 12},
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100],
+                tickfont={'color': '#ccc', 'size': 10, 'family': "'Inter', sans-serif"},
+                gridcolor='#2b2b2b',
+                linecolor='#444',
+                ticksuffix='%',
+                showline=True,
+                linewidth=1,
+                tickmode='array',
+                tickvals=[0, 20, 40, 60, 80, 100],
+                ticktext=['0%', '20%', '40%', '60%', '80%', '100%'],
+                tickangle=0,
+                ticklen=5,
+                tickwidth=1,
+                layer='below traces'
+            ),
+            angularaxis=dict(
+                tickfont={'color': '#ccc', 'size': 12, 'family': "'Inter', sans-serif"},
+                gridcolor='#2b2b2b',
+                linecolor='#444',
+                rotation=90,
+                direction='clockwise'
+            ),
+            bgcolor='#141414',
+            sector=[0, 360],
+            hole=0
+        ),
+        showlegend=True,
+        legend=dict(
+            x=1.05,
+            y=0.5,
+            bgcolor='rgba(20, 20, 20, 0.8)',
+            bordercolor='#444',
+            borderwidth=1,
+            font={'color': '#ccc', 'size': 11, 'family': "'Inter', sans-serif"},
+            orientation='v'
+        ),
+        margin=dict(t=80, b=80, l=80, r=120),
+        height=450,
+        width=None,
+        hovermode='closest',
+        autosize=True
+    )
+    
+    radar_fig.update_traces(
+        hoverlabel=dict(
+            bgcolor='rgba(26, 26, 26, 0.9)',
+            font_size=12,
+            font_family="'Inter', sans-serif"
         )
+    )
+    
+    radar_fig.update_layout(
+        autosize=True,
+        dragmode=False
+    )
+    
+    return intensity_fig, heatmap_fig, radar_fig
+
+def metrics_figures_version(current_user):
+    """Versión de los datos de las gráficas: sesiones del atleta, su fila de la cohorte y día"""
+    COHORT.start()
+    return (repository.data_version(f"sessions:{current_user}"), COHORT.athlete_version(current_user),
+            date.today())
+
+# Figuras de métricas ya serializadas por atleta; se recalculan en segundo plano
+# cuando llega una sesión nueva o cambia su fila en la instantánea de la cohorte
+METRICS_FIGURES = FigureCache(build_advanced_metrics_figures, metrics_figures_version)
+COHORT.subscribe(lambda snapshot: METRICS_FIGURES.schedule_cached())
+COHORT.start()  # cada worker empieza a calcular la instantánea al importar la app
 
 # ==========================================================
 # CALLBACKS PARA GRÃFICAS AVANZADAS EN MÃ‰TRICAS
@@ -11987,7 +12252,7 @@ def update_ecg_inicio(pathname, current_user, user_type):
     [Output('intensity-recovery-chart', 'figure'),
      Output('performance-heatmap', 'figure'),
      Output('athletic-radar-chart', 'figure')],
-    [Input('url', "pathname"),
+    [page_pathname('metricas'),
      Input('current-user', "data")],
     prevent_initial_call=False
 )
@@ -12021,255 +12286,9 @@ def generate_advanced_metrics_charts(pathname, current_user):
     print("ðŸ“Š Generando grÃ¡ficas avanzadas para mÃ©tricas...")
     
     try:
-        # 1. GRÃFICA DE INTENSIDAD VS RECUPERACIÃ“N
-        days = list(range(1, 31))
-        intensity_days = [1, 2, 3, 1, 4, 2, 1, 3, 4, 2, 
-                         1, 2, 3, 1, 4, 2, 1, 3, 4, 2,
-                         1, 2, 3, 1, 4, 2, 1, 3, 4, 2]
-        recovery_days = [2, 1, 2, 3, 1, 2, 3, 2, 1, 3,
-                        2, 1, 2, 3, 1, 2, 3, 2, 1, 3,
-                        2, 1, 2, 3, 1, 2, 3, 2, 1, 3]
-        
-        intensity_fig = {
-            'data': [
-                {
-                    'x': days,
-                    'y': intensity_days,
-                    'type': 'scatter',
-                    'mode': 'lines+markers',
-                    'name': 'DÃ­as Alta Intensidad',
-                    'line': {'color': HIGHLIGHT_COLOR, 'width': 3, 'shape': 'spline'},
-                    'marker': {'size': 8, 'color': HIGHLIGHT_COLOR},
-                    'fill': 'tozeroy',
-                    'fillcolor': 'rgba(0, 212, 255, 0.1)'
-                },
-                {
-                    'x': days,
-                    'y': recovery_days,
-                    'type': 'scatter',
-                    'mode': 'lines+markers',
-                    'name': 'DÃ­as RecuperaciÃ³n',
-                    'line': {'color': '#4ecdc4', 'width': 3, 'shape': 'spline'},
-                    'marker': {'size': 8, 'color': '#4ecdc4'},
-                    'fill': 'tozeroy',
-                    'fillcolor': 'rgba(78, 205, 196, 0.1)'
-                }
-            ],
-            'layout': {
-                'title': {
-                    'text': 'AnÃ¡lisis de Intensidad vs RecuperaciÃ³n (Ãšltimos 30 dÃ­as)',
-                    'font': {'color': HIGHLIGHT_COLOR, 'size': 18},
-                    'x': 0.5,
-                    'xanchor': 'center'
-                },
-                'paper_bgcolor': '#1a1a1a',
-                'plot_bgcolor': '#1a1a1a',
-                'font': {'color': '#ccc'},
-                'xaxis': {
-                    'title': 'DÃ­as',
-                    'gridcolor': '#2b2b2b',
-                    'zerolinecolor': '#2b2b2b',
-                    'titlefont': {'color': '#ccc', 'size': 14},
-                    'tickfont': {'color': '#ccc', 'size': 12},
-                    'showgrid': True,
-                    'gridwidth': 1,
-                    'showline': True,
-                    'linecolor': '#444'
-                },
-                'yaxis': {
-                    'title': 'Nivel (1-4)',
-                    'gridcolor': '#2b2b2b',
-                    'zerolinecolor': '#2b2b2b',
-                    'titlefont': {'color': '#ccc', 'size': 14},
-                    'tickfont': {'color': '#ccc', 'size': 12},
-                    'showgrid': True,
-                    'gridwidth': 1,
-                    'showline': True,
-                    'linecolor': '#444',
-                    'range': [0, 5]
-                },
-                'margin': {'t': 60, 'b': 60, 'l': 80, 'r': 40},
-                'showlegend': True,
-                'legend': {
-                    'x': 0.02,
-                    'y': 1,
-                    'bgcolor': 'rgba(0,0,0,0.5)',
-                    'bordercolor': '#444',
-                    'borderwidth': 1,
-                    'font': {'color': '#ccc', 'size': 12}
-                },
-                'hovermode': 'x unified',
-                'height': 400
-            }
-        }
-        
-        # 2. HEATMAP DE RENDIMIENTO SEMANAL
-        days_of_week = ['Lun', 'Mar', 'MiÃ©', 'Jue', 'Vie', 'SÃ¡b', 'Dom']
-        weeks = ['Sem 1', 'Sem 2', 'Sem 3', 'Sem 4']
-        
-        heatmap_data = [
-            [2, 5, 3, 7, 6, 1, 4],
-            [4, 6, 5, 8, 7, 3, 2],
-            [3, 7, 6, 8, 5, 4, 1],
-            [5, 8, 7, 6, 4, 2, 3]
-        ]
-        
-        colorscale = [
-            [0, '#0a2a38'],
-            [0.4, '#006d8f'],
-            [1, HIGHLIGHT_COLOR]
-        ]
-        
-        heatmap_fig = {
-            'data': [{
-                'z': heatmap_data,
-                'x': days_of_week,
-                'y': weeks,
-                'type': 'heatmap',
-                'colorscale': colorscale,
-                'showscale': True,
-                'colorbar': {
-                    'title': 'Intensidad',
-                    'titleside': 'right',
-                    'titlefont': {'color': '#ccc', 'size': 12},
-                    'tickfont': {'color': '#ccc', 'size': 11},
-                    'ticks': 'outside',
-                    'tickcolor': '#ccc',
-                    'ticklen': 5,
-                    'thickness': 15,
-                    'len': 0.8
-                },
-                'hovertemplate': 'DÃ­a: %{x}<br>Semana: %{y}<br>Intensidad: %{z}/8<extra></extra>'
-            }],
-            'layout': {
-                'title': {
-                    'text': 'Heatmap de Rendimiento Semanal',
-                    'font': {'color': HIGHLIGHT_COLOR, 'size': 18},
-                    'x': 0.5,
-                    'xanchor': 'center'
-                },
-                'paper_bgcolor': '#1a1a1a',
-                'plot_bgcolor': '#1a1a1a',
-                'font': {'color': '#ccc'},
-                'xaxis': {
-                    'side': 'bottom',
-                    'tickfont': {'color': '#ccc', 'size': 12},
-                    'gridcolor': '#2b2b2b',
-                    'linecolor': '#444'
-                },
-                'yaxis': {
-                    'tickfont': {'color': '#ccc', 'size': 12},
-                    'gridcolor': '#2b2b2b',
-                    'linecolor': '#444'
-                },
-                'margin': {'t': 60, 'b': 60, 'l': 80, 'r': 80},
-                'height': 350
-            }
-        }
-        
-        # 3. RADAR DE COMPETENCIAS ATLÃ‰TICAS
-        categories = ['Resistencia', 'Fuerza', 'Velocidad', 'Flexibilidad', 'Agilidad', 'Potencia']
-        user_values = [92, 88, 95, 78, 85, 90]
-        elite_values = [98, 96, 99, 95, 97, 98]
-        
-        radar_fig = go.Figure()
-        
-        radar_fig.add_trace(go.Scatterpolar(
-            r=elite_values,
-            theta=categories,
-            fill='toself',
-            name='Atleta Ã‰lite (Referencia)',
-            line_color='rgba(255, 255, 255, 0.4)',
-            fillcolor='rgba(255, 255, 255, 0.1)',
-            line_width=2,
-            opacity=0.6
-        ))
-        
-        radar_fig.add_trace(go.Scatterpolar(
-            r=user_values,
-            theta=categories,
-            fill='toself',
-            name='Tu Rendimiento',
-            line_color=HIGHLIGHT_COLOR,
-            fillcolor=f'rgba(0, 212, 255, 0.3)',
-            line_width=3,
-            opacity=0.8
-        ))
-        
-        radar_fig.update_layout(
-            title={
-                'text': 'Radar de Competencias AtlÃ©ticas',
-                'font': {'color': HIGHLIGHT_COLOR, 'size': 18, 'family': "'Inter', sans-serif"},
-                'x': 0.5,
-                'xanchor': 'center',
-                'y': 0.95
-            },
-            paper_bgcolor='#1a1a1a',
-            plot_bgcolor='#1a1a1a',
-            font={'color': '#ccc', 'family': "'Inter', sans-serif", 'size': 12},
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 100],
-                    tickfont={'color': '#ccc', 'size': 10, 'family': "'Inter', sans-serif"},
-                    gridcolor='#2b2b2b',
-                    linecolor='#444',
-                    ticksuffix='%',
-                    showline=True,
-                    linewidth=1,
-                    tickmode='array',
-                    tickvals=[0, 20, 40, 60, 80, 100],
-                    ticktext=['0%', '20%', '40%', '60%', '80%', '100%'],
-                    tickangle=0,
-                    ticklen=5,
-                    tickwidth=1,
-                    layer='below traces'
-                ),
-                angularaxis=dict(
-                    tickfont={'color': '#ccc', 'size': 12, 'family': "'Inter', sans-serif"},
-                    gridcolor='#2b2b2b',
-                    linecolor='#444',
-                    rotation=90,
-                    direction='clockwise'
-                ),
-                bgcolor='#141414',
-                sector=[0, 360],
-                hole=0
-            ),
-            showlegend=True,
-            legend=dict(
-                x=1.05,
-                y=0.5,
-                bgcolor='rgba(20, 20, 20, 0.8)',
-                bordercolor='#444',
-                borderwidth=1,
-                font={'color': '#ccc', 'size': 11, 'family': "'Inter', sans-serif"},
-                orientation='v'
-            ),
-            margin=dict(t=80, b=80, l=80, r=120),
-            height=450,
-            width=None,
-            hovermode='closest',
-            autosize=True
-        )
-        
-        radar_fig.update_traces(
-            hovertemplate='<b>%{theta}</b><br>PuntuaciÃ³n: %{r}%<extra></extra>',
-            hoverlabel=dict(
-                bgcolor='rgba(26, 26, 26, 0.9)',
-                font_size=12,
-                font_family="'Inter', sans-serif"
-            )
-        )
-        
-        radar_fig.update_layout(
-            autosize=True,
-            dragmode=False
-        )
-        
+        figures = METRICS_FIGURES.get(current_user)
         print("âœ… GrÃ¡ficas avanzadas generadas exitosamente")
-        
-        return intensity_fig, heatmap_fig, radar_fig
+        return figures
         
     except Exception as e:
         print(f"âŒ Error generando grÃ¡ficas avanzadas: {e}")
@@ -12354,7 +12373,7 @@ def generate_advanced_metrics_charts(pathname, current_user):
     [Output('intensity-recovery-chart', 'config'),
      Output('performance-heatmap', 'config'),
      Output('athletic-radar-chart', 'config')],
-    Input('url', "pathname"),
+    page_pathname('metricas'),
     prevent_initial_call=False
 )
 def configure_minimal_toolbars(pathname):
@@ -12447,17 +12466,12 @@ def toggle_modal(open_clicks, cancel_clicks, submit_clicks, is_open, pathname):
      Output("goal-type-text", "style")],
     [Input("btn-health-goal", "n_clicks"),
      Input("btn-fitness-goal", "n_clicks"),
-     Input("btn-back-to-choose", "n_clicks"),
-     Input("url", "pathname")],  # AÃ‘ADIR pathname
+     Input("btn-back-to-choose", "n_clicks")],
     prevent_initial_call=True
 )
-def toggle_goal_form(health_clicks, fitness_clicks, back_clicks, pathname):
+def toggle_goal_form(health_clicks, fitness_clicks, back_clicks):
     """Alterna entre la selecciÃ³n de tipo y el formulario - VERSIÃ“N CORREGIDA"""
     
-    # Verificar que estamos en la pÃ¡gina correcta
-    if pathname != '/objetivos':
-        raise dash.exceptions.PreventUpdate
-    
     ctx = dash.callback_context
     if not ctx.triggered:
         return dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update
@@ -12500,18 +12514,12 @@ def toggle_goal_form(health_clicks, fitness_clicks, back_clicks, pathname):
     [Output("btn-health-goal", "style"),
      Output("btn-fitness-goal", "style")],
     [Input("btn-health-goal", "n_clicks"),
-     Input("btn-fitness-goal", "n_clicks"),
-     Input("url", "pathname")],  # AÃ‘ADIR pathname
+     Input("btn-fitness-goal", "n_clicks")],
     prevent_initial_call=True
 )
-def highlight_selected_goal(health_clicks, fitness_clicks, pathname):
+def highlight_selected_goal(health_clicks, fitness_clicks):
     """Resalta visualmente la opciÃ³n seleccionada - VERSIÃ“N CORREGIDA"""
     
-    # Verificar que estamos en la pÃ¡gina correcta
-    if pathname != '/objetivos':
-        # Devolver estilos vacÃ­os
-        return dash.no_update, dash.no_update
-    
     ctx = dash.callback_context
     if not ctx.triggered:
         # Estado inicial
@@ -12545,8 +12553,8 @@ def highlight_selected_goal(health_clicks, fitness_clicks, pathname):
 @app.callback(
     Output("activity-level-indicator", "children"),
     [Input("input-activity-level", "value"),
-     Input("url", "pathname")],
-    prevent_initial_call=True
+     page_pathname('onboarding')],
+    prevent_initial_call=False  # Se rellena al montarse el onboarding
 )
 def update_activity_indicator(activity_level, current_path):
     """Actualiza indicador de nivel de actividad - SOLO en onboarding"""
@@ -12557,14 +12565,10 @@ def update_activity_indicator(activity_level, current_path):
     
     # Usar contexto para determinar quÃ© disparÃ³ el callback
     ctx = dash.callback_context
-    if not ctx.triggered:
-        raise dash.exceptions.PreventUpdate
-    
-    # Obtener quÃ© input disparÃ³ el callback
-    trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
+    slider_changed = bool(ctx.triggered) and ctx.triggered[0]['prop_id'].startswith('input-activity-level')
     
-    # Si se disparÃ³ por cambio de URL (navegaciÃ³n) y activity_level es None, usar valor por defecto
-    if trigger_id == 'url' and activity_level is None:
+    # Al montarse la pÃ¡gina sin valor, usar el valor por defecto
+    if activity_level is None and not slider_changed:
         activity_level = 5
     # Si se disparÃ³ por el slider pero activity_level es None, prevenir actualizaciÃ³n
     elif activity_level is None:
@@ -12655,8 +12659,8 @@ def force_onboarding_completed(current_user):
 @app.callback(
     Output("stores-debug", "children"),
     [Input("current-user", "data"),
-     Input("onboarding-completed", "data"),
-     Input("url", "pathname")]
+     Input("onboarding-completed", "data")],
+    [State("url", "pathname")]
 )
 def debug_all_stores(current_user, onboarding_completed, pathname):
     print(f"ðŸ” DEBUG COMPLETO - current-user: {current_user}, onboarding: {onboarding_completed}, pathname: {pathname}")
@@ -12716,9 +12720,9 @@ def toggle_bluetooth_connection(n_clicks, bluetooth_status, pathname):
 
 @app.callback(
     Output("user-goals-store", "data", allow_duplicate=True),
-    [Input("url", "pathname")],
+    [page_pathname('objetivos')],
     [State("current-user", "data")],
-    prevent_initial_call=True
+    prevent_initial_call='initial_duplicate'
 )
 def load_goals_when_page_opens(pathname, current_user):
     """Carga objetivos cuando se abre la pÃ¡gina de objetivos"""
@@ -12929,8 +12933,8 @@ def update_sports_selection_dynamic(clicks, class_names, current_selection, curr
 @app.callback(
     [Output({"type": "sport-card", "index": sport["label"]}, "className") for sport in SPORTS_OPTIONS],
     [Input("selected-sports-store", "data"),
-     Input("url", "pathname")],  # AÃ‘ADIR pathname
-    prevent_initial_call=True
+     page_pathname('onboarding')],  # AÃ‘ADIR pathname
+    prevent_initial_call=False  # Restaura la selecciÃ³n al volver al onboarding
 )
 def update_sport_card_styles_dynamic(selected_sports, current_path):
     """Actualiza estilos de tarjetas de deporte - VERSIÃ“N CORREGIDA"""
@@ -13092,6 +13096,9 @@ def handle_login(n_clicks, username, password):
         
         print(f"ðŸ“‹ Estado onboarding para {username}: {onboarding_status}")
         
+        db = DOCTORS_DB if user_type == "doctor" else USERS_DB
+        session["user"] = {"username": auth.find_username(db, username), "type": user_type}
+        
         return username, "", onboarding_status, username, user_type
     else:
         print(f"âŒ Login fallido: {username}")
@@ -0,0 +1,41 @@
+"""Autenticación con hashes de werkzeug y búsqueda O(1) por usuario o email."""
+import hashlib
+import hmac
+
+from werkzeug.security import generate_password_hash, check_password_hash
+
+import repository
+
+
+def hash_password(password):
+    return generate_password_hash(password)
+
+
+def verify_password(user_data, password):
+    """Comprueba la contraseña contra el hash (o contra el texto plano de registros sin migrar)"""
+    stored_hash = user_data.get("password_hash")
+    if stored_hash:
+        return check_password_hash(stored_hash, password)
+    stored = user_data.get("password")
+    return stored is not None and hmac.compare_digest(str(stored), str(password))
+
+
+def find_username(db, identifier):
+    """Devuelve el username si identifier es un usuario o un email de db"""
+    if identifier in db:
+        return identifier
+    return db.lookup("email", identifier)
+
+
+def device_token(secret, username):
+    """Token con el que el wearable de un atleta firma sus envíos (derivado de la clave del servidor)"""
+    return hmac.new(str(secret).encode(), f"device:{username}".encode(), hashlib.sha256).hexdigest()
+
+
+def verify_device_token(secret, username, token):
+    return bool(token) and hmac.compare_digest(device_token(secret, username), str(token))
+
+
+def migrate_plaintext_passwords():
+    """Convierte a hash todas las contraseñas guardadas en texto plano"""
+    return repository.hash_plaintext_passwords(hash_password)
@@ -0,0 +1,211 @@
+"""Análisis por lotes de las grabaciones de ECG de todos los pacientes.
+
+Cada grabación se procesa en un ProcessPoolExecutor (repartida en bloques
+con chunksize) y los resúmenes por paciente se guardan en la tabla
+ecg_summaries, de donde los lee el dashboard médico.
+
+Las grabaciones de cada atleta están en data/ecg/<username>/ (.csv o .ecgbin).
+
+Uso: python batch_analysis.py [--doctor medico1 | --users Haisea test] [--workers 4]
+"""
+import argparse
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+
+import numpy as np
+
+import repository
+from ecg_storage import BINARY_EXT, load_ecg_arrays
+import training_load
+from hr_zones import max_hr_for, zone_metrics
+from hrv import compute_hrv, heart_rate_summary
+from sensors import process_ecg
+from signal_quality import bad_sample_mask, clean_rr_mask
+from vo2max import get_vo2max
+
+RECORDINGS_DIR = os.path.join("data", "ecg")
+_DATE_PREFIX = re.compile(r"^(\d{4}-\d{2}-\d{2})")
+
+
+def recording_paths(username, root=RECORDINGS_DIR):
+    """Grabaciones del atleta ordenadas por nombre; un .ecgbin sólo si no tiene CSV hermano"""
+    folder = os.path.join(root, username)
+    if not os.path.isdir(folder):
+        return []
+    names = set(os.listdir(folder))
+    paths = []
+    for name in sorted(names):
+        stem, ext = os.path.splitext(name)
+        if ext == ".csv" or (ext == BINARY_EXT and f"{stem}.csv" not in names):
+            paths.append(os.path.join(folder, name))
+    return paths
+
+
+def session_date(path):
+    """Fecha ISO de la sesión: prefijo AAAA-MM-DD del nombre o, si no lo hay, fecha de modificación"""
+    match = _DATE_PREFIX.match(os.path.basename(path))
+    if match:
+        try:
+            return date.fromisoformat(match.group(1)).isoformat()
+        except ValueError:
+            pass
+    return datetime.fromtimestamp(os.path.getmtime(path)).date().isoformat()
+
+
+def athlete_profile(user_data, resting_hr=None):
+    """Datos del atleta que necesita el análisis: FC máxima, FC en reposo y sexo.
+
+    resting_hr es la FC en reposo medida en sus sesiones, si se conoce.
+    """
+    return {
+        "max_hr": max_hr_for(user_data),
+        "resting_hr": training_load.resting_hr_for(user_data, resting_hr),
+        "sex": user_data.get("gender"),
+    }
+
+
+def athlete_profiles(usernames):
+    """{username: athlete_profile} con el perfil guardado y la FC en reposo medida en sus sesiones"""
+    profiles = {}
+    for username in usernames:
+        user_data = repository.get_athlete(username) or {}
+        profiles[username] = athlete_profile(user_data, get_vo2max(username, user_data)["resting_hr"])
+    return profiles
+
+
+def summarize_recording(path, profile=None):
+    """Ejecuta el pipeline completo sobre una grabación y devuelve un resumen serializable"""
+    try:
+        t, ecg = load_ecg_arrays(path)
+        t, _, bpm, peaks, quality = process_ecg(t, ecg)
+    except Exception as e:
+        return {"path": path, "error": str(e)}
+
+    profile = profile or athlete_profile({})
+    rr_mask = clean_rr_mask(peaks, bad_sample_mask(quality, len(t)))
+    heart_rate = heart_rate_summary(t[peaks], rr_mask=rr_mask)
+    hrv = compute_hrv(t[peaks], rr_mask)
+    return {
+        "path": path,
+        "duration": float(t[-1] - t[0]) if len(t) > 1 else 0.0,
+        "bpm": bpm,
+        "max_bpm": heart_rate["max_bpm"],
+        "min_bpm": heart_rate["min_bpm"],
+        "rmssd": hrv["rmssd"],
+        "sdnn": hrv["sdnn"],
+        "quality": float(quality["good"].mean()) if len(quality["good"]) else 0.0,
+        "n_beats": int(len(peaks)),
+        "zones": zone_metrics(t[peaks], profile["max_hr"], rr_mask),
+        "trimp": training_load.banister_trimp(t[peaks], profile["resting_hr"], profile["max_hr"],
+                                              profile["sex"], rr_mask),
+    }
+
+
+def summarize_patient(recordings):
+    """Combina los resúmenes de las grabaciones de un paciente (medias ponderadas por duración)"""
+    ok = [r for r in recordings if "error" not in r]
+    with_bpm = [r for r in ok if r["bpm"] is not None and r["duration"] > 0]
+    summary = {
+        "n_recordings": len(recordings),
+        "n_errors": len(recordings) - len(ok),
+        "duration": sum(r["duration"] for r in ok),
+        "bpm": None, "max_bpm": None, "min_bpm": None, "rmssd": None, "quality": None,
+        "latest_recording": recordings[-1]["path"] if recordings else None,
+    }
+    if ok and summary["duration"] > 0:
+        summary["quality"] = float(np.average([r["quality"] for r in ok], weights=[r["duration"] for r in ok]))
+    if with_bpm:
+        weights = [r["duration"] for r in with_bpm]
+        summary["bpm"] = float(np.average([r["bpm"] for r in with_bpm], weights=weights))
+        maxima = [r["max_bpm"] for r in with_bpm if r["max_bpm"] is not None]
+        minima = [r["min_bpm"] for r in with_bpm if r["min_bpm"] is not None]
+        summary["max_bpm"] = max(maxima) if maxima else None
+        summary["min_bpm"] = min(minima) if minima else None
+        rmssd = [(r["rmssd"], w) for r, w in zip(with_bpm, weights) if r["rmssd"] is not None]
+        if rmssd:
+            summary["rmssd"] = float(np.average([v for v, _ in rmssd], weights=[w for _, w in rmssd]))
+    return summary
+
+
+def _record_sessions(username, recordings):
+    """Registra cada grabación como sesión, acumula zonas y TRIMP por día y actualiza las cargas"""
+    first_day = None
+    for result in recordings:
+        if "error" in result:
+            continue
+        metrics = {**result["zones"], "ecg_s": result["duration"], "training_min": result["duration"] / 60,
+                   "trimp": result["trimp"], "load": result["trimp"]}
+        data = {key: result[key] for key in ("path", "bpm", "max_bpm", "min_bpm", "rmssd", "quality")}
+        session_id = os.path.splitext(os.path.basename(result["path"]))[0]
+        day = session_date(result["path"])
+        repository.record_session(username, session_id, day, metrics, data)
+        first_day = min(first_day or day, day)
+    if first_day:
+        training_load.refresh_training_load(username, first_day)
+
+
+def analyze_patients(usernames, root=RECORDINGS_DIR, max_workers=None, chunksize=None,
+                     progress=None, save=True, profiles=None):
+    """Analiza todas las grabaciones de los atletas indicados en paralelo.
+
+    progress(hechas, total) se llama tras cada grabación. Devuelve
+    {username: resumen} de los atletas con grabaciones y, si save es True,
+    los guarda en la base de datos junto con una sesión por grabación.
+    profiles ({username: athlete_profile}) se leen de la base de datos si no se indican.
+    """
+    tasks = [(username, path) for username in usernames for path in recording_paths(username, root)]
+    if profiles is None:
+        profiles = athlete_profiles({username for username, _ in tasks})
+    per_patient = {}
+    if tasks:
+        workers = max_workers or os.cpu_count() or 1
+        # Bloques de varias grabaciones para no pagar un viaje entre procesos por archivo
+        chunksize = chunksize or max(1, len(tasks) // (workers * 4))
+        # spawn: la API lo lanza desde un hilo del servidor web, y un fork de un proceso
+        # con hilos (conexiones SQLite, cachés en segundo plano) puede bloquearse
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            results = executor.map(summarize_recording, [path for _, path in tasks],
+                                   [profiles.get(username) for username, _ in tasks], chunksize=chunksize)
+            for done, ((username, _), result) in enumerate(zip(tasks, results), 1):
+                per_patient.setdefault(username, []).append(result)
+                if progress:
+                    progress(done, len(tasks))
+
+    summaries = {username: summarize_patient(recordings) for username, recordings in per_patient.items()}
+    if save and summaries:
+        repository.save_ecg_summaries(summaries)
+        for username, recordings in per_patient.items():
+            _record_sessions(username, recordings)
+    return summaries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analiza por lotes las grabaciones de ECG de los pacientes")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--doctor", help="Sólo los pacientes de este médico")
+    group.add_argument("--users", nargs="+", help="Atletas a analizar (por defecto, todos)")
+    parser.add_argument("--root", default=RECORDINGS_DIR)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    repository.init_repository()
+    if args.doctor:
+        usernames = repository.get_patients(args.doctor)
+    else:
+        usernames = args.users or list(repository.load_athletes())
+
+    def report(done, total):
+        print(f"\r{done}/{total} grabaciones analizadas", end="", flush=True)
+
+    summaries = analyze_patients(usernames, root=args.root, max_workers=args.workers, progress=report)
+    print()
+    for username, summary in summaries.items():
+        bpm = f"{summary['bpm']:.0f} bpm" if summary["bpm"] is not None else "sin BPM"
+        print(f"✅ {username}: {summary['n_recordings']} grabaciones, {bpm}")
+
+
+if __name__ == "__main__":
+    main()
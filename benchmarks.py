@@ -0,0 +1,329 @@
+"""Benchmarks del procesamiento de ECG.
+
+Uso: python benchmarks.py
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+import auth
+import batch_analysis
+import cohort_stats
+import repository
+from ecg_storage import csv_to_binary, load_ecg_arrays, open_ecg_binary, write_ecg_binary
+from hr_zones import time_in_zones
+from hrv import compute_hrv, heart_rate_summary
+from sensors import detect_r_peaks, find_peaks_simple
+from signal_quality import window_quality
+from synthetic_ecg import synthetic_ecg
+
+
+def _timeit(func, *args, repeat=3, **kwargs):
+    """Mejor tiempo (en segundos) de varias ejecuciones"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _example_signal(minutes, filepath="ecg_example.csv"):
+    """Repite ecg_example.csv hasta cubrir la duración pedida"""
+    df = pd.read_csv(filepath)
+    t = df["Time"].values
+    ecg = df["ECG"].values
+    fs = 1 / (t[1] - t[0])
+    n_samples = int(minutes * 60 * fs)
+    reps = int(np.ceil(n_samples / len(ecg)))
+    tiled = np.tile(ecg, reps)[:n_samples]
+    normalized = (tiled - tiled.min()) / (tiled.max() - tiled.min())
+    return normalized, fs
+
+
+def bench_peak_detection(durations=(1, 10, 60)):
+    print("== Detección de picos R ==")
+    for minutes in durations:
+        ecg, fs = _example_signal(minutes)
+        min_distance = int(0.4 * fs)
+        threshold = np.percentile(ecg, 85)
+
+        loop = _timeit(find_peaks_simple, ecg, min_distance=min_distance,
+                       threshold=threshold, repeat=1)
+        vectorized = _timeit(detect_r_peaks, ecg, min_distance=min_distance,
+                             threshold=threshold)
+        pan_tompkins = _timeit(detect_r_peaks, ecg, min_distance=min_distance,
+                               method="pan_tompkins", fs=fs)
+        print(f"{minutes:>3} min ({len(ecg):>7} muestras): "
+              f"bucle {loop * 1000:9.1f} ms | vectorizado {vectorized * 1000:7.1f} ms | "
+              f"pan-tompkins {pan_tompkins * 1000:7.1f} ms")
+
+
+def bench_hrv(minutes=60):
+    print("== HRV (tiempo + Welch LF/HF) ==")
+    ecg, fs = _example_signal(minutes)
+    peaks = detect_r_peaks(ecg, min_distance=int(0.4 * fs), threshold=np.percentile(ecg, 85))
+    peak_times = peaks / fs
+    hrv_time = _timeit(compute_hrv, peak_times)
+    total = _timeit(lambda: compute_hrv(detect_r_peaks(
+        ecg, min_distance=int(0.4 * fs), threshold=np.percentile(ecg, 85)) / fs))
+    print(f"{minutes} min ({len(peaks)} latidos): HRV {hrv_time * 1000:.1f} ms | "
+          f"picos + HRV {total * 1000:.1f} ms")
+
+
+def bench_heart_rate(hours=(1, 8)):
+    print("== BPM latido a latido con estadísticas móviles ==")
+    rng = np.random.default_rng(0)
+    for h in hours:
+        rr = 0.8 + 0.05 * rng.standard_normal(int(h * 3600 / 0.8))
+        peak_times = np.cumsum(rr)
+        elapsed = _timeit(heart_rate_summary, peak_times, window_seconds=10)
+        zones = _timeit(time_in_zones, peak_times, 190)
+        print(f"{h} h ({len(peak_times)} latidos): {elapsed * 1000:.1f} ms | zonas {zones * 1000:.1f} ms")
+
+
+def bench_signal_quality(minutes=60):
+    print("== Índice de calidad de señal por ventanas ==")
+    ecg, fs = _example_signal(minutes)
+    elapsed = _timeit(window_quality, ecg, fs)
+    print(f"{minutes} min ({len(ecg)} muestras): {elapsed * 1000:.1f} ms")
+
+
+def _loop_synthetic_ecg(duration, fs=100):
+    """Generador anterior de la app: bucle por muestra con ondas cada 83 muestras (72 BPM a 100 Hz)"""
+    t_example = np.arange(int(duration * fs)) / fs
+    ecg_example = np.zeros_like(t_example)
+    for i, t in enumerate(t_example):
+        if i % 83 < 10:
+            ecg_example[i] += 0.25 * np.sin(2 * np.pi * 5 * t)
+        if i % 83 == 41:
+            ecg_example[i] += 1.5
+        if 45 <= i % 83 < 65:
+            ecg_example[i] += 0.3 * np.sin(2 * np.pi * 2 * (t - 0.5))
+    return t_example, ecg_example + 0.1 * np.random.normal(size=len(ecg_example))
+
+
+def bench_synthetic_ecg(minutes=(10, 60, 480)):
+    print("== ECG sintético: bucle por muestra vs vectorizado ==")
+    loop = _timeit(_loop_synthetic_ecg, 600, repeat=1)
+    print(f"10 min a 100 Hz: bucle {loop * 1000:.0f} ms | vectorizado {_timeit(synthetic_ecg, 600, fs=100) * 1000:.1f} ms")
+    for m in minutes:
+        elapsed = _timeit(synthetic_ecg, m * 60, fs=250, seed=0, repeat=1)
+        print(f"{m} min a 250 Hz ({m * 60 * 250} muestras): {elapsed * 1000:.0f} ms")
+
+
+def bench_storage(minutes=60):
+    print("== Carga de grabaciones: CSV vs .ecgbin ==")
+    ecg, fs = _example_signal(minutes)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "ecg.csv")
+        pd.DataFrame({"Time": np.arange(len(ecg)) / fs, "ECG": ecg}).to_csv(csv_path, index=False)
+        csv_time = _timeit(load_ecg_arrays, csv_path, repeat=1)
+
+        binary = csv_to_binary(csv_path)
+        full = _timeit(lambda: np.asarray(open_ecg_binary(binary).window()[1]).sum())
+        window = _timeit(lambda: np.asarray(open_ecg_binary(binary).window(600, 610)[1]).sum())
+    print(f"{minutes} min: CSV {csv_time * 1000:.1f} ms | binario completo {full * 1000:.1f} ms | "
+          f"ventana de 10 s {window * 1000:.2f} ms")
+
+
+def bench_batch_analysis(n_patients=24, recordings=2, minutes=10):
+    print("== Análisis por lotes de pacientes ==")
+    fs = 250
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, "ecg")
+        for p in range(n_patients):
+            os.makedirs(os.path.join(root, f"p{p}"))
+            for r in range(recordings):
+                _, ecg, _ = synthetic_ecg(minutes * 60, fs=fs, heart_rate=rng.uniform(55, 90), seed=p * recordings + r)
+                write_ecg_binary(os.path.join(root, f"p{p}", f"r{r}.ecgbin"), ecg, fs)
+
+        usernames = [f"p{p}" for p in range(n_patients)]
+        workers_options = sorted({1, 2, 4, os.cpu_count() or 1})
+        baseline = None
+        for workers in workers_options:
+            elapsed = _timeit(batch_analysis.analyze_patients, usernames, root=root,
+                              max_workers=workers, save=False, profiles={}, repeat=1)
+            baseline = baseline or elapsed
+            print(f"{n_patients * recordings} grabaciones de {minutes} min, {workers} procesos: "
+                  f"{elapsed:.2f} s (x{baseline / elapsed:.1f})")
+
+
+@contextmanager
+def _temporary_repository(filename):
+    """Base de datos vacía en un directorio temporal; al salir se restaura repository.DB_PATH"""
+    previous = repository.DB_PATH
+    with tempfile.TemporaryDirectory() as tmp:
+        repository.DB_PATH = os.path.join(tmp, filename)
+        try:
+            repository.init_repository()
+            yield
+        finally:
+            repository.DB_PATH = previous
+
+
+def bench_login(n_users=100_000):
+    print("== Login por email: recorrido lineal vs índice ==")
+    password_hash = auth.hash_password("secreto")
+    athletes = {
+        f"user{i}": {"password_hash": password_hash, "email": f"user{i}@example.com"}
+        for i in range(n_users)
+    }
+    target = f"user{n_users - 1}@example.com"
+
+    with _temporary_repository("users.db"):
+        repository.upsert_athletes(athletes)
+        users = repository.CachedTable("athletes", repository.load_athletes)
+
+        scan = _timeit(lambda: next(u for u, d in users.items() if d.get("email") == target))
+        users.lookup("email", target)  # construye el índice
+        indexed = _timeit(auth.find_username, users, target)
+        verify = _timeit(auth.verify_password, users[f"user{n_users - 1}"], "secreto", repeat=1)
+    print(f"{n_users} usuarios: lineal {scan * 1000:.2f} ms | índice {indexed * 1000:.3f} ms | "
+          f"verificación del hash {verify * 1000:.1f} ms")
+
+
+def bench_daily_rollups(history_days=(90, 1825), sessions_per_day=3, weeks=4):
+    print("== Heatmap semanal: totales diarios vs recorrer sesiones ==")
+    with _temporary_repository("rollups.db"):
+        end = pd.Timestamp("2025-12-31").date()
+        recorded = 0
+        for days in history_days:
+            for day in pd.date_range(end=end, periods=days).date[::-1][recorded:]:
+                for k in range(sessions_per_day):
+                    repository.record_session("ana", f"{day}_{k}", day.isoformat(), {"load": 50.0})
+            recorded = days
+            dates = pd.date_range(end=end, periods=7 * weeks).date
+            start, stop = dates[0].isoformat(), dates[-1].isoformat()
+
+            def from_rollups():
+                rollups = repository.load_daily_rollups("ana", start, stop, ["load"])
+                return np.array([rollups.get(d.isoformat(), {}).get("load", 0.0) for d in dates]).reshape(weeks, 7)
+
+            def from_sessions():
+                totals = {}
+                for session in repository.load_sessions("ana"):
+                    totals[session["date"]] = totals.get(session["date"], 0.0) + session["metrics"]["load"]
+                return np.array([totals.get(d.isoformat(), 0.0) for d in dates]).reshape(weeks, 7)
+
+            assert np.allclose(from_rollups(), from_sessions())
+            print(f"{days * sessions_per_day} sesiones: totales diarios {_timeit(from_rollups) * 1000:.2f} ms | "
+                  f"sesiones {_timeit(from_sessions) * 1000:.1f} ms")
+
+
+def bench_cohort(n_athletes=5_000, days=28):
+    print("== Percentiles de la cohorte: instantánea vs consulta por atleta ==")
+    rng = np.random.default_rng(0)
+    with _temporary_repository("cohort.db"):
+        repository.upsert_athletes({f"user{i}": {"password_hash": "x", "email": f"user{i}@example.com",
+                                                 "resting_hr": int(rng.integers(45, 80))}
+                                    for i in range(n_athletes)})
+        end = pd.Timestamp.today().date()
+        rows = [(f"user{i}", day.isoformat(), metric, float(rng.uniform(10, 120)))
+                for i in range(n_athletes) for day in pd.date_range(end=end, periods=days).date[::3]
+                for metric in ("training_min", "chronic_load")]
+        with repository.closing(repository.connect()) as conn, conn:
+            conn.executemany("INSERT INTO daily_rollups (username, date, metric, value) VALUES (?, ?, ?, ?)", rows)
+
+        stats = cohort_stats.CohortStats()
+        snapshot = _timeit(stats.refresh, repeat=1)
+        lookup = _timeit(stats.athlete, f"user{n_athletes // 2}")
+    print(f"{n_athletes} atletas: instantánea {snapshot * 1000:.0f} ms (en segundo plano) | "
+          f"radar por petición {lookup * 1000:.3f} ms")
+
+
+PAGE_LAYOUTS = ("welcome_layout", "login_layout", "register_layout", "doctor_dashboard_layout",
+                "onboarding_layout", "inicio_layout", "metricas_layout", "objetivos_layout",
+                "nutricion_layout", "entrenamientos_layout")
+
+_STARTUP_SCRIPT = """
+import json, resource, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter() - start
+for name in sys.argv[1:]:
+    getattr(app, name)()
+print(json.dumps({"import": imported, "total": time.perf_counter() - start,
+                  "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+"""
+
+
+def _startup(layouts):
+    """Importa app en un intérprete nuevo (como un worker) y construye los layouts indicados"""
+    repo = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as tmp:
+        result = subprocess.run([sys.executable, "-c", _STARTUP_SCRIPT, *layouts], cwd=tmp,
+                                env={**os.environ, "PYTHONPATH": repo}, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def bench_app_startup():
+    print("== Arranque de un worker: layouts bajo demanda vs todos al importar ==")
+    for label, layouts in (("sólo /login", ["login_layout"]), ("todas las páginas (antes)", list(PAGE_LAYOUTS))):
+        stats = _startup(layouts)
+        print(f"{label}: import {stats['import'] * 1000:.0f} ms | "
+              f"layouts {(stats['total'] - stats['import']) * 1000:.1f} ms | RSS máx {stats['rss_mb']:.1f} MB")
+
+
+_METRICS_SCRIPT = """
+import json, sys, time
+from datetime import date, timedelta
+from dash._utils import to_json
+import app, training_load
+for i in range(60):
+    day = (date.today() - timedelta(days=i)).isoformat()
+    training_load.record_rpe_session("test", f"s{i}", day, 6, 45, distance_km=8.0, avg_hr=150)
+
+def view(figures):
+    return lambda: to_json(list(figures()))
+
+def timeit(func, repeat):
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+repeat = int(sys.argv[1])
+app.METRICS_FIGURES.get("test")
+print(json.dumps({
+    "build": timeit(view(lambda: app.build_advanced_metrics_figures("test")), repeat),
+    "refresh": timeit(lambda: app.METRICS_FIGURES.refresh("test"), repeat),
+    "cached": timeit(view(lambda: app.METRICS_FIGURES.get("test")), repeat),
+}))
+"""
+
+
+def bench_metrics_figures(repeat=20):
+    print("== Gráficas de /metricas: construir en cada visita vs caché de figuras ==")
+    repo = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as tmp:
+        result = subprocess.run([sys.executable, "-c", _METRICS_SCRIPT, str(repeat)], cwd=tmp,
+                                env={**os.environ, "PYTHONPATH": repo}, capture_output=True, text=True, check=True)
+    stats = json.loads(result.stdout.strip().splitlines()[-1])
+    print(f"construir y serializar (antes) {stats['build'] * 1000:.1f} ms | "
+          f"lectura de la caché {stats['cached'] * 1000:.2f} ms por visita | "
+          f"recálculo en segundo plano {stats['refresh'] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    bench_peak_detection()
+    bench_hrv()
+    bench_heart_rate()
+    bench_signal_quality()
+    bench_synthetic_ecg()
+    bench_storage()
+    bench_login()
+    bench_app_startup()
+    bench_daily_rollups()
+    bench_cohort()
+    bench_metrics_figures()
+    bench_batch_analysis()
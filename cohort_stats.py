@@ -0,0 +1,145 @@
+"""Estadísticas de la cohorte de atletas para el radar de competencias.
+
+Cada refresco construye una instantánea columnar (atletas x métricas) con
+dos consultas agregadas a los totales diarios y las estimaciones de VO2máx
+guardadas y calcula el percentil de cada atleta con searchsorted sobre las
+columnas ordenadas. El radar compara esos percentiles con el
+ELITE_PERCENTILE de la cohorte. Las peticiones sólo consultan
+la última instantánea (sin datos hasta que exista la primera); un hilo en
+segundo plano, arrancado al cargar cada worker, la renueva cada
+REFRESH_SECONDS.
+"""
+import hashlib
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+import repository
+import training_load
+from vo2max import vo2max_for_all
+
+COHORT_METRICS = ("endurance", "resting_hr", "vo2max", "volume")
+LOWER_IS_BETTER = ("resting_hr",)
+VOLUME_DAYS = 28
+ELITE_PERCENTILE = 90
+REFRESH_SECONDS = 600
+
+
+def _athlete_row(username, today, volume, chronic, vo2max):
+    last = chronic.get(username)
+    return [
+        training_load.decayed(last[1], (today - date.fromisoformat(last[0])).days,
+                              training_load.CHRONIC_DAYS) if last else np.nan,
+        vo2max["resting_hr"] if vo2max["resting_hr"] is not None else np.nan,
+        vo2max["vo2max"] if vo2max["vo2max"] is not None else np.nan,
+        volume.get(username, {}).get("training_min", 0.0),
+    ]
+
+
+def percentile_ranks(values):
+    """Percentil (0-100) de cada celda dentro de su columna; los NaN se quedan en NaN.
+
+    Rango medio: un empate reparte el percentil entre los atletas empatados
+    y un atleta solo queda en el 50.
+    """
+    ranks = np.full(values.shape, np.nan)
+    for j in range(values.shape[1]):
+        column = values[:, j]
+        known = ~np.isnan(column)
+        ordered = np.sort(column[known])
+        if len(ordered) == 0:
+            continue
+        below = np.searchsorted(ordered, column[known], side="left")
+        upto = np.searchsorted(ordered, column[known], side="right")
+        ranks[known, j] = 50.0 * (below + upto) / len(ordered)
+    for metric in LOWER_IS_BETTER:
+        j = COHORT_METRICS.index(metric)
+        ranks[:, j] = 100.0 - ranks[:, j]
+    return ranks
+
+
+def cohort_snapshot(today=None):
+    """Instantánea de la cohorte: valores y percentiles de todos los atletas"""
+    today = today or date.today()
+    athletes = repository.load_athletes()
+    usernames = sorted(athletes)
+    start = today - timedelta(days=VOLUME_DAYS - 1)
+    volume = repository.sum_daily_values(["training_min"], start.isoformat(), today.isoformat())
+    chronic = repository.latest_daily_values("chronic_load", today.isoformat())
+    vo2max = vo2max_for_all(athletes)
+
+    values = np.array([_athlete_row(username, today, volume, chronic, vo2max[username])
+                       for username in usernames], dtype=float).reshape(len(usernames), len(COHORT_METRICS))
+    return {
+        "computed_at": datetime.now().isoformat(timespec="seconds"),
+        "index": {username: i for i, username in enumerate(usernames)},
+        "values": values,
+        "ranks": percentile_ranks(values),
+    }
+
+
+class CohortStats:
+    """Última instantánea de la cohorte, renovada por un hilo en segundo plano"""
+
+    def __init__(self, refresh_seconds=REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._snapshot = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._listeners = []
+
+    def subscribe(self, listener):
+        """listener(snapshot) se llama tras cada refresco"""
+        self._listeners.append(listener)
+
+    def refresh(self):
+        self._snapshot = cohort_snapshot()
+        for listener in self._listeners:
+            listener(self._snapshot)
+        return self._snapshot
+
+    def _run(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"❌ Error actualizando las estadísticas de la cohorte: {e}")
+            time.sleep(self.refresh_seconds)
+
+    def start(self):
+        """Arranca el hilo de refresco si no está en marcha (p. ej. tras un fork del worker)"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True, name="cohort-stats")
+                self._thread.start()
+
+    def snapshot(self):
+        """Última instantánea; None hasta que el hilo termina la primera"""
+        return self._snapshot
+
+    def athlete(self, username):
+        """{métrica: {"value", "rank"}} del atleta (None donde no hay dato)"""
+        snapshot = self.snapshot()
+        row = snapshot["index"].get(username) if snapshot is not None else None
+        result = {}
+        for j, metric in enumerate(COHORT_METRICS):
+            value = snapshot["values"][row, j] if row is not None else np.nan
+            rank = snapshot["ranks"][row, j] if row is not None else np.nan
+            result[metric] = {"value": None if np.isnan(value) else float(value),
+                              "rank": None if np.isnan(rank) else float(rank)}
+        return result
+
+    def athlete_version(self, username):
+        """Huella de la fila del atleta (valores y percentiles); None si no está en la cohorte.
+
+        Sólo cambia cuando cambia algo de lo que muestra su radar, no en cada refresco.
+        """
+        snapshot = self.snapshot()
+        row = snapshot["index"].get(username) if snapshot is not None else None
+        if row is None:
+            return None
+        digest = hashlib.blake2b(snapshot["values"][row].tobytes(), digest_size=16)
+        digest.update(snapshot["ranks"][row].tobytes())
+        return digest.hexdigest()
@@ -0,0 +1,76 @@
+import numpy as np
+
+
+def minmax_decimate(x, y, n_out):
+    """Reduce la traza a ~n_out puntos conservando el mínimo y el máximo de cada tramo.
+
+    Al quedarse con los extremos de cada tramo, los picos R siguen viéndose
+    con su amplitud real aunque se envíen muchos menos puntos.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(y)
+    if n <= n_out or n_out < 4:
+        return x, y
+
+    n_buckets = n_out // 2
+    bucket_size = int(np.ceil(n / n_buckets))
+    padded = np.pad(y, (0, n_buckets * bucket_size - n), mode="edge").reshape(n_buckets, bucket_size)
+
+    offsets = np.arange(n_buckets)[:, None] * bucket_size
+    pairs = np.stack((np.argmin(padded, axis=1), np.argmax(padded, axis=1)), axis=1) + offsets
+    idx = np.unique(np.concatenate(([0], np.minimum(pairs.ravel(), n - 1), [n - 1])))
+    return x[idx], y[idx]
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: ~n_out puntos que mantienen la forma visual"""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0], idx[-1] = 0, n - 1
+
+    xf = x.astype(float)
+    yf = y.astype(float)
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = xf[stop:next_stop].mean() if next_stop > stop else xf[-1]
+        avg_y = yf[stop:next_stop].mean() if next_stop > stop else yf[-1]
+
+        ax, ay = xf[idx[i]], yf[idx[i]]
+        area = np.abs((ax - avg_x) * (yf[start:stop] - ay) - (ax - xf[start:stop]) * (avg_y - ay))
+        idx[i + 1] = start + int(np.argmax(area))
+
+    return x[idx], y[idx]
+
+
+def decimate_trace(x, y, n_out, method="minmax"):
+    if method == "minmax":
+        return minmax_decimate(x, y, n_out)
+    if method == "lttb":
+        return lttb(x, y, n_out)
+    raise ValueError(f"Método de reducción desconocido: {method}")
+
+
+def xrange_from_relayout(relayout_data):
+    """Extrae el rango visible del eje x de un relayoutData de Plotly.
+
+    Devuelve (x0, x1), "reset" si el usuario ha vuelto a la vista completa
+    o None si el evento no cambia el eje x (p. ej. autosize).
+    """
+    if not relayout_data:
+        return None
+    if relayout_data.get("xaxis.autorange"):
+        return "reset"
+    if "xaxis.range[0]" in relayout_data and "xaxis.range[1]" in relayout_data:
+        return float(relayout_data["xaxis.range[0]"]), float(relayout_data["xaxis.range[1]"])
+    if "xaxis.range" in relayout_data:
+        x0, x1 = relayout_data["xaxis.range"]
+        return float(x0), float(x1)
+    return None
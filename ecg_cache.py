@@ -0,0 +1,86 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class ECGAnalysisCache:
+    """Caché LRU de resultados de ECG procesados.
+
+    La clave incluye la ruta, el mtime y el tamaño del archivo, así que una
+    entrada deja de usarse en cuanto el archivo cambia en disco.
+    """
+
+    def __init__(self, maxsize=16):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _make_key(self, filepath, compute, params):
+        st = os.stat(filepath)
+        # Cada análisis (BPM, HRV...) del mismo archivo tiene su propia entrada
+        analysis = (getattr(compute, "__module__", None), getattr(compute, "__qualname__", repr(compute)))
+        return (os.path.abspath(filepath), st.st_mtime_ns, st.st_size,
+                (analysis, tuple(sorted(params.items()))))
+
+    def get(self, filepath, compute, **params):
+        """Devuelve compute(filepath, **params), calculándolo sólo si hace falta"""
+        try:
+            key = self._make_key(filepath, compute, params)
+        except OSError:
+            # Sin archivo no hay nada que invalidar: se calcula sin cachear
+            with self._lock:
+                self.misses += 1
+            return compute(filepath, **params)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        result = _freeze(compute(filepath, **params))
+
+        with self._lock:
+            # Las versiones antiguas del mismo archivo/parámetros ya no sirven
+            stale = [k for k in self._entries if k[0] == key[0] and k[3] == key[3]]
+            for k in stale:
+                del self._entries[k]
+            self._entries[key] = result
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self, filepath=None):
+        """Elimina las entradas de un archivo (o todas si filepath es None)"""
+        with self._lock:
+            if filepath is None:
+                self._entries.clear()
+                return
+            path = os.path.abspath(filepath)
+            for k in [k for k in self._entries if k[0] == path]:
+                del self._entries[k]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+def _freeze(result):
+    """Marca los arrays como de sólo lectura para que nadie altere la caché"""
+    if isinstance(result, tuple):
+        return tuple(_freeze(item) for item in result)
+    if isinstance(result, dict):
+        return {key: _freeze(value) for key, value in result.items()}
+    if isinstance(result, np.ndarray):
+        result.setflags(write=False)
+    return result
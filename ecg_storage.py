@@ -0,0 +1,134 @@
+"""Formato binario para grabaciones de ECG.
+
+Estructura del archivo (.ecgbin):
+    - 8 bytes mágicos b"ATHECG01"
+    - uint32 little-endian con la longitud de la cabecera JSON
+    - cabecera JSON: {"fs", "start_time", "n_samples", "dtype"}
+    - relleno hasta múltiplo de 64 bytes
+    - muestras float32 contiguas
+
+Las muestras se abren con np.memmap, así que leer una ventana de tiempo no
+copia ni parsea el resto del archivo.
+
+Conversión desde CSV: python ecg_storage.py ecg_example.csv
+"""
+import json
+import os
+import struct
+import sys
+
+import numpy as np
+import pandas as pd
+
+MAGIC = b"ATHECG01"
+BINARY_EXT = ".ecgbin"
+_ALIGN = 64
+
+
+class ECGRecording:
+    """Grabación abierta en modo memmap (sólo lectura)"""
+
+    def __init__(self, path, fs, start_time, samples):
+        self.path = path
+        self.fs = fs
+        self.start_time = start_time
+        self.samples = samples
+
+    def __len__(self):
+        return len(self.samples)
+
+    @property
+    def duration(self):
+        return len(self.samples) / self.fs
+
+    def times(self, start=0, stop=None):
+        stop = len(self.samples) if stop is None else stop
+        return self.start_time + np.arange(start, stop) / self.fs
+
+    def window(self, t0=None, t1=None):
+        """Devuelve (t, ecg) entre t0 y t1 segundos; ecg es una vista del memmap"""
+        start = 0 if t0 is None else int(np.clip(np.ceil((t0 - self.start_time) * self.fs), 0, len(self)))
+        stop = len(self) if t1 is None else int(np.clip(np.floor((t1 - self.start_time) * self.fs) + 1, start, len(self)))
+        return self.times(start, stop), self.samples[start:stop]
+
+
+def write_ecg_binary(path, ecg, fs, start_time=0.0):
+    """Guarda las muestras en formato .ecgbin"""
+    ecg = np.asarray(ecg, dtype="<f4")
+    header = json.dumps({
+        "fs": float(fs),
+        "start_time": float(start_time),
+        "n_samples": int(len(ecg)),
+        "dtype": "<f4",
+    }).encode("utf-8")
+    prefix_len = len(MAGIC) + 4 + len(header)
+    padding = (-prefix_len) % _ALIGN
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        f.write(b"\0" * padding)
+        f.write(ecg.tobytes())
+    os.replace(tmp_path, path)
+    return path
+
+
+def open_ecg_binary(path):
+    """Abre un .ecgbin sin leer las muestras a memoria"""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} no es un archivo {BINARY_EXT} válido")
+        (header_len,) = struct.unpack("<I", f.read(4))
+        header = json.loads(f.read(header_len).decode("utf-8"))
+
+    prefix_len = len(MAGIC) + 4 + header_len
+    offset = prefix_len + (-prefix_len) % _ALIGN
+    n_samples = header["n_samples"]
+    if n_samples:
+        samples = np.memmap(path, dtype=header["dtype"], mode="r", offset=offset, shape=(n_samples,))
+    else:
+        samples = np.zeros(0, dtype=header["dtype"])
+    return ECGRecording(path, header["fs"], header["start_time"], samples)
+
+
+def binary_path_for(csv_path):
+    return os.path.splitext(csv_path)[0] + BINARY_EXT
+
+
+def csv_to_binary(csv_path, out_path=None):
+    """Convierte un CSV con columnas Time y ECG a .ecgbin"""
+    df = pd.read_csv(csv_path)
+    if "Time" not in df.columns or "ECG" not in df.columns:
+        raise ValueError("Columnas requeridas no encontradas")
+
+    t = df["Time"].values
+    ecg = df["ECG"].values
+    fs = (len(t) - 1) / (t[-1] - t[0]) if len(t) > 1 else 250
+    out_path = out_path or binary_path_for(csv_path)
+    return write_ecg_binary(out_path, ecg, fs, start_time=t[0] if len(t) else 0.0)
+
+
+def load_ecg_arrays(filepath):
+    """Devuelve (t, ecg) de un CSV o de un .ecgbin.
+
+    Para un CSV se usa su .ecgbin hermano si existe y no es más antiguo,
+    así los llamadores existentes aprovechan el formato binario sin cambios.
+    """
+    if filepath.endswith(BINARY_EXT):
+        return open_ecg_binary(filepath).window()
+
+    binary = binary_path_for(filepath)
+    if os.path.exists(binary) and os.path.getmtime(binary) >= os.path.getmtime(filepath):
+        return open_ecg_binary(binary).window()
+
+    df = pd.read_csv(filepath)
+    if "Time" not in df.columns or "ECG" not in df.columns:
+        raise ValueError("Columnas requeridas no encontradas")
+    return df["Time"].values, df["ECG"].values
+
+
+if __name__ == "__main__":
+    for csv_file in sys.argv[1:]:
+        print(f"✅ {csv_file} -> {csv_to_binary(csv_file)}")
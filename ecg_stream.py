@@ -0,0 +1,241 @@
+import threading
+import time
+from collections import deque
+
+import numpy as np
+from scipy.signal import butter, find_peaks, sosfilt, sosfilt_zi
+
+DEFAULT_FS = 250
+DEFAULT_WINDOW_SECONDS = 300  # últimos 5 minutos
+DEFAULT_MAX_BATCH_SECONDS = 5  # un wearable envía lotes de ~1 s
+LIVE_TIMEOUT_SECONDS = 10  # sin lotes nuevos en este tiempo, el stream ya no está en vivo
+
+
+class ECGRingBuffer:
+    """Buffer circular de tamaño fijo con las últimas muestras de ECG.
+
+    La memoria no crece con la duración de la sesión: al llenarse, las
+    muestras nuevas sobrescriben a las más antiguas.
+    """
+
+    def __init__(self, fs=DEFAULT_FS, window_seconds=DEFAULT_WINDOW_SECONDS):
+        self.fs = fs
+        self.capacity = int(fs * window_seconds)
+        self._data = np.zeros(self.capacity, dtype=np.float32)
+        self._write_pos = 0
+        self.total_samples = 0  # muestras recibidas desde el inicio de la sesión
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self.total_samples, self.capacity)
+
+    def append(self, samples):
+        """Añade un lote de muestras; devuelve cuántas se han recibido"""
+        samples = np.asarray(samples, dtype=np.float32).ravel()
+        n = len(samples)
+        if n == 0:
+            return 0
+
+        with self._lock:
+            if n >= self.capacity:
+                # Sólo cabe el final del lote
+                self._data[:] = samples[-self.capacity:]
+                self._write_pos = 0
+            else:
+                end = self._write_pos + n
+                if end <= self.capacity:
+                    self._data[self._write_pos:end] = samples
+                else:
+                    first = self.capacity - self._write_pos
+                    self._data[self._write_pos:] = samples[:first]
+                    self._data[:n - first] = samples[first:]
+                self._write_pos = end % self.capacity
+            self.total_samples += n
+        return n
+
+    def snapshot(self, seconds=None):
+        """Devuelve (t, ecg) en orden cronológico; t en segundos desde el inicio de la sesión"""
+        with self._lock:
+            n = len(self)
+            if seconds is not None:
+                n = min(n, int(seconds * self.fs))
+            start = (self._write_pos - n) % self.capacity
+            if start + n <= self.capacity:
+                ecg = self._data[start:start + n].copy()
+            else:
+                ecg = np.concatenate((self._data[start:], self._data[:self._write_pos]))
+            first_index = self.total_samples - n
+
+        t = (first_index + np.arange(n)) / self.fs
+        return t, ecg
+
+
+class OnlineECGProcessor:
+    """Procesa ECG por lotes manteniendo el estado entre llamadas.
+
+    El filtro pasa-banda conserva su estado (zi) y el detector de picos sólo
+    revisa el lote nuevo más una cola corta del anterior, así que procesar N
+    muestras cuesta O(N) sin importar la duración de la sesión. El estado se
+    protege con lock: Flask atiende las peticiones de un mismo atleta en
+    varios hilos.
+    """
+
+    def __init__(self, fs=DEFAULT_FS, window_seconds=DEFAULT_WINDOW_SECONDS,
+                 refractory_seconds=0.3, rolling_beats=10):
+        self.fs = fs
+        self._sos = butter(3, [0.5, 40.0], btype="band", fs=fs, output="sos")
+        self._zi = None
+        self._refractory = max(1, int(refractory_seconds * fs))
+
+        # Cola de señal filtrada pendiente de confirmar (contexto a la izquierda + zona pendiente)
+        self._tail = np.zeros(0)
+        self._tail_start = 0  # índice global de la primera muestra de la cola
+        self._processed = 0   # muestras filtradas desde el inicio
+
+        self._signal_level = None
+        self._last_peak = None
+        self.peaks = deque(maxlen=int(window_seconds * 4))  # índices globales recientes
+        self._rolling = deque(maxlen=rolling_beats)
+        self._rolling_sum = 0.0
+        self.filtered = ECGRingBuffer(fs, window_seconds)
+        self.lock = threading.RLock()
+
+    @property
+    def mean_bpm(self):
+        """Media móvil de la frecuencia cardiaca instantánea (None sin latidos)"""
+        if not self._rolling:
+            return None
+        return self._rolling_sum / len(self._rolling)
+
+    def process(self, samples):
+        """Filtra un lote y devuelve los picos R nuevos con su BPM instantáneo"""
+        with self.lock:
+            return self._process(samples)
+
+    def _process(self, samples):
+        samples = np.asarray(samples, dtype=float).ravel()
+        if len(samples) == 0:
+            return self._result([], [])
+
+        if self._zi is None:
+            self._zi = sosfilt_zi(self._sos) * samples[0]
+        filtered, self._zi = sosfilt(self._sos, samples, zi=self._zi)
+        self.filtered.append(filtered)
+        self._processed += len(filtered)
+
+        x = np.concatenate((self._tail, filtered))
+        if self._signal_level is None:
+            self._signal_level = np.max(np.abs(x))
+        threshold = 0.4 * self._signal_level
+
+        candidates, props = find_peaks(x, height=threshold, distance=self._refractory)
+        # Sólo se confirman picos con contexto suficiente a la derecha
+        confirmable = candidates < len(x) - self._refractory
+
+        new_peaks, new_bpm = [], []
+        for idx, height in zip(candidates[confirmable], props["peak_heights"][confirmable]):
+            peak = self._tail_start + int(idx)
+            if self._last_peak is not None:
+                if peak - self._last_peak < self._refractory:
+                    continue
+                bpm = 60.0 * self.fs / (peak - self._last_peak)
+                if len(self._rolling) == self._rolling.maxlen:
+                    self._rolling_sum -= self._rolling[0]
+                self._rolling.append(bpm)
+                self._rolling_sum += bpm
+                new_bpm.append(bpm)
+            self._last_peak = peak
+            self._signal_level = 0.875 * self._signal_level + 0.125 * height
+            self.peaks.append(peak)
+            new_peaks.append(peak)
+
+        keep = min(len(x), 2 * self._refractory)
+        self._tail = x[len(x) - keep:]
+        self._tail_start = self._processed - keep
+        return self._result(new_peaks, new_bpm)
+
+    def _result(self, new_peaks, new_bpm):
+        return {
+            "peaks": np.asarray(new_peaks, dtype=np.intp),
+            "peak_times": np.asarray(new_peaks, dtype=float) / self.fs,
+            "bpm": np.asarray(new_bpm),
+            "mean_bpm": self.mean_bpm,
+        }
+
+    def recent(self, seconds=None):
+        """Devuelve (t, señal filtrada, picos locales, BPM medio) de la ventana reciente"""
+        with self.lock:
+            t, ecg = self.filtered.snapshot(seconds)
+            if len(t) == 0:
+                return t, ecg, np.zeros(0, dtype=np.intp), self.mean_bpm
+            first_index = int(round(t[0] * self.fs))
+            peaks = np.asarray(self.peaks, dtype=np.intp)
+            peaks = peaks[(peaks >= first_index) & (peaks < first_index + len(t))] - first_index
+            return t, ecg, peaks, self.mean_bpm
+
+
+class ECGStreamStore:
+    """Un ECGRingBuffer y un OnlineECGProcessor por atleta"""
+
+    def __init__(self, fs=DEFAULT_FS, window_seconds=DEFAULT_WINDOW_SECONDS,
+                 max_batch_seconds=DEFAULT_MAX_BATCH_SECONDS):
+        self.fs = fs
+        self.window_seconds = window_seconds
+        self.max_batch_samples = int(fs * max_batch_seconds)
+        self._buffers = {}
+        self._processors = {}
+        self._last_ingest = {}
+        self._lock = threading.Lock()
+
+    def get_buffer(self, username, create=False):
+        with self._lock:
+            buffer = self._buffers.get(username)
+            if buffer is None and create:
+                buffer = ECGRingBuffer(self.fs, self.window_seconds)
+                self._buffers[username] = buffer
+                self._processors[username] = OnlineECGProcessor(self.fs, self.window_seconds)
+            return buffer
+
+    def get_processor(self, username):
+        with self._lock:
+            return self._processors.get(username)
+
+    def ingest(self, username, samples, fs=None):
+        """Guarda un lote de muestras del atleta y lo procesa de forma incremental.
+
+        Devuelve (buffer, resultado de OnlineECGProcessor.process). Los lotes
+        de más de max_batch_samples o con valores no finitos se rechazan
+        enteros: un NaN en el estado del filtro estropearía el resto del stream.
+        """
+        if fs is not None and fs != self.fs:
+            raise ValueError(f"Frecuencia de muestreo no soportada: {fs} Hz (se espera {self.fs} Hz)")
+        samples = np.asarray(samples, dtype=float).ravel()
+        if len(samples) > self.max_batch_samples:
+            raise ValueError(f"Lote demasiado grande: {len(samples)} muestras (máximo {self.max_batch_samples})")
+        if not np.isfinite(samples).all():
+            raise ValueError("El lote contiene valores no finitos")
+        buffer = self.get_buffer(username, create=True)
+        processor = self.get_processor(username)
+        # Los lotes de un mismo atleta entran enteros y en el mismo orden en el buffer y en el filtro
+        with processor.lock:
+            buffer.append(samples)
+            result = processor.process(samples)
+        with self._lock:
+            self._last_ingest[username] = time.monotonic()
+        return buffer, result
+
+    def has_data(self, username, min_seconds=0):
+        buffer = self.get_buffer(username)
+        return buffer is not None and len(buffer) > 0 and len(buffer) >= min_seconds * buffer.fs
+
+    def is_live(self, username, timeout=LIVE_TIMEOUT_SECONDS):
+        """Si el wearable del atleta ha enviado algún lote en los últimos timeout segundos"""
+        with self._lock:
+            last = self._last_ingest.get(username)
+        return last is not None and time.monotonic() - last <= timeout
+
+    def reset(self, username):
+        with self._lock:
+            self._buffers.pop(username, None)
+            self._processors.pop(username, None)
+            self._last_ingest.pop(username, None)
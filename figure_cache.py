@@ -0,0 +1,82 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from plotly.utils import PlotlyJSONEncoder
+
+
+class FigureCache:
+    """Caché de figuras de Plotly ya serializadas a JSON, por usuario.
+
+    build(username) devuelve una tupla de figuras (dicts o go.Figure) y
+    version(username) la versión de los datos de los que dependen. Cada
+    entrada guarda la versión con la que se construyó: una lectura con la
+    misma versión sólo decodifica el JSON guardado. Cuando cambian los
+    datos, schedule() reconstruye las figuras en un hilo en segundo plano
+    para que la siguiente visita ya las encuentre.
+    """
+
+    def __init__(self, build, version, maxsize=256):
+        self.build = build
+        self.version = version
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="figure-cache")
+
+    def refresh(self, username):
+        """Construye y guarda las figuras del usuario con la versión actual de sus datos"""
+        # La versión se lee antes de construir: si los datos cambian entremedias,
+        # la entrada queda con la versión vieja y se reconstruye en la siguiente lectura
+        version = self.version(username)
+        serialized = tuple(json.dumps(figure, cls=PlotlyJSONEncoder) for figure in self.build(username))
+        with self._lock:
+            self._entries.pop(username, None)
+            self._entries[username] = (version, serialized)
+            while len(self._entries) > self.maxsize:
+                del self._entries[next(iter(self._entries))]
+        return serialized
+
+    def get(self, username):
+        """Figuras del usuario como dicts listos para Dash; sólo se construyen si no están al día"""
+        version = self.version(username)
+        with self._lock:
+            entry = self._entries.get(username)
+            fresh = entry is not None and entry[0] == version
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        serialized = entry[1] if fresh else self.refresh(username)
+        return tuple(json.loads(figure) for figure in serialized)
+
+    def _refresh_pending(self, username):
+        with self._lock:
+            self._pending.discard(username)
+        try:
+            self.refresh(username)
+        except Exception as e:
+            print(f"❌ Error precalculando las figuras de {username}: {e}")
+
+    def schedule(self, *usernames):
+        """Reconstruye en segundo plano las figuras de los usuarios (una vez aunque se pida varias)"""
+        for username in usernames:
+            with self._lock:
+                if username in self._pending:
+                    continue
+                self._pending.add(username)
+            self._executor.submit(self._refresh_pending, username)
+
+    def schedule_cached(self):
+        """Reconstruye en segundo plano las figuras cacheadas cuya versión ha cambiado"""
+        with self._lock:
+            entries = list(self._entries.items())
+        self.schedule(*[username for username, (version, _) in entries if self.version(username) != version])
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "size": len(self._entries), "maxsize": self.maxsize}
@@ -0,0 +1,46 @@
+"""Zonas de frecuencia cardiaca y tiempo en cada zona.
+
+Cinco zonas por porcentaje de la FC máxima:
+    Z1 50-60 %, Z2 60-70 %, Z3 70-80 %, Z4 80-90 %, Z5 >= 90 %
+Por debajo del 50 % se considera reposo y no cuenta en ninguna zona.
+"""
+import numpy as np
+
+from hrv import heart_rate_series
+
+ZONE_BOUNDS = (0.5, 0.6, 0.7, 0.8, 0.9)
+ZONE_NAMES = ("Z1", "Z2", "Z3", "Z4", "Z5")
+ZONE_METRICS = tuple(f"zone{i}_s" for i in range(1, len(ZONE_BOUNDS) + 1))
+DEFAULT_AGE = 30
+
+
+def estimate_max_hr(age):
+    """FC máxima estimada con la fórmula de Tanaka (208 - 0.7 * edad)"""
+    return 208.0 - 0.7 * float(age)
+
+
+def max_hr_for(user_data):
+    """FC máxima medida del atleta si existe; si no, estimada por su edad"""
+    measured = user_data.get("max_hr")
+    if measured:
+        return float(measured)
+    return estimate_max_hr(user_data.get("age") or DEFAULT_AGE)
+
+
+def time_in_zones(peak_times, max_hr, rr_mask=None):
+    """Segundos pasados en cada zona (array de 5).
+
+    Cada intervalo RR válido aporta su duración a la zona de su BPM
+    instantáneo, de modo que la suma es el tiempo real registrado.
+    """
+    _, bpm = heart_rate_series(peak_times, rr_mask)
+    if len(bpm) == 0:
+        return np.zeros(len(ZONE_BOUNDS))
+    zone = np.digitize(bpm / max_hr, ZONE_BOUNDS)  # 0 = reposo, 1..5 = zonas
+    seconds = np.bincount(zone, weights=60.0 / bpm, minlength=len(ZONE_BOUNDS) + 1)
+    return seconds[1:]
+
+
+def zone_metrics(peak_times, max_hr, rr_mask=None):
+    """{zone1_s: ..., zone5_s: ...} listo para acumular en los totales diarios"""
+    return dict(zip(ZONE_METRICS, time_in_zones(peak_times, max_hr, rr_mask).tolist()))
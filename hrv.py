@@ -0,0 +1,125 @@
+"""Variabilidad de la frecuencia cardiaca (HRV) a partir de los picos R.
+
+Dominio del tiempo: SDNN, RMSSD y pNN50 sobre los intervalos RR.
+Dominio de la frecuencia: potencia LF (0.04-0.15 Hz) y HF (0.15-0.4 Hz)
+con Welch sobre la serie RR remuestreada a frecuencia constante.
+Frecuencia cardiaca latido a latido con máximo, mínimo y media móviles.
+"""
+import numpy as np
+from scipy.integrate import trapezoid
+from scipy.ndimage import maximum_filter1d, minimum_filter1d, uniform_filter1d
+from scipy.signal import welch
+
+RR_MIN_MS = 300.0   # 200 BPM
+RR_MAX_MS = 2000.0  # 30 BPM
+LF_BAND = (0.04, 0.15)
+HF_BAND = (0.15, 0.40)
+RESAMPLE_FS = 4.0
+MIN_SPECTRUM_SECONDS = 60.0
+
+
+def rr_intervals(peak_times, rr_mask=None):
+    """Devuelve (rr en ms, máscara de intervalos válidos).
+
+    Un intervalo es válido si está en rango fisiológico y, si se pasa
+    rr_mask (p. ej. de signal_quality.clean_rr_mask), si ésta lo acepta.
+    """
+    rr = np.diff(np.asarray(peak_times, dtype=float)) * 1000.0
+    valid = (rr >= RR_MIN_MS) & (rr <= RR_MAX_MS)
+    return rr, valid if rr_mask is None else valid & rr_mask
+
+
+def time_domain(rr, valid=None):
+    """SDNN, RMSSD y pNN50; las diferencias sólo usan pares de intervalos válidos"""
+    if valid is None:
+        valid = np.ones(len(rr), dtype=bool)
+    nn = rr[valid]
+    if len(nn) < 2:
+        return {"mean_rr": None, "sdnn": None, "rmssd": None, "pnn50": None}
+
+    successive = np.diff(rr)[valid[1:] & valid[:-1]]
+    return {
+        "mean_rr": float(nn.mean()),
+        "sdnn": float(nn.std(ddof=1)),
+        "rmssd": float(np.sqrt(np.mean(successive ** 2))) if len(successive) else None,
+        "pnn50": float(100.0 * np.mean(np.abs(successive) > 50.0)) if len(successive) else None,
+    }
+
+
+def frequency_domain(beat_times, rr, fs=RESAMPLE_FS):
+    """Potencia LF/HF (ms²) de la serie RR interpolada a fs Hz.
+
+    beat_times es el instante de cada intervalo (el pico que lo cierra).
+    """
+    empty = {"lf": None, "hf": None, "lf_hf": None}
+    if len(rr) < 4 or beat_times[-1] - beat_times[0] < MIN_SPECTRUM_SECONDS:
+        return empty
+
+    grid = np.arange(beat_times[0], beat_times[-1], 1.0 / fs)
+    series = np.interp(grid, beat_times, rr)
+    nperseg = min(len(series), int(256 * fs / RESAMPLE_FS))
+    freqs, psd = welch(series, fs=fs, nperseg=nperseg, detrend="linear")
+
+    def band_power(band):
+        mask = (freqs >= band[0]) & (freqs < band[1])
+        return float(trapezoid(psd[mask], freqs[mask])) if mask.sum() > 1 else 0.0
+
+    lf, hf = band_power(LF_BAND), band_power(HF_BAND)
+    return {"lf": lf, "hf": hf, "lf_hf": lf / hf if hf > 0 else None}
+
+
+def compute_hrv(peak_times, rr_mask=None):
+    """Métricas HRV de una grabación a partir de los instantes (s) de sus picos R"""
+    peak_times = np.asarray(peak_times, dtype=float)
+    rr, valid = rr_intervals(peak_times, rr_mask)
+    metrics = {"n_beats": int(len(peak_times)), "n_valid_rr": int(valid.sum())}
+    metrics.update(time_domain(rr, valid))
+    metrics.update(frequency_domain(peak_times[1:][valid], rr[valid]))
+    return metrics
+
+
+# ===============================
+# FRECUENCIA CARDIACA LATIDO A LATIDO
+# ===============================
+def heart_rate_series(peak_times, rr_mask=None):
+    """Devuelve (instante de cada latido válido, BPM instantáneo)"""
+    peak_times = np.asarray(peak_times, dtype=float)
+    rr, valid = rr_intervals(peak_times, rr_mask)
+    return peak_times[1:][valid], 60000.0 / rr[valid]
+
+
+def rolling_heart_rate(peak_times, window_seconds=10.0, fs=1.0, rr_mask=None):
+    """Media, máximo y mínimo móviles del BPM instantáneo en ventanas de window_seconds.
+
+    La serie latido a latido se lleva a una rejilla regular de fs Hz (cada
+    punto conserva el último latido) y los tres filtros recorren la rejilla
+    una sola vez cada uno.
+    """
+    beat_times, bpm = heart_rate_series(peak_times, rr_mask)
+    if len(bpm) == 0:
+        empty = np.zeros(0)
+        return {"t": empty, "mean": empty, "max": empty, "min": empty}
+
+    grid = np.arange(beat_times[0], beat_times[-1] + 0.5 / fs, 1.0 / fs)
+    held = bpm[np.searchsorted(beat_times, grid, side="right") - 1]
+    size = max(1, int(round(window_seconds * fs)))
+    return {
+        "t": grid,
+        "mean": uniform_filter1d(held, size, mode="nearest"),
+        "max": maximum_filter1d(held, size, mode="nearest"),
+        "min": minimum_filter1d(held, size, mode="nearest"),
+    }
+
+
+def heart_rate_summary(peak_times, window_seconds=10.0, rr_mask=None):
+    """Máximo y mínimo de la media móvil y BPM medio de toda la grabación"""
+    _, bpm = heart_rate_series(peak_times, rr_mask)
+    rolling = rolling_heart_rate(peak_times, window_seconds, rr_mask=rr_mask)
+    if len(bpm) == 0:
+        return {"max_bpm": None, "min_bpm": None, "avg_bpm": None, "rolling": rolling}
+    return {
+        "max_bpm": float(rolling["mean"].max()),
+        "min_bpm": float(rolling["mean"].min()),
+        "avg_bpm": float(bpm.mean()),
+        "rolling": rolling,
+    }
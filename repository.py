@@ -0,0 +1,854 @@
+"""Repositorio SQLite para atletas, médicos, pacientes, objetivos y comidas.
+
+Usa el mismo archivo que db.py (data/users.db). Cada cambio actualiza sólo
+las filas afectadas en lugar de reescribir un JSON completo.
+
+La base de datos trabaja en modo WAL con transacciones cortas, de modo que
+varios workers de gunicorn comparten una única fuente de verdad. Cada
+escritura incrementa un contador de versión por tabla (tabla meta) que
+CachedTable usa para invalidar su copia en memoria.
+"""
+import glob
+import json
+import os
+import secrets
+import sqlite3
+import threading
+from collections.abc import MutableMapping
+from contextlib import closing
+from datetime import datetime
+
+from db import DB_PATH
+
+# Campos con columna propia; el resto se guarda en la columna JSON "extra"
+ATHLETE_FIELDS = ("password", "password_hash", "email", "full_name", "onboarding_completed",
+                  "activity_level", "registration_date")
+DOCTOR_FIELDS = ("password", "password_hash", "email", "full_name")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS athletes (
+    username TEXT PRIMARY KEY,
+    password TEXT,
+    password_hash TEXT,
+    email TEXT,
+    full_name TEXT,
+    onboarding_completed INTEGER NOT NULL DEFAULT 0,
+    activity_level INTEGER NOT NULL DEFAULT 5,
+    registration_date TEXT,
+    extra TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_athletes_email ON athletes(email);
+
+CREATE TABLE IF NOT EXISTS doctors (
+    username TEXT PRIMARY KEY,
+    password TEXT,
+    password_hash TEXT,
+    email TEXT,
+    full_name TEXT,
+    extra TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_doctors_email ON doctors(email);
+
+CREATE TABLE IF NOT EXISTS doctor_patients (
+    doctor TEXT NOT NULL,
+    patient TEXT NOT NULL,
+    added_order INTEGER NOT NULL,
+    PRIMARY KEY (doctor, patient)
+);
+CREATE INDEX IF NOT EXISTS idx_doctor_patients_patient ON doctor_patients(patient);
+
+CREATE TABLE IF NOT EXISTS goals (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    username TEXT NOT NULL,
+    category TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_goals_user ON goals(username, category);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_goals_id ON goals(username, id);
+
+CREATE TABLE IF NOT EXISTS meals (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT,
+    username TEXT NOT NULL,
+    date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_meals_user_date ON meals(username, date);
+
+CREATE TABLE IF NOT EXISTS ecg_summaries (
+    username TEXT PRIMARY KEY,
+    computed_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS vo2max_estimates (
+    username TEXT PRIMARY KEY,
+    sessions_version INTEGER NOT NULL,
+    profile_version INTEGER NOT NULL DEFAULT 0,
+    window_start TEXT NOT NULL DEFAULT '',
+    computed_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS sessions (
+    username TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    metrics TEXT NOT NULL DEFAULT '{}',
+    data TEXT NOT NULL DEFAULT '{}',
+    PRIMARY KEY (username, session_id)
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_user_date ON sessions(username, date);
+
+CREATE TABLE IF NOT EXISTS daily_rollups (
+    username TEXT NOT NULL,
+    date TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (username, date, metric)
+);
+CREATE INDEX IF NOT EXISTS idx_daily_rollups_metric ON daily_rollups(username, metric, date);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def connect():
+    conn = sqlite3.connect(DB_PATH, timeout=10)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA synchronous = NORMAL")
+    return conn
+
+
+def init_repository():
+    """Crea las tablas e índices si no existen y activa el modo WAL"""
+    os.makedirs(os.path.dirname(DB_PATH) or ".", exist_ok=True)
+    with closing(connect()) as conn:
+        conn.execute("PRAGMA journal_mode = WAL")
+        with conn:
+            conn.executescript(SCHEMA)
+            # Bases creadas antes de que existiera la columna password_hash
+            for table in ("athletes", "doctors"):
+                columns = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+                if "password_hash" not in columns:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN password_hash TEXT")
+            # Estimaciones de VO2máx guardadas sólo con la versión de las sesiones
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(vo2max_estimates)")}
+            if "profile_version" not in columns:
+                conn.execute("ALTER TABLE vo2max_estimates ADD COLUMN profile_version INTEGER NOT NULL DEFAULT 0")
+            if "window_start" not in columns:
+                conn.execute("ALTER TABLE vo2max_estimates ADD COLUMN window_start TEXT NOT NULL DEFAULT ''")
+            # Comidas guardadas antes de los totales diarios: se suman una sola vez
+            if conn.execute("SELECT 1 FROM meta WHERE key = 'meal_rollups'").fetchone() is None:
+                for row in conn.execute("SELECT username, data FROM meals").fetchall():
+                    _add_meal_to_rollups(conn, row["username"], json.loads(row["data"]))
+                conn.execute("INSERT INTO meta (key, value) VALUES ('meal_rollups', datetime('now'))")
+
+
+# ===============================
+# VERSIONES E INVALIDACIÓN DE CACHÉ
+# ===============================
+_local = threading.local()
+
+
+def _bump_version(conn, table):
+    """Incrementa la versión de una tabla dentro de la transacción en curso"""
+    conn.execute(
+        """INSERT INTO meta (key, value) VALUES (?, 1)
+           ON CONFLICT(key) DO UPDATE SET value = value + 1""",
+        (f"version:{table}",),
+    )
+
+
+def secret_key():
+    """Clave para firmar las cookies de sesión, creada una vez y compartida por todos los workers"""
+    with closing(connect()) as conn, conn:
+        conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('secret_key', ?)", (secrets.token_hex(32),))
+        return conn.execute("SELECT value FROM meta WHERE key = 'secret_key'").fetchone()[0]
+
+
+def data_version(table):
+    """Versión actual de una tabla; usa una conexión persistente por hilo"""
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.path != DB_PATH:
+        conn = sqlite3.connect(DB_PATH, timeout=10, isolation_level=None)
+        _local.conn, _local.path = conn, DB_PATH
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (f"version:{table}",)).fetchone()
+    return row[0] if row else 0
+
+
+class CachedTable(MutableMapping):
+    """Diccionario en memoria respaldado por SQLite.
+
+    Antes de cada lectura compara la versión de la tabla con la que tenía al
+    cargarse y, si otro worker ha escrito, vuelve a cargarla con loader().
+    Las escrituras siguen haciéndose fila a fila con las funciones del
+    repositorio; asignar aquí sólo actualiza la copia local.
+    """
+
+    def __init__(self, table, loader):
+        self.table = table
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._version = None
+        self._data = {}
+        self._indexes = {}  # campo -> (datos indexados, {valor: clave})
+
+    def _current(self):
+        version = data_version(self.table)
+        if version != self._version:
+            with self._lock:
+                if version != self._version:
+                    self._data = self._loader()
+                    self._version = version
+        return self._data
+
+    def invalidate(self):
+        self._version = None
+
+    def __getitem__(self, key):
+        return self._current()[key]
+
+    def __setitem__(self, key, value):
+        self._current()[key] = value
+        self._indexes.clear()
+
+    def __delitem__(self, key):
+        del self._current()[key]
+        self._indexes.clear()
+
+    def lookup(self, field, value):
+        """Clave de la primera fila cuyo campo vale value (índice hash, O(1))"""
+        data = self._current()
+        index = self._indexes.get(field)
+        if index is None or index[0] is not data:
+            positions = {}
+            for key, row in data.items():
+                if row.get(field) is not None:
+                    positions.setdefault(row[field], key)
+            index = (data, positions)
+            self._indexes[field] = index
+        return index[1].get(value)
+
+    def __iter__(self):
+        return iter(list(self._current()))
+
+    def __len__(self):
+        return len(self._current())
+
+    def __contains__(self, key):
+        return key in self._current()
+
+    # Una sola comprobación de versión por llamada (no una por clave)
+    def get(self, key, default=None):
+        return self._current().get(key, default)
+
+    def keys(self):
+        return self._current().keys()
+
+    def items(self):
+        return self._current().items()
+
+    def values(self):
+        return self._current().values()
+
+
+# ===============================
+# ATLETAS
+# ===============================
+def _split_fields(data, fields):
+    columns = {field: data.get(field) for field in fields}
+    extra = {k: v for k, v in data.items() if k not in fields and k not in ("type", "patients")}
+    return columns, json.dumps(extra, ensure_ascii=False)
+
+
+def _credentials(row):
+    """Sólo incluye las credenciales presentes (hash o contraseña sin migrar)"""
+    return {field: row[field] for field in ("password", "password_hash") if row[field] is not None}
+
+
+def _athlete_from_row(row):
+    athlete = {
+        **_credentials(row),
+        "email": row["email"],
+        "full_name": row["full_name"],
+        "onboarding_completed": bool(row["onboarding_completed"]),
+        "activity_level": row["activity_level"],
+    }
+    if row["registration_date"]:
+        athlete["registration_date"] = row["registration_date"]
+    athlete.update(json.loads(row["extra"]))
+    athlete["type"] = "athlete"
+    return athlete
+
+
+def _upsert_athlete(conn, username, data):
+    columns, extra = _split_fields(data, ATHLETE_FIELDS)
+    conn.execute(
+        """INSERT INTO athletes (username, password, password_hash, email, full_name,
+                                 onboarding_completed, activity_level, registration_date, extra)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+           ON CONFLICT(username) DO UPDATE SET
+               password = excluded.password, password_hash = excluded.password_hash,
+               email = excluded.email,
+               full_name = excluded.full_name,
+               onboarding_completed = excluded.onboarding_completed,
+               activity_level = excluded.activity_level,
+               registration_date = excluded.registration_date, extra = excluded.extra""",
+        (username, columns["password"], columns["password_hash"], columns["email"],
+         columns["full_name"], int(bool(columns["onboarding_completed"])),
+         columns["activity_level"] if columns["activity_level"] is not None else 5,
+         columns["registration_date"], extra),
+    )
+    _bump_version(conn, "athletes")
+    _bump_version(conn, f"athlete:{username}")
+
+
+def upsert_athlete(username, data):
+    with closing(connect()) as conn, conn:
+        _upsert_athlete(conn, username, data)
+
+
+def upsert_athletes(athletes):
+    """Inserta o actualiza varios atletas en una sola transacción"""
+    with closing(connect()) as conn, conn:
+        for username, data in athletes.items():
+            _upsert_athlete(conn, username, data)
+
+
+def update_athlete_fields(username, **fields):
+    """Actualiza sólo las columnas indicadas; devuelve False si el atleta no existe"""
+    unknown = set(fields) - set(ATHLETE_FIELDS)
+    if unknown:
+        raise ValueError(f"Campos de atleta desconocidos: {sorted(unknown)}")
+    if "onboarding_completed" in fields:
+        fields["onboarding_completed"] = int(bool(fields["onboarding_completed"]))
+
+    assignments = ", ".join(f"{name} = ?" for name in fields)
+    with closing(connect()) as conn, conn:
+        cur = conn.execute(f"UPDATE athletes SET {assignments} WHERE username = ?",
+                           (*fields.values(), username))
+        if cur.rowcount == 1:
+            _bump_version(conn, "athletes")
+            _bump_version(conn, f"athlete:{username}")
+        return cur.rowcount == 1
+
+
+def update_athlete_profile(username, **fields):
+    """Guarda datos del perfil que no tienen columna propia (edad, FC máxima...) en extra.
+
+    Un valor None borra el dato. Devuelve False si el atleta no existe.
+    """
+    with closing(connect()) as conn, conn:
+        row = conn.execute("SELECT extra FROM athletes WHERE username = ?", (username,)).fetchone()
+        if row is None:
+            return False
+        extra = json.loads(row["extra"])
+        for name, value in fields.items():
+            if value is None:
+                extra.pop(name, None)
+            else:
+                extra[name] = value
+        conn.execute("UPDATE athletes SET extra = ? WHERE username = ?",
+                     (json.dumps(extra, ensure_ascii=False), username))
+        _bump_version(conn, "athletes")
+        _bump_version(conn, f"athlete:{username}")
+        return True
+
+
+def get_athlete(username):
+    with closing(connect()) as conn:
+        row = conn.execute("SELECT * FROM athletes WHERE username = ?", (username,)).fetchone()
+    return _athlete_from_row(row) if row else None
+
+
+def load_athletes():
+    with closing(connect()) as conn:
+        rows = conn.execute("SELECT * FROM athletes ORDER BY rowid").fetchall()
+    return {row["username"]: _athlete_from_row(row) for row in rows}
+
+
+# ===============================
+# MÉDICOS Y PACIENTES
+# ===============================
+def _doctor_from_row(row, patients):
+    doctor = {
+        **_credentials(row),
+        "email": row["email"],
+        "full_name": row["full_name"],
+    }
+    doctor.update(json.loads(row["extra"]))
+    doctor["type"] = "doctor"
+    doctor["patients"] = patients
+    return doctor
+
+
+def _upsert_doctor(conn, username, data):
+    columns, extra = _split_fields(data, DOCTOR_FIELDS)
+    conn.execute(
+        """INSERT INTO doctors (username, password, password_hash, email, full_name, extra)
+           VALUES (?, ?, ?, ?, ?, ?)
+           ON CONFLICT(username) DO UPDATE SET
+               password = excluded.password, password_hash = excluded.password_hash,
+               email = excluded.email, full_name = excluded.full_name, extra = excluded.extra""",
+        (username, columns["password"], columns["password_hash"], columns["email"],
+         columns["full_name"], extra),
+    )
+    if "patients" in data:
+        conn.execute("DELETE FROM doctor_patients WHERE doctor = ?", (username,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO doctor_patients (doctor, patient, added_order) VALUES (?, ?, ?)",
+            [(username, patient, i) for i, patient in enumerate(data["patients"])],
+        )
+    _bump_version(conn, "doctors")
+    _bump_version(conn, f"doctor:{username}")
+
+
+def upsert_doctor(username, data):
+    with closing(connect()) as conn, conn:
+        _upsert_doctor(conn, username, data)
+
+
+def upsert_doctors(doctors):
+    """Inserta o actualiza varios médicos en una sola transacción"""
+    with closing(connect()) as conn, conn:
+        for username, data in doctors.items():
+            _upsert_doctor(conn, username, data)
+
+
+def get_patients(doctor_username):
+    with closing(connect()) as conn:
+        rows = conn.execute(
+            "SELECT patient FROM doctor_patients WHERE doctor = ? ORDER BY added_order",
+            (doctor_username,),
+        ).fetchall()
+    return [row["patient"] for row in rows]
+
+
+def get_doctor(username):
+    with closing(connect()) as conn:
+        row = conn.execute("SELECT * FROM doctors WHERE username = ?", (username,)).fetchone()
+    return _doctor_from_row(row, get_patients(username)) if row else None
+
+
+def load_doctors():
+    with closing(connect()) as conn:
+        rows = conn.execute("SELECT * FROM doctors ORDER BY rowid").fetchall()
+        links = conn.execute(
+            "SELECT doctor, patient FROM doctor_patients ORDER BY doctor, added_order"
+        ).fetchall()
+
+    patients = {}
+    for link in links:
+        patients.setdefault(link["doctor"], []).append(link["patient"])
+    return {row["username"]: _doctor_from_row(row, patients.get(row["username"], [])) for row in rows}
+
+
+def add_patient(doctor_username, patient_username):
+    """Vincula un paciente a un médico; devuelve False si ya estaba vinculado"""
+    with closing(connect()) as conn, conn:
+        cur = conn.execute(
+            """INSERT OR IGNORE INTO doctor_patients (doctor, patient, added_order)
+               SELECT ?, ?, COALESCE(MAX(added_order) + 1, 0)
+               FROM doctor_patients WHERE doctor = ?""",
+            (doctor_username, patient_username, doctor_username),
+        )
+        if cur.rowcount == 1:
+            _bump_version(conn, "doctors")
+            _bump_version(conn, f"doctor:{doctor_username}")
+        return cur.rowcount == 1
+
+
+def remove_patient(doctor_username, patient_username):
+    with closing(connect()) as conn, conn:
+        cur = conn.execute("DELETE FROM doctor_patients WHERE doctor = ? AND patient = ?",
+                           (doctor_username, patient_username))
+        if cur.rowcount == 1:
+            _bump_version(conn, "doctors")
+            _bump_version(conn, f"doctor:{doctor_username}")
+        return cur.rowcount == 1
+
+
+# ===============================
+# OBJETIVOS
+# ===============================
+def load_goals(username):
+    goals = {"fitness": [], "health": []}
+    with closing(connect()) as conn:
+        rows = conn.execute("SELECT category, data FROM goals WHERE username = ? ORDER BY seq",
+                            (username,)).fetchall()
+    for row in rows:
+        goals.setdefault(row["category"], []).append(json.loads(row["data"]))
+    return goals
+
+
+def insert_goal(username, category, goal):
+    with closing(connect()) as conn, conn:
+        conn.execute("INSERT INTO goals (id, username, category, data) VALUES (?, ?, ?, ?)",
+                     (goal["id"], username, category, json.dumps(goal, ensure_ascii=False)))
+
+
+def update_goal(username, goal):
+    with closing(connect()) as conn, conn:
+        cur = conn.execute("UPDATE goals SET data = ? WHERE username = ? AND id = ?",
+                           (json.dumps(goal, ensure_ascii=False), username, goal["id"]))
+        return cur.rowcount == 1
+
+
+def delete_goal(username, goal_id):
+    with closing(connect()) as conn, conn:
+        cur = conn.execute("DELETE FROM goals WHERE username = ? AND id = ?", (username, goal_id))
+        return cur.rowcount == 1
+
+
+def _replace_goals(conn, username, goals):
+    conn.execute("DELETE FROM goals WHERE username = ?", (username,))
+    conn.executemany(
+        "INSERT OR REPLACE INTO goals (id, username, category, data) VALUES (?, ?, ?, ?)",
+        [(goal.get("id"), username, category, json.dumps(goal, ensure_ascii=False))
+         for category, items in goals.items() for goal in items],
+    )
+
+
+def replace_goals(username, goals):
+    """Sustituye todos los objetivos de un usuario (sólo toca sus filas)"""
+    with closing(connect()) as conn, conn:
+        _replace_goals(conn, username, goals)
+
+
+# ===============================
+# COMIDAS
+# ===============================
+MEAL_METRICS = ("calories", "carbs", "protein", "fat")
+
+
+def _insert_meal(conn, username, meal):
+    """Inserta la comida y suma sus macronutrientes a los totales del día"""
+    conn.execute("INSERT INTO meals (id, username, date, data) VALUES (?, ?, ?, ?)",
+                 (meal.get("id"), username, meal.get("date"), json.dumps(meal, ensure_ascii=False)))
+    _add_meal_to_rollups(conn, username, meal)
+
+
+def _add_meal_to_rollups(conn, username, meal):
+    if meal.get("date"):
+        deltas = {metric: float(meal.get(metric) or 0) for metric in MEAL_METRICS}
+        _add_to_rollups(conn, username, meal["date"], {"meals": 1.0, **deltas})
+
+
+def add_meal(username, meal):
+    with closing(connect()) as conn, conn:
+        _insert_meal(conn, username, meal)
+
+
+def load_meals(username, date=None):
+    query = "SELECT data FROM meals WHERE username = ?"
+    params = [username]
+    if date is not None:
+        query += " AND date = ?"
+        params.append(date)
+    with closing(connect()) as conn:
+        rows = conn.execute(query + " ORDER BY seq", params).fetchall()
+    return [json.loads(row["data"]) for row in rows]
+
+
+# ===============================
+# RESÚMENES DE ECG
+# ===============================
+def save_ecg_summaries(summaries, computed_at=None):
+    """Guarda {username: resumen} precalculados por el análisis por lotes"""
+    computed_at = computed_at or datetime.now().isoformat(timespec="seconds")
+    with closing(connect()) as conn, conn:
+        conn.executemany(
+            """INSERT INTO ecg_summaries (username, computed_at, data) VALUES (?, ?, ?)
+               ON CONFLICT(username) DO UPDATE SET computed_at = excluded.computed_at, data = excluded.data""",
+            [(username, computed_at, json.dumps(summary, ensure_ascii=False))
+             for username, summary in summaries.items()],
+        )
+
+
+def load_ecg_summaries(usernames=None):
+    """Devuelve {username: resumen} de los atletas indicados (o de todos)"""
+    query = "SELECT username, computed_at, data FROM ecg_summaries"
+    params = []
+    if usernames is not None:
+        usernames = list(usernames)
+        if not usernames:
+            return {}
+        query += f" WHERE username IN ({', '.join('?' * len(usernames))})"
+        params = usernames
+    with closing(connect()) as conn:
+        rows = conn.execute(query, params).fetchall()
+    return {row["username"]: {**json.loads(row["data"]), "computed_at": row["computed_at"]} for row in rows}
+
+
+# ===============================
+# ANÁLISIS POR LOTES
+# ===============================
+# Estado de los análisis lanzados por cada médico en meta (batch_job:<médico>),
+# visible desde cualquier worker
+def start_batch_job(doctor_username, job):
+    """Guarda job como el análisis del médico salvo que ya haya uno en curso; devuelve si lo guardó"""
+    with closing(connect()) as conn, conn:
+        cur = conn.execute(
+            """INSERT INTO meta (key, value) VALUES (?, ?)
+               ON CONFLICT(key) DO UPDATE SET value = excluded.value
+               WHERE json_extract(meta.value, '$.status') IS NOT 'running'""",
+            (f"batch_job:{doctor_username}", json.dumps(job)),
+        )
+        return cur.rowcount == 1
+
+
+def update_batch_job(doctor_username, **fields):
+    with closing(connect()) as conn, conn:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (f"batch_job:{doctor_username}",)).fetchone()
+        job = {**(json.loads(row["value"]) if row else {}), **fields}
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                     (f"batch_job:{doctor_username}", json.dumps(job)))
+
+
+def get_batch_job(doctor_username):
+    """Último análisis del médico, o None si nunca ha lanzado uno"""
+    with closing(connect()) as conn:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (f"batch_job:{doctor_username}",)).fetchone()
+    return json.loads(row["value"]) if row else None
+
+
+# ===============================
+# ESTIMACIONES DE VO2MÁX
+# ===============================
+def save_vo2max_estimate(username, sessions_version, estimate, computed_at=None,
+                         profile_version=0, window_start=""):
+    """Guarda la estimación junto con las versiones y la ventana de datos con las que se calculó"""
+    computed_at = computed_at or datetime.now().isoformat(timespec="seconds")
+    with closing(connect()) as conn, conn:
+        conn.execute(
+            """INSERT INTO vo2max_estimates
+                   (username, sessions_version, profile_version, window_start, computed_at, data)
+               VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT(username) DO UPDATE SET sessions_version = excluded.sessions_version,
+                   profile_version = excluded.profile_version, window_start = excluded.window_start,
+                   computed_at = excluded.computed_at, data = excluded.data""",
+            (username, sessions_version, profile_version, window_start, computed_at, json.dumps(estimate)),
+        )
+
+
+def load_vo2max_estimates(usernames=None):
+    """Devuelve {username: estimación} con sus versiones, window_start y computed_at"""
+    query = ("SELECT username, sessions_version, profile_version, window_start, computed_at, data"
+             " FROM vo2max_estimates")
+    params = []
+    if usernames is not None:
+        usernames = list(usernames)
+        if not usernames:
+            return {}
+        query += f" WHERE username IN ({', '.join('?' * len(usernames))})"
+        params = usernames
+    with closing(connect()) as conn:
+        rows = conn.execute(query, params).fetchall()
+    return {row["username"]: {**json.loads(row["data"]), "sessions_version": row["sessions_version"],
+                              "profile_version": row["profile_version"], "window_start": row["window_start"],
+                              "computed_at": row["computed_at"]} for row in rows}
+
+
+# ===============================
+# SESIONES Y TOTALES DIARIOS
+# ===============================
+def _add_to_rollups(conn, username, date, deltas):
+    conn.executemany(
+        """INSERT INTO daily_rollups (username, date, metric, value) VALUES (?, ?, ?, ?)
+           ON CONFLICT(username, date, metric) DO UPDATE SET value = value + excluded.value""",
+        [(username, date, metric, value) for metric, value in deltas.items() if value],
+    )
+
+
+def record_session(username, session_id, date, metrics, data=None):
+    """Guarda una sesión y suma sus métricas a los totales diarios.
+
+    Si la sesión ya existía (p. ej. se vuelve a analizar la misma
+    grabación) sólo se aplica la diferencia, así que los totales nunca se
+    cuentan dos veces y no hay que recalcularlos desde las sesiones.
+    """
+    with closing(connect()) as conn, conn:
+        conn.execute("BEGIN IMMEDIATE")
+        old = conn.execute(
+            "SELECT date, metrics FROM sessions WHERE username = ? AND session_id = ?",
+            (username, session_id),
+        ).fetchone()
+        if old is not None:
+            _add_to_rollups(conn, username, old["date"],
+                            {metric: -value for metric, value in json.loads(old["metrics"]).items()})
+        _add_to_rollups(conn, username, date, metrics)
+        conn.execute(
+            """INSERT INTO sessions (username, session_id, date, metrics, data) VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(username, session_id) DO UPDATE SET
+                   date = excluded.date, metrics = excluded.metrics, data = excluded.data""",
+            (username, session_id, date, json.dumps(metrics), json.dumps(data or {}, ensure_ascii=False)),
+        )
+        # Invalida lo que se calcula a partir de las sesiones del atleta (p. ej. VO2máx)
+        _bump_version(conn, f"sessions:{username}")
+
+
+def load_sessions(username, start_date=None, end_date=None):
+    query = "SELECT session_id, date, metrics, data FROM sessions WHERE username = ?"
+    params = [username]
+    if start_date is not None:
+        query += " AND date >= ?"
+        params.append(start_date)
+    if end_date is not None:
+        query += " AND date <= ?"
+        params.append(end_date)
+    with closing(connect()) as conn:
+        rows = conn.execute(query + " ORDER BY date, session_id", params).fetchall()
+    return [{"session_id": row["session_id"], "date": row["date"],
+             "metrics": json.loads(row["metrics"]), **json.loads(row["data"])} for row in rows]
+
+
+def _versions(table_prefix):
+    """{username: versión} de todas las claves version:<table_prefix><username> de meta"""
+    prefix = f"version:{table_prefix}"
+    with closing(connect()) as conn:
+        rows = conn.execute("SELECT key, value FROM meta WHERE key LIKE ?", (prefix + "%",)).fetchall()
+    return {row["key"][len(prefix):]: int(row["value"]) for row in rows}
+
+
+def session_versions():
+    """{username: versión de sus sesiones} de todos los atletas con alguna sesión"""
+    return _versions("sessions:")
+
+
+def athlete_versions():
+    """{username: versión de su fila} de todos los atletas"""
+    return _versions("athlete:")
+
+
+def load_daily_rollups(username, start_date, end_date, metrics=None):
+    """Devuelve {fecha: {métrica: valor}} entre dos fechas ISO (incluidas) con una consulta"""
+    query = "SELECT date, metric, value FROM daily_rollups WHERE username = ? AND date BETWEEN ? AND ?"
+    params = [username, start_date, end_date]
+    if metrics is not None:
+        metrics = list(metrics)
+        query += f" AND metric IN ({', '.join('?' * len(metrics))})"
+        params += metrics
+    with closing(connect()) as conn:
+        rows = conn.execute(query, params).fetchall()
+    days = {}
+    for row in rows:
+        days.setdefault(row["date"], {})[row["metric"]] = row["value"]
+    return days
+
+
+def sum_daily_values(metrics, start_date, end_date):
+    """{username: {métrica: suma}} de todos los atletas entre dos fechas, en una consulta agregada"""
+    metrics = list(metrics)
+    with closing(connect()) as conn:
+        rows = conn.execute(
+            f"""SELECT username, metric, SUM(value) AS total FROM daily_rollups
+                WHERE date BETWEEN ? AND ? AND metric IN ({', '.join('?' * len(metrics))})
+                GROUP BY username, metric""",
+            [start_date, end_date, *metrics],
+        ).fetchall()
+    totals = {}
+    for row in rows:
+        totals.setdefault(row["username"], {})[row["metric"]] = row["total"]
+    return totals
+
+
+def latest_daily_values(metric, on_or_before):
+    """{username: (fecha, valor)} del último día <= on_or_before con esa métrica, para cada atleta"""
+    with closing(connect()) as conn:
+        # SQLite devuelve value de la fila que tiene MAX(date)
+        rows = conn.execute(
+            """SELECT username, MAX(date) AS date, value FROM daily_rollups
+               WHERE metric = ? AND date <= ? GROUP BY username""",
+            (metric, on_or_before),
+        ).fetchall()
+    return {row["username"]: (row["date"], row["value"]) for row in rows}
+
+
+def set_daily_values(username, values):
+    """Sobrescribe métricas derivadas por día ({fecha: {métrica: valor}}), p. ej. cargas EWMA"""
+    with closing(connect()) as conn, conn:
+        conn.executemany(
+            """INSERT INTO daily_rollups (username, date, metric, value) VALUES (?, ?, ?, ?)
+               ON CONFLICT(username, date, metric) DO UPDATE SET value = excluded.value""",
+            [(username, day, metric, value)
+             for day, metrics in values.items() for metric, value in metrics.items()],
+        )
+
+
+def last_daily_value(username, metric, before_date):
+    """(fecha, valor) del último día anterior a before_date con esa métrica, o None"""
+    with closing(connect()) as conn:
+        row = conn.execute(
+            """SELECT date, value FROM daily_rollups
+               WHERE username = ? AND metric = ? AND date < ? ORDER BY date DESC LIMIT 1""",
+            (username, metric, before_date),
+        ).fetchone()
+    return (row["date"], row["value"]) if row else None
+
+
+# ===============================
+# CREDENCIALES
+# ===============================
+def hash_plaintext_passwords(hasher):
+    """Sustituye las contraseñas en texto plano por hasher(password); devuelve cuántas"""
+    migrated = 0
+    with closing(connect()) as conn, conn:
+        conn.execute("BEGIN IMMEDIATE")
+        for table in ("athletes", "doctors"):
+            rows = conn.execute(
+                f"SELECT username, password FROM {table} WHERE password IS NOT NULL"
+            ).fetchall()
+            conn.executemany(
+                f"UPDATE {table} SET password_hash = ?, password = NULL WHERE username = ?",
+                [(hasher(row["password"]), row["username"]) for row in rows],
+            )
+            if rows:
+                _bump_version(conn, table)
+            migrated += len(rows)
+    return migrated
+
+
+# ===============================
+# MIGRACIÓN DESDE JSON
+# ===============================
+def _read_json(path, default):
+    if not os.path.exists(path):
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def migrate_from_json(users_file="users.json", doctors_file="doctors.json",
+                      goals_file="user_goals.json", meals_pattern="meals_*.json",
+                      default_athletes=None, default_doctors=None):
+    """Importa los JSON heredados una única vez; devuelve False si ya se había hecho"""
+    init_repository()
+    with closing(connect()) as conn, conn:
+        # BEGIN IMMEDIATE: si arrancan varios workers a la vez sólo uno migra
+        conn.execute("BEGIN IMMEDIATE")
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'json_migrated'").fetchone():
+            return False
+
+        athletes = {**(default_athletes or {}), **_read_json(users_file, {})}
+        for username, data in athletes.items():
+            _upsert_athlete(conn, username, data)
+
+        doctors = {**(default_doctors or {}), **_read_json(doctors_file, {})}
+        for username, data in doctors.items():
+            _upsert_doctor(conn, username, data)
+
+        for username, goals in _read_json(goals_file, {}).items():
+            _replace_goals(conn, username, goals)
+
+        for path in glob.glob(meals_pattern):
+            username = os.path.basename(path)[len("meals_"):-len(".json")]
+            for meal in _read_json(path, []):
+                _insert_meal(conn, username, meal)
+
+        conn.execute("INSERT INTO meta (key, value) VALUES ('json_migrated', datetime('now'))")
+    return True
@@ -1,6 +1,10 @@
 import pandas as pd
 import numpy as np
-from scipy.signal import find_peaks
+from scipy.ndimage import maximum_filter1d
+from scipy.signal import butter, filtfilt, find_peaks, sosfiltfilt
+
+from hrv import rr_intervals
+from signal_quality import bad_sample_mask, clean_peaks, clean_rr_mask, window_quality
 
 def load_ecg_and_compute_bpm(filepath):
     df = pd.read_csv(filepath)
@@ -17,3 +21,155 @@ def load_ecg_and_compute_bpm(filepath):
     bpm = 60000 / np.mean(rr_intervals) if len(rr_intervals) > 0 else 0
 
     return t, ecg, bpm
+
+
+# ===============================
+# DETECCIÓN DE PICOS R
+# ===============================
+def find_peaks_simple(signal, min_distance=50, threshold=0.3):
+    """Detector original en Python puro (referencia para tests y benchmarks)"""
+    peaks = []
+    signal_length = len(signal)
+
+    if threshold is None:
+        threshold = np.mean(signal) + 0.5 * np.std(signal)
+
+    for i in range(min_distance, signal_length - min_distance):
+        is_peak = True
+        for j in range(1, min_distance):
+            if (i - j >= 0 and signal[i] <= signal[i - j]) or \
+               (i + j < signal_length and signal[i] <= signal[i + j]):
+                is_peak = False
+                break
+
+        if is_peak and signal[i] > threshold:
+            if not peaks or (i - peaks[-1]) >= min_distance:
+                peaks.append(i)
+
+    return np.array(peaks)
+
+
+def _local_max_peaks(signal, min_distance, threshold):
+    """Máximos locales estrictos en una ventana de ±(min_distance - 1) muestras.
+
+    Mismo resultado que find_peaks_simple pero vectorizado: un máximo estricto
+    en esa ventana ya está a >= min_distance de cualquier otro, así que no hace
+    falta el filtrado secuencial por distancia.
+    """
+    n = len(signal)
+    start, stop = max(min_distance, 0), n - min_distance
+    if stop <= start:
+        return np.array([], dtype=np.intp)
+
+    idx = np.arange(start, stop)
+    is_peak = signal[idx] > threshold
+
+    w = min_distance - 1
+    if w > 0:
+        # wmax[k] = max(signal[k:k + w])
+        wmax = maximum_filter1d(signal, size=w, origin=-(w // 2), mode="nearest")
+        is_peak &= signal[idx] > wmax[idx - w]
+        is_peak &= signal[idx] > wmax[idx + 1]
+
+    return idx[is_peak]
+
+
+def _pan_tompkins_peaks(signal, fs, min_distance):
+    """Detector estilo Pan-Tompkins: pasa-banda, derivada, cuadrado, integración
+    en ventana móvil y umbral adaptativo sobre los candidatos."""
+    if fs is None:
+        raise ValueError("El método 'pan_tompkins' necesita la frecuencia de muestreo (fs)")
+
+    nyquist = fs / 2
+    highcut = min(15.0, 0.9 * nyquist)
+    sos = butter(2, [5.0, highcut], btype="band", fs=fs, output="sos")
+    filtered = sosfiltfilt(sos, signal)
+
+    squared = np.gradient(filtered) ** 2
+    win = max(1, int(round(0.150 * fs)))
+    integrated = np.convolve(squared, np.ones(win) / win, mode="same")
+
+    distance = max(1, min_distance)
+    candidates, _ = find_peaks(integrated, distance=distance)
+    if len(candidates) == 0:
+        return np.array([], dtype=np.intp)
+
+    # Umbral adaptativo (SPKI/NPKI); el bucle es por latido, no por muestra
+    heights = integrated[candidates]
+    spki = np.max(heights[: max(1, int(2 * fs / distance))])
+    npki = np.mean(integrated)
+    accepted = []
+    for cand, height in zip(candidates, heights):
+        threshold = npki + 0.25 * (spki - npki)
+        if height > threshold:
+            spki = 0.125 * height + 0.875 * spki
+            accepted.append(cand)
+        else:
+            npki = 0.125 * height + 0.875 * npki
+
+    if not accepted:
+        return np.array([], dtype=np.intp)
+
+    # Afinar cada pico al máximo de la señal original cerca del candidato
+    accepted = np.asarray(accepted)
+    offsets = np.arange(-win, win + 1)
+    windows = np.clip(accepted[:, None] + offsets, 0, len(signal) - 1)
+    refined = windows[np.arange(len(accepted)), np.argmax(signal[windows], axis=1)]
+
+    refined = np.unique(refined)
+    keep = np.concatenate(([True], np.diff(refined) >= distance))
+    return refined[keep].astype(np.intp)
+
+
+def detect_r_peaks(signal, min_distance=50, threshold=0.3, method="local_max", fs=None):
+    """Detecta picos R y devuelve sus índices (np.ndarray de enteros).
+
+    method="local_max" reproduce find_peaks_simple; method="pan_tompkins"
+    usa el pipeline clásico de Pan-Tompkins y requiere fs. El umbral None
+    se calcula como media + 0.5 * desviación estándar.
+    """
+    signal = np.asarray(signal, dtype=float)
+
+    if method == "local_max":
+        if threshold is None:
+            threshold = np.mean(signal) + 0.5 * np.std(signal)
+        return _local_max_peaks(signal, int(min_distance), threshold)
+    if method == "pan_tompkins":
+        return _pan_tompkins_peaks(signal, fs, int(min_distance))
+
+    raise ValueError(f"Método de detección desconocido: {method}")
+
+
+# ===============================
+# PIPELINE COMPLETO
+# ===============================
+def process_ecg(t, ecg):
+    """Filtra, evalúa la calidad, detecta picos R limpios y calcula el BPM medio.
+
+    Devuelve (t, ecg filtrado, bpm o None si no hay intervalos RR limpios,
+    picos, calidad por ventana). No depende de la app, así que puede
+    ejecutarse en procesos de trabajo.
+    """
+    t = np.asarray(t, dtype=float)
+    ecg_clean = np.asarray(ecg, dtype=float) - np.mean(ecg)
+    fs = 1 / (t[1] - t[0]) if len(t) > 1 else 250
+
+    # Pasa-banda 0.5-40 Hz típico para ECG
+    b, a = butter(3, [0.5, 40.0], btype="band", fs=fs)
+    ecg_filtered = filtfilt(b, a, ecg_clean)
+
+    ecg_range = np.max(ecg_filtered) - np.min(ecg_filtered)
+    ecg_normalized = (ecg_filtered - np.min(ecg_filtered)) / ecg_range if ecg_range > 0 else ecg_filtered
+
+    # Calidad sobre la señal sin filtrar: el filtro ocultaría el ruido de alta frecuencia
+    quality = window_quality(ecg_clean, fs)
+    bad_mask = bad_sample_mask(quality, len(t))
+
+    # Al menos 400 ms entre latidos (150 BPM máximo), umbral en el percentil 85
+    peaks = detect_r_peaks(ecg_normalized, min_distance=int(0.4 * fs),
+                           threshold=np.percentile(ecg_normalized, 85))
+    peaks = clean_peaks(peaks, bad_mask)
+
+    rr, valid = rr_intervals(t[peaks], clean_rr_mask(peaks, bad_mask))
+    bpm = 60000 / np.mean(rr[valid]) if valid.any() else None
+    return t, ecg_filtered, bpm, peaks, quality
@@ -0,0 +1,114 @@
+"""Índice de calidad de señal (SQI) por ventanas fijas de ECG.
+
+Cada ventana se evalúa con cuatro criterios, todos vectorizados sobre una
+matriz (ventanas x muestras):
+    - flatline: fracción de muestras sin cambio (electrodo suelto)
+    - saturation: fracción de muestras pegadas a los extremos del registro
+    - kurtosis: un ECG limpio es muy apuntado (curtosis > 5); el ruido no
+    - hf_ratio: potencia por encima de 40 Hz frente a la de 1-40 Hz
+"""
+import numpy as np
+
+WINDOW_SECONDS = 2.0
+MAX_FLATLINE = 0.5
+MAX_SATURATION = 0.05
+MIN_KURTOSIS = 5.0
+MAX_HF_RATIO = 0.5
+HF_CUTOFF = 40.0
+
+
+def _window_starts(n, size):
+    """Inicios de ventana; la última se alinea con el final para no perder muestras"""
+    if n <= size:
+        return np.zeros(1, dtype=np.intp)
+    starts = np.arange(0, n - size + 1, size)
+    if starts[-1] + size < n:
+        starts = np.append(starts, n - size)
+    return starts
+
+
+def window_quality(ecg, fs, window_seconds=WINDOW_SECONDS):
+    """Evalúa cada ventana de window_seconds y devuelve un dict de arrays por ventana.
+
+    "good" marca las ventanas utilizables y "score" es la fracción de
+    criterios superados (0-1).
+    """
+    ecg = np.asarray(ecg, dtype=float)
+    n = len(ecg)
+    size = max(4, int(round(window_seconds * fs)))
+    if n == 0:
+        empty = np.zeros(0)
+        return {"fs": fs, "start": np.zeros(0, dtype=np.intp), "stop": np.zeros(0, dtype=np.intp),
+                "flatline": empty, "saturation": empty, "kurtosis": empty, "hf_ratio": empty,
+                "score": empty, "good": np.zeros(0, dtype=bool)}
+
+    starts = _window_starts(n, size)
+    stops = np.minimum(starts + size, n)
+    windows = ecg[np.minimum(starts[:, None] + np.arange(size), n - 1)]
+
+    span = np.ptp(ecg)
+    tolerance = 0.01 * span if span > 0 else 1e-12
+    flatline = np.mean(np.abs(np.diff(windows, axis=1)) <= 1e-6 * max(span, 1e-12), axis=1)
+    saturation = np.mean((windows >= ecg.max() - tolerance) | (windows <= ecg.min() + tolerance), axis=1)
+
+    centered = windows - windows.mean(axis=1, keepdims=True)
+    m2 = np.mean(centered ** 2, axis=1)
+    m4 = np.mean(centered ** 4, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Curtosis de Pearson; una ventana constante cuenta como 0
+        kurt = np.where(m2 > 0, m4 / m2 ** 2, 0.0)
+        spectrum = np.abs(np.fft.rfft(centered, axis=1)) ** 2
+        freqs = np.fft.rfftfreq(size, 1.0 / fs)
+        band = spectrum[:, (freqs >= 1.0) & (freqs <= HF_CUTOFF)].sum(axis=1)
+        hf_ratio = np.where(band > 0, spectrum[:, freqs > HF_CUTOFF].sum(axis=1) / band, np.inf)
+
+    checks = np.stack((
+        flatline <= MAX_FLATLINE,
+        saturation <= MAX_SATURATION,
+        kurt >= MIN_KURTOSIS,
+        hf_ratio <= MAX_HF_RATIO,
+    ))
+    return {
+        "fs": fs,
+        "start": starts,
+        "stop": stops,
+        "flatline": flatline,
+        "saturation": saturation,
+        "kurtosis": kurt,
+        "hf_ratio": hf_ratio,
+        "score": checks.mean(axis=0),
+        "good": checks.all(axis=0),
+    }
+
+
+def bad_sample_mask(quality, n):
+    """Máscara por muestra: True donde alguna ventana mala cubre la muestra"""
+    delta = np.zeros(n + 1, dtype=np.int64)
+    bad = ~quality["good"]
+    np.add.at(delta, quality["start"][bad], 1)
+    np.add.at(delta, quality["stop"][bad], -1)
+    return np.cumsum(delta[:-1]) > 0
+
+
+def clean_peaks(peaks, bad_mask):
+    """Descarta los picos que caen en ventanas malas"""
+    peaks = np.asarray(peaks, dtype=np.intp)
+    return peaks[~bad_mask[peaks]] if len(peaks) else peaks
+
+
+def clean_rr_mask(peaks, bad_mask):
+    """True para cada intervalo entre picos consecutivos sin muestras malas en medio"""
+    peaks = np.asarray(peaks, dtype=np.intp)
+    if len(peaks) < 2:
+        return np.zeros(0, dtype=bool)
+    bad_count = np.concatenate(([0], np.cumsum(bad_mask)))
+    return bad_count[peaks[1:] + 1] - bad_count[peaks[:-1]] == 0
+
+
+def bad_segments(quality, t):
+    """Tramos (t0, t1) inutilizables, con las ventanas malas contiguas unidas (para sombrear)"""
+    if len(t) == 0:
+        return []
+    mask = bad_sample_mask(quality, len(t))
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.view(np.int8), [0]))))
+    return [(float(t[a]), float(t[b - 1])) for a, b in zip(edges[::2], edges[1::2])]
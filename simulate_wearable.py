@@ -0,0 +1,90 @@
+"""Simulador de wearable: envía lotes de ECG al endpoint de ingesta de la app.
+
+Uso: python simulate_wearable.py --user Haisea --token <token> [--url http://127.0.0.1:8051]
+     python simulate_wearable.py --user Haisea --token <token> --source synthetic --hr 150 --seed 1
+
+El token del atleta se obtiene con su sesión iniciada en GET /api/ecg/<usuario>/device-token
+(o en la variable de entorno ATHLETICA_DEVICE_TOKEN).
+"""
+import argparse
+import json
+import os
+import time
+import urllib.request
+
+import numpy as np
+import pandas as pd
+
+from synthetic_ecg import synthetic_ecg
+
+SYNTHETIC_SECONDS = 600
+
+
+def load_source_signal(filepath, fs):
+    """Lee el CSV de ejemplo y lo remuestrea a fs"""
+    df = pd.read_csv(filepath)
+    t = df["Time"].values
+    ecg = df["ECG"].values
+    t_uniform = np.arange(t[0], t[-1], 1 / fs)
+    return np.interp(t_uniform, t, ecg)
+
+
+def synthetic_source(fs, heart_rate, seed):
+    """Diez minutos de ECG sintético que se repiten en bucle"""
+    return synthetic_ecg(SYNTHETIC_SECONDS, fs=fs, heart_rate=heart_rate, seed=seed)[1]
+
+
+def send_batch(url, username, samples, fs, token):
+    body = json.dumps({"samples": samples.tolist(), "fs": fs}).encode("utf-8")
+    req = urllib.request.Request(
+        f"{url}/api/ecg/{username}/samples",
+        data=body,
+        headers={"Content-Type": "application/json", "X-Device-Token": token},
+        method="POST",
+    )
+    with urllib.request.urlopen(req, timeout=5) as resp:
+        return json.loads(resp.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simula un wearable que transmite ECG")
+    parser.add_argument("--user", required=True, help="Atleta al que pertenece la señal")
+    parser.add_argument("--token", default=os.environ.get("ATHLETICA_DEVICE_TOKEN"),
+                        help="Token de dispositivo del atleta")
+    parser.add_argument("--url", default="http://127.0.0.1:8051")
+    parser.add_argument("--source", default="ecg_example.csv",
+                        help="CSV de origen o 'synthetic' para generar la señal")
+    parser.add_argument("--hr", type=float, default=60.0, help="BPM de la señal sintética")
+    parser.add_argument("--seed", type=int, default=None, help="Semilla de la señal sintética")
+    parser.add_argument("--fs", type=int, default=250)
+    parser.add_argument("--batch-seconds", type=float, default=1.0)
+    parser.add_argument("--duration", type=float, default=None,
+                        help="Segundos a transmitir (por defecto, indefinidamente)")
+    args = parser.parse_args()
+    if not args.token:
+        parser.error("falta el token de dispositivo (--token o ATHLETICA_DEVICE_TOKEN)")
+
+    if args.source == "synthetic":
+        signal = synthetic_source(args.fs, args.hr, args.seed)
+    else:
+        signal = load_source_signal(args.source, args.fs)
+    batch_size = int(args.fs * args.batch_seconds)
+    sent = 0
+    pos = 0
+
+    print(f"📡 Transmitiendo ECG de '{args.user}' a {args.url} ({batch_size} muestras/lote)")
+    while args.duration is None or sent < args.duration * args.fs:
+        idx = (pos + np.arange(batch_size)) % len(signal)
+        batch = signal[idx]
+        pos = (pos + batch_size) % len(signal)
+
+        start = time.perf_counter()
+        result = send_batch(args.url, args.user, batch, args.fs, args.token)
+        sent += batch_size
+        print(f"Enviadas {sent} muestras - en buffer: {result['buffered']}")
+
+        time.sleep(max(0.0, args.batch_seconds - (time.perf_counter() - start)))
+
+
+if __name__ == "__main__":
+    main()
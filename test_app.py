@@ -0,0 +1,305 @@
+import importlib
+import json
+
+import pytest
+from dash.development.base_component import Component
+
+import batch_analysis
+import repository
+import training_load
+from hr_zones import estimate_max_hr, max_hr_for
+
+ROUTES = ["/", "/login", "/register", "/onboarding", "/inicio", "/metricas",
+          "/objetivos", "/nutricion", "/entrenamientos"]
+
+
+@pytest.fixture(scope="module")
+def dash_app(tmp_path_factory):
+    folder = tmp_path_factory.mktemp("app")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(folder)
+        monkeypatch.setattr(repository, "DB_PATH", str(folder / "data" / "users.db"))
+        yield importlib.import_module("app")
+
+
+def _ids(component, found):
+    if isinstance(component, Component):
+        if isinstance(getattr(component, "id", None), dict):
+            found.add(json.dumps(component.id, sort_keys=True))
+        elif getattr(component, "id", None) is not None:
+            found.add(component.id)
+        _ids(getattr(component, "children", None), found)
+    elif isinstance(component, (list, tuple)):
+        for child in component:
+            _ids(child, found)
+    return found
+
+
+def _output_ids(callback):
+    outputs = callback["output"].split("@")[0].strip(".").split("...")
+    return {output.rsplit(".", 1)[0] for output in outputs if output}
+
+
+def _present(component_id, mounted):
+    """Un id con comodines (ALL) está presente si algún componente montado encaja"""
+    if not component_id.startswith("{"):
+        return component_id in mounted
+    pattern = json.loads(component_id)
+    for other in mounted:
+        if other.startswith("{"):
+            other = json.loads(other)
+            if other.keys() == pattern.keys() and all(
+                    isinstance(value, list) or other[key] == value for key, value in pattern.items()):
+                return True
+    return False
+
+
+def _mounted(dash_app, pathname):
+    page = _ids(dash_app.display_page_corrected(pathname, "ana", "athlete"), set())
+    return page, _ids(dash_app.app.layout, set()) | page
+
+
+def _fired_on_navigation(dash_app, previous, pathname):
+    """Callbacks del servidor que el navegador ejecuta al navegar de previous a pathname.
+
+    Modelo del renderer de Dash: al cambiar la URL se ejecutan los que
+    escuchan url.pathname con sus salidas montadas (aún en la página
+    anterior) y, al montarse el nuevo page-content, los que tienen alguna
+    entrada o salida en él (salvo prevent_initial_call) y todas sus
+    entradas y salidas montadas.
+    """
+    _, before = _mounted(dash_app, previous)
+    page, after = _mounted(dash_app, pathname)
+    fired = []
+    for callback in dash_app.app._callback_list:
+        if callback["clientside_function"]:
+            continue
+        inputs = {item["id"] for item in callback["inputs"]}
+        outputs = _output_ids(callback)
+        if "url" in inputs and all(_present(output, before) for output in outputs):
+            fired.append(callback["output"])
+        if (callback["prevent_initial_call"] in (False, None)
+                and any(_present(item, page) for item in inputs | outputs)
+                and all(_present(item, after) for item in inputs | outputs)):
+            fired.append(callback["output"])
+    return fired
+
+
+# Callbacks del servidor (por su primera salida) que se ejecutan al entrar en cada página
+PAGE = "page-content.children"
+SIDEBAR = "sidebar-user-avatar.children"  # perfil de la barra lateral (patrón ALL)
+EXPECTED_ON_NAVIGATION = {
+    "/": {PAGE},
+    "/login": {PAGE, "current-user-debug.children", "onboarding-completed-debug.children"},
+    "/register": {PAGE},
+    "/onboarding": {PAGE},
+    "/inicio": {PAGE, "user-profile-name.children", "vo2max-summary.children", "ecg-live-available.data",
+                "ecg-graph.figure"},
+    "/metricas": {PAGE, SIDEBAR, "hr-zones-chart.figure", "intensity-recovery-chart.figure",
+                  "intensity-recovery-chart.config"},
+    "/objetivos": {PAGE, SIDEBAR, "fitness-goals-list.children", "user-goals-store.data"},
+    "/nutricion": {PAGE, SIDEBAR, "calorias-total.children", "macronutrientes-chart.figure"},
+    "/entrenamientos": {PAGE, SIDEBAR},
+}
+
+
+def _first_output(output):
+    first = output.split("@")[0].strip(".").split("...")[0]
+    component_id, prop = first.rsplit(".", 1)
+    if component_id.startswith("{"):
+        component_id = json.loads(component_id)["type"]
+    return f"{component_id}.{prop}"
+
+
+def test_page_callbacks_only_fire_on_their_page(dash_app):
+    url_callbacks = [callback["output"] for callback in dash_app.app._callback_list
+                     if any(item["id"] == "url" and item["property"] == "pathname"
+                            for item in callback["inputs"])]
+    assert url_callbacks == ["page-content.children"]
+
+    # El marcador de página sólo cambia al montarse: con prevent_initial_call nunca dispararía
+    for callback in dash_app.app._callback_list:
+        if any(item["id"].startswith("page-") and item["property"] == "data" for item in callback["inputs"]):
+            assert callback["prevent_initial_call"] in (False, None), callback["output"]
+
+    for pathname in ROUTES:
+        fired = [_first_output(output) for output in _fired_on_navigation(dash_app, "/", pathname)]
+        assert sorted(fired) == sorted(EXPECTED_ON_NAVIGATION[pathname]), pathname
+
+    for previous in ROUTES:
+        for pathname in ROUTES:
+            if previous == pathname:
+                continue
+            fired = _fired_on_navigation(dash_app, previous, pathname)
+            # Ningún callback se ejecuta dos veces ni lo hacen los de la página que se deja
+            assert len(fired) == len(set(fired)), (previous, pathname)
+            assert fired.count("page-content.children") == 1
+            assert {_first_output(output) for output in fired} <= EXPECTED_ON_NAVIGATION[pathname], \
+                (previous, pathname)
+
+    charts = _fired_on_navigation(dash_app, "/inicio", "/metricas")
+    assert "hr-zones-chart.figure" in charts
+    assert "hr-zones-chart.figure" not in _fired_on_navigation(dash_app, "/metricas", "/objetivos")
+    assert "macronutrientes-chart.figure" in _fired_on_navigation(dash_app, "/metricas", "/nutricion")
+    assert _fired_on_navigation(dash_app, "/nutricion", "/register") == ["page-content.children"]
+
+
+def test_nav_styles_are_clientside(dash_app):
+    nav = [callback for callback in dash_app.app._callback_list if "nav-inicio-metricas.style" in callback["output"]]
+    assert len(nav) == 1 and nav[0]["clientside_function"]
+    for pathname in ROUTES[1:]:
+        assert not any(".style" in output and "nav-" in output
+                       for output in _fired_on_navigation(dash_app, "/", pathname))
+
+
+def test_sidebar_profile_is_cached_per_user(dash_app):
+    profile_callbacks = [callback for callback in dash_app.app._callback_list
+                         if "sidebar-user-avatar" in callback["output"]]
+    assert len(profile_callbacks) == 2  # el patrón ALL y la vista de paciente de inicio
+    for pathname in ["/metricas", "/objetivos", "/nutricion", "/entrenamientos"]:
+        assert sum("sidebar-user-avatar" in output
+                   for output in _fired_on_navigation(dash_app, "/", pathname)) == 1
+
+    dash_app.update_user_activity_level("test", 3)
+    profile = dash_app.sidebar_profile("test", "athlete")
+    assert dash_app.sidebar_profile("test", "athlete") is profile
+    assert profile[2] == "Atleta Principiante"
+    dash_app.update_user_activity_level("test", 9)
+    assert dash_app.sidebar_profile("test", "athlete")[2] == "Atleta Intermedio"
+
+    # Una escritura de otro worker sólo llega a la base de datos
+    name = dash_app.USERS_DB["test"]["full_name"]
+    assert repository.update_athlete_fields("test", full_name="Nombre Nuevo")
+    assert dash_app.sidebar_profile("test", "athlete", 9)[1] == "Nombre Nuevo"
+    assert repository.update_athlete_fields("test", full_name=name)
+    assert dash_app.sidebar_profile("test", "athlete", 9)[1] == name
+    assert dash_app._cached_sidebar_profile.cache_info().maxsize == dash_app.PROFILE_CACHE_SIZE
+
+    # La escritura de otro atleta no invalida este perfil
+    profile = dash_app.sidebar_profile("test", "athlete", 9)
+    assert repository.update_athlete_fields("Haisea", activity_level=4)
+    assert dash_app.sidebar_profile("test", "athlete", 9) is profile
+
+    doctor = "medico1"
+    before = dash_app.sidebar_profile(doctor, "doctor")[2]
+    patient = dash_app.get_doctor_patients(doctor)[0]
+    assert dash_app.remove_patient_from_doctor(doctor, patient)
+    assert dash_app.sidebar_profile(doctor, "doctor")[2] != before
+    assert dash_app.add_patient_to_doctor(doctor, patient)
+    assert dash_app.sidebar_profile(doctor, "doctor")[2] == before
+
+
+def test_metrics_figures_are_cached_until_a_new_session(dash_app):
+    cache = dash_app.METRICS_FIGURES
+    dash_app.COHORT.refresh()  # sin esperar a que el hilo termine la primera instantánea
+    figures = cache.get("test")
+    assert len(figures) == 3 and figures[2]["data"][1]["name"] == "Tu Percentil"
+    hits = cache.stats()["hits"]
+    assert cache.get("test") == figures
+    assert cache.stats()["hits"] == hits + 1
+
+    # Un refresco de la cohorte que no cambia la fila del atleta no reconstruye nada
+    built = []
+    build = cache.build
+    cache.build = lambda username: built.append(username) or build(username)
+    try:
+        dash_app.COHORT.refresh()
+        cache._executor.submit(lambda: None).result()
+    finally:
+        cache.build = build
+    assert built == []
+
+    training_load.record_rpe_session("test", "rpe_1", dash_app.date.today().isoformat(), 7, 60)
+    misses = cache.stats()["misses"]
+    cache.refresh("test")  # lo que hace schedule() en segundo plano
+    updated = cache.get("test")
+    assert cache.stats()["misses"] == misses
+    assert updated[0]["data"][0]["y"][-1] == 420
+
+
+def test_onboarding_biometrics_calibrate_heart_rate(dash_app):
+    assert dash_app.save_biometrics_during_onboarding(170, 60, 50, None, "F", "test") == ""
+    athlete = repository.get_athlete("test")
+    assert athlete["age"] == 50 and "max_hr" not in athlete
+    assert max_hr_for(athlete) == estimate_max_hr(50)
+    assert batch_analysis.athlete_profile(athlete)["max_hr"] == estimate_max_hr(50)
+    assert batch_analysis.athlete_profiles(["test"])["test"]["sex"] == "F"
+
+    # Una FC máxima medida tiene prioridad sobre la estimada por la edad
+    dash_app.save_biometrics_during_onboarding(170, 60, 50, 185, "F", "test")
+    assert max_hr_for(repository.get_athlete("test")) == 185
+    assert max_hr_for(dash_app.USERS_DB["test"]) == 185
+
+    assert dash_app.save_biometrics_during_onboarding(170, 60, 500, None, "F", "test") != ""
+    athlete = repository.get_athlete("test")
+    assert athlete["age"] == 50 and "max_hr" not in athlete
+
+
+def test_batch_analysis_api_requires_the_doctor_session(dash_app):
+    client = dash_app.server.test_client()
+    url = "/api/doctors/medico1/ecg-analysis"
+    assert client.post(url).status_code == 403
+
+    with client.session_transaction() as session:
+        session["user"] = {"username": "neuro_med", "type": "doctor"}
+    assert client.post(url).status_code == 403
+
+    assert client.get(url).status_code == 403
+
+    with client.session_transaction() as session:
+        session["user"] = {"username": "medico1", "type": "doctor"}
+    assert client.post(url).status_code == 202
+    # El estado está en SQLite: otro cliente con la sesión del médico (otro worker) lo ve
+    other = dash_app.server.test_client()
+    with other.session_transaction() as session:
+        session["user"] = {"username": "medico1", "type": "doctor"}
+    assert other.get(url).get_json()["status"] in ("running", "done")
+
+
+def test_workout_api_requires_the_athlete_session_and_finite_values(dash_app):
+    client = dash_app.server.test_client()
+    url = "/api/athletes/test/workouts"
+    workout = {"rpe": 6, "duration_min": 45, "date": "2025-01-01", "id": "api_1"}
+    assert client.post(url, json=workout).status_code == 403
+    with client.session_transaction() as session:
+        session["user"] = {"username": "Haisea", "type": "athlete"}
+    assert client.post(url, json=workout).status_code == 403
+
+    with client.session_transaction() as session:
+        session["user"] = {"username": "test", "type": "athlete"}
+    for bad in ({"duration_min": "nan"}, {"duration_min": 1e999}, {"rpe": "inf"},
+                {"distance_km": 0}, {"avg_hr": -150}, {"distance_km": "nan"}):
+        assert client.post(url, json={**workout, **bad}).status_code == 400, bad
+    response = client.post(url, data='{"rpe": 6, "duration_min": NaN}', content_type="application/json")
+    assert response.status_code == 400
+    assert not any(s["session_id"] == "api_1" for s in repository.load_sessions("test"))
+
+    response = client.post(url, json={**workout, "distance_km": 8.0, "avg_hr": 150})
+    assert response.status_code == 201 and response.get_json()["load"] == 270
+
+
+def test_ecg_ingest_requires_the_device_token_and_clean_batches(dash_app):
+    client = dash_app.server.test_client()
+    url = "/api/ecg/Haisea/samples"
+    assert client.post(url, json={"samples": [0.1, 0.2]}).status_code == 403
+    headers = {"X-Device-Token": dash_app.auth.device_token(dash_app.server.secret_key, "test")}
+    assert client.post(url, json={"samples": [0.1, 0.2]}, headers=headers).status_code == 403
+
+    assert client.get("/api/ecg/Haisea/device-token").status_code == 403
+    with client.session_transaction() as session:
+        session["user"] = {"username": "Haisea", "type": "athlete"}
+    token = client.get("/api/ecg/Haisea/device-token").get_json()["token"]
+    with client.session_transaction() as session:
+        session.clear()
+
+    headers = {"X-Device-Token": token}
+    # get_json acepta el literal NaN: el lote entero se rechaza
+    response = client.post(url, data='{"samples": [0.1, NaN]}', content_type="application/json", headers=headers)
+    assert response.status_code == 400
+    too_big = [0.0] * (dash_app.ECG_STREAMS.max_batch_samples + 1)
+    assert client.post(url, json={"samples": too_big}, headers=headers).status_code == 400
+    assert not dash_app.ECG_STREAMS.has_data("Haisea")
+
+    response = client.post(url, json={"samples": [0.1, 0.2]}, headers=headers)
+    assert response.status_code == 200 and response.get_json()["buffered"] == 2
+    dash_app.ECG_STREAMS.reset("Haisea")
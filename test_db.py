@@ -0,0 +1,354 @@
+import json
+
+import pytest
+
+import repository
+
+
+@pytest.fixture
+def repo_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(repository, "DB_PATH", str(tmp_path / "data" / "users.db"))
+    repository.init_repository()
+    return tmp_path
+
+
+def test_migration_imports_json_once(repo_db):
+    users = {"ana": {"password": "1", "email": "ana@x.com", "full_name": "Ana",
+                     "onboarding_completed": True, "activity_level": 7, "type": "athlete",
+                     "sports": ["running"]}}
+    doctors = {"doc": {"password": "2", "email": "doc@x.com", "full_name": "Dr",
+                       "type": "doctor", "patients": ["ana"]}}
+    goals = {"ana": {"fitness": [{"id": "goal_1", "name": "10K"}], "health": []}}
+    meals = [{"id": "meal_1", "date": "2025-12-15", "calories": 500}]
+    for name, data in [("users.json", users), ("doctors.json", doctors),
+                       ("user_goals.json", goals), ("meals_ana.json", meals)]:
+        (repo_db / name).write_text(json.dumps(data), encoding="utf-8")
+
+    assert repository.migrate_from_json(
+        str(repo_db / "users.json"), str(repo_db / "doctors.json"),
+        str(repo_db / "user_goals.json"), str(repo_db / "meals_*.json"))
+    assert not repository.migrate_from_json(str(repo_db / "users.json"))
+
+    assert repository.load_athletes() == users
+    assert repository.load_doctors() == doctors
+    assert repository.load_goals("ana") == goals["ana"]
+    assert repository.load_meals("ana", date="2025-12-15") == meals
+    assert repository.load_daily_rollups("ana", "2025-12-15", "2025-12-15", ["meals", "calories"]) == {
+        "2025-12-15": {"meals": 1.0, "calories": 500.0}}
+
+
+def test_row_level_updates(repo_db):
+    repository.upsert_athlete("ana", {"password": "1", "email": "ana@x.com", "full_name": "Ana"})
+    repository.upsert_athlete("luis", {"password": "1", "email": "luis@x.com", "full_name": "Luis"})
+    repository.upsert_doctor("doc", {"password": "2", "email": "doc@x.com", "full_name": "Dr"})
+
+    assert repository.update_athlete_fields("ana", activity_level=9, onboarding_completed=True)
+    assert not repository.update_athlete_fields("nadie", activity_level=1)
+    assert repository.get_athlete("ana")["activity_level"] == 9
+    assert repository.get_athlete("ana")["onboarding_completed"] is True
+    assert repository.get_athlete("luis")["activity_level"] == 5
+
+    assert repository.add_patient("doc", "luis")
+    assert repository.add_patient("doc", "ana")
+    assert not repository.add_patient("doc", "ana")
+    assert repository.get_patients("doc") == ["luis", "ana"]
+    assert repository.remove_patient("doc", "luis")
+    assert repository.get_doctor("doc")["patients"] == ["ana"]
+
+    goal = {"id": "goal_1", "name": "10K", "status": "active"}
+    repository.insert_goal("ana", "fitness", goal)
+    assert repository.update_goal("ana", {**goal, "status": "completed"})
+    assert repository.load_goals("ana")["fitness"][0]["status"] == "completed"
+    assert repository.delete_goal("ana", "goal_1")
+    assert repository.load_goals("ana") == {"fitness": [], "health": []}
+
+
+def test_update_athlete_fields_rejects_unknown_columns(repo_db):
+    with pytest.raises(ValueError):
+        repository.update_athlete_fields("ana", is_admin=1)
+
+
+def _concurrent_writer(db_path, worker, n):
+    repository.DB_PATH = db_path
+    for i in range(n):
+        username = f"atleta_{worker}_{i}"
+        repository.upsert_athlete(username, {"password": "x", "email": f"{username}@x.com"})
+        repository.add_patient("doc", username)
+        repository.insert_goal("ana", "fitness", {"id": f"goal_{worker}_{i}"})
+        repository.update_athlete_fields("ana", activity_level=worker)
+
+
+def test_concurrent_processes_do_not_lose_updates(repo_db):
+    import multiprocessing
+
+    repository.upsert_doctor("doc", {"password": "2", "email": "doc@x.com", "patients": []})
+    repository.upsert_athlete("ana", {"password": "1", "email": "ana@x.com"})
+    users = repository.CachedTable("athletes", repository.load_athletes)
+    doctors = repository.CachedTable("doctors", repository.load_doctors)
+    assert len(users) == 1 and doctors["doc"]["patients"] == []
+
+    ctx = multiprocessing.get_context("spawn")
+    workers, n = 4, 25
+    procs = [ctx.Process(target=_concurrent_writer, args=(repository.DB_PATH, w, n))
+             for w in range(workers)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join(timeout=60)
+        assert proc.exitcode == 0
+
+    assert len(repository.load_athletes()) == 1 + workers * n
+    assert len(repository.get_patients("doc")) == workers * n
+    assert len(repository.load_goals("ana")["fitness"]) == workers * n
+
+    # Las cachés de este proceso ven lo que escribieron los demás
+    assert len(users) == 1 + workers * n
+    assert "atleta_3_24" in users
+    assert len(doctors["doc"]["patients"]) == workers * n
+
+
+def test_plaintext_passwords_are_hashed_and_indexed_by_email(repo_db):
+    import auth
+
+    repository.upsert_athlete("ana", {"password": "secreto", "email": "ana@x.com"})
+    repository.upsert_doctor("doc", {"password": "doctor", "email": "doc@x.com"})
+    users = repository.CachedTable("athletes", repository.load_athletes)
+    assert users.lookup("email", "ana@x.com") == "ana"
+
+    assert auth.migrate_plaintext_passwords() == 2
+    assert auth.migrate_plaintext_passwords() == 0
+
+    ana = users["ana"]
+    assert "password" not in ana
+    assert auth.verify_password(ana, "secreto")
+    assert not auth.verify_password(ana, "otro")
+    assert auth.verify_password(repository.get_doctor("doc"), "doctor")
+
+    assert auth.find_username(users, "ana") == "ana"
+    assert auth.find_username(users, "ana@x.com") == "ana"
+    assert auth.find_username(users, "nadie@x.com") is None
+
+    # El índice se reconstruye cuando otra escritura cambia la tabla
+    repository.update_athlete_fields("ana", email="ana@nuevo.com")
+    assert auth.find_username(users, "ana@nuevo.com") == "ana"
+    assert auth.find_username(users, "ana@x.com") is None
+
+
+def test_init_repository_adds_password_hash_to_old_tables(tmp_path, monkeypatch):
+    import sqlite3
+
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE athletes (username TEXT PRIMARY KEY, password TEXT, email TEXT, "
+                 "full_name TEXT, onboarding_completed INTEGER NOT NULL DEFAULT 0, "
+                 "activity_level INTEGER NOT NULL DEFAULT 5, registration_date TEXT, "
+                 "extra TEXT NOT NULL DEFAULT '{}')")
+    conn.execute("INSERT INTO athletes (username, password) VALUES ('ana', '1')")
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(repository, "DB_PATH", str(path))
+    repository.init_repository()
+    assert repository.hash_plaintext_passwords(lambda p: f"hash:{p}") == 1
+    assert repository.get_athlete("ana")["password_hash"] == "hash:1"
+
+
+def test_batch_analysis_stores_per_patient_summaries(repo_db):
+    import shutil
+
+    import numpy as np
+
+    import batch_analysis
+    from ecg_storage import write_ecg_binary
+
+    root = repo_db / "ecg"
+    (root / "ana").mkdir(parents=True)
+    (root / "luis").mkdir()
+    shutil.copy("ecg_example.csv", root / "ana" / "a.csv")
+    write_ecg_binary(str(root / "ana" / "b.ecgbin"), np.loadtxt("ecg_example.csv", delimiter=",", skiprows=1)[:, 1], 250)
+    write_ecg_binary(str(root / "luis" / "ruido.ecgbin"), np.random.default_rng(0).normal(size=2500), 250)
+    (root / "luis" / "roto.csv").write_text("x,y\n1,2\n")
+
+    progress = []
+    summaries = batch_analysis.analyze_patients(
+        ["ana", "luis", "sin_grabaciones"], root=str(root), max_workers=2,
+        progress=lambda done, total: progress.append((done, total)))
+
+    assert progress[-1] == (4, 4)
+    assert set(summaries) == {"ana", "luis"}
+    assert summaries["ana"]["n_recordings"] == 2
+    assert summaries["ana"]["bpm"] == pytest.approx(60, abs=1)
+    assert summaries["luis"]["n_errors"] == 1 and summaries["luis"]["bpm"] is None
+
+    stored = repository.load_ecg_summaries(["ana", "luis", "sin_grabaciones"])
+    assert stored["ana"]["bpm"] == pytest.approx(summaries["ana"]["bpm"])
+    assert "computed_at" in stored["luis"]
+    assert repository.load_ecg_summaries([]) == {}
+
+
+def test_batch_jobs_are_shared_and_never_started_twice(repo_db):
+    assert repository.get_batch_job("medico1") is None
+    assert repository.start_batch_job("medico1", {"status": "running", "done": 0})
+    assert not repository.start_batch_job("medico1", {"status": "running", "done": 0})
+    repository.update_batch_job("medico1", done=3, total=4)
+    assert repository.get_batch_job("medico1") == {"status": "running", "done": 3, "total": 4}
+
+    repository.update_batch_job("medico1", status="done")
+    assert repository.start_batch_job("medico1", {"status": "running", "done": 0})
+    assert repository.get_batch_job("medico1")["done"] == 0
+
+
+def test_batch_profiles_use_the_measured_resting_heart_rate(repo_db):
+    import batch_analysis
+    import training_load
+    from datetime import date
+
+    repository.upsert_athlete("ana", {"password": "1", "email": "ana@x.com", "gender": "F"})
+    assert batch_analysis.athlete_profiles(["ana"])["ana"] == {
+        "max_hr": 187.0, "resting_hr": training_load.DEFAULT_RESTING_HR, "sex": "F"}
+
+    repository.record_session("ana", "noche", date.today().isoformat(), {"ecg_s": 28800.0},
+                              {"min_bpm": 48.0, "max_bpm": 70.0})
+    assert batch_analysis.athlete_profiles(["ana"])["ana"]["resting_hr"] == 48.0
+
+
+def test_daily_rollups_are_updated_incrementally(repo_db):
+    repository.record_session("ana", "s1", "2025-01-01", {"zone2_s": 600.0, "zone3_s": 120.0})
+    repository.record_session("ana", "s2", "2025-01-01", {"zone2_s": 300.0})
+    repository.record_session("ana", "s3", "2025-01-03", {"zone4_s": 60.0})
+    days = repository.load_daily_rollups("ana", "2025-01-01", "2025-01-07")
+    assert days == {"2025-01-01": {"zone2_s": 900.0, "zone3_s": 120.0}, "2025-01-03": {"zone4_s": 60.0}}
+
+    # Volver a registrar una sesión sustituye su aportación en lugar de sumarla otra vez
+    repository.record_session("ana", "s1", "2025-01-02", {"zone2_s": 100.0})
+    days = repository.load_daily_rollups("ana", "2025-01-01", "2025-01-07", metrics=["zone2_s"])
+    assert days["2025-01-01"]["zone2_s"] == 300.0
+    assert days["2025-01-02"]["zone2_s"] == 100.0
+    assert [s["session_id"] for s in repository.load_sessions("ana")] == ["s2", "s1", "s3"]
+
+
+def test_training_load_ewma_is_refreshed_from_the_new_session(repo_db):
+    import numpy as np
+    import training_load
+    from datetime import date
+
+    training_load.record_rpe_session("ana", "r1", "2025-01-01", 5, 60)
+    training_load.record_rpe_session("ana", "r2", "2025-01-03", 8, 30)
+    training_load.refresh_training_load("ana", "2025-01-03", "2025-01-10")
+
+    load = training_load.load_training_load("ana", days=14, end_date=date(2025, 1, 14))
+    daily = np.zeros(14)
+    daily[[0, 2]] = [300.0, 240.0]
+    assert load["load"].tolist() == daily.tolist()
+    # Los días sin recálculo (11-14) siguen decayendo como la EWMA completa
+    np.testing.assert_allclose(load["acute_load"], training_load.ewma(daily, training_load.ACUTE_DAYS))
+    np.testing.assert_allclose(load["chronic_load"], training_load.ewma(daily, training_load.CHRONIC_DAYS))
+    assert load["acwr"][0] == pytest.approx(load["acute_load"][0] / load["chronic_load"][0])
+
+    # Una sesión en un día intermedio sólo recalcula desde ese día
+    training_load.record_rpe_session("ana", "r3", "2025-01-02", 4, 50)
+    daily[1] = 200.0
+    load = training_load.load_training_load("ana", days=14, end_date=date(2025, 1, 14))
+    np.testing.assert_allclose(load["acute_load"], training_load.ewma(daily, training_load.ACUTE_DAYS))
+
+
+def test_meals_are_added_to_daily_rollups(repo_db):
+    repository.add_meal("ana", {"id": "m1", "date": "2025-01-01", "calories": 400, "protein": 20})
+    repository.add_meal("ana", {"id": "m2", "date": "2025-01-01", "calories": 250, "carbs": 30})
+    assert repository.load_daily_rollups("ana", "2025-01-01", "2025-01-01") == {
+        "2025-01-01": {"meals": 2.0, "calories": 650.0, "carbs": 30.0, "protein": 20.0}}
+
+    # Comidas guardadas antes de existir los totales se suman una vez al arrancar
+    conn = repository.connect()
+    conn.execute("DELETE FROM daily_rollups")
+    conn.execute("DELETE FROM meta WHERE key = 'meal_rollups'")
+    conn.commit()
+    conn.close()
+    repository.init_repository()
+    repository.init_repository()
+    assert repository.load_daily_rollups("ana", "2025-01-01", "2025-01-01", ["calories"]) == {
+        "2025-01-01": {"calories": 650.0}}
+
+
+def test_cohort_percentiles_from_columnar_snapshot(repo_db):
+    import numpy as np
+    import cohort_stats
+    from datetime import date
+
+    ranks = cohort_stats.percentile_ranks(np.array([[1.0, 70.0, np.nan, 0.0],
+                                                    [3.0, 50.0, np.nan, 0.0],
+                                                    [2.0, np.nan, np.nan, 10.0]]))
+    np.testing.assert_allclose(ranks[:, 0], [100 / 6, 500 / 6, 50.0])
+    np.testing.assert_allclose(ranks[:2, 1], [25.0, 75.0])  # menos FC en reposo es mejor
+    assert np.isnan(ranks[2, 1]) and np.isnan(ranks[:, 2]).all()
+    np.testing.assert_allclose(ranks[:, 3], [100 / 3, 100 / 3, 500 / 6])
+
+    repository.upsert_athlete("ana", {"password": "1", "email": "ana@x.com", "resting_hr": 50, "max_hr": 190})
+    repository.upsert_athlete("luis", {"password": "1", "email": "luis@x.com", "resting_hr": 65, "max_hr": 190})
+    repository.upsert_athlete("eva", {"password": "1", "email": "eva@x.com"})
+    repository.record_session("ana", "s1", "2025-01-10", {"training_min": 90.0})
+    repository.record_session("ana", "s0", "2024-11-01", {"training_min": 500.0})  # fuera de los 28 días
+    repository.record_session("luis", "s1", "2025-01-12", {"training_min": 30.0})
+    repository.set_daily_values("ana", {"2025-01-10": {"chronic_load": 100.0}})
+
+    snapshot = cohort_stats.cohort_snapshot(today=date(2025, 1, 15))
+    ana = snapshot["values"][snapshot["index"]["ana"]]
+    assert ana[0] == pytest.approx(100.0 * (27 / 29) ** 5)
+    assert ana[2] == pytest.approx(15.3 * 190 / 50)
+    assert ana[3] == 90.0
+    assert set(snapshot) == {"computed_at", "index", "values", "ranks"}
+
+    stats = cohort_stats.CohortStats()
+    # Hasta que el hilo termina la primera instantánea las peticiones no calculan nada
+    assert stats.athlete("ana")["volume"] == {"value": None, "rank": None}
+    assert stats.athlete_version("ana") is None and stats.snapshot() is None
+    stats._snapshot = snapshot
+    assert stats.athlete("ana")["volume"] == {"value": 90.0, "rank": pytest.approx(500 / 6)}
+    assert stats.athlete("eva")["vo2max"] == {"value": None, "rank": None}
+    assert stats.athlete("desconocido")["endurance"]["rank"] is None
+
+
+def test_vo2max_is_cached_until_new_sessions_arrive(repo_db, monkeypatch):
+    import training_load
+    import vo2max
+    from datetime import date
+
+    today = date.today().isoformat()
+    repository.upsert_athlete("ana", {"password": "1", "email": "ana@x.com", "age": 30})
+    repository.record_session("ana", "noche", today, {"ecg_s": 28800.0}, {"min_bpm": 48.0, "max_bpm": 70.0})
+    repository.record_session("ana", "series", today, {"ecg_s": 1800.0}, {"min_bpm": 95.0, "max_bpm": 192.0})
+
+    estimate = vo2max.get_vo2max("ana")
+    assert estimate["resting_hr"] == 48.0  # sólo la noche: las series no son reposo
+    assert estimate["max_hr"] == 192.0  # pico real >= 90 % de la teórica (187)
+    assert estimate["uth_sorensen"] == pytest.approx(15.3 * 192.0 / estimate["resting_hr"])
+    assert estimate["vo2max"] == estimate["uth_sorensen"] and estimate["submaximal"] is None
+
+    computed = []
+    original = vo2max.estimate_vo2max
+    monkeypatch.setattr(vo2max, "estimate_vo2max", lambda *args: computed.append(1) or original(*args))
+    assert vo2max.get_vo2max("ana")["vo2max"] == pytest.approx(estimate["vo2max"])
+    assert vo2max.vo2max_for_all({"ana": {}})["ana"]["vo2max"] == pytest.approx(estimate["vo2max"])
+    assert computed == []
+
+    # Carrera de 10 km en 50 min (200 m/min) al 70 % de la reserva de FC
+    resting = estimate["resting_hr"]
+    training_load.record_rpe_session("ana", "carrera", today, 6, 50.0, distance_km=10.0,
+                                     avg_hr=resting + 0.7 * (192.0 - resting))
+    updated = vo2max.get_vo2max("ana")
+    assert computed == [1]
+    assert updated["submaximal"] == pytest.approx(3.5 + 40.0 / 0.7)
+    assert updated["vo2max"] == pytest.approx((updated["uth_sorensen"] + updated["submaximal"]) / 2)
+
+    # También se recalcula al cambiar su perfil (no el de otro atleta) o al avanzar la ventana
+    repository.upsert_athlete("luis", {"password": "1", "email": "luis@x.com", "age": 40})
+    repository.update_athlete_profile("luis", age=41)
+    vo2max.get_vo2max("ana")
+    assert computed == [1]
+    repository.update_athlete_profile("ana", age=31)
+    vo2max.get_vo2max("ana")
+    assert computed == [1, 1]
+    monkeypatch.setattr(vo2max, "window_start", lambda: "2000-01-01")
+    vo2max.vo2max_for_all({"ana": {"age": 31}})
+    assert repository.load_vo2max_estimates()["ana"]["window_start"] == "2000-01-01"
+    assert computed == [1, 1, 1]
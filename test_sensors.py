@@ -0,0 +1,403 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import signal
+
+from sensors import detect_r_peaks, find_peaks_simple
+
+
+def _normalized_example_ecg():
+    """Señal de ecg_example.csv preprocesada igual que load_ecg_and_compute_bpm"""
+    df = pd.read_csv("ecg_example.csv")
+    t = df["Time"].values
+    ecg = df["ECG"].values
+    fs = 1 / (t[1] - t[0])
+    b, a = signal.butter(3, [0.5 / (fs / 2), 40.0 / (fs / 2)], btype="band")
+    filtered = signal.filtfilt(b, a, ecg - np.mean(ecg))
+    normalized = (filtered - filtered.min()) / (filtered.max() - filtered.min())
+    return t, filtered, normalized, fs
+
+
+def test_detect_r_peaks_matches_find_peaks_simple_on_example():
+    _, _, normalized, fs = _normalized_example_ecg()
+    min_distance = int(0.4 * fs)
+    threshold = np.percentile(normalized, 85)
+
+    expected = find_peaks_simple(normalized, min_distance=min_distance, threshold=threshold)
+    peaks = detect_r_peaks(normalized, min_distance=min_distance, threshold=threshold)
+
+    assert len(peaks) > 1
+    np.testing.assert_array_equal(peaks, expected)
+
+
+@pytest.mark.parametrize("min_distance", [0, 1, 2, 5, 50])
+@pytest.mark.parametrize("threshold", [None, 0.3])
+def test_detect_r_peaks_matches_find_peaks_simple_on_noise(min_distance, threshold):
+    noise = np.random.default_rng(0).normal(size=3000).round(1)
+
+    expected = find_peaks_simple(noise, min_distance=min_distance, threshold=threshold)
+    peaks = detect_r_peaks(noise, min_distance=min_distance, threshold=threshold)
+
+    np.testing.assert_array_equal(peaks, expected)
+
+
+def test_detect_r_peaks_returns_int_array_when_empty():
+    peaks = detect_r_peaks(np.zeros(10), min_distance=50)
+    assert peaks.dtype.kind == "i"
+    assert len(peaks) == 0
+
+
+def test_pan_tompkins_finds_same_beats_as_local_max():
+    _, filtered, normalized, fs = _normalized_example_ecg()
+    min_distance = int(0.4 * fs)
+    reference = detect_r_peaks(normalized, min_distance=min_distance,
+                               threshold=np.percentile(normalized, 85))
+
+    peaks = detect_r_peaks(filtered, min_distance=min_distance, method="pan_tompkins", fs=fs)
+
+    assert len(peaks) == len(reference)
+    assert np.max(np.abs(peaks - reference)) <= int(0.02 * fs)
+
+
+def test_pan_tompkins_requires_sampling_rate():
+    with pytest.raises(ValueError):
+        detect_r_peaks(np.zeros(100), method="pan_tompkins")
+
+
+def test_ecg_cache_hits_until_file_changes(tmp_path):
+    from ecg_cache import ECGAnalysisCache
+
+    path = tmp_path / "ecg.csv"
+    path.write_text("Time,ECG\n0,1\n")
+    calls = []
+
+    def compute(filepath, scale=1):
+        calls.append(filepath)
+        return np.arange(3) * scale, len(calls)
+
+    cache = ECGAnalysisCache(maxsize=2)
+    first = cache.get(str(path), compute)
+    second = cache.get(str(path), compute)
+    assert first is second
+    assert not first[0].flags.writeable
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    # Otros parámetros => otra entrada
+    cache.get(str(path), compute, scale=2)
+    assert len(calls) == 2
+
+    path.write_text("Time,ECG\n0,1\n0.004,2\n")
+    third = cache.get(str(path), compute)
+    assert third[1] == 3
+    assert cache.stats()["size"] == 2
+
+
+def test_ecg_cache_evicts_least_recently_used(tmp_path):
+    from ecg_cache import ECGAnalysisCache
+
+    cache = ECGAnalysisCache(maxsize=2)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.csv"
+        path.write_text(name)
+        paths.append(str(path))
+
+    compute = lambda filepath: filepath
+    cache.get(paths[0], compute)
+    cache.get(paths[1], compute)
+    cache.get(paths[0], compute)
+    cache.get(paths[2], compute)
+
+    cache.get(paths[0], compute)
+    assert cache.stats()["hits"] == 2
+    cache.get(paths[1], compute)
+    assert cache.stats()["misses"] == 4
+
+
+def test_ecg_cache_keeps_each_analysis_of_a_file_apart(tmp_path):
+    from ecg_cache import ECGAnalysisCache
+
+    path = tmp_path / "ecg.csv"
+    path.write_text("Time,ECG\n0,1\n")
+
+    def bpm(filepath):
+        return "bpm"
+
+    def hrv(filepath):
+        return "hrv"
+
+    cache = ECGAnalysisCache()
+    assert cache.get(str(path), bpm) == "bpm"
+    assert cache.get(str(path), hrv) == "hrv"
+    assert cache.get(str(path), bpm) == "bpm"
+    assert cache.stats()["hits"] == 1 and cache.stats()["size"] == 2
+
+
+def _synthetic_peak_times(n_beats=3600, mean_rr=0.8, amplitude=0.05, seed=0):
+    """Latidos con arritmia sinusal respiratoria a 0.25 Hz (banda HF)"""
+    rng = np.random.default_rng(seed)
+    beat_clock = np.arange(n_beats) * mean_rr
+    rr = mean_rr + amplitude * np.sin(2 * np.pi * 0.25 * beat_clock) + 0.005 * rng.standard_normal(n_beats)
+    return np.cumsum(rr), rr * 1000
+
+
+def test_hrv_time_domain_matches_direct_formulas():
+    from hrv import compute_hrv
+
+    peak_times, rr = _synthetic_peak_times()
+    rr = rr[1:]
+    metrics = compute_hrv(peak_times)
+
+    assert metrics["n_valid_rr"] == len(rr)
+    assert metrics["sdnn"] == pytest.approx(np.std(rr, ddof=1))
+    assert metrics["rmssd"] == pytest.approx(np.sqrt(np.mean(np.diff(rr) ** 2)))
+    assert metrics["pnn50"] == pytest.approx(100 * np.mean(np.abs(np.diff(rr)) > 50))
+    # La modulación respiratoria concentra la potencia en HF
+    assert metrics["hf"] > metrics["lf"]
+    assert metrics["lf_hf"] < 1
+
+
+def test_hrv_skips_artifacts_and_short_recordings():
+    from hrv import compute_hrv
+
+    peak_times = np.array([0.0, 0.8, 1.6, 1.65, 2.45, 3.25])  # 50 ms: latido espurio
+    metrics = compute_hrv(peak_times)
+    assert metrics["n_valid_rr"] == 4
+    assert metrics["rmssd"] == pytest.approx(0.0, abs=1e-6)
+    assert metrics["lf"] is None and metrics["lf_hf"] is None
+
+    assert compute_hrv([1.0])["sdnn"] is None
+
+
+def test_rolling_heart_rate_follows_tempo_changes():
+    from hrv import heart_rate_summary, rolling_heart_rate
+
+    # 60 s a 60 BPM y luego 60 s a 120 BPM, con un latido espurio
+    peak_times = np.cumsum(np.r_[np.full(60, 1.0), np.full(120, 0.5)])
+    peak_times = np.sort(np.r_[peak_times, 30.05])
+
+    summary = heart_rate_summary(peak_times, window_seconds=10)
+    assert summary["max_bpm"] == pytest.approx(120)
+    assert summary["min_bpm"] == pytest.approx(60)
+    assert 60 < summary["avg_bpm"] < 120
+
+    rolling = rolling_heart_rate(peak_times, window_seconds=20)
+    assert rolling["max"].max() == pytest.approx(120)
+    assert np.all(rolling["min"] <= rolling["mean"]) and np.all(rolling["mean"] <= rolling["max"])
+    assert heart_rate_summary([0.0])["max_bpm"] is None
+
+
+def test_signal_quality_flags_flatline_saturation_and_noise():
+    from signal_quality import bad_sample_mask, bad_segments, clean_peaks, clean_rr_mask, window_quality
+
+    df = pd.read_csv("ecg_example.csv")
+    fs = 250
+    ecg = np.tile(df["ECG"].values, 4)[:40 * fs]  # 40 s, ventanas de 2 s
+    ecg[4 * fs:6 * fs] = ecg[4 * fs]                                              # ventana 2: plana
+    ecg[10 * fs:12 * fs] = np.clip(ecg[10 * fs:12 * fs] * 20, None, ecg.max())   # ventana 5: saturada
+    ecg[20 * fs:22 * fs] += np.random.default_rng(0).normal(0, 0.3, 2 * fs)       # ventana 10: ruido
+
+    quality = window_quality(ecg, fs)
+    assert np.flatnonzero(~quality["good"]).tolist() == [2, 5, 10]
+    assert quality["score"][quality["good"]].min() == 1
+
+    bad = bad_sample_mask(quality, len(ecg))
+    assert bad.sum() == 3 * 2 * fs
+    assert bad_segments(quality, np.arange(len(ecg)) / fs)[0] == (4.0, 6.0 - 1 / fs)
+
+    peaks = np.arange(fs // 2, len(ecg), fs)  # un pico por segundo
+    kept = clean_peaks(peaks, bad)
+    assert len(kept) == len(peaks) - 6
+    rr_ok = clean_rr_mask(kept, bad)
+    assert (~rr_ok).sum() == 3  # los intervalos que cruzan un tramo malo
+
+
+def test_time_in_zones_bins_each_rr_interval_by_its_heart_rate():
+    from hr_zones import estimate_max_hr, max_hr_for, time_in_zones
+
+    max_hr = 200
+    # 60 s a 60 BPM (reposo), 60 s a 110 BPM (Z1), 30 s a 150 BPM (Z3), 20 s a 190 BPM (Z5)
+    rr = np.r_[np.full(60, 1.0), np.full(110, 60 / 110), np.full(75, 0.4), np.full(63, 60 / 190)]
+    seconds = time_in_zones(np.cumsum(np.r_[0.0, rr]), max_hr)
+
+    assert seconds == pytest.approx([60, 0, 30, 0, 63 * 60 / 190])
+    assert max_hr_for({"max_hr": 195}) == 195
+    assert max_hr_for({"age": 40}) == estimate_max_hr(40) == pytest.approx(180)
+    assert time_in_zones([0.0], max_hr).sum() == 0
+
+
+def test_ring_buffer_keeps_only_latest_window():
+    from ecg_stream import ECGRingBuffer
+
+    buffer = ECGRingBuffer(fs=10, window_seconds=2)  # capacidad 20
+    buffer.append(np.arange(15))
+    buffer.append(np.arange(15, 32))
+
+    t, ecg = buffer.snapshot()
+    assert len(buffer) == 20
+    assert buffer.total_samples == 32
+    np.testing.assert_array_equal(ecg, np.arange(12, 32))
+    np.testing.assert_allclose(t, np.arange(12, 32) / 10)
+
+    t, ecg = buffer.snapshot(seconds=0.5)
+    np.testing.assert_array_equal(ecg, np.arange(27, 32))
+
+    buffer.append(np.arange(100))
+    np.testing.assert_array_equal(buffer.snapshot()[1], np.arange(80, 100))
+
+
+def test_stream_store_rejects_other_sampling_rates():
+    from ecg_stream import ECGStreamStore
+
+    store = ECGStreamStore(fs=250, window_seconds=1)
+    store.ingest("Haisea", [0.1, 0.2], fs=250)
+    assert store.has_data("Haisea")
+    assert not store.has_data("test")
+    with pytest.raises(ValueError):
+        store.ingest("Haisea", [0.1], fs=500)
+
+
+def test_stream_store_rejects_non_finite_and_oversized_batches():
+    from ecg_stream import ECGStreamStore
+
+    store = ECGStreamStore(fs=250, window_seconds=60, max_batch_seconds=2)
+    chunk = pd.read_csv("ecg_example.csv")["ECG"].values[:250]
+    for bad in ([*chunk[:10], np.nan], [np.inf], np.zeros(501)):
+        with pytest.raises(ValueError):
+            store.ingest("Haisea", bad)
+    assert not store.has_data("Haisea")
+
+    # Un lote rechazado no llega al filtro: el stream sigue sano
+    for _ in range(20):
+        store.ingest("Haisea", chunk)
+    t, ecg, peaks, mean_bpm = store.get_processor("Haisea").recent()
+    assert np.isfinite(ecg).all() and len(peaks) and mean_bpm is not None
+
+
+def test_online_processor_is_chunk_size_independent():
+    from ecg_stream import OnlineECGProcessor
+
+    ecg = np.tile(pd.read_csv("ecg_example.csv")["ECG"].values, 4)
+
+    whole = OnlineECGProcessor(fs=250).process(ecg)
+
+    chunked = OnlineECGProcessor(fs=250)
+    peaks, bpm = [], []
+    for start in range(0, len(ecg), 173):
+        result = chunked.process(ecg[start:start + 173])
+        peaks.extend(result["peaks"])
+        bpm.extend(result["bpm"])
+
+    np.testing.assert_array_equal(peaks, whole["peaks"])
+    np.testing.assert_allclose(bpm, whole["bpm"])
+    assert len(peaks) >= 35
+    assert chunked.mean_bpm == pytest.approx(60, abs=1)
+
+    t, filtered, local_peaks, mean_bpm = chunked.recent(seconds=10)
+    assert len(t) == 2500
+    assert np.all(np.diff(local_peaks) > 0) and local_peaks.max() < len(t)
+
+
+def test_stream_ingest_is_consistent_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from ecg_stream import ECGStreamStore
+
+    store = ECGStreamStore(fs=250, window_seconds=60)
+    chunk = pd.read_csv("ecg_example.csv")["ECG"].values[:250]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: store.ingest("Haisea", chunk), range(40)))
+
+    processor = store.get_processor("Haisea")
+    assert store.get_buffer("Haisea").total_samples == processor.filtered.total_samples == 40 * 250
+    assert np.all(np.diff(processor.peaks) > 0)
+
+
+def test_stream_stops_being_live_without_new_batches(monkeypatch):
+    import ecg_stream
+
+    clock = [100.0]
+    monkeypatch.setattr(ecg_stream.time, "monotonic", lambda: clock[0])
+    store = ecg_stream.ECGStreamStore(fs=250, window_seconds=1)
+    assert not store.is_live("Haisea")
+    store.ingest("Haisea", [0.1, 0.2])
+    assert store.is_live("Haisea")
+    clock[0] += ecg_stream.LIVE_TIMEOUT_SECONDS + 1
+    assert not store.is_live("Haisea") and store.has_data("Haisea")
+
+
+def test_minmax_decimate_keeps_r_peak_extremes():
+    from downsampling import minmax_decimate
+
+    t = np.arange(900_000) / 250
+    ecg = np.tile(pd.read_csv("ecg_example.csv")["ECG"].values, 360)
+
+    t_plot, ecg_plot = minmax_decimate(t, ecg, 1500)
+
+    assert len(t_plot) <= 1502
+    assert np.all(np.diff(t_plot) > 0)
+    assert ecg_plot.max() == ecg.max()
+    assert ecg_plot.min() == ecg.min()
+
+
+def test_lttb_returns_requested_points_with_endpoints():
+    from downsampling import decimate_trace
+
+    x = np.linspace(0, 10, 5000)
+    y = np.sin(x)
+    x_plot, y_plot = decimate_trace(x, y, 200, method="lttb")
+
+    assert len(x_plot) == 200
+    assert x_plot[0] == x[0] and x_plot[-1] == x[-1]
+    assert np.all(np.diff(x_plot) > 0)
+
+
+def test_xrange_from_relayout():
+    from downsampling import xrange_from_relayout
+
+    assert xrange_from_relayout({"xaxis.range[0]": 1, "xaxis.range[1]": 2.5}) == (1.0, 2.5)
+    assert xrange_from_relayout({"xaxis.autorange": True}) == "reset"
+    assert xrange_from_relayout({"autosize": True}) is None
+    assert xrange_from_relayout(None) is None
+
+
+def test_ecg_binary_roundtrip_and_window(tmp_path):
+    from ecg_storage import csv_to_binary, load_ecg_arrays, open_ecg_binary
+
+    csv_path = tmp_path / "ecg.csv"
+    df = pd.read_csv("ecg_example.csv")
+    df.to_csv(csv_path, index=False)
+
+    binary = csv_to_binary(str(csv_path))
+    recording = open_ecg_binary(binary)
+    assert isinstance(recording.samples, np.memmap)
+    assert recording.fs == pytest.approx(1 / (df["Time"][1] - df["Time"][0]), rel=1e-6)
+    np.testing.assert_allclose(recording.samples, df["ECG"].values, rtol=1e-6, atol=1e-7)
+
+    t, ecg = recording.window(2.0, 4.0)
+    assert t[0] >= 2.0 and t[-1] <= 4.0
+    assert np.shares_memory(ecg, recording.samples)
+
+    # El CSV se lee a través de su .ecgbin hermano
+    t_loaded, ecg_loaded = load_ecg_arrays(str(csv_path))
+    assert isinstance(ecg_loaded, np.memmap)
+    np.testing.assert_allclose(t_loaded, df["Time"].values, atol=1e-9)
+
+
+def test_synthetic_ecg_is_seeded_and_detectable():
+    from hrv import compute_hrv
+    from sensors import process_ecg
+    from synthetic_ecg import synthetic_ecg
+
+    t, ecg, peaks = synthetic_ecg(300, fs=250, heart_rate=72, hrv_ms=40, seed=7)
+    assert len(t) == len(ecg) == 300 * 250
+    np.testing.assert_array_equal(ecg, synthetic_ecg(300, fs=250, heart_rate=72, hrv_ms=40, seed=7)[1])
+    assert not np.array_equal(ecg, synthetic_ecg(300, fs=250, heart_rate=72, hrv_ms=40, seed=8)[1])
+
+    _, _, bpm, detected, quality = process_ecg(t, ecg)
+    assert bpm == pytest.approx(72, abs=1)
+    assert quality["good"].all()
+    assert len(detected) == pytest.approx(len(peaks), abs=2)
+    # Los picos detectados coinciden con los generados y conservan la HRV pedida
+    assert np.abs(detected[:, None] - peaks[None, :]).min(axis=1).max() <= 2
+    assert compute_hrv(t[peaks])["sdnn"] > compute_hrv(t[synthetic_ecg(300, heart_rate=72, hrv_ms=0, seed=7)[2]])["sdnn"]
@@ -0,0 +1,127 @@
+"""Carga de entrenamiento: TRIMP por sesión y cargas aguda/crónica (EWMA).
+
+- TRIMP de Banister a partir de la FC latido a latido.
+- Carga sRPE de Foster (RPE x minutos) para sesiones registradas sólo con
+  cuestionario, sin frecuencia cardiaca.
+- Cargas aguda (7 días) y crónica (28 días) como medias móviles
+  exponenciales de la carga diaria, guardadas en la tabla de totales
+  diarios y actualizadas sólo desde el día de la sesión nueva.
+"""
+from datetime import date, timedelta
+
+import numpy as np
+from scipy.signal import lfilter
+
+import repository
+from hrv import heart_rate_series
+
+ACUTE_DAYS = 7
+CHRONIC_DAYS = 28
+DEFAULT_RESTING_HR = 60.0
+LOAD_METRICS = ("load", "acute_load", "chronic_load")
+
+
+def resting_hr_for(user_data, measured=None):
+    """FC en reposo medida en las sesiones (vo2max.resting_hr_from_sessions) si la hay;
+    si no, la del perfil o DEFAULT_RESTING_HR"""
+    return float(measured or user_data.get("resting_hr") or DEFAULT_RESTING_HR)
+
+
+def banister_trimp(peak_times, resting_hr, max_hr, sex="M", rr_mask=None):
+    """TRIMP de Banister sumado intervalo a intervalo (minutos x FC de reserva ponderada)"""
+    _, bpm = heart_rate_series(peak_times, rr_mask)
+    if len(bpm) == 0 or max_hr <= resting_hr:
+        return 0.0
+    reserve = np.clip((bpm - resting_hr) / (max_hr - resting_hr), 0.0, 1.0)
+    a, b = (0.86, 1.67) if sex == "F" else (0.64, 1.92)
+    minutes = 1.0 / bpm  # duración de cada intervalo RR en minutos
+    return float(np.sum(minutes * reserve * a * np.exp(b * reserve)))
+
+
+def srpe_load(rpe, duration_min):
+    """Carga sRPE de Foster: esfuerzo percibido (0-10) por duración en minutos"""
+    return float(rpe) * float(duration_min)
+
+
+def _ewma_factor(days):
+    return 2.0 / (days + 1)
+
+
+def ewma(loads, days, initial=0.0):
+    """EWMA de la carga diaria con lfilter (recurrencia vectorizada) partiendo de initial"""
+    alpha = _ewma_factor(days)
+    result, _ = lfilter([alpha], [1.0, alpha - 1.0], np.asarray(loads, dtype=float),
+                        zi=[(1.0 - alpha) * initial])
+    return result
+
+
+def decayed(value, elapsed_days, days):
+    """Valor de una EWMA tras elapsed_days días sin carga"""
+    return value * (1.0 - _ewma_factor(days)) ** elapsed_days
+
+
+def _previous_value(username, metric, day, days):
+    """Valor EWMA del día anterior a day, decaído por los días sin registro"""
+    previous = repository.last_daily_value(username, metric, day.isoformat())
+    if previous is None:
+        return 0.0
+    return decayed(previous[1], (day - date.fromisoformat(previous[0])).days - 1, days)
+
+
+def refresh_training_load(username, from_date, to_date=None):
+    """Recalcula las cargas aguda y crónica desde from_date (el día de la sesión nueva)"""
+    from_date = date.fromisoformat(str(from_date))
+    to_date = date.fromisoformat(str(to_date)) if to_date else max(date.today(), from_date)
+    days = [from_date + timedelta(days=i) for i in range((to_date - from_date).days + 1)]
+
+    rollups = repository.load_daily_rollups(username, from_date.isoformat(), to_date.isoformat(), ["load"])
+    loads = np.array([rollups.get(day.isoformat(), {}).get("load", 0.0) for day in days])
+    acute = ewma(loads, ACUTE_DAYS, _previous_value(username, "acute_load", from_date, ACUTE_DAYS))
+    chronic = ewma(loads, CHRONIC_DAYS, _previous_value(username, "chronic_load", from_date, CHRONIC_DAYS))
+
+    repository.set_daily_values(username, {
+        day.isoformat(): {"acute_load": float(a), "chronic_load": float(c)}
+        for day, a, c in zip(days, acute, chronic)
+    })
+
+
+def record_rpe_session(username, session_id, day, rpe, duration_min, **details):
+    """Registra una sesión de cuestionario (sin ECG) y actualiza las cargas.
+
+    details guarda datos opcionales de la sesión, p. ej. distance_km y avg_hr de una carrera.
+    """
+    load = srpe_load(rpe, duration_min)
+    metrics = {"srpe": load, "load": load, "training_min": float(duration_min)}
+    repository.record_session(username, session_id, str(day), metrics,
+                              {"rpe": rpe, "duration_min": duration_min, **details})
+    refresh_training_load(username, day)
+
+
+def load_training_load(username, days=30, end_date=None):
+    """Carga diaria, aguda, crónica y ratio agudo:crónico de los últimos days días.
+
+    Una consulta por rango a los totales diarios; los días posteriores al
+    último recálculo se completan aplicando el decaimiento de la EWMA.
+    """
+    end_date = end_date or date.today()
+    start = end_date - timedelta(days=days - 1)
+    dates = [start + timedelta(days=i) for i in range(days)]
+    rollups = repository.load_daily_rollups(username, start.isoformat(), end_date.isoformat(), LOAD_METRICS)
+
+    result = {"dates": dates}
+    for metric in LOAD_METRICS:
+        result[metric] = np.array([rollups.get(day.isoformat(), {}).get(metric, np.nan) for day in dates])
+    result["load"] = np.nan_to_num(result["load"])
+
+    for metric, window in (("acute_load", ACUTE_DAYS), ("chronic_load", CHRONIC_DAYS)):
+        values = result[metric]
+        known = ~np.isnan(values)
+        # Índice del último día conocido (-1 = valor anterior a la ventana)
+        last = np.maximum.accumulate(np.where(known, np.arange(days), -1))
+        seed = _previous_value(username, metric, start, window) if not known[0] else 0.0
+        base = np.where(last >= 0, values[np.maximum(last, 0)], seed)
+        result[metric] = decayed(base, np.arange(days) - last, window)
+
+    chronic = result["chronic_load"]
+    result["acwr"] = np.divide(result["acute_load"], chronic, out=np.zeros(days), where=chronic > 0)
+    return result
@@ -0,0 +1,134 @@
+"""Estimación del VO2máx (ml/kg/min) de cada atleta.
+
+- Uth-Sørensen: 15.3 x FCmáx / FCreposo. La FC en reposo es el percentil
+  10 de los mínimos de la media móvil de las sesiones de ECG de reposo
+  (largas, como el sueño, o sin pasar de actividad ligera); sin ellas, la
+  del perfil. La FCmáx es el pico de las sesiones si llega al 90 % de la
+  teórica; si no, la teórica (Tanaka o la medida del perfil).
+- Regresión submáxima de carrera: el VO2 de la ecuación ACSM (3.5 + 0.2 x
+  velocidad en m/min) extrapolado a la FCmáx por la reserva de FC.
+
+La estimación se guarda por atleta junto con la versión de sus sesiones,
+la de su perfil y el inicio de la ventana de WINDOW_DAYS días, y sólo se
+recalcula cuando cambia alguna de las tres.
+"""
+from datetime import date, timedelta
+
+import numpy as np
+
+import repository
+from hr_zones import max_hr_for
+
+WINDOW_DAYS = 90
+RESTING_PERCENTILE = 10
+REST_MIN_SECONDS = 4 * 3600  # grabaciones de sueño o de reposo prolongado
+LOW_ACTIVITY_FRACTION = 0.6  # pico por debajo del 60 % de la FCmáx: actividad ligera
+MIN_PEAK_FRACTION = 0.9
+SUBMAX_HRR = (0.5, 0.9)  # reserva de FC de una carrera útil para extrapolar
+
+
+def uth_sorensen(max_hr, resting_hr):
+    return 15.3 * max_hr / resting_hr
+
+
+def acsm_running_vo2(speed_m_min):
+    """VO2 de carrera en llano (ACSM) a speed_m_min metros por minuto"""
+    return 3.5 + 0.2 * np.asarray(speed_m_min, dtype=float)
+
+
+def submaximal_vo2max(speed_m_min, avg_hr, max_hr, resting_hr):
+    """VO2máx extrapolado de cada carrera; NaN si su reserva de FC no está en SUBMAX_HRR"""
+    hrr = (np.asarray(avg_hr, dtype=float) - resting_hr) / (max_hr - resting_hr)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        estimate = 3.5 + (acsm_running_vo2(speed_m_min) - 3.5) / hrr
+    return np.where((hrr >= SUBMAX_HRR[0]) & (hrr <= SUBMAX_HRR[1]), estimate, np.nan)
+
+
+def is_resting_session(session, predicted_max_hr):
+    """Sesión cuyo mínimo refleja la FC en reposo: larga o sin pasar de actividad ligera"""
+    long = session.get("metrics", {}).get("ecg_s", 0) >= REST_MIN_SECONDS
+    light = bool(session.get("max_bpm")) and session["max_bpm"] < LOW_ACTIVITY_FRACTION * predicted_max_hr
+    return long or light
+
+
+def estimate_vo2max(sessions, user_data):
+    """Estimación a partir de las sesiones del atleta (repository.load_sessions) y su perfil"""
+    predicted = max_hr_for(user_data)
+    minima = np.array([s["min_bpm"] for s in sessions
+                       if s.get("min_bpm") and is_resting_session(s, predicted)], dtype=float)
+    peaks = [s["max_bpm"] for s in sessions if s.get("max_bpm")]
+    runs = [s for s in sessions if s.get("distance_km") and s.get("duration_min") and s.get("avg_hr")]
+
+    if len(minima):
+        resting_hr = float(np.percentile(minima, RESTING_PERCENTILE))
+    elif user_data.get("resting_hr"):
+        resting_hr = float(user_data["resting_hr"])
+    else:
+        resting_hr = None
+    max_hr = max(peaks) if peaks and max(peaks) >= MIN_PEAK_FRACTION * predicted else predicted
+
+    estimate = {"resting_hr": resting_hr, "max_hr": float(max_hr), "uth_sorensen": None,
+                "submaximal": None, "n_runs": 0, "vo2max": None}
+    if resting_hr is None or max_hr <= resting_hr:
+        return estimate
+
+    estimate["uth_sorensen"] = uth_sorensen(max_hr, resting_hr)
+    if runs:
+        speed = [1000.0 * s["distance_km"] / s["duration_min"] for s in runs]
+        per_run = submaximal_vo2max(speed, [s["avg_hr"] for s in runs], max_hr, resting_hr)
+        per_run = per_run[~np.isnan(per_run)]
+        if len(per_run):
+            estimate.update(submaximal=float(np.median(per_run)), n_runs=int(len(per_run)))
+    methods = [v for v in (estimate["uth_sorensen"], estimate["submaximal"]) if v is not None]
+    estimate["vo2max"] = float(np.mean(methods))
+    return estimate
+
+
+def window_start():
+    """Primer día (ISO) de la ventana de sesiones que entra en la estimación"""
+    return (date.today() - timedelta(days=WINDOW_DAYS)).isoformat()
+
+
+def _is_fresh(stored, sessions_version, profile_version, start):
+    return stored is not None and (stored["sessions_version"], stored["profile_version"],
+                                   stored["window_start"]) == (sessions_version, profile_version, start)
+
+
+def _compute(username, sessions_version, profile_version, start, user_data):
+    estimate = estimate_vo2max(repository.load_sessions(username, start), user_data)
+    repository.save_vo2max_estimate(username, sessions_version, estimate,
+                                    profile_version=profile_version, window_start=start)
+    return estimate
+
+
+def get_vo2max(username, user_data=None):
+    """Estimación guardada del atleta; se recalcula si sus sesiones, su perfil o la ventana han cambiado"""
+    # Las versiones se leen antes que los datos: un cambio que llegue entremedias deja
+    # la estimación guardada con la versión vieja y se recalcula en la siguiente lectura
+    sessions_version = int(repository.data_version(f"sessions:{username}"))
+    profile_version = int(repository.data_version(f"athlete:{username}"))
+    start = window_start()
+    cached = repository.load_vo2max_estimates([username]).get(username)
+    if _is_fresh(cached, sessions_version, profile_version, start):
+        return cached
+    if user_data is None:
+        user_data = repository.get_athlete(username) or {}
+    return _compute(username, sessions_version, profile_version, start, user_data)
+
+
+def vo2max_for_all(athletes):
+    """{username: estimación} de todos los atletas ({username: perfil}); sólo recalcula los cambiados"""
+    versions = repository.session_versions()
+    profile_versions = repository.athlete_versions()
+    start = window_start()
+    cached = repository.load_vo2max_estimates()
+    estimates = {}
+    for username, user_data in athletes.items():
+        version = versions.get(username, 0)
+        profile_version = profile_versions.get(username, 0)
+        stored = cached.get(username)
+        if _is_fresh(stored, version, profile_version, start):
+            estimates[username] = stored
+        else:
+            estimates[username] = _compute(username, version, profile_version, start, user_data)
+    return estimates